@@ -31,6 +31,19 @@ cdef class ExchangeRateCalculator:
     )
 
 
+cdef class ExchangeRateGraph:
+    cdef dict _rates
+    cdef dict _direct
+    cdef dict _cross_rates
+
+    cpdef void update(self, str symbol, bid, ask) except *
+    cpdef object get_rate(self, Currency from_currency, Currency to_currency, PriceType price_type)
+    cpdef void clear(self) except *
+
+    cdef void _set_rate(self, dict rates, str code_lhs, str code_rhs, quote) except *
+    cdef object _find_cross_rate(self, dict rates, str from_code, str to_code)
+
+
 cdef class RolloverInterestCalculator:
     cdef dict _rate_data
 
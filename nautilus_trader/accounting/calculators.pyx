@@ -184,6 +184,163 @@ cdef class ExchangeRateCalculator:
         return quotes.get(to_currency.code, Decimal(0))
 
 
+cdef class ExchangeRateGraph:
+    """
+    Provides a maintained exchange rate graph for the currency pairs of a
+    single venue.
+
+    The direct (and inverse) rates for each price type are updated in place
+    when a quote for a currency pair is received. Cross rates are derived on
+    demand by searching the graph for the shortest conversion path, and are
+    cached until the next update.
+    """
+
+    def __init__(self):
+        self._rates = {
+            PriceType.BID: {},
+            PriceType.ASK: {},
+            PriceType.MID: {},
+        }  # type: dict[PriceType, dict[str, dict[str, Decimal]]]
+        self._direct = {}       # type: dict[str, tuple[str, str]]
+        self._cross_rates = {}  # type: dict[tuple[PriceType, str, str], Decimal]
+
+    cpdef void update(self, str symbol, bid, ask) except *:
+        """
+        Update the graph with the given currency pair quote.
+
+        Parameters
+        ----------
+        symbol : str
+            The currency pair symbol, e.g. 'AUD/USD'.
+        bid : Decimal
+            The bid quote for the pair.
+        ask : Decimal
+            The ask quote for the pair.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        cdef tuple codes = self._direct.get(symbol)
+        if codes is None:
+            pieces = symbol.partition('/')
+            codes = (pieces[0], pieces[2])
+            self._direct[symbol] = codes
+
+        cdef str code_lhs = codes[0]
+        cdef str code_rhs = codes[1]
+        self._set_rate(self._rates[PriceType.BID], code_lhs, code_rhs, bid)
+        self._set_rate(self._rates[PriceType.ASK], code_lhs, code_rhs, ask)
+        self._set_rate(self._rates[PriceType.MID], code_lhs, code_rhs, (bid + ask) / Decimal(2))
+
+        # Any cached cross rate may have been derived from the updated pair
+        if self._cross_rates:
+            self._cross_rates.clear()
+
+    cpdef object get_rate(
+        self,
+        Currency from_currency,
+        Currency to_currency,
+        PriceType price_type,
+    ):
+        """
+        Return the exchange rate for the given price type.
+
+        Parameters
+        ----------
+        from_currency : Currency
+            The currency to convert from.
+        to_currency : Currency
+            The currency to convert to.
+        price_type : PriceType
+            The price type for conversion.
+
+        Returns
+        -------
+        Decimal
+
+        Raises
+        ------
+        ValueError
+            If `price_type` is ``LAST``.
+
+        Notes
+        -----
+        If insufficient data to calculate exchange rate then will return 0.
+
+        """
+        Condition.not_none(from_currency, "from_currency")
+        Condition.not_none(to_currency, "to_currency")
+        Condition.true(price_type != PriceType.LAST, "price_type was invalid (LAST)")
+
+        if from_currency == to_currency:
+            return Decimal(1)  # No conversion necessary
+
+        cdef dict rates = self._rates[price_type]
+        cdef dict from_rates = rates.get(from_currency.code)
+        if from_rates is None:
+            return Decimal(0)  # Not enough data
+
+        xrate = from_rates.get(to_currency.code)
+        if xrate is not None:
+            return xrate  # Direct or inverse rate
+
+        cdef tuple key = (price_type, from_currency.code, to_currency.code)
+        xrate = self._cross_rates.get(key)
+        if xrate is None:
+            xrate = self._find_cross_rate(rates, from_currency.code, to_currency.code)
+            self._cross_rates[key] = xrate
+
+        return xrate
+
+    cpdef void clear(self) except *:
+        """
+        Clear all rates from the graph.
+
+        """
+        cdef dict rates
+        for rates in self._rates.values():
+            rates.clear()
+        self._direct.clear()
+        self._cross_rates.clear()
+
+    cdef void _set_rate(self, dict rates, str code_lhs, str code_rhs, quote) except *:
+        cdef dict lhs_rates = rates.get(code_lhs)
+        if lhs_rates is None:
+            lhs_rates = {}
+            rates[code_lhs] = lhs_rates
+        cdef dict rhs_rates = rates.get(code_rhs)
+        if rhs_rates is None:
+            rhs_rates = {}
+            rates[code_rhs] = rhs_rates
+
+        lhs_rates[code_rhs] = quote
+
+        # A quote for the inverse pair takes precedence over the derived inverse
+        if quote and f"{code_rhs}/{code_lhs}" not in self._direct:
+            rhs_rates[code_lhs] = Decimal(1) / quote
+
+    cdef object _find_cross_rate(self, dict rates, str from_code, str to_code):
+        # Breadth-first search for the shortest conversion path
+        cdef dict path_rates = {from_code: Decimal(1)}
+        cdef list frontier = [from_code]
+        cdef list next_frontier
+        cdef str code
+        cdef str next_code
+        while frontier:
+            next_frontier = []
+            for code in frontier:
+                for next_code, rate in rates[code].items():
+                    if next_code in path_rates:
+                        continue
+                    path_rates[next_code] = path_rates[code] * rate
+                    if next_code == to_code:
+                        return path_rates[next_code]
+                    next_frontier.append(next_code)
+            frontier = next_frontier
+
+        return Decimal(0)  # No conversion path
+
+
 cdef class RolloverInterestCalculator:
     """
     Provides rollover interest rate calculations.
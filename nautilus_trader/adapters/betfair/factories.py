@@ -25,7 +25,6 @@ from nautilus_trader.adapters.betfair.execution import BetfairExecutionClient
 from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.clock import LiveClock
-from nautilus_trader.common.logging import LiveLogger
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.live.factories import LiveDataClientFactory
@@ -147,7 +146,7 @@ class BetfairLiveDataClientFactory(LiveDataClientFactory):
         msgbus: MessageBus,
         cache: Cache,
         clock: LiveClock,
-        logger: LiveLogger,
+        logger: Logger,
         client_cls=None,
     ) -> BetfairDataClient:
         """
@@ -167,7 +166,7 @@ class BetfairLiveDataClientFactory(LiveDataClientFactory):
             The cache for the client.
         clock : LiveClock
             The clock for the client.
-        logger : LiveLogger
+        logger : Logger
             The logger for the client.
         client_cls : class, optional
             The class to call to return a new internal client.
@@ -218,7 +217,7 @@ class BetfairLiveExecutionClientFactory(LiveExecutionClientFactory):
         msgbus: MessageBus,
         cache: Cache,
         clock: LiveClock,
-        logger: LiveLogger,
+        logger: Logger,
         client_cls=None,
     ) -> BetfairExecutionClient:
         """
@@ -238,7 +237,7 @@ class BetfairLiveExecutionClientFactory(LiveExecutionClientFactory):
             The cache for the client.
         clock : LiveClock
             The clock for the client.
-        logger : LiveLogger
+        logger : Logger
             The logger for the client.
         client_cls : class, optional
             The internal client constructor. This allows external library and
@@ -548,12 +548,10 @@ class BinanceDataClient(LiveMarketDataClient):
         self._handle_bars(bar_type, bars, partial, correlation_id)
 
     def _send_all_instruments_to_data_engine(self):
+        # The data engine adds the instruments (and their currencies) to the cache
         for instrument in self._instrument_provider.get_all().values():
             self._handle_data(instrument)
 
-        for currency in self._instrument_provider.currencies().values():
-            self._cache.add_currency(currency)
-
     def _handle_spot_ws_message(self, raw: bytes):
         msg: Dict[str, Any] = orjson.loads(raw)
         data: Dict[str, Any] = msg.get("data")
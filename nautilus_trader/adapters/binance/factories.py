@@ -25,7 +25,6 @@ from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
 from nautilus_trader.adapters.binance.providers import BinanceInstrumentProvider
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.clock import LiveClock
-from nautilus_trader.common.logging import LiveLogger
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.live.factories import LiveDataClientFactory
 from nautilus_trader.live.factories import LiveExecutionClientFactory
@@ -128,7 +127,7 @@ class BinanceLiveDataClientFactory(LiveDataClientFactory):
         msgbus: MessageBus,
         cache: Cache,
         clock: LiveClock,
-        logger: LiveLogger,
+        logger: Logger,
         client_cls=None,
     ) -> BinanceDataClient:
         """
@@ -148,7 +147,7 @@ class BinanceLiveDataClientFactory(LiveDataClientFactory):
             The cache for the client.
         clock : LiveClock
             The clock for the client.
-        logger : LiveLogger
+        logger : Logger
             The logger for the client.
         client_cls : class, optional
             The class to call to return a new internal client.
@@ -195,7 +194,7 @@ class BinanceLiveExecutionClientFactory(LiveExecutionClientFactory):
         msgbus: MessageBus,
         cache: Cache,
         clock: LiveClock,
-        logger: LiveLogger,
+        logger: Logger,
         client_cls=None,
     ) -> BinanceSpotExecutionClient:
         """
@@ -215,7 +214,7 @@ class BinanceLiveExecutionClientFactory(LiveExecutionClientFactory):
             The cache for the client.
         clock : LiveClock
             The clock for the client.
-        logger : LiveLogger
+        logger : Logger
             The logger for the client.
         client_cls : class, optional
             The internal client constructor. This allows external library and
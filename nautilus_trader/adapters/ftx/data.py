@@ -261,12 +261,10 @@ class FTXDataClient(LiveMarketDataClient):
         self._update_instruments_task = self._loop.create_task(update)
 
     def _send_all_instruments_to_data_engine(self):
+        # The data engine adds the instruments (and their currencies) to the cache
         for instrument in self._instrument_provider.get_all().values():
             self._handle_data(instrument)
 
-        for currency in self._instrument_provider.currencies().values():
-            self._cache.add_currency(currency)
-
     def _schedule_subscribed_instruments_update(self, delay: int):
         update = self.run_after_delay(delay, self._subscribed_instruments_update(delay))
         self._update_instruments_task = self._loop.create_task(update)
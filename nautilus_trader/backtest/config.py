@@ -31,6 +31,7 @@ from nautilus_trader.execution.engine import ExecEngineConfig
 from nautilus_trader.infrastructure.cache import CacheDatabaseConfig
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.persistence.config import PersistenceConfig
+from nautilus_trader.portfolio.config import PortfolioConfig
 from nautilus_trader.risk.config import RiskEngineConfig
 from nautilus_trader.trading.config import ImportableStrategyConfig
 
@@ -213,6 +214,8 @@ class BacktestEngineConfig(pydantic.BaseModel):
         The configuration for the cache.
     cache_database : CacheDatabaseConfig, optional
         The configuration for the cache database.
+    portfolio : PortfolioConfig, optional
+        The configuration for the portfolio.
     data_engine : DataEngineConfig, optional
         The configuration for the data engine.
     risk_engine : RiskEngineConfig, optional
@@ -230,6 +233,7 @@ class BacktestEngineConfig(pydantic.BaseModel):
     log_level: str = "INFO"
     cache: Optional[CacheConfig] = None
     cache_database: Optional[CacheDatabaseConfig] = None
+    portfolio: Optional[PortfolioConfig] = None
     data_engine: Optional[DataEngineConfig] = None
     risk_engine: Optional[RiskEngineConfig] = None
     exec_engine: Optional[ExecEngineConfig] = None
@@ -15,28 +15,34 @@
 
 from libc.stdint cimport int64_t
 
-from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarType
-from nautilus_trader.model.data.tick cimport QuoteTick
-from nautilus_trader.model.data.tick cimport TradeTick
 from nautilus_trader.model.instruments.base cimport Instrument
 
 
 cdef class QuoteTickDataWrangler:
     cdef readonly Instrument instrument
 
-    cpdef QuoteTick _build_tick(self, double[:] values, int64_t ts_event, int64_t ts_init_delta)
+    cdef list _build_ticks(self, data, int64_t ts_init_delta)
+    cdef list _build_ticks_from_raw(
+        self,
+        int64_t[:] ts_events,
+        int64_t[:] bids,
+        int64_t[:] asks,
+        int64_t[:] bid_sizes,
+        int64_t[:] ask_sizes,
+        int64_t ts_init_delta,
+    )
 
 
 cdef class TradeTickDataWrangler:
     cdef readonly Instrument instrument
     cdef readonly processed_data
 
-    cpdef TradeTick _build_tick(self, str[:] values, int64_t ts_event, int64_t ts_init_delta)
+    cdef list _build_ticks(self, data, int64_t ts_init_delta)
 
 
 cdef class BarDataWrangler:
     cdef readonly BarType bar_type
     cdef readonly Instrument instrument
 
-    cpdef Bar _build_bar(self, double[:] values, int64_t ts_event, int64_t ts_init_delta)
+    cdef list _build_bars(self, data, int64_t ts_init_delta)
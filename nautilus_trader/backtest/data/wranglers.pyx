@@ -14,24 +14,96 @@
 # -------------------------------------------------------------------------------------------------
 
 import numpy as np
-from libc.stdint cimport int64_t
-
-import random
-
 import pandas as pd
 
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport as_utc_index
-from nautilus_trader.core.datetime cimport secs_to_nanos
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
 from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSideParser
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarType
+from nautilus_trader.model.data.columnar cimport QuoteTickColumns
+from nautilus_trader.model.data.columnar cimport TradeTickColumns
 from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 
 
+cdef double _RAW_MAX = 9223372036854775807.0
+
+# Offsets of the synthesized open, high, low and close ticks from a bars timestamp
+_BAR_TICK_OFFSETS_NS = np.array([-300_000_000, -200_000_000, -100_000_000, 0], dtype=np.int64)
+
+
+def _bar_tick_arrays(bar_ts, bid_raw, ask_raw, bid_sizes, ask_sizes, rng):
+    # Return the timestamps, bids, asks, bid sizes and ask sizes of the open,
+    # high, low and close ticks synthesized for a block of bars (in bar order).
+    if rng is not None:
+        # Swap the high and low tick values (not timestamps) of a random
+        # half of the bars
+        swap = rng.random(bar_ts.shape[0]) < 0.5
+        bid_raw[swap, 1:3] = bid_raw[swap, 2:0:-1]
+        ask_raw[swap, 1:3] = ask_raw[swap, 2:0:-1]
+
+    return [
+        (bar_ts[:, None] + _BAR_TICK_OFFSETS_NS[None, :]).ravel(),
+        bid_raw.ravel(),
+        ask_raw.ravel(),
+        np.repeat(bid_sizes, 4),
+        np.repeat(ask_sizes, 4),
+    ]
+
+
+def _sort_by_ts(arrays):
+    # Return the given tick arrays stable sorted by their timestamps (the
+    # first array), only sorting if bars were closer together than the tick
+    # offsets.
+    ts_events = arrays[0]
+    if ts_events.shape[0] > 1 and (np.diff(ts_events) < 0).any():
+        order = np.argsort(ts_events, kind="stable")
+        return [array[order] for array in arrays]
+    return arrays
+
+
+def _index_to_nanos(index):
+    # Return the UNIX timestamps (nanoseconds) of the given `DatetimeIndex` as
+    # a contiguous int64 array, read straight from the underlying datetime64[ns]
+    # values (tz-naive indexes are treated as UTC, tz-aware are already UTC).
+    return np.ascontiguousarray(
+        index.values.astype("datetime64[ns]").view(np.int64),
+        dtype=np.int64,
+    )
+
+
+def _to_raw(values, uint8_t precision):
+    # Return the fixed-point raw values for the given float values, rounded as
+    # per `BaseDecimal` construction from a `float` (round half to even on the
+    # scaled value, with near-ties resolved by exact string formatting).
+    floats = np.ascontiguousarray(values, dtype=np.float64)
+    scaled = floats * float(10 ** precision)
+    if np.isnan(scaled).any():
+        raise ValueError("value was NaN")
+    if not (np.abs(scaled) < _RAW_MAX).all():
+        raise OverflowError(f"value out of range for precision {precision}")
+
+    rounded = np.rint(scaled)
+    raw = rounded.astype(np.int64)
+
+    ties = np.abs(np.abs(scaled - rounded) - 0.5) <= 1e-6 + np.abs(scaled) * 4.5e-16
+    for i in np.flatnonzero(ties):
+        # Too close to a tie to trust the scaled double, round exactly
+        # as per the string formatting of the `float`.
+        raw[i] = int(f"{floats[i]:.{precision}f}".replace(".", ""))
+
+    return raw
+
+
 cdef class QuoteTickDataWrangler:
     """
     Provides a means of building lists of Nautilus `QuoteTick` objects.
@@ -74,25 +146,66 @@ cdef class QuoteTickDataWrangler:
         list[QuoteTick]
 
         """
+        return self._build_ticks(self._prepare_data(data, default_volume), ts_init_delta)
+
+    def process_columns(
+        self,
+        data: pd.DataFrame,
+        default_volume: float=1_000_000.0,
+        ts_init_delta: int=0,
+    ):
+        """
+        Process the given tick dataset into columnar quote ticks.
+
+        As per `process`, however no `QuoteTick` objects are built here, the
+        ticks are only built from the raw columns as they are accessed.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The tick data to process.
+        default_volume : float
+            The default volume for each tick (if not provided).
+        ts_init_delta : int
+            The difference in nanoseconds between the data timestamps and the
+            `ts_init` value. Can be used to represent/simulate latency between
+            the data source and the Nautilus system. Cannot be negative.
+
+        Returns
+        -------
+        QuoteTickColumns
+
+        """
+        data = self._prepare_data(data, default_volume)
+
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+        ts_events = _index_to_nanos(data.index)
+        return QuoteTickColumns(
+            instrument_ids=[self.instrument.id],
+            price_precisions=np.array([price_prec], dtype=np.uint8),
+            size_precisions=np.array([size_prec], dtype=np.uint8),
+            instrument_index=np.zeros(len(ts_events), dtype=np.uint16),
+            bid=_to_raw(data["bid"], price_prec),
+            ask=_to_raw(data["ask"], price_prec),
+            bid_size=_to_raw(data["bid_size"], size_prec),
+            ask_size=_to_raw(data["ask_size"], size_prec),
+            ts_event=ts_events,
+            ts_init=ts_events + ts_init_delta,
+        )
+
+    def _prepare_data(self, data, default_volume):
         Condition.false(data.empty, "data.empty")
         Condition.not_none(default_volume, "default_volume")
 
-        as_utc_index(data)
+        data = as_utc_index(data)
 
         if "bid_size" not in data.columns:
             data["bid_size"] = float(default_volume)
         if "ask_size" not in data.columns:
             data["ask_size"] = float(default_volume)
 
-        cdef int64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.int64)  # noqa
-        cdef int64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.int64)  # noqa
-
-        return list(map(
-            self._build_tick,
-            data.values,
-            ts_events,
-            ts_inits,
-        ))
+        return data
 
     def process_bar_data(
         self,
@@ -108,6 +221,10 @@ cdef class QuoteTickDataWrangler:
         Expects columns ['open', 'high', 'low', 'close', 'volume'] with 'timestamp' index.
         Note: The 'volume' column is optional, will then use the `default_volume`.
 
+        Each bar is synthesized into four ticks (open, high, low, close) at
+        offsets of -300ms, -200ms, -100ms and 0ms from the bar timestamp, each
+        with a quarter of the bars volume.
+
         Parameters
         ----------
         bid_data : pd.DataFrame
@@ -124,12 +241,79 @@ cdef class QuoteTickDataWrangler:
             The random seed for shuffling order of high and low ticks from bar
             data. If random_seed is ``None`` then won't shuffle.
 
+        Returns
+        -------
+        list[QuoteTick]
+
+        """
+        cdef list ticks = []
+        for chunk in self.process_bar_data_chunks(
+            bid_data=bid_data,
+            ask_data=ask_data,
+            default_volume=default_volume,
+            ts_init_delta=ts_init_delta,
+            random_seed=random_seed,
+            chunk_size=0,
+        ):
+            ticks.extend(chunk)
+
+        return ticks
+
+    def process_bar_data_chunks(
+        self,
+        bid_data: pd.DataFrame,
+        ask_data: pd.DataFrame,
+        default_volume: float=1_000_000.0,
+        ts_init_delta: int=0,
+        random_seed=None,
+        int chunk_size=100_000,
+    ):
+        """
+        Process the given bar datasets into Nautilus `QuoteTick` objects,
+        yielding lists of ticks for `chunk_size` bars at a time.
+
+        The concatenated chunks are identical to the output of
+        `process_bar_data` for the same arguments (including `random_seed`),
+        only the ticks for a single chunk are held in memory at once. If bars
+        are closer together than the tick offsets, the ticks of a chunk which
+        are later than the next chunks earliest tick are carried over and
+        yielded with the next chunk (so chunk lengths may vary).
+
+        Parameters
+        ----------
+        bid_data : pd.DataFrame
+            The bid bar data.
+        ask_data : pd.DataFrame
+            The ask bar data.
+        default_volume : float
+            The volume per tick if not available from the data.
+        ts_init_delta : int
+            The difference in nanoseconds between the data timestamps and the
+            `ts_init` value. Can be used to represent/simulate latency between
+            the data source and the Nautilus system.
+        random_seed : int, optional
+            The random seed for shuffling order of high and low ticks from bar
+            data. If random_seed is ``None`` then won't shuffle.
+        chunk_size : int
+            The maximum number of bars per yielded chunk (four ticks per bar).
+            If zero then all bars are yielded in a single chunk.
+
+        Yields
+        ------
+        list[QuoteTick]
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is negative.
+
         """
         Condition.not_none(bid_data, "bid_data")
         Condition.not_none(ask_data, "ask_data")
         Condition.false(bid_data.empty, "bid_data.empty")
         Condition.false(ask_data.empty, "ask_data.empty")
         Condition.not_none(default_volume, "default_volume")
+        Condition.not_negative_int(chunk_size, "chunk_size")
         if random_seed is not None:
             Condition.type(random_seed, int, "random_seed")
 
@@ -137,89 +321,119 @@ cdef class QuoteTickDataWrangler:
         bid_data = as_utc_index(bid_data)
         ask_data = as_utc_index(ask_data)
 
-        if "volume" not in bid_data:
-            bid_data["volume"] = float(default_volume * 4)
-
-        if "volume" not in ask_data:
-            ask_data["volume"] = float(default_volume * 4)
-
-        cdef dict data_open = {
-            "bid": bid_data["open"],
-            "ask": ask_data["open"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        cdef dict data_high = {
-            "bid": bid_data["high"],
-            "ask": ask_data["high"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        cdef dict data_low = {
-            "bid": bid_data["low"],
-            "ask": ask_data["low"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        cdef dict data_close = {
-            "bid": bid_data["close"],
-            "ask": ask_data["close"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        df_ticks_o = pd.DataFrame(data=data_open)
-        df_ticks_h = pd.DataFrame(data=data_high)
-        df_ticks_l = pd.DataFrame(data=data_low)
-        df_ticks_c = pd.DataFrame(data=data_close)
-
-        # Latency offsets
-        df_ticks_o.index = df_ticks_o.index.shift(periods=-300, freq="ms")
-        df_ticks_h.index = df_ticks_h.index.shift(periods=-200, freq="ms")
-        df_ticks_l.index = df_ticks_l.index.shift(periods=-100, freq="ms")
-
-        # Merge tick data
-        df_ticks_final = pd.concat([df_ticks_o, df_ticks_h, df_ticks_l, df_ticks_c])
-        df_ticks_final.sort_index(axis=0, kind="mergesort", inplace=True)
-
-        cdef int i
-        # Randomly shift high low prices
-        if random_seed is not None:
-            random.seed(random_seed)
-            for i in range(0, len(df_ticks_o), 4):
-                if random.getrandbits(1):
-                    high = df_ticks_h.iloc[i]
-                    low = df_ticks_l.iloc[i]
-                    df_ticks_final.iloc[i + 1] = low
-                    df_ticks_final.iloc[i + 2] = high
-
-        cdef int64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in df_ticks_final.index], dtype=np.int64)  # noqa
-        cdef int64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.int64)  # noqa
-
-        return list(map(
-            self._build_tick,
-            df_ticks_final.values,
-            ts_events,
-            ts_inits,
-        ))
-
-    # cpdef method for Python wrap() (called with map)
-    cpdef QuoteTick _build_tick(self, double[:] values, int64_t ts_event, int64_t ts_init):
-        # Build a quote tick from the given values. The function expects the values to
-        # be an ndarray with 4 elements [bid, ask, bid_size, ask_size] of type double.
-        return QuoteTick(
-            instrument_id=self.instrument.id,
-            bid=Price(values[0], self.instrument.price_precision),
-            ask=Price(values[1], self.instrument.price_precision),
-            bid_size=Quantity(values[2], self.instrument.size_precision),
-            ask_size=Quantity(values[3], self.instrument.size_precision),
-            ts_event=ts_event,
-            ts_init=ts_init,
+        if not bid_data.index.equals(ask_data.index):
+            bid_data, ask_data = bid_data.align(ask_data, join="outer", axis=0)
+
+        price_prec = self.instrument.price_precision
+        size_prec = self.instrument.size_precision
+
+        # Bar fields are laid out per row as [open, high, low, close] so that
+        # flattening a block of rows interleaves the synthesized ticks in order
+        bar_ts = _index_to_nanos(bid_data.index)
+        bar_count = len(bar_ts)
+        bid_raw = np.empty((bar_count, 4), dtype=np.int64)
+        ask_raw = np.empty((bar_count, 4), dtype=np.int64)
+        for col, field in enumerate(("open", "high", "low", "close")):
+            bid_raw[:, col] = _to_raw(bid_data[field], price_prec)
+            ask_raw[:, col] = _to_raw(ask_data[field], price_prec)
+
+        bid_volume = bid_data["volume"] if "volume" in bid_data else float(default_volume * 4)
+        ask_volume = ask_data["volume"] if "volume" in ask_data else float(default_volume * 4)
+        bid_sizes = _to_raw(np.broadcast_to(bid_volume, (bar_count,)) / 4, size_prec)
+        ask_sizes = _to_raw(np.broadcast_to(ask_volume, (bar_count,)) / 4, size_prec)
+
+        # A single generator consumed chunk by chunk keeps the shuffle
+        # independent of the chunking
+        rng = np.random.default_rng(random_seed) if random_seed is not None else None
+
+        if chunk_size == 0:
+            chunk_size = bar_count
+
+        # The earliest tick timestamp of the bars from each index onwards. Ticks
+        # up to the next chunks earliest tick are final, any later ticks are
+        # carried over to be merged with the next chunk.
+        next_ts_min = np.minimum.accumulate(bar_ts[::-1])[::-1] + _BAR_TICK_OFFSETS_NS.min()
+        carry = None
+
+        for start in range(0, bar_count, chunk_size):
+            stop = min(start + chunk_size, bar_count)
+            arrays = _bar_tick_arrays(
+                bar_ts[start:stop],
+                bid_raw[start:stop],
+                ask_raw[start:stop],
+                bid_sizes[start:stop],
+                ask_sizes[start:stop],
+                rng,
+            )
+            if carry is not None:
+                arrays = [np.concatenate(pair) for pair in zip(carry, arrays)]
+            ts_events, bids, asks, bid_sizes_chunk, ask_sizes_chunk = _sort_by_ts(arrays)
+
+            if stop < bar_count:
+                split = np.searchsorted(ts_events, next_ts_min[stop], side="right")
+            else:
+                split = len(ts_events)
+            carry = (
+                ts_events[split:],
+                bids[split:],
+                asks[split:],
+                bid_sizes_chunk[split:],
+                ask_sizes_chunk[split:],
+            )
+            if split == 0:
+                continue  # All ticks carried over
+
+            yield self._build_ticks_from_raw(
+                np.ascontiguousarray(ts_events[:split]),
+                np.ascontiguousarray(bids[:split]),
+                np.ascontiguousarray(asks[:split]),
+                np.ascontiguousarray(bid_sizes_chunk[:split]),
+                np.ascontiguousarray(ask_sizes_chunk[:split]),
+                ts_init_delta,
+            )
+
+    cdef list _build_ticks(self, data, int64_t ts_init_delta):
+        # Build quote ticks from the given frame with columns
+        # ['bid', 'ask', 'bid_size', 'ask_size'] and a UTC 'timestamp' index.
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+        return self._build_ticks_from_raw(
+            _index_to_nanos(data.index),
+            _to_raw(data["bid"], price_prec),
+            _to_raw(data["ask"], price_prec),
+            _to_raw(data["bid_size"], size_prec),
+            _to_raw(data["ask_size"], size_prec),
+            ts_init_delta,
         )
 
+    cdef list _build_ticks_from_raw(
+        self,
+        int64_t[:] ts_events,
+        int64_t[:] bids,
+        int64_t[:] asks,
+        int64_t[:] bid_sizes,
+        int64_t[:] ask_sizes,
+        int64_t ts_init_delta,
+    ):
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+        cdef InstrumentId instrument_id = self.instrument.id
+        cdef int64_t count = ts_events.shape[0]
+        cdef list ticks = [None] * count
+        cdef int64_t i
+        for i in range(count):
+            ticks[i] = QuoteTick(
+                instrument_id,
+                Price.from_raw_c(bids[i], price_prec),
+                Price.from_raw_c(asks[i], price_prec),
+                Quantity.from_raw_c(bid_sizes[i], size_prec),
+                Quantity.from_raw_c(ask_sizes[i], size_prec),
+                ts_events[i],
+                ts_events[i] + ts_init_delta,
+            )
+
+        return ticks
+
 
 cdef class TradeTickDataWrangler:
     """
@@ -258,41 +472,98 @@ cdef class TradeTickDataWrangler:
 
         data = as_utc_index(data)
 
-        processed = pd.DataFrame(index=data.index)
-        processed["price"] = data["price"].apply(lambda x: f'{x:.{self.instrument.price_precision}f}')
-        processed["quantity"] = data["quantity"].apply(lambda x: f'{x:.{self.instrument.size_precision}f}')
-        processed["aggressor_side"] = self._create_side_if_not_exist(data)
-        processed["trade_id"] = data["trade_id"].apply(str)
+        return self._build_ticks(data, ts_init_delta)
 
-        cdef int64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.int64)  # noqa
-        cdef int64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.int64)  # noqa
+    def process_columns(self, data: pd.DataFrame, ts_init_delta: int=0):
+        """
+        Process the given trade tick dataset into columnar trade ticks.
 
-        return list(map(
-            self._build_tick,
-            processed.values,
-            ts_events,
-            ts_inits,
-        ))
+        As per `process`, however no `TradeTick` objects are built here, the
+        ticks are only built from the raw columns as they are accessed.
 
-    def _create_side_if_not_exist(self, data):
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data to process.
+        ts_init_delta : int
+            The difference in nanoseconds between the data timestamps and the
+            `ts_init` value. Can be used to represent/simulate latency between
+            the data source and the Nautilus system.
+
+        Returns
+        -------
+        TradeTickColumns
+
+        Raises
+        ------
+        ValueError
+            If `data` is empty.
+
+        """
+        Condition.not_none(data, "data")
+        Condition.false(data.empty, "data.empty")
+
+        data = as_utc_index(data)
+
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+        ts_events = _index_to_nanos(data.index)
+        return TradeTickColumns(
+            instrument_ids=[self.instrument.id],
+            price_precisions=np.array([price_prec], dtype=np.uint8),
+            size_precisions=np.array([size_prec], dtype=np.uint8),
+            instrument_index=np.zeros(len(ts_events), dtype=np.uint16),
+            price=_to_raw(data["price"], price_prec),
+            size=_to_raw(data["quantity"], size_prec),
+            aggressor_side=self._create_aggressor_sides(data),
+            trade_ids=data["trade_id"].astype(str).tolist(),
+            ts_event=ts_events,
+            ts_init=ts_events + ts_init_delta,
+        )
+
+    def _create_aggressor_sides(self, data):
         if "side" in data.columns:
-            return data["side"]
+            # Parse each distinct side once, then map back over the codes
+            codes, uniques = pd.factorize(data["side"])
+            parsed = np.asarray(
+                [AggressorSideParser.from_str(str(side)) for side in uniques],
+                dtype=np.uint8,
+            )
+            return np.ascontiguousarray(parsed[codes], dtype=np.uint8)
         else:
-            return data["buyer_maker"].apply(lambda x: "SELL" if x is True else "BUY")
-
-    # cpdef method for Python wrap() (called with map)
-    cpdef TradeTick _build_tick(self, str[:] values, int64_t ts_event, int64_t ts_init):
-        # Build a quote tick from the given values. The function expects the values to
-        # be an ndarray with 4 elements [bid, ask, bid_size, ask_size] of type double.
-        return TradeTick(
-            instrument_id=self.instrument.id,
-            price=Price(values[0], self.instrument.price_precision),
-            size=Quantity(values[1], self.instrument.size_precision),
-            aggressor_side=AggressorSideParser.from_str(values[2]),
-            trade_id=values[3],
-            ts_event=ts_event,
-            ts_init=ts_init,
-        )
+            return np.where(
+                data["buyer_maker"].to_numpy() == True,  # noqa (explicit bool comparison)
+                AggressorSide.SELL,
+                AggressorSide.BUY,
+            ).astype(np.uint8)
+
+    cdef list _build_ticks(self, data, int64_t ts_init_delta):
+        # Build trade ticks from the given frame with columns
+        # ['price', 'quantity', 'trade_id'] and either 'side' or 'buyer_maker'.
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+        cdef int64_t[:] ts_events = _index_to_nanos(data.index)
+        cdef int64_t[:] prices = _to_raw(data["price"], price_prec)
+        cdef int64_t[:] sizes = _to_raw(data["quantity"], size_prec)
+        cdef uint8_t[:] sides = self._create_aggressor_sides(data)
+        cdef list trade_ids = data["trade_id"].astype(str).tolist()
+
+        cdef InstrumentId instrument_id = self.instrument.id
+        cdef int64_t count = ts_events.shape[0]
+        cdef list ticks = [None] * count
+        cdef int64_t i
+        for i in range(count):
+            ticks[i] = TradeTick(
+                instrument_id,
+                Price.from_raw_c(prices[i], price_prec),
+                Quantity.from_raw_c(sizes[i], size_prec),
+                <AggressorSide>sides[i],
+                trade_ids[i],
+                ts_events[i],
+                ts_events[i] + ts_init_delta,
+            )
+
+        return ticks
 
 
 cdef class BarDataWrangler:
@@ -360,27 +631,34 @@ cdef class BarDataWrangler:
         if "volume" not in data:
             data["volume"] = float(default_volume)
 
-        cdef int64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.int64)  # noqa
-        cdef int64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.int64)  # noqa
-
-        return list(map(
-            self._build_bar,
-            data.values,
-            ts_events,
-            ts_inits
-        ))
-
-    # cpdef method for Python wrap() (called with map)
-    cpdef Bar _build_bar(self, double[:] values, int64_t ts_event, int64_t ts_init):
-        # Build a bar from the given index and values. The function expects the
-        # values to be an ndarray with 5 elements [open, high, low, close, volume].
-        return Bar(
-            bar_type=self.bar_type,
-            open=Price(values[0], self.instrument.price_precision),
-            high=Price(values[1], self.instrument.price_precision),
-            low=Price(values[2], self.instrument.price_precision),
-            close=Price(values[3], self.instrument.price_precision),
-            volume=Quantity(values[4], self.instrument.size_precision),
-            ts_event=ts_event,
-            ts_init=ts_init,
-        )
+        return self._build_bars(data, ts_init_delta)
+
+    cdef list _build_bars(self, data, int64_t ts_init_delta):
+        # Build bars from the given frame with columns
+        # ['open', 'high', 'low', 'close', 'volume'] and a UTC 'timestamp' index.
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+        cdef int64_t[:] ts_events = _index_to_nanos(data.index)
+        cdef int64_t[:] opens = _to_raw(data["open"], price_prec)
+        cdef int64_t[:] highs = _to_raw(data["high"], price_prec)
+        cdef int64_t[:] lows = _to_raw(data["low"], price_prec)
+        cdef int64_t[:] closes = _to_raw(data["close"], price_prec)
+        cdef int64_t[:] volumes = _to_raw(data["volume"], size_prec)
+
+        cdef BarType bar_type = self.bar_type
+        cdef int64_t count = ts_events.shape[0]
+        cdef list bars = [None] * count
+        cdef int64_t i
+        for i in range(count):
+            bars[i] = Bar(
+                bar_type,
+                Price.from_raw_c(opens[i], price_prec),
+                Price.from_raw_c(highs[i], price_prec),
+                Price.from_raw_c(lows[i], price_prec),
+                Price.from_raw_c(closes[i], price_prec),
+                Quantity.from_raw_c(volumes[i], size_prec),
+                ts_events[i],
+                ts_events[i] + ts_init_delta,
+            )
+
+        return bars
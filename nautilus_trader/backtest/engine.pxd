@@ -13,12 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
 from cpython.datetime cimport datetime
+from libc.stdint cimport int32_t
 from libc.stdint cimport int64_t
 
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.clock cimport TestClockScheduler
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.uuid cimport UUIDFactory
@@ -38,6 +41,7 @@ cdef class BacktestEngine:
     cdef object _config
     cdef Clock _clock
     cdef Clock _test_clock
+    cdef TestClockScheduler _clock_scheduler
     cdef UUIDFactory _uuid_factory
     cdef MessageBus _msgbus
     cdef Cache _cache
@@ -51,6 +55,12 @@ cdef class BacktestEngine:
 
     cdef dict _exchanges
     cdef list _data
+    cdef list _data_streams
+    cdef list _data_columns
+    cdef np.ndarray _data_ts
+    cdef int32_t[::1] _data_sources
+    cdef int64_t[::1] _data_rows
+    cdef bint _data_indexed
     cdef int64_t _data_len
     cdef int64_t _index
 
@@ -83,5 +93,8 @@ cdef class BacktestEngine:
     cdef readonly datetime backtest_end
     """The last backtest run time range end (if run).\n\n:returns: `datetime` or ``None``"""
 
+    cdef void _add_data_stream(self, list data) except *
+    cdef void _merge_data_streams(self) except *
+    cdef void _index_data(self) except *
     cdef Data _next(self)
     cdef void _advance_time(self, int64_t now_ns) except *
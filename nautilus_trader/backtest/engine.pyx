@@ -13,14 +13,18 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
 import pickle
 import socket
 from decimal import Decimal
 from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+cimport numpy as np
 from cpython.datetime cimport datetime
+from libc.stdint cimport int32_t
 from libc.stdint cimport int64_t
 
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
@@ -34,6 +38,7 @@ from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.actor cimport Actor
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.clock cimport TestClock
+from nautilus_trader.common.clock cimport TestClockScheduler
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.logging cimport LogLevelParser
@@ -53,6 +58,7 @@ from nautilus_trader.model.c_enums.oms_type cimport OMSType
 from nautilus_trader.model.c_enums.venue_type cimport VenueType
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.base cimport GenericData
+from nautilus_trader.model.data.columnar cimport TickColumns
 from nautilus_trader.model.data.tick cimport Tick
 from nautilus_trader.model.identifiers cimport AccountId
 from nautilus_trader.model.identifiers cimport ClientId
@@ -96,6 +102,7 @@ cdef class BacktestEngine:
         self._clock = LiveClock()
         created_time = self._clock.utc_now()
         self._test_clock = TestClock()
+        self._clock_scheduler = TestClockScheduler()
         self._uuid_factory = UUIDFactory()
 
         self._config = config
@@ -108,6 +115,12 @@ cdef class BacktestEngine:
 
         # Data
         self._data = []
+        self._data_streams = []
+        self._data_columns = []
+        self._data_ts = np.empty(0, dtype=np.int64)
+        self._data_sources = None
+        self._data_rows = None
+        self._data_indexed = True
         self._data_len = 0
         self._index = 0
 
@@ -184,6 +197,7 @@ cdef class BacktestEngine:
             cache=self.cache,
             clock=self._test_clock,
             logger=self._test_logger,
+            config=config.portfolio,
         )
         # Set external facade
         self.portfolio = self._portfolio
@@ -280,7 +294,7 @@ cdef class BacktestEngine:
         self._add_data_client_if_not_exists(client_id)
 
         # Add data
-        self._data = sorted(self._data + data, key=lambda x: x.ts_init)
+        self._add_data_stream(data)
 
         self._log.info(
             f"Added {len(data)} {type(data[0].data).__name__} "
@@ -337,7 +351,7 @@ cdef class BacktestEngine:
         self._add_market_data_client_if_not_exists(first.instrument_id.venue)
 
         # Add data
-        self._data = sorted(self._data + data, key=lambda x: x.ts_init)
+        self._add_data_stream(data)
 
         self._log.info(
             f"Added {len(data):,} {first.instrument_id} "
@@ -372,7 +386,7 @@ cdef class BacktestEngine:
         self._add_market_data_client_if_not_exists(first.instrument_id.venue)
 
         # Add data
-        self._data = sorted(self._data + data, key=lambda x: x.ts_init)
+        self._add_data_stream(data)
 
         self._log.info(
             f"Added {len(data):,} {first.instrument_id} "
@@ -407,13 +421,57 @@ cdef class BacktestEngine:
         self._add_market_data_client_if_not_exists(first.instrument_id.venue)
 
         # Add data
-        self._data = sorted(self._data + data, key=lambda x: x.ts_init)
+        self._add_data_stream(data)
 
         self._log.info(
             f"Added {len(data):,} {first.instrument_id} "
             f"{type(first).__name__} element{'' if len(data) == 1 else 's'}.",
         )
 
+    def add_tick_columns(self, TickColumns data) -> None:
+        """
+        Add the columnar tick data to the backtest engine.
+
+        The tick objects are only built from the columns on demand as the
+        backtest runs, which greatly reduces memory usage for long runs.
+
+        Parameters
+        ----------
+        data : TickColumns
+            The columnar tick data to add.
+
+        Raises
+        ------
+        ValueError
+            If `data` is empty.
+        ValueError
+            If any `instrument_id` is not found in the cache.
+
+        """
+        Condition.not_none(data, "data")
+        Condition.not_empty(data, "data")
+
+        cdef list instrument_ids = data.instrument_ids()
+        cdef set cached_instrument_ids = set(self._cache.instrument_ids())
+        for instrument_id in instrument_ids:
+            Condition.true(
+                instrument_id in cached_instrument_ids,
+                "Instrument for given data not found in the cache. "
+                "Please call `add_instrument()` before adding related data.",
+            )
+            # Check client has been registered
+            self._add_market_data_client_if_not_exists(instrument_id.venue)
+
+        # Add data
+        self._data_columns.append(data)
+        self._data_indexed = False
+
+        self._log.info(
+            f"Added {len(data):,} {type(data).__name__} "
+            f"element{'' if len(data) == 1 else 's'} "
+            f"for {len(instrument_ids)} instrument{'' if len(instrument_ids) == 1 else 's'}.",
+        )
+
     def add_bars(self, list data) -> None:
         """
         Add the built bar data objects to the backtest engines. Suitable for
@@ -454,7 +512,7 @@ cdef class BacktestEngine:
         self._add_market_data_client_if_not_exists(first.type.instrument_id.venue)
 
         # Add data
-        self._data = sorted(self._data + data, key=lambda x: x.ts_init)
+        self._add_data_stream(data)
 
         self._log.info(
             f"Added {len(data):,} {first.type} "
@@ -470,7 +528,19 @@ cdef class BacktestEngine:
         bytes
 
         """
-        return pickle.dumps(self._data)
+        self._merge_data_streams()
+
+        if not self._data_columns:
+            return pickle.dumps(self._data)
+
+        # Build any columnar data into the stream
+        cdef list data = []
+        self._index = 0
+        while self._index < self._data_len:
+            data.append(self._next())
+        self._index = 0
+
+        return pickle.dumps(data)
 
     def load_pickled_data(self, bytes data) -> None:
         """
@@ -491,6 +561,9 @@ cdef class BacktestEngine:
         Condition.not_none(data, "data")
 
         self._data = pickle.loads(data)
+        self._data_streams.clear()
+        self._data_columns.clear()
+        self._data_indexed = False
 
         self._log.info(
             f"Loaded {len(self._data):,} data "
@@ -698,6 +771,12 @@ cdef class BacktestEngine:
         Clear the engines internal data stream.
         """
         self._data.clear()
+        self._data_streams.clear()
+        self._data_columns.clear()
+        self._data_ts = np.empty(0, dtype=np.int64)
+        self._data_sources = None
+        self._data_rows = None
+        self._data_indexed = True
         self._data_len = 0
         self._index = 0
 
@@ -755,6 +834,58 @@ cdef class BacktestEngine:
         self._run(start, end, run_config_id)
         self._end()
 
+    def run_windows(
+        self,
+        list windows,
+        run_config_id: str=None,
+    ) -> None:
+        """
+        Run a backtest over several time windows back-to-back.
+
+        The windows are run in order over the already loaded data stream, as one
+        continuous backtest run (data between the windows is skipped). At the end
+        of the last window the trader and strategies will be stopped, then
+        post-run analysis performed.
+
+        To run independent backtests over several windows of the same data, call
+        `reset()` followed by `run(start, end)` for each window instead, the
+        loaded data stream is retained between runs.
+
+        Parameters
+        ----------
+        windows : list[tuple[Union[datetime, str, int], Union[datetime, str, int]]]
+            The (start, end) datetime (UTC) windows to run.
+        run_config_id : str, optional
+            The tokenized `BacktestRunConfig` ID.
+
+        Raises
+        ------
+        ValueError
+            If `windows` is empty.
+        ValueError
+            If any window `start` is >= its `end` datetime.
+        ValueError
+            If the `windows` are not in ascending order or are overlapping.
+
+        """
+        Condition.not_empty(windows, "windows")
+
+        cdef list windows_ns = []
+        cdef int64_t start_ns
+        cdef int64_t end_ns
+        cdef int64_t last_end_ns = -1
+        for start, end in windows:
+            start_ns = int(pd.to_datetime(start, utc=True).to_datetime64())
+            end_ns = int(pd.to_datetime(end, utc=True).to_datetime64())
+            Condition.true(start_ns < end_ns, "window start was >= end")
+            Condition.true(start_ns > last_end_ns, "windows were not ascending and non-overlapping")
+            windows_ns.append((start_ns, end_ns))
+            last_end_ns = end_ns
+
+        for start_ns, end_ns in windows_ns:
+            self._run(start_ns, end_ns, run_config_id)
+        self._end()
+
     def run_streaming(
         self,
         start: Union[datetime, str, int]=None,
@@ -846,32 +977,36 @@ cdef class BacktestEngine:
         end: Union[datetime, str, int]=None,
         run_config_id: str=None,
     ):
+        # Merge any data streams added since the last run
+        self._merge_data_streams()
+        Condition.true(self._data_len > 0, "no data has been added")
+
         cdef int64_t start_ns
         cdef int64_t end_ns
         # Time range check and set
         if start is None:
             # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+            start_ns = self._data_ts[0]
             start = unix_nanos_to_dt(start_ns)
         else:
             start = pd.to_datetime(start, utc=True)
             start_ns = int(start.to_datetime64())
         if end is None:
             # Set `end` to end of data
-            end_ns = self._data[-1].ts_init
+            end_ns = self._data_ts[self._data_len - 1]
             end = unix_nanos_to_dt(end_ns)
         else:
             end = pd.to_datetime(end, utc=True)
             end_ns = int(end.to_datetime64())
         Condition.true(start_ns < end_ns, "start was >= end")
-        Condition.not_empty(self._data, "data")
 
-        # Set clocks
+        # Set clocks (actor and strategy clocks are advanced together)
         self._test_clock.set_time(start_ns)
         for actor in self.trader.actors_c():
-            actor.clock.set_time(start_ns)
+            self._clock_scheduler.register_clock(actor.clock)
         for strategy in self.trader.strategies_c():
-            strategy.clock.set_time(start_ns)
+            self._clock_scheduler.register_clock(strategy.clock)
+        self._clock_scheduler.set_time(start_ns)
 
         cdef SimulatedExchange exchange
         if self.iteration == 0:
@@ -891,21 +1026,14 @@ cdef class BacktestEngine:
 
         self._log_run(start, end)
 
-        # Set data stream length
-        self._data_len = len(self._data)
-
-        # Set starting index
-        cdef int i
-        for i in range(self._data_len):
-            if start_ns <= self._data[i].ts_init:
-                self._index = i
-                break
+        # Set starting and ending index (binary search on `ts_init`)
+        self._index = self._data_ts.searchsorted(start_ns, side="left")
+        cdef int64_t end_index = self._data_ts.searchsorted(end_ns, side="right")
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
-        cdef Data data = self._next()
-        while data is not None:
-            if data.ts_init > end_ns:
-                break
+        cdef Data data
+        while self._index < end_index:
+            data = self._next()
             self._advance_time(data.ts_init)
             self._data_engine.process(data)
             if isinstance(data, OrderBookData):
@@ -913,9 +1041,10 @@ cdef class BacktestEngine:
             elif isinstance(data, Tick):
                 self._exchanges[data.instrument_id.venue].process_tick(data)
             for exchange in self._exchanges.values():
-                exchange.process(data.ts_init)
+                # Only process exchanges with pending commands or due work
+                if exchange.next_wakeup_ns() <= data.ts_init:
+                    exchange.process(data.ts_init)
             self.iteration += 1
-            data = self._next()
         # ---------------------------------------------------------------------#
         # Process remaining messages
         for exchange in self._exchanges.values():
@@ -933,23 +1062,71 @@ cdef class BacktestEngine:
 
         self._log_post_run()
 
+    cdef void _add_data_stream(self, list data) except *:
+        # Each stream is sorted on its own (timsort is linear for data which is
+        # already sorted), the k-way merge is deferred until the next run.
+        self._data_streams.append(sorted(data, key=lambda x: x.ts_init))
+
+    cdef void _merge_data_streams(self) except *:
+        if self._data_streams:
+            # The existing data stream is merged first so that, for equal `ts_init`,
+            # previously added data retains its priority (as with a stable sort).
+            self._data = list(
+                heapq.merge(self._data, *self._data_streams, key=lambda x: x.ts_init),
+            )
+            self._data_streams.clear()
+            self._data_indexed = False
+
+        if not self._data_indexed:
+            self._index_data()
+
+    cdef void _index_data(self) except *:
+        cdef np.ndarray data_ts = np.fromiter(
+            (x.ts_init for x in self._data),
+            dtype=np.int64,
+            count=len(self._data),
+        )
+
+        if not self._data_columns:
+            self._data_ts = data_ts
+            self._data_sources = None
+            self._data_rows = None
+        else:
+            # Source 0 is the object data stream, sources 1..n are the tick
+            # columns. A stable sort retains the order in which data was added
+            # for equal `ts_init`.
+            ts_arrays = [data_ts] + [c.ts_init for c in self._data_columns]
+            all_ts = np.concatenate(ts_arrays)
+            order = np.argsort(all_ts, kind="stable")
+            self._data_ts = all_ts[order]
+            self._data_sources = np.concatenate(
+                [np.full(len(a), i, dtype=np.int32) for i, a in enumerate(ts_arrays)],
+            )[order]
+            self._data_rows = np.concatenate(
+                [np.arange(len(a), dtype=np.int64) for a in ts_arrays],
+            )[order]
+
+        self._data_len = len(self._data_ts)
+        self._data_indexed = True
+
     cdef Data _next(self):
         cdef int64_t cursor = self._index
         self._index += 1
-        if cursor < self._data_len:
+        if cursor >= self._data_len:
+            return None
+        if self._data_sources is None:
             return self._data[cursor]
 
+        cdef int32_t source = self._data_sources[cursor]
+        cdef int64_t row = self._data_rows[cursor]
+        if source == 0:
+            return self._data[row]
+        # Tick objects are only built from the columns on demand
+        return (<TickColumns>self._data_columns[source - 1]).get_c(row)
+
     cdef void _advance_time(self, int64_t now_ns) except *:
-        cdef list time_events = []  # type: list[TimeEventHandler]
-        cdef:
-            Actor actor
-            TradingStrategy strategy
-            cdef TimeEventHandler event_handler
-        for actor in self.trader.actors_c():
-            time_events += actor.clock.advance_time(now_ns)
-        for strategy in self.trader.strategies_c():
-            time_events += strategy.clock.advance_time(now_ns)
-        for event_handler in sorted(time_events):
+        cdef TimeEventHandler event_handler
+        for event_handler in self._clock_scheduler.advance_time(now_ns):
             self._test_clock.set_time(event_handler.event.ts_event)
             event_handler.handle()
         self._test_clock.set_time(now_ns)
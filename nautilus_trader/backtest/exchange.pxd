@@ -17,6 +17,7 @@ from libc.stdint cimport int64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.backtest.execution_client cimport BacktestExecClient
+from nautilus_trader.backtest.matching cimport OrderPriceIndex
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.cache.cache cimport Cache
@@ -56,6 +57,17 @@ from nautilus_trader.model.orders.stop_market cimport StopMarketOrder
 from nautilus_trader.model.position cimport Position
 
 
+cdef class InflightQueue:
+    cdef list _heap
+    cdef int64_t _seq
+
+    cpdef void push(self, int64_t ts, message) except *
+    cpdef object pop(self)
+    cpdef bint is_due(self, int64_t now_ns) except *
+    cpdef int64_t next_ts(self) except *
+    cpdef void clear(self) except *
+
+
 cdef class SimulatedExchange:
     cdef Clock _clock
     cdef UUIDFactory _uuid_factory
@@ -107,14 +119,17 @@ cdef class SimulatedExchange:
     cdef dict _order_index
     cdef dict _orders_bid
     cdef dict _orders_ask
+    cdef dict _stops_bid
+    cdef dict _stops_ask
+    cdef dict _expiries
+    cdef int64_t _expiry_seq
     cdef dict _oto_orders
 
     cdef dict _symbol_pos_count
     cdef dict _symbol_ord_count
     cdef int _executions_count
     cdef Queue _message_queue
-    cdef list _inflight_queue
-    cdef dict _inflight_counter
+    cdef InflightQueue _inflight_queue
 
     cpdef Price best_bid_price(self, InstrumentId instrument_id)
     cpdef Price best_ask_price(self, InstrumentId instrument_id)
@@ -123,6 +138,7 @@ cdef class SimulatedExchange:
     cpdef list get_working_orders(self, InstrumentId instrument_id=*)
     cpdef list get_working_bid_orders(self, InstrumentId instrument_id=*)
     cpdef list get_working_ask_orders(self, InstrumentId instrument_id=*)
+    cdef list _get_indexed_orders(self, dict orders, dict stops, InstrumentId instrument_id)
     cpdef Account get_account(self)
 
     cpdef void register_client(self, BacktestExecClient client) except *
@@ -130,11 +146,12 @@ cdef class SimulatedExchange:
     cpdef void set_latency_model(self, LatencyModel latency_model) except *
     cpdef void initialize_account(self) except *
     cpdef void adjust_account(self, Money adjustment) except *
-    cdef tuple generate_inflight_command(self, TradingCommand command)
+    cdef int64_t generate_inflight_ts(self, TradingCommand command) except *
     cpdef void send(self, TradingCommand command) except *
     cpdef void process_order_book(self, OrderBookData data) except *
     cpdef void process_tick(self, Tick tick) except *
     cpdef void process_bar(self, Bar bar) except *
+    cpdef int64_t next_wakeup_ns(self) except *
     cpdef void process(self, int64_t now_ns) except *
     cpdef void reset(self) except *
 
@@ -162,8 +179,11 @@ cdef class SimulatedExchange:
 
     cdef void _add_order(self, PassiveOrder order) except *
     cdef void _delete_order(self, Order order) except *
+    cdef void _index_order(self, PassiveOrder order) except *
+    cdef bint _unindex_order(self, PassiveOrder order) except *
+    cdef void _reindex_order(self, PassiveOrder order) except *
     cdef void _iterate_matching_engine(self, InstrumentId instrument_id, int64_t timestamp_ns) except *
-    cdef void _iterate_side(self, list orders, int64_t timestamp_ns) except *
+    cdef void _iterate_side(self, OrderPriceIndex index, Price price) except *
     cdef void _match_order(self, PassiveOrder order) except *
     cdef void _match_limit_order(self, LimitOrder order) except *
     cdef void _match_stop_market_order(self, StopMarketOrder order) except *
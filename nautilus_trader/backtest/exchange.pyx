@@ -14,15 +14,18 @@
 # -------------------------------------------------------------------------------------------------
 
 from decimal import Decimal
+from heapq import heappop
 from heapq import heappush
 from typing import Dict
 
 from libc.limits cimport INT_MAX
 from libc.limits cimport INT_MIN
+from libc.stdint cimport INT64_MAX
 from libc.stdint cimport int64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.backtest.execution_client cimport BacktestExecClient
+from nautilus_trader.backtest.matching cimport OrderPriceIndex
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.backtest.modules cimport SimulationModule
@@ -74,6 +77,92 @@ from nautilus_trader.model.orders.stop_market cimport StopMarketOrder
 from nautilus_trader.model.position cimport Position
 
 
+cdef class InflightQueue:
+    """
+    Provides a time ordered queue of messages in-flight to a simulated exchange.
+
+    Messages are released in order of arrival time, with messages arriving at
+    the same time released in the order they were sent (a monotonic sequence
+    number breaks ties).
+    """
+
+    def __init__(self):
+        self._heap = []  # type: list[tuple[int, int, object]]
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    cpdef void push(self, int64_t ts, message) except *:
+        """
+        Push the given message onto the queue to arrive at the given time.
+
+        Parameters
+        ----------
+        ts : int64
+            The UNIX timestamp (nanoseconds) when the message arrives.
+        message : object
+            The in-flight message.
+
+        """
+        heappush(self._heap, (ts, self._seq, message))
+        self._seq += 1
+
+    cpdef object pop(self):
+        """
+        Pop the next message to arrive from the queue.
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+
+        """
+        return heappop(self._heap)[2]
+
+    cpdef bint is_due(self, int64_t now_ns) except *:
+        """
+        Return a value indicating whether the next message has arrived by the
+        given time.
+
+        Parameters
+        ----------
+        now_ns : int64
+            The UNIX timestamp (nanoseconds) now.
+
+        Returns
+        -------
+        bool
+
+        """
+        return len(self._heap) > 0 and self._heap[0][0] <= now_ns
+
+    cpdef int64_t next_ts(self) except *:
+        """
+        Return the UNIX timestamp (nanoseconds) when the next message arrives.
+
+        Returns
+        -------
+        int64
+            INT64_MAX if the queue is empty.
+
+        """
+        if not self._heap:
+            return INT64_MAX
+        return self._heap[0][0]
+
+    cpdef void clear(self) except *:
+        """
+        Clear all messages from the queue.
+        """
+        self._heap.clear()
+        self._seq = 0
+
+
 cdef class SimulatedExchange:
     """
     Provides a simulated financial market exchange.
@@ -216,16 +305,19 @@ cdef class SimulatedExchange:
         self._last_bids = {}    # type: dict[InstrumentId, Price]
         self._last_asks = {}    # type: dict[InstrumentId, Price]
         self._order_index = {}  # type: dict[ClientOrderId, PassiveOrder]
-        self._orders_bid = {}   # type: dict[InstrumentId, list[PassiveOrder]]
-        self._orders_ask = {}   # type: dict[InstrumentId, list[PassiveOrder]]
+        self._orders_bid = {}   # type: dict[InstrumentId, OrderPriceIndex]
+        self._orders_ask = {}   # type: dict[InstrumentId, OrderPriceIndex]
+        self._stops_bid = {}    # type: dict[InstrumentId, OrderPriceIndex]
+        self._stops_ask = {}    # type: dict[InstrumentId, OrderPriceIndex]
+        self._expiries = {}     # type: dict[InstrumentId, list[tuple[int, int, PassiveOrder]]]
+        self._expiry_seq = 0
         self._oto_orders = {}   # type: dict[ClientOrderId]
 
         self._symbol_pos_count = {}  # type: dict[InstrumentId, int]
         self._symbol_ord_count = {}  # type: dict[InstrumentId, int]
         self._executions_count = 0
         self._message_queue = Queue()
-        self._inflight_queue = []
-        self._inflight_counter = {}
+        self._inflight_queue = InflightQueue()
 
     def __repr__(self) -> str:
         return (f"{type(self).__name__}("
@@ -361,14 +453,7 @@ cdef class SimulatedExchange:
         list[Passive]
 
         """
-        cdef list bids = []
-        if instrument_id is None:
-            for orders in self._orders_bid.values():
-                for o in orders:
-                    bids.append(o)
-            return bids
-        else:
-            return [o for o in self._orders_bid.get(instrument_id, [])]
+        return self._get_indexed_orders(self._orders_bid, self._stops_bid, instrument_id)
 
     cpdef list get_working_ask_orders(self, InstrumentId instrument_id=None):
         """
@@ -384,14 +469,21 @@ cdef class SimulatedExchange:
         list[Passive]
 
         """
-        cdef list asks = []
+        return self._get_indexed_orders(self._orders_ask, self._stops_ask, instrument_id)
+
+    cdef list _get_indexed_orders(self, dict orders, dict stops, InstrumentId instrument_id):
+        cdef list indexes
         if instrument_id is None:
-            for orders in self._orders_ask.values():
-                for o in orders:
-                    asks.append(o)
-            return asks
+            indexes = list(orders.values()) + list(stops.values())
         else:
-            return [o for o in self._orders_ask.get(instrument_id, [])]
+            indexes = [orders.get(instrument_id), stops.get(instrument_id)]
+
+        cdef list result = []
+        cdef OrderPriceIndex index
+        for index in indexes:
+            if index is not None:
+                result.extend(index.orders())
+        return result
 
     cpdef Account get_account(self):
         """
@@ -515,23 +607,17 @@ cdef class SimulatedExchange:
         if self.latency_model is None:
             self._message_queue.put_nowait(command)
         else:
-            heappush(self._inflight_queue, self.generate_inflight_command(command))
+            self._inflight_queue.push(self.generate_inflight_ts(command), command)
 
-    cdef tuple generate_inflight_command(self, TradingCommand command):
-        cdef int64_t ts
+    cdef int64_t generate_inflight_ts(self, TradingCommand command) except *:
         if isinstance(command, (SubmitOrder, SubmitOrderList)):
-            ts = command.ts_init + self.latency_model.insert_latency_nanos
+            return command.ts_init + self.latency_model.sample_insert_latency()
         elif isinstance(command, ModifyOrder):
-            ts = command.ts_init + self.latency_model.update_latency_nanos
+            return command.ts_init + self.latency_model.sample_update_latency()
         elif isinstance(command, (CancelOrder, CancelAllOrders)):
-            ts = command.ts_init + self.latency_model.cancel_latency_nanos
+            return command.ts_init + self.latency_model.sample_cancel_latency()
         else:  # pragma: no cover (design-time error)
             raise ValueError(f"invalid command, was {command}")
-        if ts not in self._inflight_counter:
-            self._inflight_counter[ts] = 0
-        self._inflight_counter[ts] += 1
-        cdef (int64_t, int64_t) key = (ts, self._inflight_counter[ts])
-        return key, command
 
     cpdef void process_order_book(self, OrderBookData data) except *:
         """
@@ -613,6 +699,29 @@ cdef class SimulatedExchange:
         if not self._log.is_bypassed:
             self._log.debug(f"Processed {bar}")
 
+    cpdef int64_t next_wakeup_ns(self) except *:
+        """
+        Return the UNIX timestamp (nanoseconds) when the exchange next requires
+        processing.
+
+        This is the earliest of any queued commands (immediately), in-flight
+        commands arriving and simulation module wake-ups.
+
+        Returns
+        -------
+        int64
+            0 if there is pending work, INT64_MAX if nothing is scheduled.
+
+        """
+        if self._message_queue.count > 0 or self._last_bids or self._last_asks:
+            return 0
+
+        cdef int64_t wakeup = self._inflight_queue.next_ts()
+        cdef SimulationModule module
+        for module in self.modules:
+            wakeup = min(wakeup, module.next_wakeup_ns())
+        return wakeup
+
     cpdef void process(self, int64_t now_ns) except *:
         """
         Process the exchange to the gives time.
@@ -627,17 +736,9 @@ cdef class SimulatedExchange:
         """
         self._clock.set_time(now_ns)
 
-        cdef:
-            int64_t ts
-        while self._inflight_queue:
-            # Peek at timestamp of next inflight message
-            ts = self._inflight_queue[0][0][0]
-            if ts <= now_ns:
-                # Place message on queue to be processed
-                self._message_queue.put_nowait(self._inflight_queue.pop(0)[1])
-                self._inflight_counter.pop(ts, None)
-            else:
-                break
+        while self._inflight_queue.is_due(now_ns):
+            # Place message on queue to be processed
+            self._message_queue.put_nowait(self._inflight_queue.pop())
 
         cdef:
             TradingCommand command
@@ -683,10 +784,7 @@ cdef class SimulatedExchange:
                     self._generate_order_pending_cancel(order)
                     self._cancel_order(order)
             elif isinstance(command, CancelAllOrders):
-                orders = (
-                    self._orders_bid.get(command.instrument_id, [])
-                    + self._orders_ask.get(command.instrument_id, [])
-                )
+                orders = self.get_working_orders(command.instrument_id)
                 for order in orders:
                     if order.is_active_c():
                         self._generate_order_pending_cancel(order)
@@ -719,13 +817,16 @@ cdef class SimulatedExchange:
         self._order_index.clear()
         self._orders_bid.clear()
         self._orders_ask.clear()
+        self._stops_bid.clear()
+        self._stops_ask.clear()
+        self._expiries.clear()
+        self._expiry_seq = 0
 
         self._symbol_pos_count.clear()
         self._symbol_ord_count.clear()
         self._executions_count = 0
         self._message_queue = Queue()
         self._inflight_queue.clear()
-        self._inflight_counter.clear()
 
         self._log.info("Reset.")
 
@@ -961,6 +1062,9 @@ cdef class SimulatedExchange:
         else:  # pragma: no cover (design-time error)
             raise ValueError(f"invalid OrderType, was {order.type}")
 
+        # Prices may have been modified
+        self._reindex_order(order)
+
         if order.contingency == ContingencyType.OCO and update_ocos:
             self._update_oco_orders(order)
 
@@ -984,18 +1088,7 @@ cdef class SimulatedExchange:
         if order.venue_order_id is None:
             order.venue_order_id = self._generate_venue_order_id(order.instrument_id)
 
-        cdef:
-            list orders_bid
-            list orders_ask
-        if order.is_buy_c():
-            orders_bid = self._orders_bid.get(order.instrument_id)
-            if orders_bid and order in orders_bid:
-                orders_bid.remove(order)
-        elif order.is_sell_c():
-            orders_ask = self._orders_ask.get(order.instrument_id)
-            if orders_ask and order in orders_ask:
-                orders_ask.remove(order)
-
+        self._unindex_order(order)
         self._generate_order_canceled(order)
 
         if order.contingency == ContingencyType.OCO and cancel_ocos:
@@ -1023,57 +1116,99 @@ cdef class SimulatedExchange:
     cdef void _add_order(self, PassiveOrder order) except *:
         # Index order
         self._order_index[order.client_order_id] = order
+        self._index_order(order)
 
-        if order.is_buy_c():
-            orders_bid = self._orders_bid.get(order.instrument_id)
-            if orders_bid is None:
-                orders_bid = []
-                self._orders_bid[order.instrument_id] = orders_bid
-            orders_bid.append(order)
-            orders_bid.sort(key=lambda x: x.price, reverse=True)
-        elif order.is_sell_c():
-            orders_ask = self._orders_ask.get(order.instrument_id)
-            if orders_ask is None:
-                orders_ask = []
-                self._orders_ask[order.instrument_id] = orders_ask
-            orders_ask.append(order)
-            orders_ask.sort(key=lambda x: x.price)
+        cdef list expiries
+        if order.expire_time is not None:
+            expiries = self._expiries.get(order.instrument_id)
+            if expiries is None:
+                expiries = []
+                self._expiries[order.instrument_id] = expiries
+            heappush(expiries, (order.expire_time_ns, self._expiry_seq, order))
+            self._expiry_seq += 1
 
     cdef void _delete_order(self, Order order) except *:
         self._order_index.pop(order.client_order_id, None)
 
+        if order.is_passive_c():
+            self._unindex_order(order)
+
+    cdef void _index_order(self, PassiveOrder order) except *:
+        cdef dict indexes
+        cdef bint descending
+        cdef Price price
+        if order.type == OrderType.LIMIT or (order.type == OrderType.STOP_LIMIT and order.is_triggered):
+            # Working at limit price (buys are best highest)
+            indexes = self._orders_bid if order.is_buy_c() else self._orders_ask
+            descending = order.is_buy_c()
+            price = order.price
+        else:
+            # Waiting on stop trigger (buys trigger lowest first)
+            indexes = self._stops_bid if order.is_buy_c() else self._stops_ask
+            descending = order.is_sell_c()
+            price = order.trigger if order.type == OrderType.STOP_LIMIT else order.price
+
+        cdef OrderPriceIndex index = indexes.get(order.instrument_id)
+        if index is None:
+            index = OrderPriceIndex(descending=descending)
+            indexes[order.instrument_id] = index
+        index.add(order, price)
+
+    cdef bint _unindex_order(self, PassiveOrder order) except *:
+        cdef OrderPriceIndex index
         if order.is_buy_c():
-            orders_bid = self._orders_bid.get(order.instrument_id)
-            if orders_bid is not None:
-                orders_bid.remove(order)
+            index = self._orders_bid.get(order.instrument_id)
+            if index is not None and index.remove(order):
+                return True
+            index = self._stops_bid.get(order.instrument_id)
+            return index is not None and index.remove(order)
         elif order.is_sell_c():
-            orders_ask = self._orders_ask.get(order.instrument_id)
-            if orders_ask is not None:
-                orders_ask.remove(order)
+            index = self._orders_ask.get(order.instrument_id)
+            if index is not None and index.remove(order):
+                return True
+            index = self._stops_ask.get(order.instrument_id)
+            return index is not None and index.remove(order)
+        else:  # pragma: no cover (design-time error)
+            raise ValueError(f"invalid OrderSide, was {order.side}")
+
+    cdef void _reindex_order(self, PassiveOrder order) except *:
+        # Only re-index orders which are currently working in the market
+        if self._unindex_order(order):
+            self._index_order(order)
 
     cdef void _iterate_matching_engine(
         self, InstrumentId instrument_id,
         int64_t timestamp_ns,
     ) except *:
-        # Iterate bids
-        cdef list orders_bid = self._orders_bid.get(instrument_id)
-        if orders_bid is not None:
-            self._iterate_side(orders_bid.copy(), timestamp_ns)  # Copy list for safe loop
+        # Expire orders
+        cdef list expiries = self._expiries.get(instrument_id)
+        cdef PassiveOrder order
+        while expiries and expiries[0][0] <= timestamp_ns:
+            order = heappop(expiries)[2]
+            if not order.is_working_c():
+                continue  # Order already completed
+            self._delete_order(order)
+            self._expire_order(order)
+
+        # Only orders the market has reached are walked (the index prefix)
+        cdef Price ask = self.best_ask_price(instrument_id)
+        if ask is not None:
+            self._iterate_side(self._orders_bid.get(instrument_id), ask)
+            self._iterate_side(self._stops_bid.get(instrument_id), ask)
 
-        # Iterate asks
-        cdef list orders_ask = self._orders_ask.get(instrument_id)
-        if orders_ask is not None:
-            self._iterate_side(orders_ask.copy(), timestamp_ns)  # Copy list for safe loop
+        cdef Price bid = self.best_bid_price(instrument_id)
+        if bid is not None:
+            self._iterate_side(self._orders_ask.get(instrument_id), bid)
+            self._iterate_side(self._stops_ask.get(instrument_id), bid)
+
+    cdef void _iterate_side(self, OrderPriceIndex index, Price price) except *:
+        if index is None:
+            return
 
-    cdef void _iterate_side(self, list orders, int64_t timestamp_ns) except *:
         cdef PassiveOrder order
-        for order in orders:
+        for order in index.crossed(price):
             if not order.is_working_c():
                 continue  # Orders state has changed since the loop started
-            elif order.expire_time and timestamp_ns >= order.expire_time_ns:
-                self._delete_order(order)
-                self._expire_order(order)
-                continue
             # Check for order match
             self._match_order(order)
 
@@ -1104,6 +1239,7 @@ cdef class SimulatedExchange:
 
         if self._is_stop_triggered(order.instrument_id, order.side, order.trigger):
             self._generate_order_triggered(order)
+            self._reindex_order(order)  # Now working at limit price
             # Check for immediate fill
             if not self._is_limit_marketable(order.instrument_id, order.side, order.price):
                 return
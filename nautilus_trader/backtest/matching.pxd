@@ -0,0 +1,34 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.orders.base cimport PassiveOrder
+
+
+cdef class OrderPriceIndex:
+    cdef list _keys
+    cdef list _orders
+    cdef dict _order_keys
+
+    cdef readonly bint descending
+    """If the index is sorted in descending order of price.\n\n:returns: `bool`"""
+
+    cpdef void add(self, PassiveOrder order, Price price) except *
+    cpdef bint remove(self, PassiveOrder order) except *
+    cpdef bint contains(self, ClientOrderId client_order_id) except *
+    cpdef list crossed(self, Price price)
+    cpdef list orders(self)
+    cpdef void clear(self) except *
@@ -0,0 +1,173 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.core.collections cimport bisect_left
+from nautilus_trader.core.collections cimport bisect_right
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.orders.base cimport PassiveOrder
+
+
+cdef class OrderPriceIndex:
+    """
+    Represents passive orders for one side of a simulated market, sorted by
+    price then time of arrival.
+
+    Orders at the same price retain their insertion (FIFO) order. The orders
+    which a given market price has reached always form a prefix of the index,
+    so the matching engine only needs to walk the orders returned by
+    `crossed()` rather than every working order.
+
+    Parameters
+    ----------
+    descending : bool
+        If the index should be sorted in descending order of price (buy limit
+        and sell stop orders).
+    """
+
+    def __init__(self, bint descending):
+        self._keys = []         # type: list[float]  # Sorted ascending, negated if descending
+        self._orders = []       # type: list[PassiveOrder]
+        self._order_keys = {}   # type: dict[ClientOrderId, float]
+
+        self.descending = descending
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(descending={self.descending}, orders={len(self._orders)})"
+
+    cpdef void add(self, PassiveOrder order, Price price) except *:
+        """
+        Add the given order to the index at the given price.
+
+        Parameters
+        ----------
+        order : PassiveOrder
+            The order to add.
+        price : Price
+            The price to index the order at (limit or trigger price).
+
+        Raises
+        ------
+        ValueError
+            If `order.client_order_id` is already contained in the index.
+
+        """
+        Condition.not_none(order, "order")
+        Condition.not_none(price, "price")
+        Condition.not_in(order.client_order_id, self._order_keys, "order.client_order_id", "self._order_keys")
+
+        cdef double key = -price.as_double() if self.descending else price.as_double()
+        cdef int idx = bisect_right(self._keys, key)
+        self._keys.insert(idx, key)
+        self._orders.insert(idx, order)
+        self._order_keys[order.client_order_id] = key
+
+    cpdef bint remove(self, PassiveOrder order) except *:
+        """
+        Remove the given order from the index.
+
+        Parameters
+        ----------
+        order : PassiveOrder
+            The order to remove.
+
+        Returns
+        -------
+        bool
+            True if the order was contained in the index and removed, else False.
+
+        """
+        Condition.not_none(order, "order")
+
+        key = self._order_keys.pop(order.client_order_id, None)
+        if key is None:
+            return False
+
+        cdef int idx = bisect_left(self._keys, key)
+        cdef int n = len(self._orders)
+        cdef PassiveOrder existing
+        while idx < n:
+            existing = self._orders[idx]
+            if existing.client_order_id == order.client_order_id:
+                del self._keys[idx]
+                del self._orders[idx]
+                return True
+            idx += 1
+
+        raise RuntimeError(  # pragma: no cover (design-time error)
+            f"{repr(order.client_order_id)} indexed but not found at key {key}",
+        )
+
+    cpdef bint contains(self, ClientOrderId client_order_id) except *:
+        """
+        Return a value indicating whether an order with the given ID is indexed.
+
+        Parameters
+        ----------
+        client_order_id : ClientOrderId
+            The client order ID to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return client_order_id in self._order_keys
+
+    cpdef list crossed(self, Price price):
+        """
+        Return the orders which the given market price has reached.
+
+        For a descending index these are the orders priced at or above the given
+        price, for an ascending index the orders priced at or below it. The
+        returned list is a copy, so the index may be modified while iterating.
+
+        Parameters
+        ----------
+        price : Price
+            The market price bound.
+
+        Returns
+        -------
+        list[PassiveOrder]
+
+        """
+        Condition.not_none(price, "price")
+
+        cdef double key = -price.as_double() if self.descending else price.as_double()
+        return self._orders[:bisect_right(self._keys, key)]
+
+    cpdef list orders(self):
+        """
+        Return all orders in the index in price-time priority.
+
+        Returns
+        -------
+        list[PassiveOrder]
+
+        """
+        return self._orders.copy()
+
+    cpdef void clear(self) except *:
+        """
+        Clear all orders from the index.
+        """
+        self._keys.clear()
+        self._orders.clear()
+        self._order_keys.clear()
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
+
 
 cdef class FillModel:
     cdef readonly double prob_fill_on_limit
@@ -38,3 +40,17 @@ cdef class LatencyModel:
     """The latency (nanoseconds) for order update messages to reach the exchange.\n\n:returns: `int`"""
     cdef readonly int cancel_latency_nanos
     """The latency (nanoseconds) for order cancel messages to reach the exchange.\n\n:returns: `int`"""
+    cdef readonly int insert_jitter_nanos
+    """The mean jitter (nanoseconds) for order insert messages.\n\n:returns: `int`"""
+    cdef readonly int update_jitter_nanos
+    """The mean jitter (nanoseconds) for order update messages.\n\n:returns: `int`"""
+    cdef readonly int cancel_jitter_nanos
+    """The mean jitter (nanoseconds) for order cancel messages.\n\n:returns: `int`"""
+
+    cdef object _random
+
+    cpdef int64_t sample_insert_latency(self) except *
+    cpdef int64_t sample_update_latency(self) except *
+    cpdef int64_t sample_cancel_latency(self) except *
+
+    cdef int64_t _sample_jitter(self, int mean_nanos) except *
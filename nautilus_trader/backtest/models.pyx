@@ -115,6 +115,11 @@ cdef class LatencyModel:
     """
     Provides a latency model for simulated exchange message I/O.
 
+    Each command type has a fixed latency (the base latency plus any additional
+    latency for that command type) and an optional jitter. Jitter is sampled
+    per command from an exponential distribution with the given mean, giving
+    the long right tail typical of network latencies.
+
     Parameters
     ----------
     base_latency_nanos : int, default 1_000_000_000
@@ -125,6 +130,14 @@ cdef class LatencyModel:
         The order update latency (nanoseconds) for the model.
     cancel_latency_nanos : int, default 0
         The order cancel latency (nanoseconds) for the model.
+    insert_jitter_nanos : int, default 0
+        The mean jitter (nanoseconds) sampled for order insert messages.
+    update_jitter_nanos : int, default 0
+        The mean jitter (nanoseconds) sampled for order update messages.
+    cancel_jitter_nanos : int, default 0
+        The mean jitter (nanoseconds) sampled for order cancel messages.
+    random_seed : int, optional
+        The random seed for sampling jitter (if None then no random seed).
 
     Raises
     ------
@@ -136,6 +149,14 @@ cdef class LatencyModel:
         If `update_latency_nanos` is negative (< 0).
     ValueError
         If `cancel_latency_nanos` is negative (< 0).
+    ValueError
+        If `insert_jitter_nanos` is negative (< 0).
+    ValueError
+        If `update_jitter_nanos` is negative (< 0).
+    ValueError
+        If `cancel_jitter_nanos` is negative (< 0).
+    TypeError
+        If `random_seed` is not None and not of type `int`.
     """
 
     def __init__(
@@ -144,13 +165,66 @@ cdef class LatencyModel:
         int insert_latency_nanos = 0,
         int update_latency_nanos = 0,
         int cancel_latency_nanos = 0,
+        int insert_jitter_nanos = 0,
+        int update_jitter_nanos = 0,
+        int cancel_jitter_nanos = 0,
+        random_seed=None,
     ):
         Condition.not_negative_int(base_latency_nanos, "base_latency_nanos")
         Condition.not_negative_int(insert_latency_nanos, "insert_latency_nanos")
         Condition.not_negative_int(update_latency_nanos, "update_latency_nanos")
         Condition.not_negative_int(cancel_latency_nanos, "cancel_latency_nanos")
+        Condition.not_negative_int(insert_jitter_nanos, "insert_jitter_nanos")
+        Condition.not_negative_int(update_jitter_nanos, "update_jitter_nanos")
+        Condition.not_negative_int(cancel_jitter_nanos, "cancel_jitter_nanos")
+        if random_seed is not None:
+            Condition.type(random_seed, int, "random_seed")
 
         self.base_latency_nanos = base_latency_nanos
         self.insert_latency_nanos = base_latency_nanos + insert_latency_nanos
         self.update_latency_nanos = base_latency_nanos + update_latency_nanos
         self.cancel_latency_nanos = base_latency_nanos + cancel_latency_nanos
+        self.insert_jitter_nanos = insert_jitter_nanos
+        self.update_jitter_nanos = update_jitter_nanos
+        self.cancel_jitter_nanos = cancel_jitter_nanos
+
+        # Independent of the global random state seeded by the `FillModel`
+        self._random = random.Random(random_seed)
+
+    cpdef int64_t sample_insert_latency(self) except *:
+        """
+        Return a sampled latency for an order insert message.
+
+        Returns
+        -------
+        int64
+
+        """
+        return self.insert_latency_nanos + self._sample_jitter(self.insert_jitter_nanos)
+
+    cpdef int64_t sample_update_latency(self) except *:
+        """
+        Return a sampled latency for an order update message.
+
+        Returns
+        -------
+        int64
+
+        """
+        return self.update_latency_nanos + self._sample_jitter(self.update_jitter_nanos)
+
+    cpdef int64_t sample_cancel_latency(self) except *:
+        """
+        Return a sampled latency for an order cancel message.
+
+        Returns
+        -------
+        int64
+
+        """
+        return self.cancel_latency_nanos + self._sample_jitter(self.cancel_jitter_nanos)
+
+    cdef int64_t _sample_jitter(self, int mean_nanos) except *:
+        if mean_nanos == 0:
+            return 0  # No jitter (avoid advancing the random state)
+        return <int64_t>self._random.expovariate(1.0 / mean_nanos)
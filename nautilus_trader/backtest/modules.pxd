@@ -26,6 +26,7 @@ cdef class SimulationModule:
 
     cpdef void register_exchange(self, SimulatedExchange exchange) except *
     cpdef void process(self, int64_t now_ns) except *
+    cpdef int64_t next_wakeup_ns(self) except *
     cpdef void log_diagnostics(self, LoggerAdapter log) except *
     cpdef void reset(self) except *
 
@@ -34,8 +35,10 @@ cdef class FXRolloverInterestModule(SimulationModule):
     cdef RolloverInterestCalculator _calculator
     cdef object _rollover_spread
     cdef datetime _rollover_time
+    cdef int64_t _rollover_time_ns
     cdef bint _rollover_applied
     cdef dict _rollover_totals
     cdef int _day_number
+    cdef int64_t _next_day_ns
 
     cdef void _apply_rollover_interest(self, datetime timestamp, int iso_week_day) except *
@@ -24,6 +24,7 @@ import pytz
 from nautilus_trader.accounting.calculators cimport RolloverInterestCalculator
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.model.c_enums.asset_class cimport AssetClass
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.currency cimport Currency
@@ -68,6 +69,21 @@ cdef class SimulationModule:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
 
+    cpdef int64_t next_wakeup_ns(self) except *:
+        """
+        Return the UNIX timestamp (nanoseconds) when the module next requires
+        processing.
+
+        The default of 0 processes the module on every exchange iteration,
+        override in a subclass to schedule processing.
+
+        Returns
+        -------
+        int64
+
+        """
+        return 0
+
     cpdef void log_diagnostics(self, LoggerAdapter log) except *:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
@@ -78,6 +94,7 @@ cdef class SimulationModule:
 
 
 _TZ_US_EAST = pytz.timezone("US/Eastern")
+cdef int64_t NANOSECONDS_IN_DAY = 86_400_000_000_000
 
 cdef class FXRolloverInterestModule(SimulationModule):
     """
@@ -97,6 +114,7 @@ cdef class FXRolloverInterestModule(SimulationModule):
         self._rollover_applied = False
         self._rollover_totals = {}
         self._day_number = 0
+        self._next_day_ns = 0
 
     cpdef void process(self, int64_t now_ns) except *:
         """
@@ -108,6 +126,9 @@ cdef class FXRolloverInterestModule(SimulationModule):
             The current time in the simulated exchange.
 
         """
+        if now_ns >= self._next_day_ns:
+            self._next_day_ns = (now_ns // NANOSECONDS_IN_DAY + 1) * NANOSECONDS_IN_DAY
+
         cdef datetime now = pd.Timestamp(now_ns, tz="UTC")
         cdef datetime rollover_local
         if self._day_number != now.day:
@@ -122,12 +143,32 @@ cdef class FXRolloverInterestModule(SimulationModule):
                 rollover_local.day,
                 17),
             ).astimezone(pytz.utc)
+            self._rollover_time_ns = dt_to_unix_nanos(self._rollover_time)
 
         # Check for and apply any rollover interest
         if not self._rollover_applied and now >= self._rollover_time:
             self._apply_rollover_interest(now, self._rollover_time.isoweekday())
             self._rollover_applied = True
 
+    cpdef int64_t next_wakeup_ns(self) except *:
+        """
+        Return the UNIX timestamp (nanoseconds) when the module next requires
+        processing.
+
+        This is the pending rollover time for the current day, otherwise the
+        start of the next UTC day.
+
+        Returns
+        -------
+        int64
+
+        """
+        if self._rollover_time is None:
+            return 0  # Not yet initialized
+        if not self._rollover_applied and self._rollover_time_ns < self._next_day_ns:
+            return self._rollover_time_ns
+        return self._next_day_ns
+
     cdef void _apply_rollover_interest(self, datetime timestamp, int iso_week_day) except *:
         cdef list open_positions = self._exchange.cache.positions_open()
 
@@ -203,3 +244,4 @@ cdef class FXRolloverInterestModule(SimulationModule):
         self._rollover_applied = False
         self._rollover_totals = {}
         self._day_number = 0
+        self._next_day_ns = 0
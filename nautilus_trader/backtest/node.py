@@ -209,18 +209,21 @@ class BacktestNode:
                 engine.add_strategies(strategies)
 
         # Run backtest
-        backtest_runner(
-            run_config_id=run_config_id,
-            engine=engine,
-            data_configs=data_configs,
-            batch_size_bytes=batch_size_bytes,
-        )
+        try:
+            backtest_runner(
+                run_config_id=run_config_id,
+                engine=engine,
+                data_configs=data_configs,
+                batch_size_bytes=batch_size_bytes,
+            )
 
-        result = engine.get_result()
+            result = engine.get_result()
 
-        engine.dispose()
-        if writer is not None:
-            writer.close()
+            engine.dispose()
+        finally:
+            if writer is not None:
+                # Write any buffered rows and close the files
+                writer.close()
 
         return result
 
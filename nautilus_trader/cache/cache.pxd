@@ -14,7 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
+from nautilus_trader.accounting.calculators cimport ExchangeRateGraph
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.cache.database cimport CacheDatabase
 from nautilus_trader.common.logging cimport LoggerAdapter
@@ -40,9 +40,9 @@ from nautilus_trader.trading.strategy cimport TradingStrategy
 cdef class Cache(CacheFacade):
     cdef LoggerAdapter _log
     cdef CacheDatabase _database
-    cdef ExchangeRateCalculator _xrate_calculator
 
     cdef dict _xrate_symbols
+    cdef dict _xrate_graphs
     cdef dict _tickers
     cdef dict _quote_ticks
     cdef dict _trade_ticks
@@ -94,7 +94,8 @@ cdef class Cache(CacheFacade):
     cpdef void reset(self) except *
     cpdef void flush_db(self) except *
 
-    cdef tuple _build_quote_table(self, Venue venue)
+    cdef ExchangeRateGraph _get_xrate_graph(self, Venue venue)
+    cdef void _update_xrate_graph(self, QuoteTick tick) except *
     cdef void _build_index_venue_account(self) except *
     cdef void _cache_venue_account_id(self, AccountId account_id) except *
     cdef void _build_indexes_from_orders(self) except *
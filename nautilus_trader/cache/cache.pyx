@@ -20,7 +20,7 @@ from typing import Optional
 from libc.stdint cimport int64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
+from nautilus_trader.accounting.calculators cimport ExchangeRateGraph
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
@@ -81,7 +81,6 @@ cdef class Cache(CacheFacade):
 
         self._database = database
         self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
-        self._xrate_calculator = ExchangeRateCalculator()
 
         # Configuration
         self.tick_capacity = config.tick_capacity
@@ -89,6 +88,7 @@ cdef class Cache(CacheFacade):
 
         # Caches
         self._xrate_symbols = {}               # type: dict[InstrumentId, str]
+        self._xrate_graphs = {}                # type: dict[Venue, ExchangeRateGraph]
         self._tickers = {}                     # type: dict[InstrumentId, deque[Ticker]]
         self._quote_ticks = {}                 # type: dict[InstrumentId, deque[QuoteTick]]
         self._trade_ticks = {}                 # type: dict[InstrumentId, deque[TradeTick]]
@@ -595,6 +595,7 @@ cdef class Cache(CacheFacade):
         self._log.info("Resetting cache...")
 
         self._xrate_symbols.clear()
+        self._xrate_graphs.clear()
         self._instruments.clear()
         self._tickers.clear()
         self._quote_ticks.clear()
@@ -886,6 +887,9 @@ cdef class Cache(CacheFacade):
 
         ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate_graph(tick)
+
     cpdef void add_trade_tick(self, TradeTick tick) except *:
         """
         Add the given trade tick to the cache.
@@ -966,6 +970,9 @@ cdef class Cache(CacheFacade):
         for tick in ticks:
             cached_ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate_graph(cached_ticks[0])
+
     cpdef void add_trade_ticks(self, list ticks) except *:
         """
         Add the given trade ticks to the cache.
@@ -1077,6 +1084,9 @@ cdef class Cache(CacheFacade):
             self._xrate_symbols[instrument.id] = (
                 f"{instrument.base_currency}/{instrument.quote_currency}"
             )
+            ticks = self._quote_ticks.get(instrument.id)
+            if ticks:
+                self._update_xrate_graph(ticks[0])
 
         self._log.debug(f"Added instrument {instrument.id.value}.")
 
@@ -1860,35 +1870,25 @@ cdef class Cache(CacheFacade):
         if from_currency == to_currency:
             return Decimal(1)  # No conversion necessary
 
-        cdef tuple quotes = self._build_quote_table(venue)
-
-        return self._xrate_calculator.get_rate(
+        return self._get_xrate_graph(venue).get_rate(
             from_currency=from_currency,
             to_currency=to_currency,
             price_type=price_type,
-            bid_quotes=quotes[0],  # Bid
-            ask_quotes=quotes[1],  # Ask
         )
 
-    cdef tuple _build_quote_table(self, Venue venue):
-        cdef dict bid_quotes = {}
-        cdef dict ask_quotes = {}
-
-        cdef InstrumentId instrument_id
-        cdef str base_quote
-        for instrument_id, base_quote in self._xrate_symbols.items():
-            if instrument_id.venue != venue:
-                continue
-
-            ticks = self._quote_ticks.get(instrument_id)
-            if not ticks:
-                # No quotes for instrument_id
-                continue
-
-            bid_quotes[base_quote] = ticks[0].bid.as_decimal()
-            ask_quotes[base_quote] = ticks[0].ask.as_decimal()
-
-        return bid_quotes, ask_quotes
+    cdef ExchangeRateGraph _get_xrate_graph(self, Venue venue):
+        cdef ExchangeRateGraph graph = self._xrate_graphs.get(venue)
+        if graph is None:
+            graph = ExchangeRateGraph()
+            self._xrate_graphs[venue] = graph
+        return graph
+
+    cdef void _update_xrate_graph(self, QuoteTick tick) except *:
+        self._get_xrate_graph(tick.instrument_id.venue).update(
+            self._xrate_symbols[tick.instrument_id],
+            tick.bid.as_decimal(),
+            tick.ask.as_decimal(),
+        )
 
 # -- INSTRUMENT QUERIES ----------------------------------------------------------------------------
 
@@ -30,7 +30,7 @@ cdef class Clock:
     cdef UUIDFactory _uuid_factory
     cdef dict _timers
     cdef dict _handlers
-    cdef Timer[:] _stack
+    cdef list _stack
     cdef object _default_handler
 
     cdef readonly bint is_test_clock
@@ -100,13 +100,38 @@ cdef class Clock:
     cdef void _update_timing(self) except *
 
 
+cdef class TestClockScheduler
+
+
 cdef class TestClock(Clock):
     cdef int64_t _time_ns
     cdef dict _pending_events
+    cdef TestClockScheduler _scheduler
+    cdef int _scheduler_index
+    cdef int64_t _scheduled_ns
 
     cpdef void set_time(self, int64_t to_time_ns) except *
     cpdef list advance_time(self, int64_t to_time_ns)
 
+    cdef list _advance_timers(self, int64_t to_time_ns)
+    cdef void _update_timing(self) except *
+
+
+cdef class TestClockScheduler:
+    cdef list _clocks
+    cdef list _queue
+    cdef int64_t _seq
+
+    cdef readonly int64_t time_ns
+    """The current UNIX time (nanoseconds) of the scheduler.\n\n:returns: `int64`"""
+
+    cpdef list clocks(self)
+    cpdef void register_clock(self, TestClock clock) except *
+    cpdef void set_time(self, int64_t to_time_ns) except *
+    cpdef list advance_time(self, int64_t to_time_ns)
+
+    cdef void _schedule(self, TestClock clock) except *
+
 
 cdef class LiveClock(Clock):
     cdef object _loop
@@ -13,10 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from heapq import heappop
+from heapq import heappush
 from typing import Callable
 
-import cython
-import numpy as np
 import pandas as pd
 import pytz
 
@@ -475,11 +475,7 @@ cdef class Clock:
         self.timer_count = len(self._timers)
 
         if self.timer_count > 0:
-            # The call to np.asarray here looks inefficient, however its only
-            # called when a timer is added or removed. This then allows the
-            # construction of an efficient Timer[:] memoryview.
-            timers = list(self._timers.values())
-            self._stack = np.ascontiguousarray(timers, dtype=Timer)
+            self._stack = list(self._timers.values())
         else:
             self._stack = None
 
@@ -520,23 +516,16 @@ cdef class Clock:
             # and timer.
             self.cancel_timer(name)
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cdef void _update_timing(self) except *:
         if self.timer_count == 0:
             self.next_event_time_ns = 0
             return
-        elif self.timer_count == 1:
-            self.next_event_time_ns = self._stack[0].next_time_ns
-            return
 
-        cdef int64_t next_time_ns = self._stack[0].next_time_ns
-        cdef int64_t observed_ns
-        cdef int i
-        for i in range(self.timer_count - 1):
-            observed_ns = self._stack[i + 1].next_time_ns
-            if observed_ns < next_time_ns:
-                next_time_ns = observed_ns
+        cdef Timer timer = self._stack[0]
+        cdef int64_t next_time_ns = timer.next_time_ns
+        for timer in self._stack:
+            if timer.next_time_ns < next_time_ns:
+                next_time_ns = timer.next_time_ns
 
         self.next_event_time_ns = next_time_ns
 
@@ -549,6 +538,11 @@ cdef class TestClock(Clock):
     ----------
     initial_ns : int64
         The initial UNIX time (nanoseconds) for the clock.
+
+    Notes
+    -----
+    Once registered with a `TestClockScheduler` the clock shares the time of
+    the scheduler, and is advanced through the scheduler.
     """
     __test__ = False
 
@@ -556,6 +550,9 @@ cdef class TestClock(Clock):
         super().__init__()
 
         self._time_ns = initial_ns
+        self._scheduler = None
+        self._scheduler_index = 0
+        self._scheduled_ns = 0
         self.is_test_clock = True
 
     cpdef datetime utc_now(self):
@@ -568,7 +565,7 @@ cdef class TestClock(Clock):
             The current tz-aware UTC time of the clock.
 
         """
-        return pd.Timestamp(self._time_ns, tz=pytz.utc)
+        return pd.Timestamp(self.timestamp_ns(), tz=pytz.utc)
 
     cpdef double timestamp(self) except *:
         """
@@ -583,7 +580,7 @@ cdef class TestClock(Clock):
         https://en.wikipedia.org/wiki/Unix_time
 
         """
-        return nanos_to_secs(self._time_ns)
+        return nanos_to_secs(self.timestamp_ns())
 
     cpdef int64_t timestamp_ms(self) except *:
         """
@@ -598,7 +595,7 @@ cdef class TestClock(Clock):
         https://en.wikipedia.org/wiki/Unix_time
 
         """
-        return nanos_to_millis(self._time_ns)
+        return nanos_to_millis(self.timestamp_ns())
 
     cpdef int64_t timestamp_ns(self) except *:
         """
@@ -613,19 +610,27 @@ cdef class TestClock(Clock):
         https://en.wikipedia.org/wiki/Unix_time
 
         """
+        if self._scheduler is not None:
+            return self._scheduler.time_ns
         return self._time_ns
 
     cpdef void set_time(self, int64_t to_time_ns) except *:
         """
         Set the clocks datetime to the given time (UTC).
 
+        If the clock is registered with a scheduler then the time is set for
+        all clocks registered with the scheduler.
+
         Parameters
         ----------
         to_time_ns : int64
             The UNIX time (nanoseconds) to set.
 
         """
-        self._time_ns = to_time_ns
+        if self._scheduler is not None:
+            self._scheduler.set_time(to_time_ns)
+        else:
+            self._time_ns = to_time_ns
 
     cpdef list advance_time(self, int64_t to_time_ns):
         """
@@ -645,15 +650,24 @@ cdef class TestClock(Clock):
         ------
         ValueError
             If `to_time` is < the clocks current time.
+        ValueError
+            If the clock is registered with a scheduler (advance the scheduler).
 
         """
+        Condition.none(self._scheduler, "self._scheduler")
         # Ensure monotonic
         Condition.true(to_time_ns >= self._time_ns, "to_time_ns was < self._time_ns")
 
+        cdef list event_handlers = self._advance_timers(to_time_ns)
+        self._time_ns = to_time_ns
+        if event_handlers:
+            event_handlers.sort()
+        return event_handlers
+
+    cdef list _advance_timers(self, int64_t to_time_ns):
         cdef list event_handlers = []
 
         if self.timer_count == 0 or to_time_ns < self.next_event_time_ns:
-            self._time_ns = to_time_ns
             return event_handlers  # No timer events to iterate
 
         # Iterate timer events
@@ -669,8 +683,13 @@ cdef class TestClock(Clock):
                 self._remove_timer(timer)
 
         self._update_timing()
-        self._time_ns = to_time_ns
-        return sorted(event_handlers)
+        return event_handlers
+
+    cdef void _update_timing(self) except *:
+        Clock._update_timing(self)
+
+        if self._scheduler is not None:
+            self._scheduler._schedule(self)
 
     cdef Timer _create_timer(
         self,
@@ -689,6 +708,141 @@ cdef class TestClock(Clock):
         )
 
 
+cdef class TestClockScheduler:
+    """
+    Provides a shared scheduler for advancing many `TestClock` instances.
+
+    Registered clocks share the time of the scheduler, and the next time event
+    of every clock is held in a single priority queue. Advancing time is then
+    O(1) when no timers are due and O(log n) for each clock with a due timer,
+    rather than iterating every clock on every advance.
+
+    Parameters
+    ----------
+    initial_ns : int64
+        The initial UNIX time (nanoseconds) for the scheduler.
+    """
+    __test__ = False
+
+    def __init__(self, int64_t initial_ns=0):
+        self._clocks = []  # type: list[TestClock]
+        self._queue = []   # type: list[tuple[int, int, TestClock]]
+        self._seq = 0
+
+        self.time_ns = initial_ns
+
+    cpdef list clocks(self):
+        """
+        Return the clocks registered with the scheduler.
+
+        Returns
+        -------
+        list[TestClock]
+
+        """
+        return self._clocks.copy()
+
+    cpdef void register_clock(self, TestClock clock) except *:
+        """
+        Register the given clock with the scheduler.
+
+        The clock will then share the time of the scheduler. Registering a clock
+        which is already registered with this scheduler has no effect.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to register.
+
+        Raises
+        ------
+        ValueError
+            If `clock` is registered with another scheduler.
+
+        """
+        Condition.not_none(clock, "clock")
+
+        if clock._scheduler is self:
+            return  # Already registered
+
+        Condition.none(clock._scheduler, "clock._scheduler")
+
+        clock._scheduler = self
+        clock._scheduler_index = len(self._clocks)
+        self._clocks.append(clock)
+        self._schedule(clock)
+
+    cpdef void set_time(self, int64_t to_time_ns) except *:
+        """
+        Set the time for all registered clocks to the given time (UTC).
+
+        Parameters
+        ----------
+        to_time_ns : int64
+            The UNIX time (nanoseconds) to set.
+
+        """
+        self.time_ns = to_time_ns
+
+    cpdef list advance_time(self, int64_t to_time_ns):
+        """
+        Advance the time for all registered clocks to the given time.
+
+        Parameters
+        ----------
+        to_time_ns : int64
+            The UNIX time (nanoseconds) to advance the clocks to.
+
+        Returns
+        -------
+        list[TimeEventHandler]
+            Sorted chronologically, events at the same time are in order of
+            clock registration.
+
+        Raises
+        ------
+        ValueError
+            If `to_time_ns` is < the schedulers current time.
+
+        """
+        # Ensure monotonic
+        Condition.true(to_time_ns >= self.time_ns, "to_time_ns was < self.time_ns")
+
+        cdef list due = []  # type: list[tuple[int, list[TimeEventHandler]]]
+        cdef int64_t next_time_ns
+        cdef TestClock clock
+        while self._queue and self._queue[0][0] <= to_time_ns:
+            next_time_ns, _, clock = heappop(self._queue)
+            if clock.timer_count == 0 or clock.next_event_time_ns != next_time_ns:
+                continue  # Stale entry (timers have changed since scheduled)
+            clock._scheduled_ns = 0
+            due.append((clock._scheduler_index, clock._advance_timers(to_time_ns)))
+
+        self.time_ns = to_time_ns
+
+        if not due:
+            return due
+
+        cdef list event_handlers = []
+        cdef list clock_handlers
+        due.sort()
+        for _, clock_handlers in due:
+            event_handlers += clock_handlers
+        event_handlers.sort()
+        return event_handlers
+
+    cdef void _schedule(self, TestClock clock) except *:
+        if clock.timer_count == 0:
+            clock._scheduled_ns = 0
+            return
+        if clock.next_event_time_ns == clock._scheduled_ns:
+            return  # Already scheduled
+
+        clock._scheduled_ns = clock.next_event_time_ns
+        heappush(self._queue, (clock.next_event_time_ns, self._seq, clock))
+        self._seq += 1
+
+
 cdef class LiveClock(Clock):
     """
     Provides a clock for live trading. All times are timezone aware UTC.
@@ -17,6 +17,7 @@ from typing import Callable, Dict
 
 from cpython.datetime cimport datetime
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport Logger
@@ -62,6 +63,8 @@ cdef class Logger:
     cdef Clock _clock
     cdef LogLevel _log_level_stdout
     cdef list _sinks
+    cdef int64_t _ts_cache_secs
+    cdef str _ts_cache_prefix
 
     cdef readonly TraderId trader_id
     """The loggers trader ID.\n\n:returns: `TraderId`"""
@@ -75,10 +78,12 @@ cdef class Logger:
     cpdef void register_sink(self, handler: Callable[[Dict], None]) except *
     cdef void change_clock_c(self, Clock clock) except *
     cdef void log_c(self, dict record) except *
+    cdef void log_entry(self, LogLevel level, LogColor color, str component, str msg, dict annotations=*) except *
     cdef dict create_record(self, LogLevel level, LogColor color, str component, str msg, dict annotations=*)
 
     cdef void _log(self, dict record) except *
     cdef str _format_record(self, LogLevel level, LogColor color, dict record)
+    cdef str _format_timestamp(self, int64_t timestamp_ns)
 
 
 cdef class LoggerAdapter:
@@ -122,3 +127,28 @@ cdef class LiveLogger(Logger):
     cpdef void start(self) except *
     cpdef void stop(self) except *
     cdef void _enqueue_sentinel(self) except *
+
+
+cdef class ThreadedLogger(Logger):
+    cdef int _capacity
+    cdef list _ring_ts
+    cdef list _ring_level
+    cdef list _ring_color
+    cdef list _ring_component
+    cdef list _ring_msg
+    cdef list _ring_annotations
+    cdef int64_t _head
+    cdef int64_t _tail
+    cdef int64_t _dropped_reported
+    cdef object _thread
+    cdef object _wake
+    cdef object _lock
+
+    cdef readonly bint is_running
+    """If the logger thread is running.\n\n:returns: `bool`"""
+    cdef readonly int64_t dropped_count
+    """The count of log entries (below WARNING) dropped as the ring buffer was full.\n\n:returns: `int`"""
+
+    cpdef void start(self) except *
+    cpdef void stop(self) except *
+    cdef void _drain(self) except *
@@ -16,11 +16,14 @@
 from typing import Optional
 
 from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 import asyncio
 import platform
 import socket
 import sys
+import threading
+import time
 import traceback
 from asyncio import Task
 from collections import defaultdict
@@ -39,7 +42,6 @@ from nautilus_trader.common.logging cimport LogLevel
 from nautilus_trader.common.queue cimport Queue
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.datetime cimport format_iso8601_ns
 from nautilus_trader.model.identifiers cimport TraderId
 
 
@@ -137,6 +139,8 @@ cdef class Logger:
         self._clock = clock
         self._log_level_stdout = level_stdout
         self._sinks = []
+        self._ts_cache_secs = -1
+        self._ts_cache_prefix = ""
 
         self.trader_id = trader_id
         self.machine_id = machine_id
@@ -189,6 +193,36 @@ cdef class Logger:
         """
         self._log(record)
 
+    cdef void log_entry(
+        self,
+        LogLevel level,
+        LogColor color,
+        str component,
+        str msg,
+        dict annotations=None,
+    ) except *:
+        """
+        Handle a log entry with the given fields.
+
+        Override this method to handle log entries without first creating a
+        record for each.
+
+        Parameters
+        ----------
+        level : LogLevel
+            The log level for the entry.
+        color : LogColor
+            The color for the entry.
+        component : str
+            The component name for the entry.
+        msg : str
+            The message for the entry.
+        annotations : dict[str, object], optional
+            The annotations for the entry.
+
+        """
+        self.log_c(self.create_record(level, color, component, msg, annotations))
+
     cdef dict create_record(
         self,
         LogLevel level,
@@ -247,12 +281,21 @@ cdef class Logger:
             color_cmd = _RED
 
         # Return the formatted log message from the given arguments
-        cdef str dt = format_iso8601_ns(pd.Timestamp(record["timestamp"], tz="UTC"))
+        cdef str dt = self._format_timestamp(record["timestamp"])
         cdef str trader_id_str = f"{self.trader_id.value}." if self.trader_id is not None else ""
         return (f"{_BOLD}{dt}{_ENDC} {color_cmd}"
                 f"[{LogLevelParser.to_str(level)}] "
                 f"{trader_id_str}{record['component']}: {record['msg']}{_ENDC}")
 
+    cdef str _format_timestamp(self, int64_t timestamp_ns):
+        # Format to ISO 8601 with nanosecond precision, the date and time up to
+        # the second is cached as consecutive records are mostly within it.
+        cdef int64_t secs = timestamp_ns // 1_000_000_000
+        if secs != self._ts_cache_secs:
+            self._ts_cache_secs = secs
+            self._ts_cache_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs))
+        return f"{self._ts_cache_prefix}.{timestamp_ns - secs * 1_000_000_000:09d}Z"
+
 
 cdef class LoggerAdapter:
     """
@@ -315,7 +358,7 @@ cdef class LoggerAdapter:
         if self.is_bypassed:
             return
 
-        cdef dict record = self._logger.create_record(
+        self._logger.log_entry(
             level=LogLevel.DEBUG,
             color=color,
             component=self.component,
@@ -323,8 +366,6 @@ cdef class LoggerAdapter:
             annotations=annotations,
         )
 
-        self._logger.log_c(record)
-
     cpdef void info(
         self, str msg,
         LogColor color=LogColor.NORMAL,
@@ -348,7 +389,7 @@ cdef class LoggerAdapter:
         if self.is_bypassed:
             return
 
-        cdef dict record = self._logger.create_record(
+        self._logger.log_entry(
             level=LogLevel.INFO,
             color=color,
             component=self.component,
@@ -356,8 +397,6 @@ cdef class LoggerAdapter:
             annotations=annotations,
         )
 
-        self._logger.log_c(record)
-
     cpdef void warning(
         self,
         str msg,
@@ -382,7 +421,7 @@ cdef class LoggerAdapter:
         if self.is_bypassed:
             return
 
-        cdef dict record = self._logger.create_record(
+        self._logger.log_entry(
             level=LogLevel.WARNING,
             color=color,
             component=self.component,
@@ -390,8 +429,6 @@ cdef class LoggerAdapter:
             annotations=annotations,
         )
 
-        self._logger.log_c(record)
-
     cpdef void error(
         self,
         str msg,
@@ -416,7 +453,7 @@ cdef class LoggerAdapter:
         if self.is_bypassed:
             return
 
-        cdef dict record = self._logger.create_record(
+        self._logger.log_entry(
             level=LogLevel.ERROR,
             color=color,
             component=self.component,
@@ -424,8 +461,6 @@ cdef class LoggerAdapter:
             annotations=annotations,
         )
 
-        self._logger.log_c(record)
-
     cpdef void critical(
         self,
         str msg,
@@ -450,7 +485,7 @@ cdef class LoggerAdapter:
         if self.is_bypassed:
             return
 
-        cdef dict record = self._logger.create_record(
+        self._logger.log_entry(
             level=LogLevel.CRITICAL,
             color=color,
             component=self.component,
@@ -458,8 +493,6 @@ cdef class LoggerAdapter:
             annotations=annotations,
         )
 
-        self._logger.log_c(record)
-
     cpdef void exception(self, ex, dict annotations=None) except *:
         """
         Log the given exception including stack trace information.
@@ -719,3 +752,220 @@ cdef class LiveLogger(Logger):
 
     cdef void _enqueue_sentinel(self) except *:
         self._queue.put_nowait(self._sentinel)
+
+
+cdef class ThreadedLogger(Logger):
+    """
+    Provides a high-performance logger which formats and writes records on a
+    dedicated thread.
+
+    Log entries are written into a fixed-layout ring buffer, so logging from
+    the caller (typically the event loop thread) does not create a record,
+    format the message or write to any stream. These steps are all performed
+    on the logger thread, which also calls any registered sinks.
+
+    Entries may be logged from any number of threads (slots are claimed under
+    a lock). If the ring buffer is full then further entries below WARNING
+    level are dropped (and counted) until the logger thread has caught up,
+    rather than blocking the caller. Entries at WARNING level and above are
+    never dropped, the caller waits for the logger thread to free a slot.
+
+    Parameters
+    ----------
+    clock : LiveClock
+        The clock for the logger.
+    trader_id : TraderId, optional
+        The trader ID for the logger.
+    machine_id : str, optional
+        The machine ID for the logger.
+    instance_id : UUID4, optional
+        The systems unique instantiation ID.
+    level_stdout : LogLevel
+        The minimum log level for logging messages to stdout.
+    bypass : bool
+        If the logger should be bypassed.
+    capacity : int, optional
+        The capacity of the ring buffer (maximum number of pending entries).
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    Warnings
+    --------
+    Registered sinks are called from the logger thread.
+    """
+
+    def __init__(
+        self,
+        LiveClock clock not None,
+        TraderId trader_id=None,
+        str machine_id=None,
+        UUID4 instance_id=None,
+        LogLevel level_stdout=LogLevel.INFO,
+        bint bypass=False,
+        int capacity=10000,
+    ):
+        Condition.positive_int(capacity, "capacity")
+        super().__init__(
+            clock=clock,
+            trader_id=trader_id,
+            machine_id=machine_id,
+            instance_id=instance_id,
+            level_stdout=level_stdout,
+            bypass=bypass,
+        )
+
+        # Ring buffer slots (fixed layout, one list per field)
+        self._capacity = capacity
+        self._ring_ts = [0] * capacity
+        self._ring_level = [0] * capacity
+        self._ring_color = [0] * capacity
+        self._ring_component = [None] * capacity
+        self._ring_msg = [None] * capacity
+        self._ring_annotations = [None] * capacity
+        self._head = 0  # Next entry to write out (logger thread)
+        self._tail = 0  # Next slot to fill (caller thread)
+        self._dropped_reported = 0
+
+        self._thread = None
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+
+        self.is_running = False
+        self.dropped_count = 0
+
+    cdef void log_entry(
+        self,
+        LogLevel level,
+        LogColor color,
+        str component,
+        str msg,
+        dict annotations=None,
+    ) except *:
+        """
+        Log the given entry.
+
+        If the logger thread is not running then the entry will be passed
+        directly to the `Logger` base class for logging. If the ring buffer is
+        full then an entry below WARNING level is dropped, otherwise the caller
+        waits for a free slot.
+
+        Parameters
+        ----------
+        level : LogLevel
+            The log level for the entry.
+        color : LogColor
+            The color for the entry.
+        component : str
+            The component name for the entry.
+        msg : str
+            The message for the entry.
+        annotations : dict[str, object], optional
+            The annotations for the entry.
+
+        """
+        if not self.is_running:
+            Logger.log_entry(self, level, color, component, msg, annotations)
+            return
+
+        cdef int64_t slot
+        with self._lock:
+            while self.is_running and self._tail - self._head >= self._capacity:
+                if level < LogLevel.WARNING:
+                    self.dropped_count += 1
+                    return
+                # Wait for the logger thread to free a slot (it never takes the lock)
+                self._wake.set()
+                time.sleep(0.001)
+
+            if self.is_running:
+                slot = self._tail % self._capacity
+                self._ring_ts[slot] = self._clock.timestamp_ns()
+                self._ring_level[slot] = level
+                self._ring_color[slot] = color
+                self._ring_component[slot] = component
+                self._ring_msg[slot] = msg
+                self._ring_annotations[slot] = annotations
+                self._tail += 1
+
+                if not self._wake.is_set():
+                    self._wake.set()
+                return
+
+        # Stopped while waiting for the lock (or a free slot)
+        Logger.log_entry(self, level, color, component, msg, annotations)
+
+    cpdef void start(self) except *:
+        """
+        Start the logger thread.
+        """
+        if self.is_running:
+            return
+
+        self.is_running = True
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+        self._thread.start()
+
+    cpdef void stop(self) except *:
+        """
+        Stop the logger thread, once all pending entries have been written.
+
+        Future messages sent to the logger will be passed directly to the
+        `Logger` base class for logging.
+
+        """
+        if not self.is_running:
+            return
+
+        self.is_running = False
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+        # Write any entries logged by other threads while the logger thread exited
+        with self._lock:
+            self._drain()
+
+    def _run(self):
+        while self.is_running:
+            self._wake.clear()
+            if self._head == self._tail:
+                self._wake.wait(timeout=0.1)
+            self._drain()
+
+        # Write any remaining entries
+        self._drain()
+
+    cdef void _drain(self) except *:
+        cdef int64_t slot
+        cdef dict record
+        while self._head < self._tail:
+            slot = self._head % self._capacity
+            record = self.create_record(
+                level=self._ring_level[slot],
+                color=self._ring_color[slot],
+                component=self._ring_component[slot],
+                msg=self._ring_msg[slot],
+                annotations=self._ring_annotations[slot],
+            )
+            record["timestamp"] = self._ring_ts[slot]
+
+            # Release references held by the slot
+            self._ring_component[slot] = None
+            self._ring_msg[slot] = None
+            self._ring_annotations[slot] = None
+            self._head += 1
+
+            self._log(record)
+
+        cdef int64_t dropped = self.dropped_count - self._dropped_reported
+        if dropped > 0:
+            self._dropped_reported += dropped
+            self._log(self.create_record(
+                level=LogLevel.WARNING,
+                color=LogColor.YELLOW,
+                component=type(self).__name__,
+                msg=f"Dropped {dropped} log entries (ring buffer full).",
+            ))
@@ -39,12 +39,33 @@ from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.orderbook.data cimport OrderBookData
 
 
+cdef class TopicRegistry:
+    cdef str _prefix
+    cdef dict _topics
+    cdef object _last_key
+    cdef str _last_topic
+
+    cpdef str get(self, key)
+    cpdef void clear(self) except *
+    cdef str _make_topic(self, key)
+
+
+cdef class BarTopicRegistry(TopicRegistry):
+    cdef str _make_topic(self, key)
+
+
 cdef class DataEngine(Component):
     cdef Cache _cache
 
     cdef dict _clients
     cdef dict _order_book_intervals
     cdef dict _bar_aggregators
+    cdef TopicRegistry _topics_instrument
+    cdef TopicRegistry _topics_deltas
+    cdef TopicRegistry _topics_tickers
+    cdef TopicRegistry _topics_quotes
+    cdef TopicRegistry _topics_trades
+    cdef BarTopicRegistry _topics_bars
 
     cdef readonly int command_count
     """The total count of data commands received by the engine.\n\n:returns: `int`"""
@@ -114,6 +135,10 @@ cdef class DataEngine(Component):
     cdef void _handle_unsubscribe_data(self, DataClient client, DataType data_type) except *
     cdef void _handle_request(self, DataRequest request) except *
 
+# -- TOPICS ----------------------------------------------------------------------------------------
+
+    cdef void _clear_topics(self) except *
+
 # -- DATA HANDLERS ---------------------------------------------------------------------------------
 
     cdef void _handle_data(self, Data data) except *
@@ -57,6 +57,7 @@ from nautilus_trader.data.messages cimport Subscribe
 from nautilus_trader.data.messages cimport Unsubscribe
 from nautilus_trader.model.c_enums.bar_aggregation cimport BarAggregation
 from nautilus_trader.model.c_enums.price_type cimport PriceType
+from nautilus_trader.model.currency cimport Currency
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarType
 from nautilus_trader.model.data.base cimport DataType
@@ -75,6 +76,83 @@ from nautilus_trader.msgbus.bus cimport MessageBus
 from nautilus_trader.data.config import DataEngineConfig
 
 
+cdef class TopicRegistry:
+    """
+    Provides a registry of the message bus topics for instrument data.
+
+    Each topic is built once per instrument and then the same string object
+    is reused for every message. The most recently used instrument ID is
+    checked by identity first, so a stream of data sharing one instrument ID
+    object resolves its topic without hashing.
+
+    Parameters
+    ----------
+    prefix : str
+        The topic prefix, such as "data.quotes".
+    """
+
+    def __init__(self, str prefix not None):
+        self._prefix = prefix
+        self._topics = {}  # type: dict[object, str]
+        self._last_key = None
+        self._last_topic = None
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    cpdef str get(self, key):
+        """
+        Return the topic for the given key, building it on first use only.
+
+        Parameters
+        ----------
+        key : object
+            The key for the topic.
+
+        Returns
+        -------
+        str
+
+        """
+        if key is self._last_key:
+            return self._last_topic
+
+        cdef str topic = self._topics.get(key)
+        if topic is None:
+            topic = self._make_topic(key)
+            self._topics[key] = topic
+
+        self._last_key = key
+        self._last_topic = topic
+        return topic
+
+    cpdef void clear(self) except *:
+        """
+        Clear all topics from the registry.
+        """
+        self._topics.clear()
+        self._last_key = None
+        self._last_topic = None
+
+    cdef str _make_topic(self, key):
+        cdef InstrumentId instrument_id = key
+        return f"{self._prefix}.{instrument_id.venue}.{instrument_id.symbol}"
+
+
+cdef class BarTopicRegistry(TopicRegistry):
+    """
+    Provides a registry of the message bus topics for bar data, keyed on the
+    bar type.
+    """
+
+    def __init__(self):
+        super().__init__(prefix="data.bars")
+
+    cdef str _make_topic(self, key):
+        cdef BarType bar_type = key
+        return f"{self._prefix}.{bar_type}"
+
+
 cdef class DataEngine(Component):
     """
     Provides a high-performance data engine for managing many `DataClient`
@@ -118,6 +196,14 @@ cdef class DataEngine(Component):
         self._order_book_intervals = {}  # type: dict[(InstrumentId, int), list[Callable[[Bar], None]]]
         self._bar_aggregators = {}       # type: dict[BarType, BarAggregator]
 
+        # Topics are built once per instrument (or bar type) and then reused
+        self._topics_instrument = TopicRegistry("data.instrument")
+        self._topics_deltas = TopicRegistry("data.book.deltas")
+        self._topics_tickers = TopicRegistry("data.tickers")
+        self._topics_quotes = TopicRegistry("data.quotes")
+        self._topics_trades = TopicRegistry("data.trades")
+        self._topics_bars = BarTopicRegistry()
+
         # Counters
         self.command_count = 0
         self.data_count = 0
@@ -400,6 +486,7 @@ cdef class DataEngine(Component):
 
         self._order_book_intervals.clear()
         self._bar_aggregators.clear()
+        self._clear_topics()
 
         self._clock.cancel_timers()
         self.command_count = 0
@@ -413,6 +500,7 @@ cdef class DataEngine(Component):
             client.dispose()
 
         self._clock.cancel_timers()
+        self._clear_topics()
 
 # -- COMMANDS --------------------------------------------------------------------------------------
 
@@ -679,9 +767,7 @@ cdef class DataEngine(Component):
                 )
 
         self._msgbus.subscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=self._topics_deltas.get(instrument_id),
             handler=self._maintain_order_book,
             priority=10,
         )
@@ -694,6 +780,9 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(instrument_id, "instrument_id")
 
+        # Pre-build the topic for publishing
+        self._topics_tickers.get(instrument_id)
+
         if instrument_id not in client.subscribed_tickers():
             client.subscribe_ticker(instrument_id)
 
@@ -705,6 +794,9 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(instrument_id, "instrument_id")
 
+        # Pre-build the topic for publishing
+        self._topics_quotes.get(instrument_id)
+
         if instrument_id not in client.subscribed_quote_ticks():
             client.subscribe_quote_ticks(instrument_id)
 
@@ -716,6 +808,9 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(instrument_id, "instrument_id")
 
+        # Pre-build the topic for publishing
+        self._topics_trades.get(instrument_id)
+
         if instrument_id not in client.subscribed_trade_ticks():
             client.subscribe_trade_ticks(instrument_id)
 
@@ -727,6 +822,9 @@ cdef class DataEngine(Component):
         Condition.not_none(client, "client")
         Condition.not_none(bar_type, "bar_type")
 
+        # Pre-build the topic for publishing
+        self._topics_bars.get(bar_type)
+
         if bar_type.is_internally_aggregated() and bar_type not in self._bar_aggregators:
             # Internal aggregation
             self._start_bar_aggregator(client, bar_type)
@@ -788,9 +886,7 @@ cdef class DataEngine(Component):
             return
         else:
             if not self._msgbus.has_subscribers(
-                f"data.instrument"
-                f".{instrument_id.venue}"
-                f".{instrument_id.symbol}",
+                self._topics_instrument.get(instrument_id),
             ):
                 client.unsubscribe_instrument(instrument_id)
 
@@ -805,9 +901,7 @@ cdef class DataEngine(Component):
         Condition.not_none(metadata, "metadata")
 
         if not self._msgbus.has_subscribers(
-            f"data.book.deltas"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._topics_deltas.get(instrument_id),
         ):
             client.unsubscribe_order_book_deltas(instrument_id)
 
@@ -837,9 +931,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.tickers"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._topics_tickers.get(instrument_id),
         ):
             client.unsubscribe_ticker(instrument_id)
 
@@ -852,9 +944,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.quotes"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._topics_quotes.get(instrument_id),
         ):
             client.unsubscribe_quote_ticks(instrument_id)
 
@@ -867,9 +957,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.trades"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            self._topics_trades.get(instrument_id),
         ):
             client.unsubscribe_trade_ticks(instrument_id)
 
@@ -885,7 +973,7 @@ cdef class DataEngine(Component):
             # Internal aggregation
             self._stop_bar_aggregator(client, bar_type)
         else:
-            if not self._msgbus.has_subscribers(f"data.bars.{bar_type}"):
+            if not self._msgbus.has_subscribers(self._topics_bars.get(bar_type)):
                 # External aggregation
                 client.unsubscribe_bars(bar_type)
 
@@ -952,6 +1040,16 @@ cdef class DataEngine(Component):
             except NotImplementedError:
                 self._log.error(f"Cannot handle request: unrecognized data type {request.data_type}.")
 
+# -- TOPICS ----------------------------------------------------------------------------------------
+
+    cdef void _clear_topics(self) except *:
+        self._topics_instrument.clear()
+        self._topics_deltas.clear()
+        self._topics_tickers.clear()
+        self._topics_quotes.clear()
+        self._topics_trades.clear()
+        self._topics_bars.clear()
+
 # -- DATA HANDLERS ---------------------------------------------------------------------------------
 
     cdef void _handle_data(self, Data data) except *:
@@ -979,53 +1077,51 @@ cdef class DataEngine(Component):
             self._log.error(f"Cannot handle data: unrecognized type {type(data)} {data}.")
 
     cdef void _handle_instrument(self, Instrument instrument) except *:
+        cdef Currency base_currency
+        if self._cache.instrument(instrument.id) is None:
+            # Add the currencies of new instruments (so clients never write to the cache)
+            base_currency = instrument.get_base_currency()
+            if base_currency is not None:
+                self._cache.add_currency(base_currency)
+            self._cache.add_currency(instrument.quote_currency)
+
         self._cache.add_instrument(instrument)
         self._msgbus.publish_c(
-            topic=f"data.instrument"
-                  f".{instrument.id.venue}"
-                  f".{instrument.id.symbol}",
+            topic=self._topics_instrument.get(instrument.id),
             msg=instrument,
         )
 
     cdef void _handle_order_book_data(self, OrderBookData data) except *:
         self._msgbus.publish_c(
-            topic=f"data.book.deltas"
-                  f".{data.instrument_id.venue}"
-                  f".{data.instrument_id.symbol}",
+            topic=self._topics_deltas.get(data.instrument_id),
             msg=data,
         )
 
     cdef void _handle_ticker(self, Ticker ticker) except *:
         self._cache.add_ticker(ticker)
         self._msgbus.publish_c(
-            topic=f"data.tickers"
-                  f".{ticker.instrument_id.venue}"
-                  f".{ticker.instrument_id.symbol}",
+            topic=self._topics_tickers.get(ticker.instrument_id),
             msg=ticker,
         )
 
     cdef void _handle_quote_tick(self, QuoteTick tick) except *:
         self._cache.add_quote_tick(tick)
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._topics_quotes.get(tick.instrument_id),
             msg=tick,
         )
 
     cdef void _handle_trade_tick(self, TradeTick tick) except *:
         self._cache.add_trade_tick(tick)
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._topics_trades.get(tick.instrument_id),
             msg=tick,
         )
 
     cdef void _handle_bar(self, Bar bar) except *:
         self._cache.add_bar(bar)
 
-        self._msgbus.publish_c(topic=f"data.bars.{bar.type}", msg=bar)
+        self._msgbus.publish_c(topic=self._topics_bars.get(bar.type), msg=bar)
 
     cdef void _handle_status_update(self, StatusUpdate data) except *:
         self._msgbus.publish_c(topic=f"data.venue.status", msg=data)
@@ -1180,18 +1276,14 @@ cdef class DataEngine(Component):
         instrument_id = bar_type.instrument_id
         if bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.subscribe(
-                topic=f"data.trades"
-                      f".{instrument_id.venue}"
-                      f".{instrument_id.symbol}",
+                topic=self._topics_trades.get(instrument_id),
                 handler=aggregator.handle_trade_tick,
                 priority=5,
             )
             self._handle_subscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.subscribe(
-                topic=f"data.quotes"
-                      f".{instrument_id.venue}"
-                      f".{instrument_id.symbol}",
+                topic=self._topics_quotes.get(instrument_id),
                 handler=aggregator.handle_quote_tick,
                 priority=5,
             )
@@ -1241,17 +1333,13 @@ cdef class DataEngine(Component):
         instrument_id = bar_type.instrument_id
         if bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.unsubscribe(
-                topic=f"data.trades"
-                      f".{instrument_id.venue}"
-                      f".{instrument_id.symbol}",
+                topic=self._topics_trades.get(instrument_id),
                 handler=aggregator.handle_trade_tick,
             )
             self._handle_unsubscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.unsubscribe(
-                topic=f"data.quotes"
-                      f".{instrument_id.venue}"
-                      f".{instrument_id.symbol}",
+                topic=self._topics_quotes.get(instrument_id),
                 handler=aggregator.handle_quote_tick,
             )
             self._handle_unsubscribe_quote_ticks(client, bar_type.instrument_id)
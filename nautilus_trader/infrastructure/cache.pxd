@@ -13,7 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.cache.database cimport CacheDatabase
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport Serializer
 
 
@@ -28,3 +31,24 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
     cdef Serializer _serializer
     cdef object _redis
+    cdef int _batch_size
+
+    cdef readonly bint write_behind
+    """If event writes are buffered and persisted by a background thread.\n\n:returns: `bool`"""
+    cdef double _write_behind_interval
+    cdef list _write_buffer
+    cdef object _write_lock
+    cdef object _flush_lock
+    cdef object _write_wake
+    cdef object _write_stop
+    cdef object _write_thread
+
+    cpdef void flush_writes(self) except *
+    cpdef void close(self) except *
+
+    cdef list _scan_keys(self, str pattern)
+    cdef void _flush_pending(self) except *
+    cdef void _push_event(self, str key, bytes event) except *
+    cdef Account _account_from_events(self, list events)
+    cdef Order _order_from_events(self, list events)
+    cdef Position _position_from_events(self, list events, dict instruments)
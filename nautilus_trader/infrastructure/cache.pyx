@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import redis
 
 from nautilus_trader.accounting.accounts.base cimport Account
@@ -50,6 +53,41 @@ cdef str _POSITIONS = 'Positions'
 cdef str _STRATEGIES = 'Strategies'
 
 
+def _lrange_batch(client, list keys):
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.lrange(key, 0, -1)
+    return pipe.execute()
+
+
+def _mget_batch(client, list keys):
+    return client.mget(keys)
+
+
+def _iter_batches(fetch, client, list keys, int batch_size):
+    # Yields (keys, values) for each batch of keys, fetching the next batch
+    # on a worker thread while the caller deserializes the current one.
+    cdef list batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+    if not batches:
+        return
+
+    cdef int i
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(fetch, client, batches[0])
+        for i in range(len(batches)):
+            values = future.result()
+            if i + 1 < len(batches):
+                future = executor.submit(fetch, client, batches[i + 1])
+            yield batches[i], values
+
+
+def _run_write_behind(RedisCacheDatabase database):
+    while not database._write_stop.is_set():
+        database._write_wake.wait(database._write_behind_interval)
+        database._write_wake.clear()
+        database.flush_writes()
+
+
 cdef class RedisCacheDatabase(CacheDatabase):
     """
     Provides a cache database backed by Redis.
@@ -79,6 +117,11 @@ cdef class RedisCacheDatabase(CacheDatabase):
     timestamp strings back to int64's on the way out. One way to achieve this is
     to set the `timestamps_as_str` flag to true for the `MsgPackSerializer`, as
     per the default implementations for both `TradingNode` and `BacktestEngine`.
+
+    With `write_behind` configured, account, order and position events are
+    buffered and persisted in pipelined batches by a background thread. Any
+    pending events are persisted before loading, on `flush_writes` and on
+    `close`, which should be called when the owning node stops.
     """
 
     def __init__(
@@ -107,6 +150,25 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         # Redis client
         self._redis = redis.Redis(host=config.host, port=config.port, db=0)
+        self._batch_size = config.batch_size
+
+        # Write-behind
+        self.write_behind = config.write_behind
+        self._write_behind_interval = config.write_behind_interval_ms / 1000
+        self._write_buffer = []
+        self._write_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._write_wake = threading.Event()
+        self._write_stop = threading.Event()
+        self._write_thread = None
+        if self.write_behind:
+            self._write_thread = threading.Thread(
+                target=_run_write_behind,
+                args=(self,),
+                name=f"{type(self).__name__}-write-behind",
+                daemon=True,
+            )
+            self._write_thread.start()
 
 # -- COMMANDS --------------------------------------------------------------------------------------
 
@@ -116,9 +178,36 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         """
         self._log.debug("Flushing database....")
+        with self._write_lock:
+            self._write_buffer.clear()
         self._redis.flushdb()
         self._log.info("Flushed database.")
 
+    cpdef void flush_writes(self) except *:
+        """
+        Persist all pending write-behind events to the database.
+
+        Events are written in pipelined batches, in the order they were added.
+
+        """
+        # Flushes are serialized so events for a key are always appended in order
+        with self._flush_lock:
+            self._flush_pending()
+
+    cpdef void close(self) except *:
+        """
+        Close the database, persisting all pending write-behind events.
+
+        """
+        if self._write_thread is not None:
+            self._write_stop.set()
+            self._write_wake.set()
+            self._write_thread.join()
+            self._write_thread = None
+
+        self.flush_writes()
+        self._log.info("Closed database.")
+
     cpdef dict load_currencies(self):
         """
         Load all currencies from the database.
@@ -130,7 +219,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         cdef dict currencies = {}
 
-        cdef list currency_keys = self._redis.keys(f"{self._key_currencies}*")
+        cdef list currency_keys = self._scan_keys(f"{self._key_currencies}*")
         if not currency_keys:
             return currencies
 
@@ -157,20 +246,19 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         cdef dict instruments = {}
 
-        cdef list instrument_keys = self._redis.keys(f"{self._key_instruments}*")
+        cdef list instrument_keys = self._scan_keys(f"{self._key_instruments}*")
         if not instrument_keys:
             return instruments
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef InstrumentId instrument_id
+        cdef list keys
+        cdef list values
+        cdef bytes instrument_bytes
         cdef Instrument instrument
-        for key_bytes in instrument_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            instrument_id = InstrumentId.from_str_c(key_str)
-            instrument = self.load_instrument(instrument_id)
-
-            if instrument is not None:
+        for keys, values in _iter_batches(_mget_batch, self._redis, instrument_keys, self._batch_size):
+            for instrument_bytes in values:
+                if not instrument_bytes:
+                    continue
+                instrument = self._serializer.deserialize(instrument_bytes)
                 instruments[instrument.id] = instrument
 
         return instruments
@@ -184,23 +272,23 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[AccountId, Account]
 
         """
+        self.flush_writes()
+
         cdef dict accounts = {}
 
-        cdef list account_keys = self._redis.keys(f"{self._key_accounts}*")
+        cdef list account_keys = self._scan_keys(f"{self._key_accounts}*")
         if not account_keys:
             return accounts
 
-        cdef bytes key_bytes
-        cdef str account_str
-        cdef AccountId account_id
+        cdef list keys
+        cdef list values
+        cdef list events
         cdef Account account
-        for key_bytes in account_keys:
-            account_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            account_id = AccountId.from_str_c(account_str)
-            account = self.load_account(account_id)
-
-            if account is not None:
-                accounts[account.id] = account
+        for keys, values in _iter_batches(_lrange_batch, self._redis, account_keys, self._batch_size):
+            for events in values:
+                account = self._account_from_events(events)
+                if account is not None:
+                    accounts[account.id] = account
 
         return accounts
 
@@ -213,23 +301,23 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[ClientOrderId, Order]
 
         """
+        self.flush_writes()
+
         cdef dict orders = {}
 
-        cdef list order_keys = self._redis.keys(f"{self._key_orders}*")
+        cdef list order_keys = self._scan_keys(f"{self._key_orders}*")
         if not order_keys:
             return orders
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef ClientOrderId client_order_id
+        cdef list keys
+        cdef list values
+        cdef list events
         cdef Order order
-        for key_bytes in order_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            client_order_id = ClientOrderId(key_str)
-            order = self.load_order(client_order_id)
-
-            if order is not None:
-                orders[order.client_order_id] = order
+        for keys, values in _iter_batches(_lrange_batch, self._redis, order_keys, self._batch_size):
+            for events in values:
+                order = self._order_from_events(events)
+                if order is not None:
+                    orders[order.client_order_id] = order
 
         return orders
 
@@ -242,23 +330,24 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[PositionId, Position]
 
         """
+        self.flush_writes()
+
         cdef dict positions = {}
 
-        cdef list position_keys = self._redis.keys(f"{self._key_positions}*")
+        cdef list position_keys = self._scan_keys(f"{self._key_positions}*")
         if not position_keys:
             return positions
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef PositionId position_id
+        cdef dict instruments = {}  # Instruments loaded so far for the positions
+        cdef list keys
+        cdef list values
+        cdef list events
         cdef Position position
-        for key_bytes in position_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            position_id = PositionId(key_str)
-            position = self.load_position(position_id)
-
-            if position is not None:
-                positions[position.id] = position
+        for keys, values in _iter_batches(_lrange_batch, self._redis, position_keys, self._batch_size):
+            for events in values:
+                position = self._position_from_events(events, instruments)
+                if position is not None:
+                    positions[position.id] = position
 
         return positions
 
@@ -331,22 +420,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(account_id, "account_id")
 
+        self.flush_writes()
+
         cdef list events = self._redis.lrange(
             name=self._key_accounts + account_id.value,
             start=0,
             end=-1,
         )
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
-
-        cdef bytes event
-        cdef Account account = AccountFactory.create_c(self._serializer.deserialize(events[0]))
-        for event in events[1:]:
-            account.apply(event=self._serializer.deserialize(event))
-
-        return account
+        return self._account_from_events(events)
 
     cpdef Order load_order(self, ClientOrderId client_order_id):
         """
@@ -364,24 +446,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
+        self.flush_writes()
+
         cdef list events = self._redis.lrange(
             name=self._key_orders + client_order_id.value,
             start=0,
             end=-1,
         )
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
-
-        cdef OrderInitialized init = self._serializer.deserialize(events.pop(0))
-        cdef Order order = OrderUnpacker.from_init_c(init)
-
-        cdef bytes event_bytes
-        for event_bytes in events:
-            order.apply(self._serializer.deserialize(event_bytes))
-
-        return order
+        return self._order_from_events(events)
 
     cpdef Position load_position(self, PositionId position_id):
         """
@@ -399,32 +472,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(position_id, "position_id")
 
+        self.flush_writes()
+
         cdef list events = self._redis.lrange(
             name=self._key_positions + position_id.value,
             start=0,
             end=-1,
         )
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
-
-        cdef OrderFilled initial_fill = self._serializer.deserialize(events.pop(0))
-        cdef Instrument instrument = self.load_instrument(initial_fill.instrument_id)
-        if instrument is None:
-            self._log.error(
-                f"Cannot load position: "
-                f"no instrument found for {initial_fill.instrument_id}",
-            )
-            return
-
-        cdef Position position = Position(instrument, initial_fill)
-
-        cdef bytes event_bytes
-        for event_bytes in events:
-            position.apply(self._serializer.deserialize(event_bytes))
-
-        return position
+        return self._position_from_events(events, {})
 
     cpdef dict load_strategy(self, StrategyId strategy_id):
         """
@@ -519,9 +575,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(account, "account")
 
+        cdef bytes last_event = self._serializer.serialize(account.last_event_c())
+        if self.write_behind:
+            self._push_event(self._key_accounts + account.id.value, last_event)
+            self._log.debug(f"Added {account}).")
+            return
+
         # Command pipeline
         pipe = self._redis.pipeline()
-        pipe.rpush(self._key_accounts + account.id.value, self._serializer.serialize(account.last_event_c()))
+        pipe.rpush(self._key_accounts + account.id.value, last_event)
         cdef list reply = pipe.execute()
 
         # Check data integrity of reply
@@ -546,6 +608,11 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(order, "order")
 
         cdef bytes last_event = self._serializer.serialize(order.last_event_c())
+        if self.write_behind:
+            self._push_event(self._key_orders + order.client_order_id.value, last_event)
+            self._log.debug(f"Added Order(id={order.client_order_id.value}).")
+            return
+
         cdef int reply = self._redis.rpush(self._key_orders + order.client_order_id.value, last_event)
 
         # Check data integrity of reply
@@ -570,6 +637,11 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(position, "position")
 
         cdef bytes last_event = self._serializer.serialize(position.last_event_c())
+        if self.write_behind:
+            self._push_event(self._key_positions + position.id.value, last_event)
+            self._log.debug(f"Added Position(id={position.id.value}).")
+            return
+
         cdef int reply = self._redis.rpush(self._key_positions + position.id.value, last_event)
 
         # Check data integrity of reply
@@ -620,7 +692,10 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(account, "account")
 
         cdef bytes serialized_event = self._serializer.serialize(account.last_event_c())
-        self._redis.rpush(self._key_accounts + account.id.value, serialized_event)
+        if self.write_behind:
+            self._push_event(self._key_accounts + account.id.value, serialized_event)
+        else:
+            self._redis.rpush(self._key_accounts + account.id.value, serialized_event)
 
         self._log.debug(f"Updated {account}.")
 
@@ -637,6 +712,11 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(order, "order")
 
         cdef bytes serialized_event = self._serializer.serialize(order.last_event_c())
+        if self.write_behind:
+            self._push_event(self._key_orders + order.client_order_id.value, serialized_event)
+            self._log.debug(f"Updated {order}.")
+            return
+
         cdef int reply = self._redis.rpush(self._key_orders + order.client_order_id.value, serialized_event)
 
         # Check data integrity of reply
@@ -658,6 +738,98 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(position, "position")
 
         cdef bytes serialized_event = self._serializer.serialize(position.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_positions + position.id.value, serialized_event)
+        if self.write_behind:
+            self._push_event(self._key_positions + position.id.value, serialized_event)
+        else:
+            self._redis.rpush(self._key_positions + position.id.value, serialized_event)
 
         self._log.debug(f"Updated {position}.")
+
+    cdef void _flush_pending(self) except *:
+        with self._write_lock:
+            if not self._write_buffer:
+                return
+            pending = self._write_buffer
+            self._write_buffer = []
+
+        cdef int i
+        cdef int count = len(pending)
+        cdef str key
+        cdef bytes event
+        for i in range(0, count, self._batch_size):
+            pipe = self._redis.pipeline(transaction=False)
+            for key, event in pending[i:i + self._batch_size]:
+                pipe.rpush(key, event)
+            try:
+                pipe.execute()
+            except redis.RedisError as ex:
+                # Re-queue the unwritten events ahead of any newer events
+                with self._write_lock:
+                    self._write_buffer[:0] = pending[i:]
+                self._log.error(f"Cannot persist {count - i} pending event(s): {ex}.")
+                return
+
+        self._log.debug(f"Persisted {count} pending event(s).")
+
+    cdef void _push_event(self, str key, bytes event) except *:
+        # Data integrity of write-behind replies is not checked
+        with self._write_lock:
+            self._write_buffer.append((key, event))
+            if len(self._write_buffer) >= self._batch_size:
+                self._write_wake.set()
+
+    cdef list _scan_keys(self, str pattern):
+        # Incrementally iterates the keyspace rather than a blocking KEYS,
+        # SCAN may return a key more than once so the keys are deduplicated.
+        return list(set(self._redis.scan_iter(match=pattern, count=self._batch_size)))
+
+    cdef Account _account_from_events(self, list events):
+        # Check there is at least one event to pop
+        if not events:
+            return None
+
+        cdef bytes event
+        cdef Account account = AccountFactory.create_c(self._serializer.deserialize(events[0]))
+        for event in events[1:]:
+            account.apply(event=self._serializer.deserialize(event))
+
+        return account
+
+    cdef Order _order_from_events(self, list events):
+        # Check there is at least one event to pop
+        if not events:
+            return None
+
+        cdef OrderInitialized init = self._serializer.deserialize(events[0])
+        cdef Order order = OrderUnpacker.from_init_c(init)
+
+        cdef bytes event_bytes
+        for event_bytes in events[1:]:
+            order.apply(self._serializer.deserialize(event_bytes))
+
+        return order
+
+    cdef Position _position_from_events(self, list events, dict instruments):
+        # Check there is at least one event to pop
+        if not events:
+            return None
+
+        cdef OrderFilled initial_fill = self._serializer.deserialize(events[0])
+        cdef Instrument instrument = instruments.get(initial_fill.instrument_id)
+        if instrument is None:
+            instrument = self.load_instrument(initial_fill.instrument_id)
+            if instrument is None:
+                self._log.error(
+                    f"Cannot load position: "
+                    f"no instrument found for {initial_fill.instrument_id}",
+                )
+                return None
+            instruments[instrument.id] = instrument
+
+        cdef Position position = Position(instrument, initial_fill)
+
+        cdef bytes event_bytes
+        for event_bytes in events[1:]:
+            position.apply(self._serializer.deserialize(event_bytes))
+
+        return position
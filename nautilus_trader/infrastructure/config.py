@@ -30,9 +30,19 @@ class CacheDatabaseConfig(pydantic.BaseModel):
         The database port.
     flush : bool
         If database should be flushed before start.
+    batch_size : int
+        The maximum number of keys per pipeline for bulk loads and write-behind flushes.
+    write_behind : bool
+        If event writes are buffered and persisted in pipelined batches by a
+        background thread (rather than one round-trip per write).
+    write_behind_interval_ms : int
+        The maximum interval (milliseconds) between write-behind flushes.
     """
 
     type: str = "redis"
     host: str = "localhost"
     port: int = 6379
     flush: bool = False
+    batch_size: pydantic.PositiveInt = 1000
+    write_behind: bool = False
+    write_behind_interval_ms: pydantic.PositiveInt = 100
@@ -24,15 +24,38 @@ from nautilus_trader.data.config import DataEngineConfig
 from nautilus_trader.execution.config import ExecEngineConfig
 from nautilus_trader.infrastructure.cache import CacheDatabaseConfig
 from nautilus_trader.persistence.config import PersistenceConfig
+from nautilus_trader.portfolio.config import PortfolioConfig
 from nautilus_trader.risk.config import RiskEngineConfig
 
 
 class LiveDataEngineConfig(DataEngineConfig):
     """
     Configuration for ``LiveDataEngine`` instances.
+
+    Parameters
+    ----------
+    qsize : PositiveInt
+        The maximum capacity of the internal data and message queues.
+    drain_batch_size : PositiveInt, optional
+        If set, the engine runs a single batch-draining consumer which handles
+        up to this many data items per event loop wakeup.
+    drain_message_budget : PositiveInt
+        The maximum commands, requests and responses handled per event loop
+        wakeup by the batch-draining consumer (before data items).
+    overflow_policy : str, {'block', 'drop_oldest', 'conflate'}
+        The policy applied to data when the data queue is full. 'block' waits
+        for capacity, 'drop_oldest' discards the oldest queued item, and
+        'conflate' holds quote ticks and order book snapshots arriving while
+        the queue is full as one pending value per instrument, replaced by
+        later values until handled (other data is dropped oldest first).
+        Conflated values keep their queue position, so may be handled ahead
+        of data for other instruments received before them.
     """
 
     qsize: PositiveInt = 10000
+    drain_batch_size: Optional[PositiveInt] = None
+    drain_message_budget: PositiveInt = 100
+    overflow_policy: str = "block"
 
 
 class LiveRiskEngineConfig(RiskEngineConfig):
@@ -46,9 +69,19 @@ class LiveRiskEngineConfig(RiskEngineConfig):
 class LiveExecEngineConfig(ExecEngineConfig):
     """
     Configuration for ``LiveExecEngine`` instances.
+
+    Parameters
+    ----------
+    qsize : PositiveInt
+        The maximum capacity of the internal queue.
+    drain_batch_size : PositiveInt, optional
+        If set, the engine handles up to this many messages per event loop
+        wakeup, and messages overflowing a full queue are held in order on an
+        unbounded backlog (never dropped).
     """
 
     qsize: PositiveInt = 10000
+    drain_batch_size: Optional[PositiveInt] = None
 
 
 class TradingNodeConfig(pydantic.BaseModel):
@@ -61,10 +94,16 @@ class TradingNodeConfig(pydantic.BaseModel):
         The trader ID for the node (must be a name and ID tag separated by a hyphen)
     log_level : str, default="INFO"
         The stdout log level for the node.
+    threaded_logger : bool, default=False
+        If log entries should be written on a dedicated logger thread (see
+        ``ThreadedLogger``) rather than an event loop task. Always enabled
+        with `shard_event_loops`, as shard threads log from their own loops.
     cache : CacheConfig, optional
         The cache configuration.
     cache_database : CacheDatabaseConfig, optional
         The cache database configuration.
+    portfolio : PortfolioConfig, optional
+        The portfolio configuration.
     data_engine : LiveDataEngineConfig, optional
         The live data engine configuration.
     risk_engine : LiveRiskEngineConfig, optional
@@ -73,6 +112,11 @@ class TradingNodeConfig(pydantic.BaseModel):
         The live execution engine configuration.
     loop_debug : bool, default=False
         If the asyncio event loop should be in debug mode.
+    shard_event_loops : bool, default=False
+        If each adapters clients should run on their own event loop in a
+        dedicated thread (clients sharing a configuration name prefix share
+        a loop), handing messages off to the core loop. Shard clients must
+        only read from the cache (writes are made by the engines).
     load_strategy_state : bool, default=True
         If trading strategy state should be loaded from the database on start.
     save_strategy_state : bool, default=True
@@ -97,12 +141,15 @@ class TradingNodeConfig(pydantic.BaseModel):
 
     trader_id: str = "TRADER-000"
     log_level: str = "INFO"
+    threaded_logger: bool = False
     cache: Optional[CacheConfig] = None
     cache_database: Optional[CacheDatabaseConfig] = None
+    portfolio: Optional[PortfolioConfig] = None
     data_engine: Optional[LiveDataEngineConfig] = None
     risk_engine: Optional[LiveRiskEngineConfig] = None
     exec_engine: Optional[LiveExecEngineConfig] = None
     loop_debug: bool = False
+    shard_event_loops: bool = False
     load_strategy_state: bool = True
     save_strategy_state: bool = True
     timeout_connection: PositiveFloat = 10.0
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.core.message cimport Message
 from nautilus_trader.data.engine cimport DataEngine
 
 
@@ -22,12 +23,31 @@ cdef class LiveDataEngine(DataEngine):
     cdef object _run_queues_task
     cdef Queue _data_queue
     cdef Queue _message_queue
+    cdef object _data_backlog
+    cdef object _message_backlog
+    cdef object _wakeup
+    cdef dict _conflated
+    cdef int _drain_batch_size
+    cdef int _drain_message_budget
+    cdef bint _drop_oldest
+    cdef bint _conflate
 
     cdef readonly bint is_running
     """If the data engine is running.\n\n:returns: `bool`"""
+    cdef readonly int dropped_count
+    """The count of data items dropped by the overflow policy.\n\n:returns: `int`"""
+    cdef readonly int conflated_count
+    """The count of data items conflated by the overflow policy.\n\n:returns: `int`"""
 
     cpdef int data_qsize(self) except *
     cpdef int message_qsize(self) except *
+    cpdef int backlog_qsize(self) except *
 
     cpdef void kill(self) except *
+    cdef void _handle_data_item(self, item) except *
+    cdef void _handle_message(self, Message message) except *
+    cdef void _wake(self) except *
+    cdef void _put_data(self, item) except *
+    cdef void _put_message(self, Message message) except *
+    cdef void _refill_queues(self) except *
     cdef void _enqueue_sentinels(self) except *
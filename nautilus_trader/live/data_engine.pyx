@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+from collections import deque
 from typing import Optional
 
 from nautilus_trader.cache.cache cimport Cache
@@ -28,11 +29,16 @@ from nautilus_trader.data.engine cimport DataEngine
 from nautilus_trader.data.messages cimport DataCommand
 from nautilus_trader.data.messages cimport DataRequest
 from nautilus_trader.data.messages cimport DataResponse
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.orderbook.data cimport OrderBookSnapshot
 from nautilus_trader.msgbus.bus cimport MessageBus
 
 from nautilus_trader.live.config import LiveDataEngineConfig
 
 
+cdef tuple _OVERFLOW_POLICIES = ("block", "drop_oldest", "conflate")
+cdef tuple _CONFLATED_TYPES = (QuoteTick, OrderBookSnapshot)
+
 cdef class LiveDataEngine(DataEngine):
     """
     Provides a high-performance asynchronous live data engine.
@@ -56,6 +62,8 @@ cdef class LiveDataEngine(DataEngine):
     ------
     TypeError
         If `config` is not of type `LiveDataEngineConfig`.
+    KeyError
+        If `config.overflow_policy` is not a recognized policy.
     """
     _sentinel = None
 
@@ -71,6 +79,7 @@ cdef class LiveDataEngine(DataEngine):
         if config is None:
             config = LiveDataEngineConfig()
         Condition.type(config, LiveDataEngineConfig, "config")
+        Condition.is_in(config.overflow_policy, _OVERFLOW_POLICIES, "overflow_policy", "_OVERFLOW_POLICIES")
         super().__init__(
             msgbus=msgbus,
             cache=cache,
@@ -82,9 +91,20 @@ cdef class LiveDataEngine(DataEngine):
         self._loop = loop
         self._data_queue = Queue(maxsize=config.qsize)
         self._message_queue = Queue(maxsize=config.qsize)
+        self._data_backlog = deque()
+        self._message_backlog = deque()
+        self._wakeup = None  # Future the batched consumer parks on when idle
+        self._conflated = {}  # type: dict[tuple, Data]
+
+        self._drain_batch_size = config.drain_batch_size or 0
+        self._drain_message_budget = config.drain_message_budget
+        self._drop_oldest = config.overflow_policy != "block"
+        self._conflate = config.overflow_policy == "conflate"
 
         self._run_queues_task = None
         self.is_running = False
+        self.dropped_count = 0
+        self.conflated_count = 0
 
     def connect(self):
         """
@@ -144,6 +164,17 @@ cdef class LiveDataEngine(DataEngine):
         """
         return self._message_queue.qsize()
 
+    cpdef int backlog_qsize(self) except *:
+        """
+        Return the number of objects held on the internal overflow backlogs.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._data_backlog) + len(self._message_backlog)
+
     cpdef void kill(self) except *:
         """
         Kill the engine by abruptly cancelling the queue tasks and calling stop.
@@ -161,7 +192,7 @@ cdef class LiveDataEngine(DataEngine):
         Execute the given data command.
 
         If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        until queue size reduces (or hold it on the backlog when batch draining).
 
         Parameters
         ----------
@@ -177,21 +208,18 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._message_queue.put_nowait(command)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_message_queue.put` as message_queue full at "
-                f"{self._message_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._message_queue.put(command))  # Blocking until qsize reduces
+        self._put_message(command)
 
     cpdef void process(self, Data data) except *:
         """
         Process the given data.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then the configured overflow
+        policy is applied. With the 'conflate' policy, once the queue is full a
+        quote tick or order book snapshot is held as the single pending value
+        for its instrument, which later values replace (keeping its position on
+        the queue) until it is handled. Conflated values can therefore be
+        handled ahead of data for other instruments received before them.
 
         Parameters
         ----------
@@ -207,21 +235,28 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(data, "data")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._data_queue.put_nowait(data)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_data_queue.put` as data_queue full at "
-                f"{self._data_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._data_queue.put(data))  # Blocking until qsize reduces
+        cdef tuple key
+        if self._conflate and isinstance(data, _CONFLATED_TYPES):
+            key = (type(data), data.instrument_id)
+            if key in self._conflated:
+                # Replace the pending value (keeps its position on the queue)
+                self._conflated[key] = data
+                self.conflated_count += 1
+                return
+            if self._data_queue.full():
+                # Conflate the instrument until its pending value is handled
+                self._conflated[key] = data
+                self._put_data(key)
+                return
+
+        self._put_data(data)
 
     cpdef void request(self, DataRequest request) except *:
         """
         Handle the given request.
 
         If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        until queue size reduces (or hold it on the backlog when batch draining).
 
         Parameters
         ----------
@@ -237,21 +272,14 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(request, "request")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._message_queue.put_nowait(request)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_message_queue.put` as message_queue full at "
-                f"{self._message_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._message_queue.put(request))  # Blocking until qsize reduces
+        self._put_message(request)
 
     cpdef void response(self, DataResponse response) except *:
         """
         Handle the given response.
 
         If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        until queue size reduces (or hold it on the backlog when batch draining).
 
         Parameters
         ----------
@@ -266,14 +294,7 @@ cdef class LiveDataEngine(DataEngine):
         """
         Condition.not_none(response, "response")
 
-        try:
-            self._message_queue.put_nowait(response)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_message_queue.put` as message_queue full at "
-                f"{self._message_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._message_queue.put(response))  # Blocking until qsize reduces
+        self._put_message(response)
 
     cpdef void _on_start(self) except *:
         if not self._loop.is_running():
@@ -282,10 +303,13 @@ cdef class LiveDataEngine(DataEngine):
         self.is_running = True  # Queues will continue to process
 
         # Run queues
-        self._run_queues_task = asyncio.gather(
-            self._loop.create_task(self._run_data_queue()),
-            self._loop.create_task(self._run_message_queue()),
-        )
+        if self._drain_batch_size > 0:
+            self._run_queues_task = self._loop.create_task(self._run_queues_batched())
+        else:
+            self._run_queues_task = asyncio.gather(
+                self._loop.create_task(self._run_data_queue()),
+                self._loop.create_task(self._run_message_queue()),
+            )
 
         self._log.debug(f"Scheduled {self._run_queues_task}")
 
@@ -296,13 +320,12 @@ cdef class LiveDataEngine(DataEngine):
 
     async def _run_data_queue(self):
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})...")
-        cdef Data data
         try:
             while self.is_running:
-                data = await self._data_queue.get()
-                if data is None:  # Sentinel message (fast C-level check)
+                item = await self._data_queue.get()
+                if item is None:  # Sentinel message (fast C-level check)
                     continue      # Returns to the top to check `self.is_running`
-                self._handle_data(data)
+                self._handle_data_item(item)
         except asyncio.CancelledError:
             if not self._data_queue.empty():
                 self._log.warning(
@@ -323,14 +346,7 @@ cdef class LiveDataEngine(DataEngine):
                 message = await self._message_queue.get()
                 if message is None:  # Sentinel message (fast C-level check)
                     continue         # Returns to the top to check `self.is_running`
-                if message.category == MessageCategory.COMMAND:
-                    self._execute_command(message)
-                elif message.category == MessageCategory.REQUEST:
-                    self._handle_request(message)
-                elif message.category == MessageCategory.RESPONSE:
-                    self._handle_response(message)
-                else:
-                    self._log.error(f"Cannot handle message: unrecognized {message}.")
+                self._handle_message(message)
         except asyncio.CancelledError:
             if not self._message_queue.empty():
                 self._log.warning(
@@ -341,8 +357,140 @@ cdef class LiveDataEngine(DataEngine):
                     f"Message queue processing stopped (qsize={self.message_qsize()}).",
                 )
 
+    async def _run_queues_batched(self):
+        self._log.debug(
+            f"Batched queue processing starting "
+            f"(data_qsize={self.data_qsize()}, message_qsize={self.message_qsize()})...",
+        )
+        cdef int count
+        cdef Message message
+        try:
+            while self.is_running:
+                # Commands, requests and responses first (up to the fairness budget)
+                count = 0
+                while count < self._drain_message_budget and not self._message_queue.empty():
+                    message = self._message_queue.get_nowait()
+                    count += 1
+                    if message is None:  # Sentinel message
+                        continue
+                    self._handle_message(message)
+
+                count = 0
+                while count < self._drain_batch_size and not self._data_queue.empty():
+                    item = self._data_queue.get_nowait()
+                    count += 1
+                    if item is None:  # Sentinel message
+                        continue
+                    self._handle_data_item(item)
+
+                self._refill_queues()
+                if self._data_queue.empty() and self._message_queue.empty():
+                    # Park until an item is put on either queue
+                    self._wakeup = self._loop.create_future()
+                    await self._wakeup
+                    self._wakeup = None
+                else:
+                    await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            if (
+                not self._data_queue.empty()
+                or not self._message_queue.empty()
+                or self._data_backlog
+                or self._message_backlog
+            ):
+                self._log.warning(
+                    f"Running canceled with {self.data_qsize()} data item(s) "
+                    f"and {self.message_qsize()} message(s) on queues "
+                    f"(and {self.backlog_qsize()} held on backlogs).",
+                )
+            else:
+                self._log.debug(
+                    f"Batched queue processing stopped "
+                    f"(data_qsize={self.data_qsize()}, message_qsize={self.message_qsize()}).",
+                )
+
+    cdef void _handle_data_item(self, item) except *:
+        if type(item) is tuple:  # Conflation key
+            item = self._conflated.pop(item)
+        self._handle_data(item)
+
+    cdef void _handle_message(self, Message message) except *:
+        if message.category == MessageCategory.COMMAND:
+            self._execute_command(message)
+        elif message.category == MessageCategory.REQUEST:
+            self._handle_request(message)
+        elif message.category == MessageCategory.RESPONSE:
+            self._handle_response(message)
+        else:
+            self._log.error(f"Cannot handle message: unrecognized {message}.")
+
+    cdef void _wake(self) except *:
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    cdef void _put_data(self, item) except *:
+        self._wake()
+        if self._data_backlog:
+            self._data_backlog.append(item)  # Preserve order behind the backlog
+            return
+
+        try:
+            self._data_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if self._drop_oldest:
+                dropped = self._data_queue.get_nowait()
+                if type(dropped) is tuple:  # Conflation key
+                    self._conflated.pop(dropped, None)
+                self.dropped_count += 1
+                self._data_queue.put_nowait(item)
+            elif self._drain_batch_size > 0:
+                self._log.warning(
+                    f"Holding data on backlog as data_queue full at "
+                    f"{self._data_queue.qsize()} items.",
+                )
+                self._data_backlog.append(item)
+            else:
+                self._log.warning(
+                    f"Blocking on `_data_queue.put` as data_queue full at "
+                    f"{self._data_queue.qsize()} items.",
+                )
+                self._loop.create_task(self._data_queue.put(item))  # Blocking until qsize reduces
+
+    cdef void _put_message(self, Message message) except *:
+        self._wake()
+        if self._message_backlog:
+            self._message_backlog.append(message)  # Preserve order behind the backlog
+            return
+
+        try:
+            self._message_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            if self._drain_batch_size > 0:
+                self._log.warning(
+                    f"Holding message on backlog as message_queue full at "
+                    f"{self._message_queue.qsize()} items.",
+                )
+                self._message_backlog.append(message)
+            else:
+                self._log.warning(
+                    f"Blocking on `_message_queue.put` as message_queue full at "
+                    f"{self._message_queue.qsize()} items.",
+                )
+                self._loop.create_task(self._message_queue.put(message))  # Blocking until qsize reduces
+
+    cdef void _refill_queues(self) except *:
+        while self._message_backlog and not self._message_queue.full():
+            self._message_queue.put_nowait(self._message_backlog.popleft())
+        while self._data_backlog and not self._data_queue.full():
+            self._data_queue.put_nowait(self._data_backlog.popleft())
+
     cdef void _enqueue_sentinels(self) except *:
-        self._data_queue.put_nowait(self._sentinel)
-        self._message_queue.put_nowait(self._sentinel)
-        self._log.debug(f"Sentinel message placed on data queue.")
-        self._log.debug(f"Sentinel message placed on message queue.")
+        self._wake()
+        # A full queue needs no sentinel, its consumer is not waiting on `get`
+        # and checks `self.is_running` after the next item
+        if not self._data_queue.full():
+            self._data_queue.put_nowait(self._sentinel)
+            self._log.debug(f"Sentinel message placed on data queue.")
+        if not self._message_queue.full():
+            self._message_queue.put_nowait(self._sentinel)
+            self._log.debug(f"Sentinel message placed on message queue.")
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.core.message cimport Message
 from nautilus_trader.execution.engine cimport ExecutionEngine
 
 
@@ -21,11 +22,18 @@ cdef class LiveExecutionEngine(ExecutionEngine):
     cdef object _loop
     cdef object _run_queue_task
     cdef Queue _queue
+    cdef object _backlog
+    cdef object _wakeup
+    cdef int _drain_batch_size
 
     cdef readonly bint is_running
     """If the execution engine is running.\n\n:returns: `bool`"""
 
     cpdef int qsize(self) except *
+    cpdef int backlog_qsize(self) except *
 
     cpdef void kill(self) except *
+    cdef void _handle_message(self, Message message) except *
+    cdef void _wake(self) except *
+    cdef void _put(self, Message message) except *
     cdef void _enqueue_sentinel(self) except *
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+from collections import deque
 from typing import Optional
 
 from pydantic import PositiveInt
@@ -92,6 +93,9 @@ cdef class LiveExecutionEngine(ExecutionEngine):
 
         self._loop = loop
         self._queue = Queue(maxsize=config.qsize)
+        self._backlog = deque()
+        self._wakeup = None  # Future the batched consumer parks on when idle
+        self._drain_batch_size = config.drain_batch_size or 0
 
         self._run_queue_task = None
         self.is_running = False
@@ -132,6 +136,17 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         """
         return self._queue.qsize()
 
+    cpdef int backlog_qsize(self) except *:
+        """
+        Return the number of messages held on the internal overflow backlog.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._backlog)
+
     async def reconcile_state(self, double timeout_secs) -> bool:
         """
         Reconcile the execution engines state with all execution clients.
@@ -265,7 +280,7 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         Execute the given command.
 
         If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        until queue size reduces (or hold it on the backlog when batch draining).
 
         Parameters
         ----------
@@ -281,21 +296,14 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         Condition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._queue.put_nowait(command)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_queue.put` as queue full "
-                f"at {self._queue.qsize()} items.",
-            )
-            self._loop.create_task(self._queue.put(command))  # Blocking until qsize reduces
+        self._put(command)
 
     cpdef void process(self, OrderEvent event) except *:
         """
         Process the given event.
 
         If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        until queue size reduces (or hold it on the backlog when batch draining).
 
         Parameters
         ----------
@@ -310,21 +318,17 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         """
         Condition.not_none(event, "event")
 
-        try:
-            self._queue.put_nowait(event)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_queue.put` as queue full "
-                f"at {self._queue.qsize()} items.",
-            )
-            self._loop.create_task(self._queue.put(event))  # Blocking until qsize reduces
+        self._put(event)
 
     cpdef void _on_start(self) except *:
         if not self._loop.is_running():
             self._log.warning("Started when loop is not running.")
 
         self.is_running = True  # Queue will continue to process
-        self._run_queue_task = self._loop.create_task(self._run())
+        if self._drain_batch_size > 0:
+            self._run_queue_task = self._loop.create_task(self._run_batched())
+        else:
+            self._run_queue_task = self._loop.create_task(self._run())
 
         self._log.debug(f"Scheduled {self._run_queue_task}")
 
@@ -343,12 +347,7 @@ cdef class LiveExecutionEngine(ExecutionEngine):
                 message = await self._queue.get()
                 if message is None:  # Sentinel message (fast C-level check)
                     continue         # Returns to the top to check `self.is_running`
-                if message.category == MessageCategory.EVENT:
-                    self._handle_event(message)
-                elif message.category == MessageCategory.COMMAND:
-                    self._execute_command(message)
-                else:
-                    self._log.error(f"Cannot handle message: unrecognized {message}.")
+                self._handle_message(message)
         except asyncio.CancelledError:
             if not self._queue.empty():
                 self._log.warning(
@@ -359,6 +358,80 @@ cdef class LiveExecutionEngine(ExecutionEngine):
                     f"Message queue processing stopped (qsize={self.qsize()}).",
                 )
 
+    async def _run_batched(self):
+        self._log.debug(
+            f"Batched message queue processing starting (qsize={self.qsize()})...",
+        )
+        cdef int count
+        cdef Message message
+        try:
+            while self.is_running:
+                count = 0
+                while count < self._drain_batch_size and not self._queue.empty():
+                    message = self._queue.get_nowait()
+                    count += 1
+                    if message is None:  # Sentinel message
+                        continue
+                    self._handle_message(message)
+
+                # Refill from the backlog in order
+                while self._backlog and not self._queue.full():
+                    self._queue.put_nowait(self._backlog.popleft())
+
+                if self._queue.empty():
+                    # Park until a message is put on the queue
+                    self._wakeup = self._loop.create_future()
+                    await self._wakeup
+                    self._wakeup = None
+                else:
+                    await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            if not self._queue.empty() or self._backlog:
+                self._log.warning(
+                    f"Running canceled with {self.qsize() + self.backlog_qsize()} "
+                    f"message(s) on queue and backlog.",
+                )
+            else:
+                self._log.debug(
+                    f"Batched message queue processing stopped (qsize={self.qsize()}).",
+                )
+
+    cdef void _handle_message(self, Message message) except *:
+        if message.category == MessageCategory.EVENT:
+            self._handle_event(message)
+        elif message.category == MessageCategory.COMMAND:
+            self._execute_command(message)
+        else:
+            self._log.error(f"Cannot handle message: unrecognized {message}.")
+
+    cdef void _wake(self) except *:
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    cdef void _put(self, Message message) except *:
+        self._wake()
+        if self._backlog:
+            self._backlog.append(message)  # Preserve order behind the backlog
+            return
+
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            if self._drain_batch_size > 0:
+                # Execution messages are never dropped
+                self._log.warning(
+                    f"Holding message on backlog as queue full "
+                    f"at {self._queue.qsize()} items.",
+                )
+                self._backlog.append(message)
+            else:
+                self._log.warning(
+                    f"Blocking on `_queue.put` as queue full "
+                    f"at {self._queue.qsize()} items.",
+                )
+                self._loop.create_task(self._queue.put(message))  # Blocking until qsize reduces
+
     cdef void _enqueue_sentinel(self) except *:
+        self._wake()
         self._queue.put_nowait(self._sentinel)
         self._log.debug(f"Sentinel message placed on message queue.")
@@ -17,7 +17,7 @@ import asyncio
 
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.clock import LiveClock
-from nautilus_trader.common.logging import LiveLogger
+from nautilus_trader.common.logging import Logger
 from nautilus_trader.msgbus.bus import MessageBus
 
 
@@ -34,7 +34,7 @@ class LiveDataClientFactory:
         msgbus: MessageBus,
         cache: Cache,
         clock: LiveClock,
-        logger: LiveLogger,
+        logger: Logger,
         client_cls=None,
     ):
         """
@@ -54,7 +54,7 @@ class LiveDataClientFactory:
             The cache for the client.
         clock : LiveClock
             The clock for the client.
-        logger : LiveLogger
+        logger : Logger
             The logger for the client.
         client_cls : class, optional
             The internal client constructor. This allows external library and
@@ -81,7 +81,7 @@ class LiveExecutionClientFactory:
         msgbus: MessageBus,
         cache: Cache,
         clock: LiveClock,
-        logger: LiveLogger,
+        logger: Logger,
         client_cls=None,
     ):
         """
@@ -101,7 +101,7 @@ class LiveExecutionClientFactory:
             The cache for the client.
         clock : LiveClock
             The clock for the client.
-        logger : LiveLogger
+        logger : Logger
             The logger for the client.
         client_cls : class, optional
             The internal client constructor. This allows external library and
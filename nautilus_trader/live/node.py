@@ -23,7 +23,7 @@ import time
 import warnings
 from datetime import timedelta
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import msgpack
 import orjson
@@ -35,6 +35,7 @@ from nautilus_trader.common.logging import LiveLogger
 from nautilus_trader.common.logging import LogColor
 from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.common.logging import LogLevelParser
+from nautilus_trader.common.logging import ThreadedLogger
 from nautilus_trader.common.logging import nautilus_header
 from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.core.correctness import PyCondition
@@ -49,7 +50,7 @@ from nautilus_trader.msgbus.bus import MessageBus
 from nautilus_trader.persistence.config import PersistenceConfig
 from nautilus_trader.persistence.streaming import FeatherWriter
 from nautilus_trader.portfolio.portfolio import Portfolio
-from nautilus_trader.serialization.msgpack.serializer import MsgPackSerializer
+from nautilus_trader.serialization.msgpack.schema import MsgPackSchemaSerializer
 from nautilus_trader.trading.trader import Trader
 
 
@@ -105,14 +106,23 @@ class TradingNode:
         self.instance_id = self._uuid_factory.generate()
 
         # Setup logging
-        self._logger = LiveLogger(
-            loop=self._loop,
-            clock=self._clock,
-            trader_id=self.trader_id,
-            machine_id=self.machine_id,
-            instance_id=self.instance_id,
-            level_stdout=LogLevelParser.from_str_py(config.log_level.upper()),
-        )
+        if config.threaded_logger or config.shard_event_loops:
+            self._logger = ThreadedLogger(
+                clock=self._clock,
+                trader_id=self.trader_id,
+                machine_id=self.machine_id,
+                instance_id=self.instance_id,
+                level_stdout=LogLevelParser.from_str_py(config.log_level.upper()),
+            )
+        else:
+            self._logger = LiveLogger(
+                loop=self._loop,
+                clock=self._clock,
+                trader_id=self.trader_id,
+                machine_id=self.machine_id,
+                instance_id=self.instance_id,
+                level_stdout=LogLevelParser.from_str_py(config.log_level.upper()),
+            )
 
         self._log = LoggerAdapter(
             component_name=type(self).__name__,
@@ -136,7 +146,7 @@ class TradingNode:
             cache_db = RedisCacheDatabase(
                 trader_id=self.trader_id,
                 logger=self._logger,
-                serializer=MsgPackSerializer(timestamps_as_str=True),
+                serializer=MsgPackSchemaSerializer(timestamps_as_str=True),
                 config=config.cache_database,
             )
         else:  # pragma: no cover (design-time error)
@@ -145,6 +155,8 @@ class TradingNode:
                 "can one of {{'in-memory', 'redis'}}.",
             )
 
+        self._cache_db = cache_db
+
         self._msgbus = MessageBus(
             trader_id=self.trader_id,
             clock=self._clock,
@@ -162,6 +174,7 @@ class TradingNode:
             cache=self._cache,
             clock=self._clock,
             logger=self._logger,
+            config=config.portfolio,
         )
 
         self._data_engine = LiveDataEngine(
@@ -222,6 +235,7 @@ class TradingNode:
             clock=self._clock,
             logger=self._logger,
             log=self._log,
+            shard_event_loops=config.shard_event_loops,
         )
 
         self._log.info("INITIALIZED.")
@@ -265,13 +279,13 @@ class TradingNode:
         """
         return self._loop
 
-    def get_logger(self) -> LiveLogger:
+    def get_logger(self) -> Union[LiveLogger, ThreadedLogger]:
         """
         Return the logger for the trading node.
 
         Returns
         -------
-        LiveLogger
+        LiveLogger or ThreadedLogger
 
         """
         return self._logger
@@ -509,6 +523,10 @@ class TradingNode:
             self._exec_engine.start()
             self._risk_engine.start()
 
+            # Start client event loop shards
+            for shard in self._builder.shards():
+                shard.start()
+
             # Connect all clients
             self._data_engine.connect()
             self._exec_engine.connect()
@@ -659,6 +677,8 @@ class TradingNode:
                 f"\nExecEngine.check_disconnected() == {self._exec_engine.check_disconnected()}"
             )
 
+        self._stop_shards()
+
         # Clean up remaining timers
         timer_names = self._clock.timer_names()
         self._clock.cancel_timers()
@@ -670,10 +690,27 @@ class TradingNode:
         for writer in self.persistence_writers:
             writer.close()
 
+        # Persist any pending cache database writes
+        if self._cache_db is not None:
+            self._cache_db.close()
+
         self._log.info("STOPPED.")
         self._logger.stop()
         self._is_running = False
 
+    def _stop_shards(self) -> None:
+        # Stop client event loop shards
+        for shard in self._builder.shards():
+            msgbus = shard.msgbus
+            self._log.info(
+                f"Stopping {shard.name} event loop shard "
+                f"(handoffs={msgbus.handoff_count}, "
+                f"batches={msgbus.handoff_batches}, "
+                f"avg_latency={msgbus.handoff_latency_avg_ns / 1000:.1f}us, "
+                f"max_latency={msgbus.handoff_latency_max_ns / 1000:.1f}us)...",
+            )
+            shard.stop(timeout=self._config.timeout_disconnection)
+
     async def _await_engines_disconnected(self) -> bool:
         seconds = self._config.timeout_disconnection
         timeout: timedelta = self._clock.utc_now() + timedelta(seconds=seconds)
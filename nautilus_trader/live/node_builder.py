@@ -14,17 +14,18 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
-from typing import Dict
+from typing import Dict, List
 
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.clock import LiveClock
-from nautilus_trader.common.logging import LiveLogger
+from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.live.data_engine import LiveDataEngine
 from nautilus_trader.live.execution_engine import LiveExecutionEngine
 from nautilus_trader.live.factories import LiveDataClientFactory
 from nautilus_trader.live.factories import LiveExecutionClientFactory
+from nautilus_trader.live.sharding import EventLoopShard
 from nautilus_trader.msgbus.bus import MessageBus
 
 
@@ -46,10 +47,12 @@ class TradingNodeBuilder:
         The cache for building clients.
     clock : LiveClock
         The clock for building clients.
-    logger : LiveLogger
+    logger : Logger
         The logger for building clients.
     log : LoggerAdapter
         The trading nodes logger.
+    shard_event_loops : bool, default=False
+        If each adapters clients should be built on their own event loop shard.
     """
 
     def __init__(
@@ -60,8 +63,9 @@ class TradingNodeBuilder:
         msgbus: MessageBus,
         cache: Cache,
         clock: LiveClock,
-        logger: LiveLogger,
+        logger: Logger,
         log: LoggerAdapter,
+        shard_event_loops: bool = False,
     ):
         self._msgbus = msgbus
         self._cache = cache
@@ -76,6 +80,20 @@ class TradingNodeBuilder:
         self._data_factories: Dict[str, LiveDataClientFactory] = {}
         self._exec_factories: Dict[str, LiveExecutionClientFactory] = {}
 
+        self._shard_event_loops = shard_event_loops
+        self._shards: Dict[str, EventLoopShard] = {}
+
+    def shards(self) -> List[EventLoopShard]:
+        """
+        Return the event loop shards built for the clients.
+
+        Returns
+        -------
+        list[EventLoopShard]
+
+        """
+        return list(self._shards.values())
+
     def add_data_client_factory(self, name: str, factory):
         """
         Add the given data client factory to the builder.
@@ -155,13 +173,19 @@ class TradingNodeBuilder:
             pieces = name.partition("-")
             factory = self._data_factories[pieces[0]]
 
+            if self._shard_event_loops:
+                shard = self._get_shard(pieces[0])
+                loop, msgbus, clock = shard.loop, shard.msgbus, shard.clock
+            else:
+                loop, msgbus, clock = self._loop, self._msgbus, self._clock
+
             client = factory.create(
-                loop=self._loop,
+                loop=loop,
                 name=name,
                 config=options,
-                msgbus=self._msgbus,
+                msgbus=msgbus,
                 cache=self._cache,
-                clock=self._clock,
+                clock=clock,
                 logger=self._logger,
             )
 
@@ -186,14 +210,33 @@ class TradingNodeBuilder:
             pieces = name.partition("-")
             factory = self._exec_factories[pieces[0]]
 
+            if self._shard_event_loops:
+                shard = self._get_shard(pieces[0])
+                loop, msgbus, clock = shard.loop, shard.msgbus, shard.clock
+            else:
+                loop, msgbus, clock = self._loop, self._msgbus, self._clock
+
             client = factory.create(
-                loop=self._loop,
+                loop=loop,
                 name=name,
                 config=options,
-                msgbus=self._msgbus,
+                msgbus=msgbus,
                 cache=self._cache,
-                clock=self._clock,
+                clock=clock,
                 logger=self._logger,
             )
 
             self._exec_engine.register_client(client)
+
+    def _get_shard(self, name: str) -> EventLoopShard:
+        shard = self._shards.get(name)
+        if shard is None:
+            shard = EventLoopShard(
+                name=name,
+                loop=self._loop,
+                msgbus=self._msgbus,
+                logger=self._logger,
+            )
+            self._shards[name] = shard
+            self._log.info(f"Built event loop shard for {name}.")
+        return shard
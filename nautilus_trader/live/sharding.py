@@ -0,0 +1,404 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+"""
+Provides per-adapter event loop shards for the `TradingNode`.
+
+Each shard runs an event loop in its own thread, so that an adapters network
+I/O and message parsing does not delay the other adapters on the core loop.
+Messages sent or published on the bus by the adapters clients are handed off
+to the core loop through a batch-drained queue.
+
+Shard clients share the core `Cache` but must only read from it, all writes
+are made on the core loop (by the engines handling the clients messages).
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.msgbus.bus import MessageBus
+
+
+try:
+    import uvloop
+
+    _BaseEventLoop = uvloop.Loop
+except ImportError:  # pragma: no cover
+    _BaseEventLoop = asyncio.SelectorEventLoop
+
+
+class _ShardTimerHandle:
+    """
+    Provides a handle for a timer scheduled on a shard from another thread.
+
+    The timer is created on the shards loop thread, so cancellation is also
+    handed to the loop thread (where it runs after the timer was created).
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, when: float):
+        self._loop = loop
+        self._when = when
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._cancelled = False
+
+    def when(self) -> float:
+        return self._when
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        if self._cancelled:
+            return
+        self._cancelled = True
+        self._loop.call_soon_threadsafe(self._cancel)
+
+    def _schedule(self, callback, args, kwargs) -> None:
+        if self._cancelled:
+            return
+        self._handle = self._loop.call_at(self._when, callback, *args, **kwargs)
+
+    def _cancel(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+
+
+class ShardEventLoop(_BaseEventLoop):
+    """
+    Provides an event loop which may be scheduled on from other threads.
+
+    Calls to `create_task`, `call_soon`, `call_later`, `call_at` and
+    `run_in_executor` from a thread other than the one running the loop are
+    handed to the loop thread safely, so clients built with the loop can be
+    driven by the engines on the core loop.
+
+    From another thread `create_task` and `run_in_executor` return a
+    `concurrent.futures.Future`, which may be awaited with
+    `asyncio.wrap_future`.
+    """
+
+    _shard_thread_id: Optional[int] = None
+
+    def _is_foreign_thread(self) -> bool:
+        return self._shard_thread_id is not None and threading.get_ident() != self._shard_thread_id
+
+    def create_task(self, coro, **kwargs):
+        if self._is_foreign_thread():
+            return asyncio.run_coroutine_threadsafe(coro, self)
+        return super().create_task(coro, **kwargs)
+
+    def call_soon(self, callback, *args, **kwargs):
+        if self._is_foreign_thread():
+            return self.call_soon_threadsafe(callback, *args, **kwargs)
+        return super().call_soon(callback, *args, **kwargs)
+
+    def call_later(self, delay, callback, *args, **kwargs):
+        if self._is_foreign_thread():
+            return self.call_at(self.time() + delay, callback, *args, **kwargs)
+        return super().call_later(delay, callback, *args, **kwargs)
+
+    def call_at(self, when, callback, *args, **kwargs):
+        if self._is_foreign_thread():
+            handle = _ShardTimerHandle(self, when)
+            self.call_soon_threadsafe(handle._schedule, callback, args, kwargs)
+            return handle
+        return super().call_at(when, callback, *args, **kwargs)
+
+    def run_in_executor(self, executor, func, *args):
+        if self._is_foreign_thread():
+            return asyncio.run_coroutine_threadsafe(
+                self._run_in_executor(executor, func, *args),
+                self,
+            )
+        return super().run_in_executor(executor, func, *args)
+
+    async def _run_in_executor(self, executor, func, *args):
+        return await super().run_in_executor(executor, func, *args)
+
+
+class ShardMessageBus(MessageBus):
+    """
+    Provides a message bus proxy for clients running on an event loop shard.
+
+    Messages sent to endpoints or published to topics are queued and
+    dispatched on the core message bus by the core event loop in batches,
+    preserving the send order. Subscribing on the shard is not supported, as
+    handlers would be called from the core loop thread.
+
+    Parameters
+    ----------
+    msgbus : MessageBus
+        The core message bus to dispatch messages on.
+    loop : asyncio.AbstractEventLoop
+        The core event loop to dispatch messages with.
+    clock : LiveClock
+        The clock for the message bus.
+    logger : Logger
+        The logger for the message bus.
+    name : str, optional
+        The custom name for the message bus.
+    """
+
+    def __init__(
+        self,
+        msgbus: MessageBus,
+        loop: asyncio.AbstractEventLoop,
+        clock: LiveClock,
+        logger: Logger,
+        name: str = None,
+    ):
+        super().__init__(
+            trader_id=msgbus.trader_id,
+            clock=clock,
+            logger=logger,
+            name=name,
+        )
+
+        self._core = msgbus
+        self._core_loop = loop
+        self._pending: deque = deque()
+        self._drain_scheduled = False
+
+        # Handoff metrics
+        self.handoff_count = 0
+        self.handoff_batches = 0
+        self.handoff_latency_max_ns = 0
+        self._handoff_latency_total_ns = 0
+
+    @property
+    def handoff_latency_avg_ns(self) -> float:
+        """
+        The average latency between sending a message and it being dispatched
+        on the core loop (nanoseconds).
+
+        Returns
+        -------
+        float
+
+        """
+        if self.handoff_count == 0:
+            return 0.0
+        return self._handoff_latency_total_ns / self.handoff_count
+
+    def pending_count(self) -> int:
+        """
+        Return the count of messages awaiting dispatch on the core loop.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._pending)
+
+    def send(self, endpoint: str, msg: Any) -> None:
+        """
+        Send the given message to the given endpoint address on the core loop.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint address to send the message to.
+        msg : object
+            The message to send.
+
+        """
+        PyCondition.not_none(endpoint, "endpoint")
+        PyCondition.not_none(msg, "msg")
+
+        self._handoff(self._core.send, endpoint, msg)
+
+    def publish(self, topic: str, msg: Any) -> None:
+        """
+        Publish the given message for the given topic on the core loop.
+
+        Parameters
+        ----------
+        topic : str
+            The topic to publish on.
+        msg : object
+            The message to publish.
+
+        """
+        PyCondition.not_none(topic, "topic")
+        PyCondition.not_none(msg, "msg")
+
+        self._handoff(self._core.publish, topic, msg)
+
+    def subscribe(self, topic: str, handler: Callable[[Any], None], priority: int = 0) -> None:
+        """
+        Not supported on a shard (subscribe on the core message bus instead).
+
+        Raises
+        ------
+        RuntimeError
+            Always.
+
+        """
+        raise RuntimeError(
+            f"cannot subscribe to {topic} on {self}, subscribe on the core message bus",
+        )
+
+    def unsubscribe(self, topic: str, handler: Callable[[Any], None]) -> None:
+        """
+        Not supported on a shard (unsubscribe on the core message bus instead).
+
+        Raises
+        ------
+        RuntimeError
+            Always.
+
+        """
+        raise RuntimeError(
+            f"cannot unsubscribe from {topic} on {self}, unsubscribe on the core message bus",
+        )
+
+    def _handoff(self, dispatch: Callable[[str, Any], None], address: str, msg: Any) -> None:
+        self._pending.append((dispatch, address, msg, time.perf_counter_ns()))
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self._core_loop.call_soon_threadsafe(self._drain)
+
+    def _drain(self) -> None:
+        # Reset before draining so any message appended during the drain
+        # schedules another one (at worst the next drain finds nothing).
+        self._drain_scheduled = False
+
+        pending = self._pending
+        count = 0
+        while True:
+            try:
+                dispatch, address, msg, ts_sent = pending.popleft()
+            except IndexError:
+                break
+            latency = time.perf_counter_ns() - ts_sent
+            self._handoff_latency_total_ns += latency
+            if latency > self.handoff_latency_max_ns:
+                self.handoff_latency_max_ns = latency
+            dispatch(address, msg)
+            count += 1
+
+        if count:
+            self.handoff_count += count
+            self.handoff_batches += 1
+
+
+class EventLoopShard:
+    """
+    Provides an event loop running in a dedicated thread for an adapters
+    clients.
+
+    Parameters
+    ----------
+    name : str
+        The name of the shard (typically the adapter/venue name).
+    loop : asyncio.AbstractEventLoop
+        The core event loop for the trading node.
+    msgbus : MessageBus
+        The core message bus for the trading node.
+    logger : Logger
+        The logger for the shard.
+
+    Raises
+    ------
+    ValueError
+        If `name` is not a valid string.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loop: asyncio.AbstractEventLoop,
+        msgbus: MessageBus,
+        logger: Logger,
+    ):
+        PyCondition.valid_string(name, "name")
+
+        self.name = name
+        self.loop = ShardEventLoop()
+        self.clock = LiveClock(loop=self.loop)
+        self.msgbus = ShardMessageBus(
+            msgbus=msgbus,
+            loop=loop,
+            clock=self.clock,
+            logger=logger,
+            name=f"ShardMessageBus-{name}",
+        )
+
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        """
+        If the shards event loop thread is running.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Start the shards event loop in its own thread.
+        """
+        if self.is_running:
+            return  # Already running
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"{self.name}-loop",
+            daemon=True,
+        )
+        self._thread.start()
+        self._started.wait()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the shards event loop and wait for its thread to finish.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum seconds to wait for the thread to finish.
+
+        """
+        if not self.is_running:
+            return  # Not running
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop._shard_thread_id = threading.get_ident()
+        self.loop.call_soon(self._started.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
@@ -0,0 +1,76 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+cimport numpy as np
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint16_t
+
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport Tick
+from nautilus_trader.model.data.tick cimport TradeTick
+
+
+cdef class TickColumns:
+    cdef list _instrument_ids
+    cdef uint8_t[::1] _price_precisions
+    cdef uint8_t[::1] _size_precisions
+    cdef uint16_t[::1] _instrument_index
+    cdef int64_t[::1] _ts_event
+    cdef int64_t[::1] _ts_init
+
+    cdef readonly np.ndarray instrument_index
+    """The instrument index (into `instrument_ids`) for each row.\n\n:returns: `np.ndarray[uint16]`"""
+    cdef readonly np.ndarray ts_event
+    """The UNIX timestamps (nanoseconds) when each tick event occurred.\n\n:returns: `np.ndarray[int64]`"""
+    cdef readonly np.ndarray ts_init
+    """The UNIX timestamps (nanoseconds) when each tick was initialized.\n\n:returns: `np.ndarray[int64]`"""
+
+    cpdef list instrument_ids(self)
+    cdef Tick get_c(self, int64_t index)
+
+
+cdef class QuoteTickColumns(TickColumns):
+    cdef int64_t[::1] _bid
+    cdef int64_t[::1] _ask
+    cdef int64_t[::1] _bid_size
+    cdef int64_t[::1] _ask_size
+
+    cdef readonly np.ndarray bid
+    """The raw fixed-point top of book bid prices.\n\n:returns: `np.ndarray[int64]`"""
+    cdef readonly np.ndarray ask
+    """The raw fixed-point top of book ask prices.\n\n:returns: `np.ndarray[int64]`"""
+    cdef readonly np.ndarray bid_size
+    """The raw fixed-point top of book bid sizes.\n\n:returns: `np.ndarray[int64]`"""
+    cdef readonly np.ndarray ask_size
+    """The raw fixed-point top of book ask sizes.\n\n:returns: `np.ndarray[int64]`"""
+
+    cdef QuoteTick get_c(self, int64_t index)
+
+
+cdef class TradeTickColumns(TickColumns):
+    cdef int64_t[::1] _price
+    cdef int64_t[::1] _size
+    cdef uint8_t[::1] _aggressor_side
+    cdef list _trade_ids
+
+    cdef readonly np.ndarray price
+    """The raw fixed-point traded prices.\n\n:returns: `np.ndarray[int64]`"""
+    cdef readonly np.ndarray size
+    """The raw fixed-point traded sizes.\n\n:returns: `np.ndarray[int64]`"""
+    cdef readonly np.ndarray aggressor_side
+    """The trade aggressor sides.\n\n:returns: `np.ndarray[uint8]`"""
+
+    cdef TradeTick get_c(self, int64_t index)
@@ -0,0 +1,476 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+cimport numpy as np
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint16_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport Tick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
+
+
+cdef class TickColumns:
+    """
+    The abstract base class for all columnar (struct-of-arrays) tick containers.
+
+    Tick prices and sizes are held as raw fixed-point integers, scaled by the
+    price and size precision of the rows instrument. Tick objects are only
+    built on demand when a row is accessed.
+
+    Parameters
+    ----------
+    instrument_ids : list[InstrumentId]
+        The instrument IDs referenced by `instrument_index`.
+    price_precisions : np.ndarray[uint8]
+        The price precision for each instrument ID.
+    size_precisions : np.ndarray[uint8]
+        The size precision for each instrument ID.
+    instrument_index : np.ndarray[uint16]
+        The instrument index (into `instrument_ids`) for each row.
+    ts_event : np.ndarray[int64]
+        The UNIX timestamps (nanoseconds) when each tick event occurred.
+    ts_init : np.ndarray[int64]
+        The UNIX timestamps (nanoseconds) when each tick was initialized.
+
+    Raises
+    ------
+    ValueError
+        If `instrument_ids` is empty.
+    ValueError
+        If the length of the precisions is not equal to the number of instrument IDs.
+    ValueError
+        If the length of the column arrays are not all equal.
+    ValueError
+        If any `instrument_index` value is not an index into `instrument_ids`.
+
+    Warnings
+    --------
+    This class should not be used directly, but through a concrete subclass.
+    """
+
+    def __init__(
+        self,
+        list instrument_ids not None,
+        np.ndarray price_precisions not None,
+        np.ndarray size_precisions not None,
+        np.ndarray instrument_index not None,
+        np.ndarray ts_event not None,
+        np.ndarray ts_init not None,
+    ):
+        Condition.not_empty(instrument_ids, "instrument_ids")
+        Condition.list_type(instrument_ids, InstrumentId, "instrument_ids")
+        Condition.equal(len(price_precisions), len(instrument_ids), "len(price_precisions)", "len(instrument_ids)")
+        Condition.equal(len(size_precisions), len(instrument_ids), "len(size_precisions)", "len(instrument_ids)")
+        Condition.equal(len(ts_event), len(instrument_index), "len(ts_event)", "len(instrument_index)")
+        Condition.equal(len(ts_init), len(instrument_index), "len(ts_init)", "len(instrument_index)")
+        if len(instrument_index) > 0:
+            Condition.true(
+                instrument_index.min() >= 0 and instrument_index.max() < len(instrument_ids),
+                f"instrument_index values were not in range [0, {len(instrument_ids)})",
+            )
+
+        self._instrument_ids = instrument_ids
+        self._price_precisions = np.ascontiguousarray(price_precisions, dtype=np.uint8)
+        self._size_precisions = np.ascontiguousarray(size_precisions, dtype=np.uint8)
+
+        self.instrument_index = np.ascontiguousarray(instrument_index, dtype=np.uint16)
+        self.ts_event = np.ascontiguousarray(ts_event, dtype=np.int64)
+        self.ts_init = np.ascontiguousarray(ts_init, dtype=np.int64)
+
+        self._instrument_index = self.instrument_index
+        self._ts_event = self.ts_event
+        self._ts_init = self.ts_init
+
+    def __len__(self) -> int:
+        return len(self.ts_init)
+
+    def __getitem__(self, int64_t index) -> Tick:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"index out of range, was {index}")
+        return self.get_c(index)
+
+    def __iter__(self):
+        cdef int64_t i
+        for i in range(len(self)):
+            yield self.get_c(i)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(instrument_ids={self._instrument_ids}, len={len(self)})"
+
+    cpdef list instrument_ids(self):
+        """
+        Return the instrument IDs referenced by the instrument index.
+
+        Returns
+        -------
+        list[InstrumentId]
+
+        """
+        return self._instrument_ids.copy()
+
+    cdef Tick get_c(self, int64_t index):
+        raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
+
+    @staticmethod
+    def _index_instruments(list ticks):
+        cdef dict index = {}  # type: dict[InstrumentId, int]
+        cdef uint16_t[::1] instrument_index = np.empty(len(ticks), dtype=np.uint16)
+        cdef int64_t[::1] ts_event = np.empty(len(ticks), dtype=np.int64)
+        cdef int64_t[::1] ts_init = np.empty(len(ticks), dtype=np.int64)
+
+        cdef int64_t i
+        cdef Tick tick
+        for i, tick in enumerate(ticks):
+            instrument_index[i] = index.setdefault(tick.instrument_id, len(index))
+            ts_event[i] = tick.ts_event
+            ts_init[i] = tick.ts_init
+
+        return (
+            list(index),
+            np.asarray(instrument_index),
+            np.asarray(ts_event),
+            np.asarray(ts_init),
+        )
+
+
+cdef class QuoteTickColumns(TickColumns):
+    """
+    Represents a columnar (struct-of-arrays) container of quote ticks.
+
+    Parameters
+    ----------
+    instrument_ids : list[InstrumentId]
+        The instrument IDs referenced by `instrument_index`.
+    price_precisions : np.ndarray[uint8]
+        The price precision for each instrument ID.
+    size_precisions : np.ndarray[uint8]
+        The size precision for each instrument ID.
+    instrument_index : np.ndarray[uint16]
+        The instrument index (into `instrument_ids`) for each row.
+    bid : np.ndarray[int64]
+        The raw fixed-point top of book bid prices.
+    ask : np.ndarray[int64]
+        The raw fixed-point top of book ask prices.
+    bid_size : np.ndarray[int64]
+        The raw fixed-point top of book bid sizes.
+    ask_size : np.ndarray[int64]
+        The raw fixed-point top of book ask sizes.
+    ts_event : np.ndarray[int64]
+        The UNIX timestamps (nanoseconds) when each tick event occurred.
+    ts_init : np.ndarray[int64]
+        The UNIX timestamps (nanoseconds) when each tick was initialized.
+
+    Raises
+    ------
+    ValueError
+        If `instrument_ids` is empty.
+    ValueError
+        If the length of the precisions is not equal to the number of instrument IDs.
+    ValueError
+        If the length of the column arrays are not all equal.
+    ValueError
+        If any `instrument_index` value is not an index into `instrument_ids`.
+    """
+
+    def __init__(
+        self,
+        list instrument_ids not None,
+        np.ndarray price_precisions not None,
+        np.ndarray size_precisions not None,
+        np.ndarray instrument_index not None,
+        np.ndarray bid not None,
+        np.ndarray ask not None,
+        np.ndarray bid_size not None,
+        np.ndarray ask_size not None,
+        np.ndarray ts_event not None,
+        np.ndarray ts_init not None,
+    ):
+        Condition.equal(len(bid), len(instrument_index), "len(bid)", "len(instrument_index)")
+        Condition.equal(len(ask), len(instrument_index), "len(ask)", "len(instrument_index)")
+        Condition.equal(len(bid_size), len(instrument_index), "len(bid_size)", "len(instrument_index)")
+        Condition.equal(len(ask_size), len(instrument_index), "len(ask_size)", "len(instrument_index)")
+        super().__init__(
+            instrument_ids,
+            price_precisions,
+            size_precisions,
+            instrument_index,
+            ts_event,
+            ts_init,
+        )
+
+        self.bid = np.ascontiguousarray(bid, dtype=np.int64)
+        self.ask = np.ascontiguousarray(ask, dtype=np.int64)
+        self.bid_size = np.ascontiguousarray(bid_size, dtype=np.int64)
+        self.ask_size = np.ascontiguousarray(ask_size, dtype=np.int64)
+
+        self._bid = self.bid
+        self._ask = self.ask
+        self._bid_size = self.bid_size
+        self._ask_size = self.ask_size
+
+    cdef QuoteTick get_c(self, int64_t index):
+        cdef uint16_t i = self._instrument_index[index]
+        cdef uint8_t price_prec = self._price_precisions[i]
+        cdef uint8_t size_prec = self._size_precisions[i]
+        return QuoteTick(
+            instrument_id=self._instrument_ids[i],
+            bid=Price.from_raw_c(self._bid[index], price_prec),
+            ask=Price.from_raw_c(self._ask[index], price_prec),
+            bid_size=Quantity.from_raw_c(self._bid_size[index], size_prec),
+            ask_size=Quantity.from_raw_c(self._ask_size[index], size_prec),
+            ts_event=self._ts_event[index],
+            ts_init=self._ts_init[index],
+        )
+
+    @staticmethod
+    def from_ticks(list ticks) -> QuoteTickColumns:
+        """
+        Return columnar quote ticks built from the given tick objects.
+
+        The price and size precisions for each instrument are taken from the
+        first tick of that instrument.
+
+        Parameters
+        ----------
+        ticks : list[QuoteTick]
+            The ticks for the columns.
+
+        Returns
+        -------
+        QuoteTickColumns
+
+        Raises
+        ------
+        ValueError
+            If `ticks` is empty.
+        ValueError
+            If the precisions of an instruments ticks are not all equal.
+
+        """
+        Condition.not_empty(ticks, "ticks")
+        Condition.list_type(ticks, QuoteTick, "ticks")
+
+        instrument_ids, instrument_index, ts_event, ts_init = TickColumns._index_instruments(ticks)
+
+        cdef uint8_t[::1] price_precisions = np.zeros(len(instrument_ids), dtype=np.uint8)
+        cdef uint8_t[::1] size_precisions = np.zeros(len(instrument_ids), dtype=np.uint8)
+        cdef uint8_t[::1] precision_set = np.zeros(len(instrument_ids), dtype=np.uint8)
+        cdef uint16_t[::1] instrument_index_view = instrument_index
+        cdef int64_t[::1] bid = np.empty(len(ticks), dtype=np.int64)
+        cdef int64_t[::1] ask = np.empty(len(ticks), dtype=np.int64)
+        cdef int64_t[::1] bid_size = np.empty(len(ticks), dtype=np.int64)
+        cdef int64_t[::1] ask_size = np.empty(len(ticks), dtype=np.int64)
+
+        cdef int64_t i
+        cdef uint16_t j
+        cdef QuoteTick tick
+        for i, tick in enumerate(ticks):
+            j = instrument_index_view[i]
+            if not precision_set[j]:
+                price_precisions[j] = tick.bid.precision
+                size_precisions[j] = tick.bid_size.precision
+                precision_set[j] = True
+            if (
+                tick.bid.precision != price_precisions[j]
+                or tick.ask.precision != price_precisions[j]
+                or tick.bid_size.precision != size_precisions[j]
+                or tick.ask_size.precision != size_precisions[j]
+            ):
+                raise ValueError(f"precisions for {tick.instrument_id} ticks were not all equal")
+            bid[i] = tick.bid.raw
+            ask[i] = tick.ask.raw
+            bid_size[i] = tick.bid_size.raw
+            ask_size[i] = tick.ask_size.raw
+
+        return QuoteTickColumns(
+            instrument_ids=instrument_ids,
+            price_precisions=np.asarray(price_precisions),
+            size_precisions=np.asarray(size_precisions),
+            instrument_index=instrument_index,
+            bid=np.asarray(bid),
+            ask=np.asarray(ask),
+            bid_size=np.asarray(bid_size),
+            ask_size=np.asarray(ask_size),
+            ts_event=ts_event,
+            ts_init=ts_init,
+        )
+
+
+cdef class TradeTickColumns(TickColumns):
+    """
+    Represents a columnar (struct-of-arrays) container of trade ticks.
+
+    Parameters
+    ----------
+    instrument_ids : list[InstrumentId]
+        The instrument IDs referenced by `instrument_index`.
+    price_precisions : np.ndarray[uint8]
+        The price precision for each instrument ID.
+    size_precisions : np.ndarray[uint8]
+        The size precision for each instrument ID.
+    instrument_index : np.ndarray[uint16]
+        The instrument index (into `instrument_ids`) for each row.
+    price : np.ndarray[int64]
+        The raw fixed-point traded prices.
+    size : np.ndarray[int64]
+        The raw fixed-point traded sizes.
+    aggressor_side : np.ndarray[uint8]
+        The trade aggressor sides.
+    trade_ids : list[str]
+        The trade match IDs.
+    ts_event : np.ndarray[int64]
+        The UNIX timestamps (nanoseconds) when each tick event occurred.
+    ts_init : np.ndarray[int64]
+        The UNIX timestamps (nanoseconds) when each tick was initialized.
+
+    Raises
+    ------
+    ValueError
+        If `instrument_ids` is empty.
+    ValueError
+        If the length of the precisions is not equal to the number of instrument IDs.
+    ValueError
+        If the length of the column arrays are not all equal.
+    ValueError
+        If any `instrument_index` value is not an index into `instrument_ids`.
+    """
+
+    def __init__(
+        self,
+        list instrument_ids not None,
+        np.ndarray price_precisions not None,
+        np.ndarray size_precisions not None,
+        np.ndarray instrument_index not None,
+        np.ndarray price not None,
+        np.ndarray size not None,
+        np.ndarray aggressor_side not None,
+        list trade_ids not None,
+        np.ndarray ts_event not None,
+        np.ndarray ts_init not None,
+    ):
+        Condition.equal(len(price), len(instrument_index), "len(price)", "len(instrument_index)")
+        Condition.equal(len(size), len(instrument_index), "len(size)", "len(instrument_index)")
+        Condition.equal(len(aggressor_side), len(instrument_index), "len(aggressor_side)", "len(instrument_index)")
+        Condition.equal(len(trade_ids), len(instrument_index), "len(trade_ids)", "len(instrument_index)")
+        super().__init__(
+            instrument_ids,
+            price_precisions,
+            size_precisions,
+            instrument_index,
+            ts_event,
+            ts_init,
+        )
+
+        self.price = np.ascontiguousarray(price, dtype=np.int64)
+        self.size = np.ascontiguousarray(size, dtype=np.int64)
+        self.aggressor_side = np.ascontiguousarray(aggressor_side, dtype=np.uint8)
+
+        self._price = self.price
+        self._size = self.size
+        self._aggressor_side = self.aggressor_side
+        self._trade_ids = trade_ids
+
+    cdef TradeTick get_c(self, int64_t index):
+        cdef uint16_t i = self._instrument_index[index]
+        cdef uint8_t price_prec = self._price_precisions[i]
+        cdef uint8_t size_prec = self._size_precisions[i]
+        return TradeTick(
+            instrument_id=self._instrument_ids[i],
+            price=Price.from_raw_c(self._price[index], price_prec),
+            size=Quantity.from_raw_c(self._size[index], size_prec),
+            aggressor_side=<AggressorSide>self._aggressor_side[index],
+            trade_id=self._trade_ids[index],
+            ts_event=self._ts_event[index],
+            ts_init=self._ts_init[index],
+        )
+
+    @staticmethod
+    def from_ticks(list ticks) -> TradeTickColumns:
+        """
+        Return columnar trade ticks built from the given tick objects.
+
+        The price and size precisions for each instrument are taken from the
+        first tick of that instrument.
+
+        Parameters
+        ----------
+        ticks : list[TradeTick]
+            The ticks for the columns.
+
+        Returns
+        -------
+        TradeTickColumns
+
+        Raises
+        ------
+        ValueError
+            If `ticks` is empty.
+        ValueError
+            If the precisions of an instruments ticks are not all equal.
+
+        """
+        Condition.not_empty(ticks, "ticks")
+        Condition.list_type(ticks, TradeTick, "ticks")
+
+        instrument_ids, instrument_index, ts_event, ts_init = TickColumns._index_instruments(ticks)
+
+        cdef uint8_t[::1] price_precisions = np.zeros(len(instrument_ids), dtype=np.uint8)
+        cdef uint8_t[::1] size_precisions = np.zeros(len(instrument_ids), dtype=np.uint8)
+        cdef uint8_t[::1] precision_set = np.zeros(len(instrument_ids), dtype=np.uint8)
+        cdef uint16_t[::1] instrument_index_view = instrument_index
+        cdef int64_t[::1] price = np.empty(len(ticks), dtype=np.int64)
+        cdef int64_t[::1] size = np.empty(len(ticks), dtype=np.int64)
+        cdef uint8_t[::1] aggressor_side = np.empty(len(ticks), dtype=np.uint8)
+        cdef list trade_ids = []
+
+        cdef int64_t i
+        cdef uint16_t j
+        cdef TradeTick tick
+        for i, tick in enumerate(ticks):
+            j = instrument_index_view[i]
+            if not precision_set[j]:
+                price_precisions[j] = tick.price.precision
+                size_precisions[j] = tick.size.precision
+                precision_set[j] = True
+            if tick.price.precision != price_precisions[j] or tick.size.precision != size_precisions[j]:
+                raise ValueError(f"precisions for {tick.instrument_id} ticks were not all equal")
+            price[i] = tick.price.raw
+            size[i] = tick.size.raw
+            aggressor_side[i] = tick.aggressor_side
+            trade_ids.append(tick.trade_id)
+
+        return TradeTickColumns(
+            instrument_ids=instrument_ids,
+            price_precisions=np.asarray(price_precisions),
+            size_precisions=np.asarray(size_precisions),
+            instrument_index=instrument_index,
+            price=np.asarray(price),
+            size=np.asarray(size),
+            aggressor_side=np.asarray(aggressor_side),
+            trade_ids=trade_ids,
+            ts_event=ts_event,
+            ts_init=ts_init,
+        )
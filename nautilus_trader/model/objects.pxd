@@ -13,20 +13,31 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint8_t
 
 from nautilus_trader.model.currency cimport Currency
 
 
 cdef class BaseDecimal:
-    cdef object _value
-
+    cdef readonly int64_t raw
+    """The raw fixed-point value (the value scaled by 10^precision).\n\n:returns: `int64`"""
     cdef readonly uint8_t precision
     """The decimal precision.\n\n:returns: `uint8`"""
+    cdef object _decimal
+
+    @staticmethod
+    cdef int64_t _raw_from_value(object value, uint8_t precision) except *
+
+    @staticmethod
+    cdef int64_t _raw_from_int(object value) except *
 
     @staticmethod
     cdef object _extract_value(object obj)
 
+    @staticmethod
+    cdef object _add_decimals(BaseDecimal a, BaseDecimal b, bint subtract)
+
     @staticmethod
     cdef bint _compare(a, b, int op) except *
 
@@ -46,6 +57,12 @@ cdef class Quantity(BaseDecimal):
     @staticmethod
     cdef Quantity from_int_c(int value)
 
+    @staticmethod
+    cdef Quantity from_raw_c(int64_t raw, uint8_t precision)
+
+    cpdef Quantity add(self, Quantity other)
+    cpdef Quantity sub(self, Quantity other)
+
 
 cdef class Price(BaseDecimal):
     @staticmethod
@@ -54,6 +71,12 @@ cdef class Price(BaseDecimal):
     @staticmethod
     cdef Price from_int_c(int value)
 
+    @staticmethod
+    cdef Price from_raw_c(int64_t raw, uint8_t precision)
+
+    cpdef Price add(self, Price other)
+    cpdef Price sub(self, Price other)
+
 
 cdef class Money(BaseDecimal):
     cdef readonly Currency currency
@@ -62,6 +85,11 @@ cdef class Money(BaseDecimal):
     @staticmethod
     cdef Money from_str_c(str value)
 
+    @staticmethod
+    cdef Money from_raw_c(int64_t raw, Currency currency)
+
+    cpdef Money add(self, Money other)
+    cpdef Money sub(self, Money other)
     cpdef str to_str(self)
 
 
@@ -16,13 +16,21 @@
 """Defines fundamental value objects for the trading domain."""
 
 import decimal
+import sys
 
 from cpython.object cimport Py_EQ
 from cpython.object cimport Py_GE
 from cpython.object cimport Py_GT
 from cpython.object cimport Py_LE
 from cpython.object cimport Py_LT
+from cpython.object cimport Py_NE
 from cpython.object cimport PyObject_RichCompareBool
+from libc.math cimport fabs
+from libc.math cimport isnan
+from libc.math cimport rint
+from libc.stdint cimport INT64_MAX
+from libc.stdint cimport INT64_MIN
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint8_t
 
 from nautilus_trader.core.correctness cimport Condition
@@ -30,6 +38,65 @@ from nautilus_trader.core.text cimport precision_from_str
 from nautilus_trader.model.currency cimport Currency
 
 
+FIXED_PRECISION_MAX = 18  # The maximum precision for fixed-point int64 values
+
+cdef int64_t[19] _POW10 = [10 ** p for p in range(FIXED_PRECISION_MAX + 1)]
+cdef double _RAW_MAX = 9223372036854775807.0
+
+# Numeric hashing constants (as per the built-in `decimal.Decimal` hash)
+cdef object _HASH_MODULUS = sys.hash_info.modulus
+cdef object _HASH_10INV = pow(10, _HASH_MODULUS - 2, _HASH_MODULUS)
+cdef list _HASH_10INV_POW = [
+    pow(_HASH_10INV, p, _HASH_MODULUS) for p in range(FIXED_PRECISION_MAX + 1)
+]
+
+cdef int[6] _SWAPPED_OP
+_SWAPPED_OP[Py_LT] = Py_GT
+_SWAPPED_OP[Py_LE] = Py_GE
+_SWAPPED_OP[Py_EQ] = Py_EQ
+_SWAPPED_OP[Py_NE] = Py_NE
+_SWAPPED_OP[Py_GT] = Py_LT
+_SWAPPED_OP[Py_GE] = Py_LE
+
+
+cdef inline int64_t _rescale(int64_t raw, uint8_t precision, uint8_t to_precision) except? -1:
+    # Assumes `to_precision` >= `precision`
+    if to_precision == precision:
+        return raw
+    cdef int64_t factor = _POW10[to_precision - precision]
+    cdef int64_t bound = INT64_MAX // factor
+    if not -bound <= raw <= bound:
+        raise OverflowError(f"raw value {raw} out of range for precision {to_precision}")
+    return raw * factor
+
+
+cdef inline int64_t _add_raw(int64_t a, int64_t b) except? -1:
+    if (b > 0 and a > INT64_MAX - b) or (b < 0 and a < INT64_MIN - b):
+        raise OverflowError(f"raw value {a} + {b} out of range")
+    return a + b
+
+
+cdef inline int64_t _sub_raw(int64_t a, int64_t b) except? -1:
+    if (b < 0 and a > INT64_MAX + b) or (b > 0 and a < INT64_MIN + b):
+        raise OverflowError(f"raw value {a} - {b} out of range")
+    return a - b
+
+
+cdef inline bint _compare_raw(int64_t a, int64_t b, int op):
+    if op == Py_EQ:
+        return a == b
+    elif op == Py_NE:
+        return a != b
+    elif op == Py_LT:
+        return a < b
+    elif op == Py_LE:
+        return a <= b
+    elif op == Py_GT:
+        return a > b
+    else:  # Py_GE
+        return a >= b
+
+
 cdef class BaseDecimal:
     """
     The abstract base class for all domain value objects.
@@ -42,6 +109,10 @@ cdef class BaseDecimal:
     objects. Return values are floats if one of the operands is a float, else
     a decimal.Decimal.
 
+    The value is held as a raw fixed-point int64 mantissa scaled by
+    10^precision, so that instantiation, comparisons and hashing never go
+    through `decimal`.
+
     Parameters
     ----------
     value : integer, float, string or Decimal
@@ -54,6 +125,10 @@ cdef class BaseDecimal:
     ------
     OverflowError
         If `precision` is negative (< 0).
+    ValueError
+        If `precision` is greater than 18.
+    OverflowError
+        If the scaled `value` is outside the int64 range.
 
     Warnings
     --------
@@ -65,11 +140,10 @@ cdef class BaseDecimal:
     """
 
     def __init__(self, value, uint8_t precision):
-        if isinstance(value, decimal.Decimal):
-            self._value = round(value, precision)
-        else:
-            self._value = decimal.Decimal(f'{float(value):.{precision}f}')
+        if precision > FIXED_PRECISION_MAX:
+            raise ValueError(f"precision was greater than {FIXED_PRECISION_MAX}, was {precision}")
 
+        self.raw = BaseDecimal._raw_from_value(value, precision)
         self.precision = precision
 
     def __eq__(self, other) -> bool:
@@ -90,24 +164,32 @@ cdef class BaseDecimal:
     def __add__(self, other) -> decimal.Decimal or float:
         if isinstance(other, float):
             return float(self) + other
+        elif isinstance(self, BaseDecimal) and isinstance(other, BaseDecimal):
+            return BaseDecimal._add_decimals(<BaseDecimal>self, <BaseDecimal>other, False)
         else:
             return BaseDecimal._extract_value(self) + BaseDecimal._extract_value(other)
 
     def __radd__(self, other) -> decimal.Decimal or float:
         if isinstance(other, float):
             return other + float(self)
+        elif isinstance(self, BaseDecimal) and isinstance(other, BaseDecimal):
+            return BaseDecimal._add_decimals(<BaseDecimal>other, <BaseDecimal>self, False)
         else:
             return BaseDecimal._extract_value(other) + BaseDecimal._extract_value(self)
 
     def __sub__(self, other) -> decimal.Decimal or float:
         if isinstance(other, float):
             return float(self) - other
+        elif isinstance(self, BaseDecimal) and isinstance(other, BaseDecimal):
+            return BaseDecimal._add_decimals(<BaseDecimal>self, <BaseDecimal>other, True)
         else:
             return BaseDecimal._extract_value(self) - BaseDecimal._extract_value(other)
 
     def __rsub__(self, other) -> decimal.Decimal or float:
         if isinstance(other, float):
             return other - float(self)
+        elif isinstance(self, BaseDecimal) and isinstance(other, BaseDecimal):
+            return BaseDecimal._add_decimals(<BaseDecimal>other, <BaseDecimal>self, True)
         else:
             return BaseDecimal._extract_value(other) - BaseDecimal._extract_value(self)
 
@@ -160,46 +242,132 @@ cdef class BaseDecimal:
             return BaseDecimal._extract_value(other) % BaseDecimal._extract_value(self)
 
     def __neg__(self) -> decimal.Decimal:
-        return self._value.__neg__()
+        return self.as_decimal().__neg__()
 
     def __pos__(self) -> decimal.Decimal:
-        return self._value.__pos__()
+        return self.as_decimal().__pos__()
 
     def __abs__(self) -> decimal.Decimal:
-        return abs(self._value)
+        return abs(self.as_decimal())
 
     def __round__(self, ndigits=None) -> decimal.Decimal:
-        return round(self._value, ndigits)
+        return round(self.as_decimal(), ndigits)
 
     def __float__(self) -> float:
-        return float(self._value)
+        return self.as_double()
 
     def __int__(self) -> int:
-        return int(self._value)
+        return self.raw // _POW10[self.precision]  # C division truncates toward zero
 
     def __hash__(self) -> int:
-        return hash(self._value)
+        # Equal to the hash of an equal `int`, `float` or `Decimal` value
+        cdef object h = abs(self.raw) * _HASH_10INV_POW[self.precision] % _HASH_MODULUS
+        if self.raw < 0:
+            h = -h
+        return -2 if h == -1 else h
 
     def __str__(self) -> str:
-        return str(self._value)
+        # Formatted as per the built-in `decimal.Decimal` string representation
+        cdef str digits = str(abs(self.raw))
+        cdef str sign = "-" if self.raw < 0 else ""
+        cdef int adjusted = len(digits) - 1 - self.precision
+        if adjusted < -6:
+            # Scientific notation
+            if len(digits) > 1:
+                return f"{sign}{digits[0]}.{digits[1:]}E{adjusted}"
+            return f"{sign}{digits}E{adjusted}"
+        if self.precision == 0:
+            return f"{sign}{digits}"
+        if len(digits) <= self.precision:
+            digits = "0" * (self.precision - len(digits) + 1) + digits
+        return f"{sign}{digits[:-self.precision]}.{digits[-self.precision:]}"
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}('{self}')"
 
+    @staticmethod
+    cdef int64_t _raw_from_value(object value, uint8_t precision) except *:
+        cdef double scaled
+        cdef double rounded
+        if isinstance(value, int):
+            return BaseDecimal._raw_from_int(value * _POW10[precision])
+        elif isinstance(value, decimal.Decimal):
+            return BaseDecimal._raw_from_int(int(round(value, precision).scaleb(precision)))
+        elif isinstance(value, BaseDecimal) and (<BaseDecimal>value).precision <= precision:
+            return BaseDecimal._raw_from_int(
+                (<BaseDecimal>value).raw * _POW10[precision - (<BaseDecimal>value).precision],
+            )
+        else:
+            scaled = float(value) * _POW10[precision]
+            if isnan(scaled):
+                raise ValueError("value was NaN")
+            if not -_RAW_MAX < scaled < _RAW_MAX:
+                raise OverflowError(f"value {value} out of range for precision {precision}")
+            rounded = rint(scaled)
+            if fabs(fabs(scaled - rounded) - 0.5) <= 1e-6 + fabs(scaled) * 4.5e-16:
+                # Too close to a tie to trust the scaled double, round exactly
+                # as per the string formatting of the `float`.
+                return int(f"{float(value):.{precision}f}".replace(".", ""))
+            return <int64_t>rounded
+
+    @staticmethod
+    cdef int64_t _raw_from_int(object value) except *:
+        if not -_RAW_MAX < value < _RAW_MAX:
+            raise OverflowError(f"raw value {value} out of range")
+        return value
+
     @staticmethod
     cdef object _extract_value(object obj):
         if isinstance(obj, BaseDecimal):
             return obj.as_decimal()
         return obj
 
+    @staticmethod
+    cdef object _add_decimals(BaseDecimal a, BaseDecimal b, bint subtract):
+        # Add (or subtract) the raw values at the greater precision, building
+        # only the resulting `Decimal`
+        cdef uint8_t precision = a.precision if a.precision >= b.precision else b.precision
+        cdef int64_t raw
+        try:
+            if subtract:
+                raw = _sub_raw(
+                    _rescale(a.raw, a.precision, precision),
+                    _rescale(b.raw, b.precision, precision),
+                )
+            else:
+                raw = _add_raw(
+                    _rescale(a.raw, a.precision, precision),
+                    _rescale(b.raw, b.precision, precision),
+                )
+        except OverflowError:
+            # Out of the fixed-point range, `Decimal` arithmetic has no such limit
+            if subtract:
+                return a.as_decimal() - b.as_decimal()
+            return a.as_decimal() + b.as_decimal()
+        return decimal.Decimal(raw).scaleb(-precision)
+
     @staticmethod
     cdef bint _compare(a, b, int op) except *:
-        if isinstance(a, BaseDecimal):
-            a = <BaseDecimal>a.as_decimal()
-        if isinstance(b, BaseDecimal):
-            b = <BaseDecimal>b.as_decimal()
+        if not isinstance(a, BaseDecimal):
+            # Reflected operation
+            return BaseDecimal._compare(b, a, _SWAPPED_OP[op])
 
-        return PyObject_RichCompareBool(a, b, op)
+        cdef BaseDecimal x = <BaseDecimal>a
+        cdef BaseDecimal y
+        if isinstance(b, BaseDecimal):
+            y = <BaseDecimal>b
+            if x.precision == y.precision:
+                return _compare_raw(x.raw, y.raw, op)
+            elif x.precision < y.precision:
+                return PyObject_RichCompareBool(x.raw * _POW10[y.precision - x.precision], y.raw, op)
+            else:
+                return PyObject_RichCompareBool(x.raw, y.raw * _POW10[x.precision - y.precision], op)
+        elif isinstance(b, int):
+            return PyObject_RichCompareBool(x.raw, b * _POW10[x.precision], op)
+        elif isinstance(b, float):
+            return PyObject_RichCompareBool(x.as_double(), b, op)
+        else:
+            return PyObject_RichCompareBool(x.as_decimal(), b, op)
 
     cpdef object as_decimal(self):
         """
@@ -210,7 +378,10 @@ cdef class BaseDecimal:
         Decimal
 
         """
-        return self._value
+        if self._decimal is None:
+            # Cached as the value is immutable
+            self._decimal = decimal.Decimal(self.raw).scaleb(-self.precision)
+        return self._decimal
 
     cpdef double as_double(self) except *:
         """
@@ -221,7 +392,7 @@ cdef class BaseDecimal:
         double
 
         """
-        return float(self._value)
+        return self.raw / <double>_POW10[self.precision]
 
 
 cdef class Quantity(BaseDecimal):
@@ -257,11 +428,21 @@ cdef class Quantity(BaseDecimal):
         super().__init__(value, precision)
 
         # Post-condition
-        Condition.true(self._value >= 0, f"quantity negative, was {self._value}")
+        if self.raw < 0:
+            raise ValueError(f"quantity negative, was {self}")
 
     @staticmethod
     cdef Quantity zero_c(uint8_t precision):
-        return Quantity(0, precision)
+        return Quantity.from_raw_c(0, precision)
+
+    @staticmethod
+    cdef Quantity from_raw_c(int64_t raw, uint8_t precision):
+        if raw < 0:
+            raise ValueError(f"quantity negative, was raw {raw}")
+        cdef Quantity quantity = Quantity.__new__(Quantity)
+        quantity.raw = raw
+        quantity.precision = precision
+        return quantity
 
     @staticmethod
     cdef Quantity from_str_c(str value):
@@ -340,6 +521,102 @@ cdef class Quantity(BaseDecimal):
 
         return Quantity.from_int_c(value)
 
+    @staticmethod
+    def from_raw(int64_t raw, uint8_t precision) -> Quantity:
+        """
+        Return a quantity from the given raw fixed-point value.
+
+        Parameters
+        ----------
+        raw : int64
+            The raw fixed-point value (the value scaled by 10^precision).
+        precision : uint8
+            The precision for the quantity.
+
+        Returns
+        -------
+        Quantity
+
+        Raises
+        ------
+        ValueError
+            If `raw` is negative (< 0).
+
+        Warnings
+        --------
+        The `precision` is not checked against the maximum fixed-point precision.
+
+        """
+        return Quantity.from_raw_c(raw, precision)
+
+    cpdef Quantity add(self, Quantity other):
+        """
+        Return a new quantity from adding the given quantity to this quantity.
+
+        The raw fixed-point values are added without any intermediate `Decimal`,
+        the precision of the result is the greater of the two precisions.
+
+        Parameters
+        ----------
+        other : Quantity
+            The quantity to add.
+
+        Returns
+        -------
+        Quantity
+
+        Raises
+        ------
+        OverflowError
+            If the result is out of range for a fixed-point value.
+
+        """
+        Condition.not_none(other, "other")
+
+        cdef uint8_t precision = max(self.precision, other.precision)
+        return Quantity.from_raw_c(
+            _add_raw(
+                _rescale(self.raw, self.precision, precision),
+                _rescale(other.raw, other.precision, precision),
+            ),
+            precision,
+        )
+
+    cpdef Quantity sub(self, Quantity other):
+        """
+        Return a new quantity from subtracting the given quantity from this quantity.
+
+        The raw fixed-point values are subtracted without any intermediate
+        `Decimal`, the precision of the result is the greater of the two precisions.
+
+        Parameters
+        ----------
+        other : Quantity
+            The quantity to subtract.
+
+        Returns
+        -------
+        Quantity
+
+        Raises
+        ------
+        OverflowError
+            If the result is out of range for a fixed-point value.
+        ValueError
+            If the result is negative (< 0).
+
+        """
+        Condition.not_none(other, "other")
+
+        cdef uint8_t precision = max(self.precision, other.precision)
+        return Quantity.from_raw_c(
+            _sub_raw(
+                _rescale(self.raw, self.precision, precision),
+                _rescale(other.raw, other.precision, precision),
+            ),
+            precision,
+        )
+
     cpdef str to_str(self):
         """
         Return the formatted string representation of the quantity.
@@ -389,6 +666,13 @@ cdef class Price(BaseDecimal):
     cdef Price from_int_c(int value):
         return Price(value, precision=0)
 
+    @staticmethod
+    cdef Price from_raw_c(int64_t raw, uint8_t precision):
+        cdef Price price = Price.__new__(Price)
+        price.raw = raw
+        price.precision = precision
+        return price
+
     @staticmethod
     def from_str(str value) -> Price:
         """
@@ -429,6 +713,95 @@ cdef class Price(BaseDecimal):
 
         return Price.from_int_c(value)
 
+    @staticmethod
+    def from_raw(int64_t raw, uint8_t precision) -> Price:
+        """
+        Return a price from the given raw fixed-point value.
+
+        Parameters
+        ----------
+        raw : int64
+            The raw fixed-point value (the value scaled by 10^precision).
+        precision : uint8
+            The precision for the price.
+
+        Returns
+        -------
+        Price
+
+        Warnings
+        --------
+        The `precision` is not checked against the maximum fixed-point precision.
+
+        """
+        return Price.from_raw_c(raw, precision)
+
+    cpdef Price add(self, Price other):
+        """
+        Return a new price from adding the given price to this price.
+
+        The raw fixed-point values are added without any intermediate `Decimal`,
+        the precision of the result is the greater of the two precisions.
+
+        Parameters
+        ----------
+        other : Price
+            The price to add.
+
+        Returns
+        -------
+        Price
+
+        Raises
+        ------
+        OverflowError
+            If the result is out of range for a fixed-point value.
+
+        """
+        Condition.not_none(other, "other")
+
+        cdef uint8_t precision = max(self.precision, other.precision)
+        return Price.from_raw_c(
+            _add_raw(
+                _rescale(self.raw, self.precision, precision),
+                _rescale(other.raw, other.precision, precision),
+            ),
+            precision,
+        )
+
+    cpdef Price sub(self, Price other):
+        """
+        Return a new price from subtracting the given price from this price.
+
+        The raw fixed-point values are subtracted without any intermediate
+        `Decimal`, the precision of the result is the greater of the two precisions.
+
+        Parameters
+        ----------
+        other : Price
+            The price to subtract.
+
+        Returns
+        -------
+        Price
+
+        Raises
+        ------
+        OverflowError
+            If the result is out of range for a fixed-point value.
+
+        """
+        Condition.not_none(other, "other")
+
+        cdef uint8_t precision = max(self.precision, other.precision)
+        return Price.from_raw_c(
+            _sub_raw(
+                _rescale(self.raw, self.precision, precision),
+                _rescale(other.raw, other.precision, precision),
+            ),
+            precision,
+        )
+
 
 cdef class Money(BaseDecimal):
     """
@@ -450,25 +823,33 @@ cdef class Money(BaseDecimal):
         self.currency = currency
 
     def __eq__(self, Money other) -> bool:
-        return self.currency == other.currency and self._value == other.as_decimal()
+        return self.currency == other.currency and self.raw == other.raw
 
     def __lt__(self, Money other) -> bool:
-        return self.currency == other.currency and self._value < other.as_decimal()
+        return self.currency == other.currency and self.raw < other.raw
 
     def __le__(self, Money other) -> bool:
-        return self.currency == other.currency and self._value <= other.as_decimal()
+        return self.currency == other.currency and self.raw <= other.raw
 
     def __gt__(self, Money other) -> bool:
-        return self.currency == other.currency and self._value > other.as_decimal()
+        return self.currency == other.currency and self.raw > other.raw
 
     def __ge__(self, Money other) -> bool:
-        return self.currency == other.currency and self._value >= other.as_decimal()
+        return self.currency == other.currency and self.raw >= other.raw
 
     def __hash__(self) -> int:
-        return hash((self.currency, self._value))
+        return hash((self.currency, self.raw))
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}('{self._value}', {self.currency})"
+        return f"{type(self).__name__}('{self}', {self.currency})"
+
+    @staticmethod
+    cdef Money from_raw_c(int64_t raw, Currency currency):
+        cdef Money money = Money.__new__(Money)
+        money.raw = raw
+        money.precision = currency.precision
+        money.currency = currency
+        return money
 
     @staticmethod
     cdef Money from_str_c(str value):
@@ -513,6 +894,83 @@ cdef class Money(BaseDecimal):
 
         return Money.from_str_c(value)
 
+    @staticmethod
+    def from_raw(int64_t raw, Currency currency) -> Money:
+        """
+        Return money from the given raw fixed-point value.
+
+        Parameters
+        ----------
+        raw : int64
+            The raw fixed-point value (the amount scaled by 10^currency.precision).
+        currency : Currency
+            The currency of the money.
+
+        Returns
+        -------
+        Money
+
+        """
+        Condition.not_none(currency, "currency")
+
+        return Money.from_raw_c(raw, currency)
+
+    cpdef Money add(self, Money other):
+        """
+        Return new money from adding the given money to this money.
+
+        The raw fixed-point values are added without any intermediate `Decimal`.
+
+        Parameters
+        ----------
+        other : Money
+            The money to add.
+
+        Returns
+        -------
+        Money
+
+        Raises
+        ------
+        OverflowError
+            If the result is out of range for a fixed-point value.
+        ValueError
+            If `other.currency` is not equal to this currency.
+
+        """
+        Condition.not_none(other, "other")
+        Condition.equal(self.currency, other.currency, "currency", "other.currency")
+
+        return Money.from_raw_c(_add_raw(self.raw, other.raw), self.currency)
+
+    cpdef Money sub(self, Money other):
+        """
+        Return new money from subtracting the given money from this money.
+
+        The raw fixed-point values are subtracted without any intermediate `Decimal`.
+
+        Parameters
+        ----------
+        other : Money
+            The money to subtract.
+
+        Returns
+        -------
+        Money
+
+        Raises
+        ------
+        OverflowError
+            If the result is out of range for a fixed-point value.
+        ValueError
+            If `other.currency` is not equal to this currency.
+
+        """
+        Condition.not_none(other, "other")
+        Condition.equal(self.currency, other.currency, "currency", "other.currency")
+
+        return Money.from_raw_c(_sub_raw(self.raw, other.raw), self.currency)
+
     cpdef str to_str(self):
         """
         Return the formatted string representation of the money.
@@ -522,7 +980,7 @@ cdef class Money(BaseDecimal):
         str
 
         """
-        return f"{self._value:,} {self.currency}".replace(",", "_")
+        return f"{self.as_decimal():,} {self.currency}".replace(",", "_")
 
 
 cdef class AccountBalance:
@@ -559,7 +1017,7 @@ cdef class AccountBalance:
         Condition.not_negative(total.as_decimal(), "total")
         Condition.not_negative(locked.as_decimal(), "locked")
         Condition.not_negative(free.as_decimal(), "free")
-        Condition.true(total.as_decimal() - locked.as_decimal() == free.as_decimal(), "total - locked != free")
+        Condition.true(total.raw - locked.raw == free.raw, "total - locked != free")
 
         self.currency = currency
         self.total = total
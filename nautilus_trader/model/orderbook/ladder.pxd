@@ -22,6 +22,8 @@ from nautilus_trader.model.orderbook.level cimport Level
 
 cdef class Ladder:
     cdef dict _order_id_level_index
+    cdef dict _price_levels
+    cdef list _keys
 
     cdef readonly list levels
     """The ladders levels.\n\n:returns: `list[Level]`"""
@@ -32,7 +34,6 @@ cdef class Ladder:
     cdef readonly uint8_t size_precision
     """The ladders size precision.\n\n:returns: `uint8`"""
 
-    cpdef bint reverse(self) except *
     cpdef void add(self, Order order) except *
     cpdef void update(self, Order order) except *
     cpdef void delete(self, Order order) except *
@@ -42,3 +43,6 @@ cdef class Ladder:
     cpdef list exposures(self)
     cpdef Level top(self)
     cpdef list simulate_order_fills(self, Order order, DepthType depth_type=*)
+
+    cdef void _insert_level(self, Level level) except *
+    cdef void _remove_level(self, Level level) except *
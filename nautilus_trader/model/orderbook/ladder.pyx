@@ -13,10 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import heapq
-
 from libc.stdint cimport uint8_t
 
+from nautilus_trader.core.collections cimport bisect_left
 from nautilus_trader.core.collections cimport bisect_right
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.c_enums.depth_type cimport DepthType
@@ -30,6 +29,10 @@ cdef class Ladder:
     """
     Represents a ladder of orders in a book.
 
+    Levels are held in a dictionary keyed by price alongside a sorted list of
+    price keys, so level lookup is O(1), finding a levels position is
+    O(log n) and the top of the ladder is always at index 0.
+
     Parameters
     ----------
     reverse : bool
@@ -57,6 +60,8 @@ cdef class Ladder:
         Condition.not_negative_int(size_precision, "size_precision")
 
         self._order_id_level_index = {}  # type: dict[str, Level]
+        self._price_levels = {}          # type: dict[float, Level]
+        self._keys = []                  # type: list[float]  # Sorted ascending, negated if reverse
 
         self.levels = []  # type: list[Level]  # TODO: Make levels private??
         self.reverse = reverse
@@ -78,27 +83,13 @@ cdef class Ladder:
         """
         Condition.not_none(order, "order")
 
-        cdef list existing_prices = self.prices()
-
-        cdef int price_idx
-        cdef Level level
-        if order.price in existing_prices:
-            # Level exists, add new order
-            price_idx = existing_prices.index(order.price)
-            level = self.levels[price_idx]
-            level.add(order=order)
-        else:
+        cdef Level level = self._price_levels.get(order.price)
+        if level is None:
             # New price, create Level
             level = Level(price=order.price)
-            level.add(order)
+            self._insert_level(level)
 
-            if self.reverse:
-                self.levels.append(level)
-                # TODO: heapq._siftdown_max is temporary before custom data structure
-                heapq._siftdown_max(self.levels, 0, len(self.levels) - 1)
-            else:
-                price_idx = bisect_right(existing_prices, level.price)
-                self.levels.insert(price_idx, level)
+        level.add(order=order)
 
         self._order_id_level_index[order.id] = level
 
@@ -123,8 +114,10 @@ cdef class Ladder:
         if order.price == level.price:
             # This update contains a volume update
             level.update(order=order)
+            if order.size == 0:
+                self._order_id_level_index.pop(order.id)
             if not level.orders:
-                self.levels.remove(level)
+                self._remove_level(level)
         else:
             # New price for this order, delete and insert
             self.delete(order=order)
@@ -150,11 +143,24 @@ cdef class Ladder:
         if level is None:
             return
             # TODO: raise KeyError("Cannot delete order: not found at level.")
-        cdef int price_idx = self.prices().index(level.price)
         level.delete(order=order)
         self._order_id_level_index.pop(order.id)
         if not level.orders:
-            del self.levels[price_idx]
+            self._remove_level(level)
+
+    cdef void _insert_level(self, Level level) except *:
+        cdef double key = -level.price if self.reverse else level.price
+        cdef int idx = bisect_right(self._keys, key)
+        self._keys.insert(idx, key)
+        self.levels.insert(idx, level)
+        self._price_levels[level.price] = level
+
+    cdef void _remove_level(self, Level level) except *:
+        cdef double key = -level.price if self.reverse else level.price
+        cdef int idx = bisect_left(self._keys, key)
+        del self._keys[idx]
+        del self.levels[idx]
+        del self._price_levels[level.price]
 
     cpdef list depth(self, int n=1):
         """
@@ -217,9 +223,8 @@ cdef class Ladder:
         Level or ``None``
 
         """
-        cdef list top = self.depth(1)
-        if top:
-            return top[0]
+        if self.levels:
+            return self.levels[0]
         else:
             return None
 
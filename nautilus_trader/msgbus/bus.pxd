@@ -19,13 +19,16 @@ from nautilus_trader.core.message cimport Request
 from nautilus_trader.core.message cimport Response
 from nautilus_trader.model.identifiers cimport TraderId
 from nautilus_trader.msgbus.subscription cimport Subscription
+from nautilus_trader.msgbus.trie cimport SubscriptionTrie
 
 
 cdef class MessageBus:
     cdef Clock _clock
     cdef LoggerAdapter _log
     cdef dict _subscriptions
+    cdef SubscriptionTrie _trie
     cdef dict _patterns
+    cdef int _patterns_capacity
     cdef dict _endpoints
     cdef dict _correlation_index
 
@@ -55,3 +58,4 @@ cdef class MessageBus:
     cpdef void publish(self, str topic, msg) except *
     cdef void publish_c(self, str topic, msg) except *
     cdef Subscription[:] _resolve_subscriptions(self, str topic)
+    cdef void _evict_patterns(self) except *
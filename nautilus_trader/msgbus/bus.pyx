@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from itertools import islice
 from typing import Any, Callable
 
 import cython
@@ -23,6 +24,8 @@ from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.model.identifiers cimport TraderId
+from nautilus_trader.msgbus.trie cimport SubscriptionTrie
+from nautilus_trader.msgbus.trie cimport split_pattern
 from nautilus_trader.msgbus.wildcard cimport is_matching
 
 
@@ -45,6 +48,11 @@ cdef class MessageBus:
     "camp" and "comp." The question mark can also be used more than once.
     For example, "c??p" would match both of the above examples and "coop."
 
+    Subscriptions are indexed in a trie of their dot-separated topic segments,
+    and the subscriptions resolved for each published topic are cached. When
+    the cache reaches capacity the oldest half of the cached topics are
+    evicted (to be resolved again on their next publish).
+
     Parameters
     ----------
     trader_id : TraderId
@@ -55,11 +63,15 @@ cdef class MessageBus:
         The logger for the message bus.
     name : str, optional
         The custom name for the message bus.
+    topic_cache_size : int, optional
+        The maximum number of published topics to cache resolved subscriptions for.
 
     Raises
     ------
     ValueError
         If `name` is not ``None`` and not a valid string.
+    ValueError
+        If `topic_cache_size` is not positive (> 0).
 
     Warnings
     --------
@@ -73,10 +85,12 @@ cdef class MessageBus:
         Clock clock not None,
         Logger logger not None,
         str name=None,
+        int topic_cache_size=10_000,
     ):
         if name is None:
             name = "MessageBus"
         Condition.valid_string(name, "name")
+        Condition.positive_int(topic_cache_size, "topic_cache_size")
 
         self.trader_id = trader_id
 
@@ -85,7 +99,9 @@ cdef class MessageBus:
 
         self._endpoints = {}          # type: dict[str, Callable[[Any], None]]
         self._patterns = {}           # type: dict[str, Subscription[:]]
-        self._subscriptions = {}      # type: dict[Subscription, list[str]]
+        self._patterns_capacity = topic_cache_size
+        self._subscriptions = {}      # type: dict[Subscription, set[str]]
+        self._trie = SubscriptionTrie()
         self._correlation_index = {}  # type: dict[UUID4, Callable[[Any], None]]
 
         # Counters
@@ -353,20 +369,33 @@ cdef class MessageBus:
             self._log.warning(f"{sub} already exists.")
             return
 
-        cdef list matches = []
-        cdef list patterns = list(self._patterns.keys())
+        self._trie.add(sub)
+
+        # Update only the cached topics which match the new subscription
+        cdef set matches = set()
+        cdef list segments
+        cdef str tail
+        segments, tail = split_pattern(topic)
+
+        cdef str prefix
+        cdef str cached
+        if tail is None:
+            if topic in self._patterns:
+                matches.add(topic)
+        else:
+            prefix = ".".join(segments) + "." if segments else ""
+            for cached in self._patterns:
+                if cached.startswith(prefix) and is_matching(cached[len(prefix):], tail):
+                    matches.add(cached)
 
-        cdef str pattern
         cdef list subs
-        for pattern in patterns:
-            if is_matching(topic, pattern):
-                subs = list(self._patterns[pattern])
-                subs.append(sub)
-                subs = sorted(subs, reverse=True)
-                self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
-                matches.append(pattern)
+        for cached in matches:
+            subs = list(self._patterns[cached])
+            subs.append(sub)
+            subs.sort(reverse=True)
+            self._patterns[cached] = np.ascontiguousarray(subs, dtype=Subscription)
 
-        self._subscriptions[sub] = sorted(matches)
+        self._subscriptions[sub] = matches
 
         self._log.debug(f"Added {sub}.")
 
@@ -394,21 +423,22 @@ cdef class MessageBus:
 
         cdef Subscription sub = Subscription(topic=topic, handler=handler)
 
-        cdef list patterns = self._subscriptions.get(sub)
+        cdef set topics = self._subscriptions.pop(sub, None)
 
         # Check if exists
-        if patterns is None:
+        if topics is None:
             self._log.warning(f"{sub} not found.")
             return
 
-        cdef str pattern
-        for pattern in patterns:
-            subs = list(self._patterns[pattern])
-            subs.remove(sub)
-            subs = sorted(subs, reverse=True)
-            self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
+        self._trie.remove(sub)
 
-        del self._subscriptions[sub]
+        # Update only the cached topics which matched the subscription
+        cdef str cached
+        cdef list subs
+        for cached in topics:
+            subs = list(self._patterns[cached])
+            subs.remove(sub)
+            self._patterns[cached] = np.ascontiguousarray(subs, dtype=Subscription)
 
         self._log.debug(f"Removed {sub}.")
 
@@ -449,21 +479,28 @@ cdef class MessageBus:
         self.pub_count += 1
 
     cdef Subscription[:] _resolve_subscriptions(self, str topic):
-        cdef list subs_list = []
-        cdef Subscription existing_sub
-        for existing_sub in self._subscriptions:
-            if is_matching(topic, existing_sub.topic):
-                subs_list.append(existing_sub)
-
-        subs_list = sorted(subs_list, reverse=True)
+        cdef list subs_list = self._trie.match(topic)
+        subs_list.sort(reverse=True)  # Stable, so equal priorities remain in subscription order
         cdef Subscription[:] subs_array = np.ascontiguousarray(subs_list, dtype=Subscription)
+
+        if len(self._patterns) >= self._patterns_capacity:
+            self._evict_patterns()
+
         self._patterns[topic] = subs_array
 
-        cdef list matches
-        for sub in subs_array:
-            matches = self._subscriptions.get(sub, [])
-            if topic not in matches:
-                matches.append(topic)
-            self._subscriptions[sub] = sorted(matches)
+        cdef Subscription sub
+        for sub in subs_list:
+            (<set>self._subscriptions[sub]).add(topic)
 
         return subs_array
+
+    cdef void _evict_patterns(self) except *:
+        # Evict the oldest half of the cached topics (dicts preserve insertion
+        # order), which avoids tracking recency on every publish
+        cdef int count = max(1, len(self._patterns) // 2)
+        cdef list evicted = list(islice(self._patterns, count))
+        cdef str topic
+        cdef Subscription sub
+        for topic in evicted:
+            for sub in self._patterns.pop(topic):
+                (<set>self._subscriptions[sub]).discard(topic)
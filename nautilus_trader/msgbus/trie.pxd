@@ -0,0 +1,35 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.msgbus.subscription cimport Subscription
+
+
+cdef tuple split_pattern(str pattern)
+
+
+cdef class TopicTrieNode:
+    cdef dict children
+    cdef list exact
+    cdef dict tails
+
+
+cdef class SubscriptionTrie:
+    cdef TopicTrieNode _root
+    cdef dict _sequence
+    cdef int _next_seq
+
+    cpdef void add(self, Subscription sub) except *
+    cpdef bint remove(self, Subscription sub) except *
+    cpdef list match(self, str topic)
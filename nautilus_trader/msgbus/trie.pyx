@@ -0,0 +1,199 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.msgbus.subscription cimport Subscription
+from nautilus_trader.msgbus.wildcard cimport is_matching
+
+
+cdef tuple split_pattern(str pattern):
+    # Split the pattern into its leading literal segments, and the remaining
+    # pattern from the first segment containing a wildcard character (or
+    # ``None`` if the pattern contains no wildcard characters).
+    cdef list segments = pattern.split(".")
+    cdef int i
+    cdef str segment
+    for i, segment in enumerate(segments):
+        if "*" in segment or "?" in segment:
+            return segments[:i], ".".join(segments[i:])
+    return segments, None
+
+
+cdef class TopicTrieNode:
+    """
+    Represents a node of a `SubscriptionTrie`.
+
+    This is an internal class intended to be used by the subscription trie.
+    """
+
+    def __init__(self):
+        self.children = {}  # type: dict[str, TopicTrieNode]
+        self.exact = []     # type: list[Subscription]
+        self.tails = {}     # type: dict[str, list[Subscription]]
+
+
+cdef class SubscriptionTrie:
+    """
+    Provides an index of subscriptions keyed on their dot-separated topics.
+
+    Each subscription is held at the node reached by the literal segments of
+    its topic, up to the first segment containing a wildcard character '*' or
+    '?'. Any remaining pattern is held at that node, and matched only against
+    the remainder of the topics which reach it.
+
+    Resolving a topic therefore walks a single path of at most `depth` nodes,
+    rather than matching the topic against every subscription.
+
+    This is an internal class intended to be used by the message bus.
+    """
+
+    def __init__(self):
+        self._root = TopicTrieNode()
+        self._sequence = {}  # type: dict[Subscription, int]
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    cpdef void add(self, Subscription sub) except *:
+        """
+        Add the given subscription to the trie.
+
+        Parameters
+        ----------
+        sub : Subscription
+            The subscription to add.
+
+        Raises
+        ------
+        ValueError
+            If `sub` is already in the trie.
+
+        """
+        Condition.not_none(sub, "sub")
+        Condition.not_in(sub, self._sequence, "sub", "_sequence")
+
+        cdef list segments
+        cdef str tail
+        segments, tail = split_pattern(sub.topic)
+
+        cdef TopicTrieNode node = self._root
+        cdef TopicTrieNode child
+        cdef str segment
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                child = TopicTrieNode()
+                node.children[segment] = child
+            node = child
+
+        if tail is None:
+            node.exact.append(sub)
+        else:
+            node.tails.setdefault(tail, []).append(sub)
+
+        self._sequence[sub] = self._next_seq
+        self._next_seq += 1
+
+    cpdef bint remove(self, Subscription sub) except *:
+        """
+        Remove the given subscription from the trie.
+
+        Parameters
+        ----------
+        sub : Subscription
+            The subscription to remove.
+
+        Returns
+        -------
+        bool
+            True if the subscription was removed, else False (not found).
+
+        """
+        Condition.not_none(sub, "sub")
+
+        if self._sequence.pop(sub, None) is None:
+            return False
+
+        cdef list segments
+        cdef str tail
+        segments, tail = split_pattern(sub.topic)
+
+        cdef list path = [self._root]
+        cdef TopicTrieNode node = self._root
+        cdef str segment
+        for segment in segments:
+            node = node.children[segment]
+            path.append(node)
+
+        cdef list subs
+        if tail is None:
+            node.exact.remove(sub)
+        else:
+            subs = node.tails[tail]
+            subs.remove(sub)
+            if not subs:
+                del node.tails[tail]
+
+        # Prune nodes which no longer lead to any subscription
+        cdef int i
+        for i in range(len(segments), 0, -1):
+            node = path[i]
+            if node.children or node.exact or node.tails:
+                break
+            del (<TopicTrieNode>path[i - 1]).children[segments[i - 1]]
+
+        return True
+
+    cpdef list match(self, str topic):
+        """
+        Return the subscriptions matching the given topic.
+
+        Parameters
+        ----------
+        topic : str
+            The topic to match (without wildcard characters).
+
+        Returns
+        -------
+        list[Subscription]
+            In the order the subscriptions were added.
+
+        """
+        Condition.not_none(topic, "topic")
+
+        cdef list matched = []
+        cdef list segments = topic.split(".")
+        cdef TopicTrieNode node = self._root
+        cdef int pos = 0
+        cdef str segment
+        cdef str remainder
+        cdef str tail
+        cdef list subs
+        for segment in segments:
+            if node.tails:
+                remainder = topic[pos:]
+                for tail, subs in node.tails.items():
+                    if is_matching(remainder, tail):
+                        matched.extend(subs)
+            node = node.children.get(segment)
+            if node is None:
+                break
+            pos += len(segment) + 1
+        else:
+            matched.extend(node.exact)
+
+        matched.sort(key=self._sequence.__getitem__)
+        return matched
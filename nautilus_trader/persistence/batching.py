@@ -13,38 +13,45 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import heapq
-import sys
+import itertools
 from collections import namedtuple
-from typing import Any, Iterator, List, Set
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import fsspec
-import pandas as pd
+import numpy as np
+import pyarrow as pa
 import pyarrow.dataset as ds
 from dask.utils import parse_bytes
 
 from nautilus_trader.backtest.config import BacktestDataConfig
+from nautilus_trader.model.c_enums.aggressor_side import AggressorSideParser
+from nautilus_trader.model.data.columnar import QuoteTickColumns
+from nautilus_trader.model.data.columnar import TradeTickColumns
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.objects import FIXED_PRECISION_MAX
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
 from nautilus_trader.serialization.arrow.util import clean_key
 
 
+_POW10 = 10 ** np.arange(FIXED_PRECISION_MAX + 1, dtype=np.int64)
+_RAW_EXACT_MAX = 2 ** 52
+
 FileMeta = namedtuple("FileMeta", "filename datatype instrument_id client_id start end")
 
 
 def dataset_batches(
     file_meta: FileMeta, fs: fsspec.AbstractFileSystem, n_rows: int
-) -> Iterator[pd.DataFrame]:
+) -> Iterator[pa.RecordBatch]:
     d: ds.Dataset = ds.dataset(file_meta.filename, filesystem=fs)
     filter_expr = (ds.field("ts_init") >= file_meta.start) & (ds.field("ts_init") <= file_meta.end)
     scanner: ds.Scanner = d.scanner(filter=filter_expr, batch_size=n_rows)
     for batch in scanner.to_batches():
         if batch.num_rows == 0:
-            break
-        data = batch.to_pandas()
-        if file_meta.instrument_id:
-            data.loc[:, "instrument_id"] = file_meta.instrument_id
-        yield data
+            continue
+        yield batch
 
 
 def build_filenames(catalog: DataCatalog, data_configs: List[BacktestDataConfig]) -> List[FileMeta]:
@@ -68,8 +75,239 @@ def build_filenames(catalog: DataCatalog, data_configs: List[BacktestDataConfig]
     return files
 
 
-def frame_to_nautilus(df: pd.DataFrame, cls: type) -> List[Any]:
-    return ParquetSerializer.deserialize(cls=cls, chunk=df.to_dict("records"))
+def table_to_nautilus(table: pa.Table, cls: type, instrument_id: Optional[str] = None) -> List[Any]:
+    """
+    Decode the rows of the given Arrow table into Nautilus objects.
+
+    Quote and trade ticks are built straight from the Arrow column arrays,
+    via columnar ticks holding the raw fixed-point values. Other types (or
+    tick columns with mixed precisions for an instrument) are decoded row by
+    row through the `ParquetSerializer`.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The table to decode.
+    cls : type
+        The Nautilus type to decode to.
+    instrument_id : str, optional
+        The instrument ID to assign to every row (for data partitioned on
+        instrument ID, where the column is not stored in the files).
+
+    Returns
+    -------
+    list[Any]
+
+    """
+    if table.num_rows == 0:
+        return []
+    decoder = _COLUMN_DECODERS.get(cls)
+    if decoder is not None:
+        columns = decoder(table=table, instrument_id=instrument_id)
+        if columns is not None:
+            return list(columns)
+    return _deserialize_rows(table=table, cls=cls, instrument_id=instrument_id)
+
+
+def _deserialize_rows(table: pa.Table, cls: type, instrument_id: Optional[str]) -> List[Any]:
+    columns: Dict[str, list] = table.to_pydict()
+    if instrument_id:
+        columns["instrument_id"] = list(itertools.repeat(instrument_id, table.num_rows))
+    names = list(columns)
+    chunk = [dict(zip(names, row)) for row in zip(*columns.values())]
+    return ParquetSerializer.deserialize(cls=cls, chunk=chunk)
+
+
+def _column_to_numpy(table: pa.Table, name: str) -> np.ndarray:
+    chunks = []
+    for chunk in table.column(name).chunks:
+        if pa.types.is_dictionary(chunk.type):
+            chunk = chunk.dictionary_decode()
+        chunks.append(chunk.to_numpy(zero_copy_only=False))
+    return np.concatenate(chunks)
+
+
+def _decimal_column(table: pa.Table, name: str) -> Tuple[np.ndarray, np.ndarray]:
+    # Return the raw fixed-point values and precisions of a column of decimal
+    # strings (as written by `str(Price)` etc)
+    raws, precisions = [], []
+    for chunk in table.column(name).chunks:
+        raw, precision = _parse_decimals(chunk)
+        raws.append(raw)
+        precisions.append(precision)
+    return np.concatenate(raws), np.concatenate(precisions)
+
+
+def _parse_decimals(array: pa.Array) -> Tuple[np.ndarray, np.ndarray]:
+    # Parse the decimal strings straight from the Arrow buffers, the precision
+    # of each value being the number of digits after its decimal point. Raises
+    # `ValueError` for nulls or any other format (such as exponents).
+    count = len(array)
+    if count == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    if array.null_count:
+        raise ValueError("decimal strings contained nulls")
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+    offset_type = np.int64 if pa.types.is_large_string(array.type) else np.int32
+    _, offsets_buffer, data_buffer = array.buffers()
+    if data_buffer is None:
+        raise ValueError("decimal strings were empty")
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_type)
+    offsets = offsets[array.offset : array.offset + count + 1]
+    data = np.frombuffer(data_buffer, dtype=np.uint8)[offsets[0] : offsets[-1]]
+    if (data >= ord("A")).any():
+        raise ValueError("decimal strings were not all plain decimals")
+
+    values = np.asarray(array.cast(pa.float64()))  # Raises `ArrowInvalid` on any other format
+    ends = (offsets[1:] - offsets[0]).astype(np.int64)
+    dots = np.flatnonzero(data == ord("."))
+    rows = np.searchsorted(ends, dots, side="right")
+    precisions = np.zeros(count, dtype=np.int64)
+    precisions[rows] = ends[rows] - dots - 1
+    if (precisions > FIXED_PRECISION_MAX).any():
+        raise ValueError("decimal strings precision out of range")
+
+    # Exact while the scaled values are well within the 53-bit float mantissa
+    scaled = np.rint(values * _POW10[precisions])
+    if not (np.abs(scaled) < _RAW_EXACT_MAX).all():
+        raise ValueError("decimal strings out of range")
+    return scaled.astype(np.int64), precisions
+
+
+def _instrument_index(table: pa.Table, instrument_id: Optional[str]) -> Tuple[list, np.ndarray]:
+    if instrument_id:
+        return [InstrumentId.from_str(instrument_id)], np.zeros(table.num_rows, dtype=np.uint16)
+    uniques, index = np.unique(
+        _column_to_numpy(table, "instrument_id").astype(str),
+        return_inverse=True,
+    )
+    return [InstrumentId.from_str(value) for value in uniques], index.astype(np.uint16)
+
+
+def _instrument_precisions(index: np.ndarray, count: int, *precisions) -> Optional[np.ndarray]:
+    # Return the precision for each instrument, or ``None`` if the precisions
+    # of an instrument are not all equal
+    result = np.zeros(count, dtype=np.uint8)
+    result[index] = precisions[0]
+    for values in precisions:
+        if not (result[index] == values).all():
+            return None
+    return result
+
+
+def _quote_tick_columns(
+    table: pa.Table,
+    instrument_id: Optional[str],
+) -> Optional[QuoteTickColumns]:
+    try:
+        bid, bid_prec = _decimal_column(table, "bid")
+        ask, ask_prec = _decimal_column(table, "ask")
+        bid_size, bid_size_prec = _decimal_column(table, "bid_size")
+        ask_size, ask_size_prec = _decimal_column(table, "ask_size")
+    except ValueError:
+        return None
+
+    instrument_ids, index = _instrument_index(table, instrument_id)
+    price_precisions = _instrument_precisions(index, len(instrument_ids), bid_prec, ask_prec)
+    size_precisions = _instrument_precisions(
+        index, len(instrument_ids), bid_size_prec, ask_size_prec
+    )
+    if price_precisions is None or size_precisions is None:
+        return None
+
+    return QuoteTickColumns(
+        instrument_ids=instrument_ids,
+        price_precisions=price_precisions,
+        size_precisions=size_precisions,
+        instrument_index=index,
+        bid=bid,
+        ask=ask,
+        bid_size=bid_size,
+        ask_size=ask_size,
+        ts_event=_column_to_numpy(table, "ts_event"),
+        ts_init=_column_to_numpy(table, "ts_init"),
+    )
+
+
+def _trade_tick_columns(
+    table: pa.Table,
+    instrument_id: Optional[str],
+) -> Optional[TradeTickColumns]:
+    try:
+        price, price_prec = _decimal_column(table, "price")
+        size, size_prec = _decimal_column(table, "size")
+    except ValueError:
+        return None
+
+    instrument_ids, index = _instrument_index(table, instrument_id)
+    price_precisions = _instrument_precisions(index, len(instrument_ids), price_prec)
+    size_precisions = _instrument_precisions(index, len(instrument_ids), size_prec)
+    if price_precisions is None or size_precisions is None:
+        return None
+
+    # Parse each distinct aggressor side once, then map back over the codes
+    sides, codes = np.unique(
+        _column_to_numpy(table, "aggressor_side").astype(str),
+        return_inverse=True,
+    )
+    parsed = np.array([AggressorSideParser.from_str_py(side) for side in sides], dtype=np.uint8)
+
+    return TradeTickColumns(
+        instrument_ids=instrument_ids,
+        price_precisions=price_precisions,
+        size_precisions=size_precisions,
+        instrument_index=index,
+        price=price,
+        size=size,
+        aggressor_side=parsed[codes],
+        trade_ids=table.column("trade_id").to_pylist(),
+        ts_event=_column_to_numpy(table, "ts_event"),
+        ts_init=_column_to_numpy(table, "ts_init"),
+    )
+
+
+_COLUMN_DECODERS = {
+    QuoteTick: _quote_tick_columns,
+    TradeTick: _trade_tick_columns,
+}
+
+
+class _FileBuffer:
+    """
+    Holds the rows read from a single file which have not yet been replayed.
+    """
+
+    def __init__(self, file_meta: FileMeta, batches: Iterator[pa.RecordBatch]):
+        self.file_meta = file_meta
+        self.batches = batches
+        self.table: Optional[pa.Table] = None
+        self.ts_init = np.empty(0, dtype=np.int64)
+        self.completed = False
+
+    def __len__(self) -> int:
+        return len(self.ts_init)
+
+    def fill(self, n_rows: int) -> None:
+        if self.completed or len(self) >= n_rows:
+            return
+        batch: Optional[pa.RecordBatch] = next(self.batches, None)
+        if batch is None:
+            self.completed = True
+            return
+        table = pa.Table.from_batches([batch])
+        self.table = table if self.table is None else pa.concat_tables([self.table, table])
+        self.ts_init = np.concatenate([self.ts_init, batch.column("ts_init").to_numpy()])
+
+    def take_until(self, ts: int) -> Tuple[pa.Table, np.ndarray]:
+        # Split the buffer on `ts_init <= ts`, returning the rows which are due
+        # along with their `ts_init` values
+        mask = self.ts_init <= ts
+        due = self.table.filter(pa.array(mask))
+        due_ts_init = self.ts_init[mask]
+        self.table = self.table.filter(pa.array(~mask))
+        self.ts_init = self.ts_init[~mask]
+        return due, due_ts_init
 
 
 def batch_files(
@@ -78,47 +316,76 @@ def batch_files(
     read_num_rows: int = 10000,
     target_batch_size_bytes: int = parse_bytes("100mb"),  # noqa: B008
 ):
+    """
+    Stream the data for the given configs from the catalog in `ts_init` order.
+
+    Record batches are read from each file into a per-file Arrow buffer. All
+    rows up to the smallest of the buffers' latest timestamps can then be
+    replayed safely; these are decoded straight from the Arrow columns, and
+    merged across files with a single stable argsort of their Arrow `ts_init`
+    columns.
+
+    Parameters
+    ----------
+    catalog : DataCatalog
+        The catalog to read from.
+    data_configs : list[BacktestDataConfig]
+        The data configurations to stream.
+    read_num_rows : int
+        The number of rows to buffer per file before each merge.
+    target_batch_size_bytes : int
+        The target size (in Arrow buffer bytes) of each yielded batch.
+
+    Yields
+    ------
+    list[Any]
+        The decoded objects, sorted by `ts_init`.
+
+    """
     files = build_filenames(catalog=catalog, data_configs=data_configs)
-    buffer = {fn.filename: pd.DataFrame() for fn in files}
-    datasets = {
-        f.filename: dataset_batches(file_meta=f, fs=catalog.fs, n_rows=read_num_rows) for f in files
-    }
-    completed: Set[str] = set()
+    buffers = [
+        _FileBuffer(
+            file_meta=f,
+            batches=dataset_batches(file_meta=f, fs=catalog.fs, n_rows=read_num_rows),
+        )
+        for f in files
+    ]
     bytes_read = 0
-    values = []
-    while set([f.filename for f in files]) != completed:
-        # Fill buffer (if required)
-        for fn in buffer:
-            if len(buffer[fn]) < read_num_rows:
-                next_buf = next(datasets[fn], None)
-                if next_buf is None:
-                    completed.add(fn)
-                    continue
-                buffer[fn] = buffer[fn].append(next_buf)
+    values: List[Any] = []
+    while not all(buf.completed and not len(buf) for buf in buffers):
+        # Fill buffers (if required)
+        for buf in buffers:
+            buf.fill(n_rows=read_num_rows)
 
         # Determine minimum timestamp
-        max_ts_per_frame = [df["ts_init"].max() for df in buffer.values() if not df.empty]
-        if not max_ts_per_frame:
+        max_ts_per_buffer = [buf.ts_init.max() for buf in buffers if len(buf)]
+        if not max_ts_per_buffer:
             continue
-        min_ts = min(max_ts_per_frame)
+        min_ts = min(max_ts_per_buffer)
 
-        # Filter buffer dataframes based on min_timestamp
-        batches = []
-        for f in files:
-            df = buffer[f.filename]
-            if df.empty:
+        # Decode all buffered rows up to the minimum timestamp
+        objs: List[Any] = []
+        ts_inits: List[np.ndarray] = []
+        for buf in buffers:
+            if not len(buf):
                 continue
-            ts_filter = df["ts_init"] <= min_ts
-            batch = df[ts_filter]
-            buffer[f.filename] = df[~ts_filter]
-            # print(f"{f.filename} batch={len(batch)} buffer={len(buffer)}")
-            objs = frame_to_nautilus(df=batch, cls=f.datatype)
-            batches.append(objs)
-            bytes_read += sum([sys.getsizeof(x) for x in objs])
-
-        # Merge ticks
-        values.extend(list(heapq.merge(*batches, key=lambda x: x.ts_init)))
-        # print(f"iter complete, {bytes_read=}, flushing at target={target_batch_size_bytes}")
+            table, ts_init = buf.take_until(min_ts)
+            bytes_read += table.nbytes
+            decoded = table_to_nautilus(
+                table=table,
+                cls=buf.file_meta.datatype,
+                instrument_id=buf.file_meta.instrument_id,
+            )
+            if len(decoded) != len(ts_init):
+                # Rows were grouped into fewer objects (such as order book deltas)
+                ts_init = np.fromiter((x.ts_init for x in decoded), np.int64, len(decoded))
+            objs.extend(decoded)
+            ts_inits.append(ts_init)
+
+        # Merge on the Arrow `ts_init` columns (stable, so equal timestamps keep
+        # their file order)
+        order = np.argsort(np.concatenate(ts_inits), kind="stable")
+        values.extend([objs[i] for i in order])
         if bytes_read > target_batch_size_bytes:
             yield values
             bytes_read = 0
@@ -15,7 +15,7 @@
 
 import os
 import pathlib
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import fsspec
 import pandas as pd
@@ -34,7 +34,11 @@ from nautilus_trader.model.data.ticker import Ticker
 from nautilus_trader.model.data.venue import InstrumentStatusUpdate
 from nautilus_trader.model.instruments.base import Instrument
 from nautilus_trader.model.orderbook.data import OrderBookData
+from nautilus_trader.persistence.external.metadata import FRAGMENT_INDEX_FN
+from nautilus_trader.persistence.external.metadata import load_fragment_index
 from nautilus_trader.persistence.external.metadata import load_mappings
+from nautilus_trader.persistence.external.metadata import update_fragment_index
+from nautilus_trader.persistence.external.synchronization import named_lock
 from nautilus_trader.persistence.streaming import read_feather
 from nautilus_trader.persistence.util import Singleton
 from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
@@ -72,6 +76,7 @@ class DataCatalog(metaclass=Singleton):
         self.fs: fsspec.AbstractFileSystem = fsspec.filesystem(
             self.fs_protocol, **self.fs_storage_options
         )
+        self._fragment_indexes: Dict[str, Tuple[Tuple, Dict[str, Dict]]] = {}
 
     @classmethod
     def from_env(cls):
@@ -108,10 +113,12 @@ class DataCatalog(metaclass=Singleton):
             if clean_instrument_keys:
                 instrument_ids = list(set(map(clean_key, instrument_ids)))
             filters.append(ds.field(instrument_id_column).cast("string").isin(instrument_ids))
-        if start is not None:
-            filters.append(ds.field(ts_column) >= int(pd.Timestamp(start).to_datetime64()))
-        if end is not None:
-            filters.append(ds.field(ts_column) <= int(pd.Timestamp(end).to_datetime64()))
+        start_ns = int(pd.Timestamp(start).to_datetime64()) if start is not None else None
+        end_ns = int(pd.Timestamp(end).to_datetime64()) if end is not None else None
+        if start_ns is not None:
+            filters.append(ds.field(ts_column) >= start_ns)
+        if end_ns is not None:
+            filters.append(ds.field(ts_column) <= end_ns)
 
         full_path = self._make_path(cls=cls)
         if not (self.fs.exists(full_path) or self.fs.isdir(full_path)):
@@ -120,8 +127,15 @@ class DataCatalog(metaclass=Singleton):
             else:
                 return pd.DataFrame() if as_dataframe else None
 
-        dataset = ds.dataset(full_path, partitioning="hive", filesystem=self.fs)
-        table = dataset.to_table(filter=combine_filters(*filters), **(table_kwargs or {}))
+        table = self._read_table(
+            path=full_path,
+            filter_expr=combine_filters(*filters),
+            partition_values={instrument_id_column: instrument_ids},
+            ts_column=ts_column,
+            start=start_ns,
+            end=end_ns,
+            table_kwargs=table_kwargs,
+        )
         mappings = self.load_inverse_mappings(path=full_path)
         if as_dataframe:
             return self._handle_table_dataframe(
@@ -130,6 +144,163 @@ class DataCatalog(metaclass=Singleton):
         else:
             return self._handle_table_nautilus(table=table, cls=cls, mappings=mappings)
 
+    def _read_table(
+        self,
+        path: str,
+        filter_expr,
+        partition_values: Dict[str, Optional[List[str]]],
+        ts_column: str,
+        start: Optional[int],
+        end: Optional[int],
+        table_kwargs: Optional[Dict],
+    ) -> pa.Table:
+        for attempt in range(2):
+            fragments = self._prune_fragments(
+                path=path,
+                partition_values=partition_values,
+                ts_column=ts_column,
+                start=start,
+                end=end,
+            )
+            try:
+                if fragments is None:
+                    # No index, discover the dataset as is
+                    dataset = ds.dataset(path, partitioning="hive", filesystem=self.fs)
+                elif not fragments:
+                    # Nothing left after pruning
+                    return self._empty_table(path=path, table_kwargs=table_kwargs)
+                else:
+                    dataset = ds.dataset(
+                        fragments,
+                        partitioning="hive",
+                        partition_base_dir=path,
+                        filesystem=self.fs,
+                    )
+                return dataset.to_table(filter=filter_expr, **(table_kwargs or {}))
+            except FileNotFoundError:
+                # The fragments were compacted away after the index was loaded,
+                # retry once against the swapped index
+                if fragments is None or attempt > 0:
+                    raise
+                self._fragment_indexes.pop(path, None)
+
+    def _empty_table(self, path: str, table_kwargs: Optional[Dict]) -> pa.Table:
+        # Return an empty table with the schema of the dataset at `path`, read
+        # from the footer of a single indexed fragment (if any).
+        index = self.fragment_index(path=path)
+        if index:
+            dataset = ds.dataset(
+                [f"{path}/{next(iter(index))}"],
+                partitioning="hive",
+                partition_base_dir=path,
+                filesystem=self.fs,
+            )
+        else:
+            dataset = ds.dataset(path, partitioning="hive", filesystem=self.fs)
+        table = dataset.schema.empty_table()
+        columns = (table_kwargs or {}).get("columns")
+        return table if columns is None else table.select(columns)
+
+    def fragment_index(self, path: str) -> Optional[Dict[str, Dict]]:
+        """
+        Return the (cached) fragment index for the dataset at `path`.
+
+        The cached index is reused while the index file is unchanged. Readers
+        trust the index as written, files added or removed without updating
+        the index are picked up by the next write to the dataset (or by
+        `rebuild_fragment_index`).
+
+        Parameters
+        ----------
+        path : str
+            The dataset path.
+
+        Returns
+        -------
+        dict[str, dict] or ``None``
+            If the dataset has no fragment index then returns ``None``.
+
+        """
+        version = self._fragment_index_version(path=path)
+        if version is None:
+            self._fragment_indexes.pop(path, None)
+            return None
+
+        cached = self._fragment_indexes.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        index = load_fragment_index(fs=self.fs, path=path)
+        if index is not None:
+            self._fragment_indexes[path] = (version, index)
+        return index
+
+    def rebuild_fragment_index(self, path: str) -> Dict[str, Dict]:
+        """
+        Rebuild the fragment index for the dataset at `path` from a listing of
+        its files, e.g. after files were added or removed out of band.
+
+        Parameters
+        ----------
+        path : str
+            The dataset path.
+
+        Returns
+        -------
+        dict[str, dict]
+
+        """
+        with named_lock(pathlib.Path(path).name):
+            index = update_fragment_index(fs=self.fs, path=path, fragments={})
+        self._fragment_indexes[path] = (self._fragment_index_version(path=path), index)
+        return index
+
+    def _fragment_index_version(self, path: str) -> Optional[Tuple]:
+        try:
+            info = self.fs.info(f"{path}/{FRAGMENT_INDEX_FN}")
+        except FileNotFoundError:
+            return None
+        return (
+            info.get("size"),
+            info.get("mtime") or info.get("LastModified") or info.get("created"),
+        )
+
+    def _prune_fragments(
+        self,
+        path: str,
+        partition_values: Dict[str, Optional[List[str]]],
+        ts_column: str,
+        start: Optional[int],
+        end: Optional[int],
+    ) -> Optional[List[str]]:
+        # Return the fragment paths which may hold rows matching the given
+        # partition values and time range (or ``None`` if not indexed).
+        index = self.fragment_index(path=path)
+        if index is None:
+            return None
+
+        partition_values = {
+            col: {clean_key(str(v)) for v in values}
+            for col, values in partition_values.items()
+            if values is not None
+        }
+        fragments = []
+        for key, entry in index.items():
+            partition = entry.get("partition", {})
+            if any(
+                col in partition and partition[col] not in values
+                for col, values in partition_values.items()
+            ):
+                continue
+            ts_range = entry.get(ts_column)
+            if ts_range is not None:
+                if start is not None and ts_range[1] < start:
+                    continue
+                if end is not None and ts_range[0] > end:
+                    continue
+            fragments.append(f"{path}/{key}")
+        return fragments
+
     def load_inverse_mappings(self, path):
         mappings = load_mappings(fs=self.fs, path=path)
         for key in mappings:
@@ -13,13 +13,21 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import os
 import pathlib
 import re
+import uuid
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Executor
+from concurrent.futures import wait
 from itertools import groupby
-from typing import Dict, List, Optional, Tuple, Union
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
+import cloudpickle
 import dask
 import fsspec
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.dataset as ds
@@ -34,6 +42,13 @@ from tqdm import tqdm
 from nautilus_trader.model.data.base import GenericData
 from nautilus_trader.model.instruments.base import Instrument
 from nautilus_trader.persistence.catalog import DataCatalog
+from nautilus_trader.persistence.external.metadata import build_fragment_index
+from nautilus_trader.persistence.external.metadata import fragment_stats
+from nautilus_trader.persistence.external.metadata import index_fragments
+from nautilus_trader.persistence.external.metadata import load_fragment_index
+from nautilus_trader.persistence.external.metadata import rebuild_fragment_index
+from nautilus_trader.persistence.external.metadata import update_fragment_index
+from nautilus_trader.persistence.external.metadata import write_fragment_index
 from nautilus_trader.persistence.external.metadata import write_partition_column_mappings
 from nautilus_trader.persistence.external.readers import Reader
 from nautilus_trader.persistence.external.synchronization import named_lock
@@ -42,6 +57,7 @@ from nautilus_trader.serialization.arrow.serializer import get_cls_table
 from nautilus_trader.serialization.arrow.serializer import get_partition_keys
 from nautilus_trader.serialization.arrow.serializer import get_schema
 from nautilus_trader.serialization.arrow.util import check_partition_columns
+from nautilus_trader.serialization.arrow.util import check_partition_values
 from nautilus_trader.serialization.arrow.util import class_to_filename
 from nautilus_trader.serialization.arrow.util import clean_partition_cols
 from nautilus_trader.serialization.arrow.util import maybe_list
@@ -143,6 +159,402 @@ def scan_files(glob_path, compression="infer", **kw) -> List[OpenFile]:
     return [of for of in open_files]
 
 
+class TableBuffer:
+    """
+    Provides a columnar buffer of serialized rows for a single table partition.
+
+    Rows are appended straight into per-column lists and converted into Arrow
+    arrays on `to_table`, without a round-trip through pandas.
+
+    Parameters
+    ----------
+    cls : type
+        The table type for the buffered rows.
+    schema : pa.Schema
+        The parquet schema for the table.
+    """
+
+    def __init__(self, cls: type, schema: pa.Schema):
+        self.cls = cls
+        self.schema = schema
+        self.columns: Dict[str, List] = {name: [] for name in schema.names}
+        self.size = 0
+
+    def append(self, row: Dict):
+        for name, values in self.columns.items():
+            values.append(row.get(name))
+        self.size += 1
+
+    def clean_partition_cols(
+        self,
+        partition_cols: Optional[List[str]],
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Replace any illegal partition column values in place, returning the mappings used.
+        """
+        mappings = {}
+        for col in partition_cols or []:
+            values = self.columns[col]
+            val_map = check_partition_values(column=col, values=list(set(map(str, values))))
+            if val_map:
+                mappings[col] = val_map
+                self.columns[col] = [val_map[str(v)] for v in values]
+        return mappings
+
+    def to_table(self) -> pa.Table:
+        """
+        Return the buffered rows as an Arrow table sorted by `ts_init`.
+        """
+        table = pa.Table.from_arrays(
+            [_to_arrow_array(self.columns[field.name], field.type) for field in self.schema],
+            schema=self.schema,
+        )
+        if self.size > 1 and "ts_init" in self.columns:
+            ts_init = np.asarray(self.columns["ts_init"], dtype=np.int64)
+            if (np.diff(ts_init) < 0).any():
+                table = table.take(pa.array(np.argsort(ts_init, kind="stable")))
+        return table
+
+    def clear(self):
+        for values in self.columns.values():
+            values.clear()
+        self.size = 0
+
+
+def _to_arrow_array(values: List, type_: pa.DataType) -> pa.Array:
+    if pa.types.is_dictionary(type_):
+        codes: Dict = {}
+        indices = [None if v is None else codes.setdefault(v, len(codes)) for v in values]
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, type=type_.index_type),
+            pa.array(list(codes), type=type_.value_type),
+        )
+    return pa.array(values, type=type_)
+
+
+def write_table_buffer(
+    catalog: DataCatalog,
+    buffer: TableBuffer,
+    instrument_id: Optional[str],
+    fragments: Optional[Dict[str, Dict[str, Dict]]] = None,
+):
+    """
+    Write the rows in `buffer` to the catalog as a new sorted file (row group)
+    in its partition, then clear the buffer.
+
+    If `fragments` is given then the written fragment index entries are
+    collected into it by dataset path (for the caller to apply), rather than
+    updating the datasets fragment index directly.
+    """
+    partition_cols = determine_partition_cols(cls=buffer.cls, instrument_id=instrument_id)
+    name = f"{class_to_filename(buffer.cls)}.parquet"
+    path = f"{catalog.path}/data/{name}"
+    mappings = buffer.clean_partition_cols(partition_cols=partition_cols)
+    table = buffer.to_table()
+    with named_lock(name):
+        written = write_parquet_table(
+            fs=catalog.fs,
+            path=path,
+            table=table,
+            partition_cols=partition_cols,
+            mappings=mappings,
+            update_index=fragments is None,
+        )
+    if fragments is not None:
+        fragments.setdefault(path, {}).update(written)
+    rows_written = buffer.size
+    buffer.clear()
+    return rows_written
+
+
+def ingest_raw_file(
+    catalog: DataCatalog,
+    raw_file: RawFile,
+    reader: Reader,
+    row_group_size: int = 250_000,
+) -> Tuple[int, Dict[type, List[Dict]], Dict[str, Dict[str, Dict]]]:
+    """
+    Parse `raw_file` block by block, buffering rows per table partition and
+    appending each partition to the catalog once `row_group_size` rows are buffered.
+
+    Instruments are not written, their serialized rows are returned so the
+    caller can deduplicate them against the catalog with `write_instruments`.
+    Likewise the fragment index entries for the files written are returned for
+    the caller to apply with `update_fragment_index`, so that concurrent tasks
+    never write a datasets index.
+
+    Returns
+    -------
+    tuple[int, dict[type, list[dict]], dict[str, dict[str, dict]]]
+        The number of rows processed, the serialized instrument rows by type
+        and the written fragment index entries by dataset path.
+
+    """
+    buffers: Dict[Tuple[type, Optional[str]], TableBuffer] = {}
+    schemas: Dict[type, Optional[pa.Schema]] = {}
+    instruments: Dict[type, List[Dict]] = {}
+    fragments: Dict[str, Dict[str, Dict]] = {}
+    instrument_classes = Instrument.__subclasses__()
+    n_rows = 0
+
+    for cls, rows in _parse_raw_file(raw_file=raw_file, reader=reader):
+        if cls in instrument_classes:
+            instruments.setdefault(cls, []).extend(rows)
+            n_rows += len(rows)
+            continue
+        schema = _table_schema(cls=cls, schemas=schemas)
+        if schema is None:
+            continue
+        n_rows += _route_rows(
+            catalog=catalog,
+            buffers=buffers,
+            cls=cls,
+            schema=schema,
+            rows=rows,
+            row_group_size=row_group_size,
+            fragments=fragments,
+        )
+
+    n_rows += _flush_buffers(catalog=catalog, buffers=buffers, fragments=fragments)
+
+    reader.on_file_complete()
+    return n_rows, instruments, fragments
+
+
+def _parse_raw_file(raw_file: RawFile, reader: Reader) -> Iterator[Tuple[type, List[Dict]]]:
+    # Yield the table class and serialized rows of each object parsed from `raw_file`
+    for block in raw_file.iter():
+        for obj in reader.parse(block):
+            if obj is None:
+                continue
+            cls = get_cls_table(type(obj))
+            if isinstance(obj, GenericData):
+                cls = obj.data_type.type
+            yield cls, maybe_list(ParquetSerializer.serialize(obj))
+
+
+def _table_schema(cls: type, schemas: Dict[type, Optional[pa.Schema]]) -> Optional[pa.Schema]:
+    if cls not in schemas:
+        try:
+            schemas[cls] = get_schema(cls)
+        except KeyError:
+            print(f"Can't find parquet schema for type: {cls}, skipping!")
+            schemas[cls] = None
+    return schemas[cls]
+
+
+def _route_rows(
+    catalog: DataCatalog,
+    buffers: Dict[Tuple[type, Optional[str]], TableBuffer],
+    cls: type,
+    schema: pa.Schema,
+    rows: List[Dict],
+    row_group_size: int,
+    fragments: Dict[str, Dict[str, Dict]],
+) -> int:
+    # Append `rows` to the buffer for their table partition, writing any buffer
+    # reaching `row_group_size` rows. Returns the number of rows written.
+    n_rows = 0
+    for row in rows:
+        instrument_id = row.get("instrument_id", None)
+        key = (cls, instrument_id)
+        buffer = buffers.get(key)
+        if buffer is None:
+            buffer = buffers[key] = TableBuffer(cls=cls, schema=schema)
+        buffer.append(row)
+        if buffer.size >= row_group_size:
+            n_rows += write_table_buffer(catalog, buffer, instrument_id, fragments)
+    return n_rows
+
+
+def _flush_buffers(
+    catalog: DataCatalog,
+    buffers: Dict[Tuple[type, Optional[str]], TableBuffer],
+    fragments: Dict[str, Dict[str, Dict]],
+) -> int:
+    # Write the rows remaining in all `buffers`. Returns the number of rows written.
+    n_rows = 0
+    for (_, instrument_id), buffer in buffers.items():
+        if buffer.size:
+            n_rows += write_table_buffer(catalog, buffer, instrument_id, fragments)
+    return n_rows
+
+
+def _load_instrument_index(catalog: DataCatalog, cls: type, schema: pa.Schema) -> Set[Tuple]:
+    path = f"{catalog.path}/data/{class_to_filename(cls)}.parquet"
+    if not catalog.fs.exists(path):
+        return set()
+    dataset = ds.dataset(path, filesystem=catalog.fs)
+    names = [name for name in schema.names if name in dataset.schema.names]
+    columns = dataset.to_table(columns=names).to_pydict()
+    return {
+        _instrument_key(schema=schema, row={name: columns[name][i] for name in names})
+        for i in range(len(columns[names[0]]) if names else 0)
+    }
+
+
+def _instrument_key(schema: pa.Schema, row: Dict) -> Tuple:
+    # NaN never compares equal, so normalize to None (as per parquet nulls)
+    return tuple(
+        None if isinstance(value, float) and value != value else value
+        for value in (row.get(name) for name in schema.names)
+    )
+
+
+def write_instruments(
+    catalog: DataCatalog,
+    instruments: Dict[type, List[Dict]],
+    index: Optional[Dict[type, Set[Tuple]]] = None,
+):
+    """
+    Append the serialized `instruments` rows not already in the catalog.
+
+    Rows are deduplicated against `index` (a set of row keys per instrument
+    type), which is loaded from the catalog the first time a type is seen and
+    updated with every row written. Pass the same `index` across calls to
+    avoid reloading existing instruments.
+    """
+    index = {} if index is None else index
+    for cls, rows in instruments.items():
+        schema = get_schema(cls)
+        keys = index.get(cls)
+        if keys is None:
+            keys = index[cls] = _load_instrument_index(catalog=catalog, cls=cls, schema=schema)
+        buffer = TableBuffer(cls=cls, schema=schema)
+        for row in rows:
+            key = _instrument_key(schema=schema, row=row)
+            if key in keys:
+                continue
+            keys.add(key)
+            buffer.append(row)
+        if not buffer.size:
+            continue
+
+        name = f"{class_to_filename(cls)}.parquet"
+        partition_cols = determine_partition_cols(cls=cls)
+        mappings = buffer.clean_partition_cols(partition_cols=partition_cols)
+        with named_lock(name):
+            write_parquet_table(
+                fs=catalog.fs,
+                path=f"{catalog.path}/data/{name}",
+                table=buffer.to_table(),
+                partition_cols=partition_cols,
+                mappings=mappings,
+                # Instruments are appended as new files, never overwritten
+                basename_template=f"{uuid.uuid4().hex}-{{i}}.parquet",
+            )
+
+
+def _apply_fragments(catalog: DataCatalog, fragments: Dict[str, Dict[str, Dict]]):
+    for path, entries in fragments.items():
+        with named_lock(pathlib.Path(path).name):
+            update_fragment_index(fs=catalog.fs, path=path, fragments=entries)
+
+
+def _ingest_raw_file_task(payload: bytes) -> bytes:
+    catalog, raw_file, reader, row_group_size = cloudpickle.loads(payload)
+    result = ingest_raw_file(
+        catalog=catalog,
+        raw_file=raw_file,
+        reader=reader,
+        row_group_size=row_group_size,
+    )
+    return cloudpickle.dumps(result)
+
+
+def ingest_files(
+    glob_path,
+    reader: Reader,
+    catalog: DataCatalog,
+    block_size="128mb",
+    compression="infer",
+    executor: Optional[Executor] = None,
+    max_in_flight: Optional[int] = None,
+    row_group_size: int = 250_000,
+    **kw,
+) -> Dict[str, int]:
+    """
+    Ingest the files matching `glob_path` into the catalog.
+
+    Each file is streamed block by block through `reader`, with the parsed
+    objects serialized straight into Arrow columns and appended to each
+    partition as sorted row groups of up to `row_group_size` rows.
+
+    Parameters
+    ----------
+    glob_path : str
+        The glob path of the raw files to ingest.
+    reader : Reader
+        The reader for the raw files.
+    catalog : DataCatalog
+        The catalog to write to.
+    block_size : str
+        The max block size to read from each file.
+    compression : str
+        The compression of the raw files.
+    executor : Executor, optional
+        The executor to parse files on (i.e. a ``ProcessPoolExecutor``), each
+        task receives its own (cloudpickled) copy of `reader`. If ``None`` then
+        files are parsed sequentially in the calling process.
+    max_in_flight : int, optional
+        The maximum number of files submitted to `executor` at once, bounding
+        memory to one block and its buffered rows per file. Defaults to the
+        number of CPUs.
+    row_group_size : int
+        The number of rows buffered per partition before being written.
+
+    Returns
+    -------
+    dict[str, int]
+        The number of rows processed for each file path.
+
+    """
+    raw_files = make_raw_files(
+        glob_path=glob_path,
+        block_size=block_size,
+        compression=compression,
+        **kw,
+    )
+    index: Dict[type, Set[Tuple]] = {}
+    results: Dict[str, int] = {}
+
+    if executor is None:
+        for rf in raw_files:
+            n_rows, instruments, fragments = ingest_raw_file(
+                catalog=catalog,
+                raw_file=rf,
+                reader=reader,
+                row_group_size=row_group_size,
+            )
+            _apply_fragments(catalog=catalog, fragments=fragments)
+            write_instruments(catalog=catalog, instruments=instruments, index=index)
+            results[rf.open_file.path] = n_rows
+        return results
+
+    def submit(rf: RawFile):
+        payload = cloudpickle.dumps((catalog, rf, reader, row_group_size))
+        pending[executor.submit(_ingest_raw_file_task, payload)] = rf
+
+    pending: Dict = {}
+    remaining = iter(raw_files)
+    for rf in islice(remaining, max_in_flight or os.cpu_count() or 1):
+        submit(rf)
+
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            rf = pending.pop(future)
+            n_rows, instruments, fragments = cloudpickle.loads(future.result())
+            _apply_fragments(catalog=catalog, fragments=fragments)
+            write_instruments(catalog=catalog, instruments=instruments, index=index)
+            results[rf.open_file.path] = n_rows
+            next_rf = next(remaining, None)
+            if next_rf is not None:
+                submit(next_rf)
+
+    return {rf.open_file.path: results[rf.open_file.path] for rf in raw_files}
+
+
 def split_and_serialize(objs: List) -> Dict[type, Dict[Optional[str], List]]:
     """
     Given a list of Nautilus `objs`; serialize and split into dictionaries per type / instrument ID.
@@ -268,10 +680,47 @@ def write_parquet(
     table = pa.Table.from_pandas(df, schema=schema)
 
     if "basename_template" not in kwargs and "ts_init" in df.columns:
-        kwargs["basename_template"] = (
-            f"{df['ts_init'].iloc[0]}-{df['ts_init'].iloc[-1]}" + "-{i}.parquet"
+        kwargs["basename_template"] = _basename_template(
+            first=df["ts_init"].iloc[0],
+            last=df["ts_init"].iloc[-1],
         )
 
+    return write_parquet_table(
+        fs=fs,
+        path=path,
+        table=table,
+        partition_cols=partition_cols,
+        mappings=mappings,
+        **kwargs,
+    )
+
+
+def write_parquet_table(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    table: pa.Table,
+    partition_cols: Optional[List[str]],
+    mappings: Optional[Dict[str, Dict[str, str]]] = None,
+    update_index: bool = True,
+    **kwargs,
+) -> Dict[str, Dict]:
+    """
+    Write a single (partition cleaned) pyarrow table to parquet.
+
+    Returns the fragment index entries for the files written, which are also
+    added to the datasets fragment index if `update_index`.
+    """
+    if "basename_template" not in kwargs:
+        if "ts_init" in table.column_names:
+            ts_init = table.column("ts_init")
+            kwargs["basename_template"] = _basename_template(
+                first=ts_init[0].as_py(),
+                last=ts_init[-1].as_py(),
+            )
+        else:
+            # No time range to name by, ensure appends never overwrite
+            kwargs["basename_template"] = f"{uuid.uuid4().hex}-{{i}}.parquet"
+
     # Write the actual file
     partitions = (
         ds.partitioning(
@@ -296,6 +745,40 @@ def write_parquet(
     if mappings:
         write_partition_column_mappings(fs=fs, path=path, mappings=mappings)
 
+    # Index the written fragments so queries can prune them by partition / time range
+    pattern = kwargs["basename_template"].replace("{i}", "*")
+    written = [
+        fn
+        for directory in _partition_dirs(path=path, table=table, partition_cols=partition_cols)
+        for fn in fs.glob(f"{directory}/{pattern}")
+    ]
+    fragments = index_fragments(fs=fs, path=path, files=written)
+    if update_index:
+        update_fragment_index(fs=fs, path=path, fragments=fragments)
+    return fragments
+
+
+def _partition_dirs(path: str, table: pa.Table, partition_cols: Optional[List[str]]) -> List[str]:
+    # Return the hive partition directories the rows of `table` are written to
+    if not partition_cols:
+        return [path]
+    if len(partition_cols) == 1:
+        (col,) = partition_cols
+        values = [(value,) for value in table.column(col).unique().to_pylist()]
+    else:
+        values = set(zip(*(table.column(col).to_pylist() for col in partition_cols)))
+    return [
+        "/".join([path, *(f"{col}={value}" for col, value in zip(partition_cols, combo))])
+        for combo in values
+    ]
+
+
+def _basename_template(first: int, last: int) -> str:
+    # Name files by their time range, with a unique suffix so that files
+    # written for the same range (i.e. by other flushes or files) never
+    # overwrite each other
+    return f"{first}-{last}-{uuid.uuid4().hex}-{{i}}.parquet"
+
 
 def write_objects(catalog: DataCatalog, chunk: List, **kwargs):
     serialized = split_and_serialize(objs=chunk)
@@ -327,7 +810,7 @@ def _parse_file_start_by_filename(fn: str):
     >>> _parse_file_start_by_filename('/data/test/sample.parquet/instrument_id=a/0648140b1fd7491a97983c0c6ece8d57.parquet')
 
     """
-    match = re.match(r"(?P<start>\d{19})\-\d{19}\-\d", pathlib.Path(fn).stem)
+    match = re.match(r"(?P<start>\d{19})\-\d{19}\-", pathlib.Path(fn).stem)
     if match:
         return int(match.groups()[0])
 
@@ -364,14 +847,224 @@ def _validate_dataset(catalog: DataCatalog, path: str, new_partition_format="%Y%
         # Write new file
         table = pa.Table.from_pandas(df, schema=dataset.schema)
         new_fn = filenames[0].replace(pathlib.Path(filenames[0]).stem, part[1])
-        pq.write_table(table=table, where=fs.open(new_fn, "wb"))
+        with fs.open(new_fn, "wb") as f:
+            pq.write_table(table=table, where=f)
 
         # Remove old files
         for fn in filenames:
             fs.rm(fn)
 
+    rebuild_fragment_index(fs=fs, path=path)
+
 
 def validate_data_catalog(catalog: DataCatalog, **kwargs):
     for cls in catalog.list_data_types():
         path = f"{catalog.path}/data/{cls}.parquet"
         _validate_dataset(catalog=catalog, path=path, **kwargs)
+
+
+_NANOS_PER_DAY = 86_400_000_000_000
+
+
+def compact_dataset(
+    catalog: DataCatalog,
+    path: str,
+    target_file_size="256mb",
+    row_group_size="64mb",
+    date_format: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Compact the dataset at `path` by merging small fragments within each
+    partition into `ts_init` sorted files of around `target_file_size`.
+
+    Fragments smaller than half the `target_file_size` are merged in time
+    order. If `date_format` is given then all fragments are rewritten and
+    additionally split into one or more files per date (i.e. "%Y%m%d").
+
+    The compacted files are written under hidden staging names (ignored by
+    dataset discovery), so readers never see them while they are being
+    written. Under the datasets lock they are then moved into place, the
+    merged fragments are removed and finally the fragment index is rewritten
+    to the compacted fragments. The swap is not atomic, a reader holding the
+    previous index may find its fragments removed (and retries once against
+    the rewritten index).
+
+    The lock is only shared between processes when running on dask, so
+    outside of dask compaction requires a single writer process (no other
+    process writing to or compacting the dataset concurrently).
+
+    Parameters
+    ----------
+    catalog : DataCatalog
+        The catalog holding the dataset.
+    path : str
+        The dataset path.
+    target_file_size : str or int
+        The target size of each compacted file.
+    row_group_size : str or int
+        The target size of each row group within a compacted file.
+    date_format : str, optional
+        The date format (day resolution or coarser) to split files by.
+
+    Returns
+    -------
+    dict[str, int]
+        The number of fragments removed and added.
+
+    """
+    fs = catalog.fs
+    index = load_fragment_index(fs=fs, path=path)
+    if index is None:
+        index = build_fragment_index(fs=fs, path=path)
+
+    staged, removed = _compact_partitions(
+        fs=fs,
+        path=path,
+        index=index,
+        target_bytes=parse_bytes(target_file_size),
+        row_group_bytes=parse_bytes(row_group_size),
+        date_format=date_format,
+    )
+    if not removed:
+        return {"removed": 0, "added": 0}
+
+    _swap_compacted_fragments(fs=fs, path=path, staged=staged, removed=removed)
+
+    return {"removed": len(removed), "added": len(staged)}
+
+
+def compact_data_catalog(catalog: DataCatalog, **kwargs) -> Dict[str, Dict[str, int]]:
+    results = {}
+    for cls in catalog.list_data_types():
+        path = f"{catalog.path}/data/{cls}.parquet"
+        results[cls] = compact_dataset(catalog=catalog, path=path, **kwargs)
+    return results
+
+
+def _compact_partitions(
+    fs,
+    path: str,
+    index: Dict[str, Dict],
+    target_bytes: int,
+    row_group_bytes: int,
+    date_format: Optional[str],
+) -> Tuple[Dict[str, Tuple[str, Dict]], List[str]]:
+    # Write the compacted files of every partition under staging names. Returns
+    # the staged file and index entry by fragment key, and the replaced keys.
+    partitions: Dict[str, List[str]] = {}
+    for key in sorted(index, key=lambda k: (index[k].get("ts_init") or [0])[0]):
+        partitions.setdefault(key.rpartition("/")[0], []).append(key)
+
+    staged: Dict[str, Tuple[str, Dict]] = {}
+    removed: List[str] = []
+    for part_dir, keys in partitions.items():
+        if date_format is None:
+            keys = [k for k in keys if index[k]["size"] < target_bytes // 2]
+        for batch in _batch_fragments(keys=keys, index=index, target_bytes=target_bytes):
+            if date_format is None and len(batch) < 2:
+                continue  # Nothing to merge
+            staged.update(
+                _compact_fragments(
+                    fs=fs,
+                    path=path,
+                    part_dir=part_dir,
+                    keys=batch,
+                    index=index,
+                    target_bytes=target_bytes,
+                    row_group_bytes=row_group_bytes,
+                    date_format=date_format,
+                ),
+            )
+            removed.extend(batch)
+    return staged, removed
+
+
+def _swap_compacted_fragments(
+    fs,
+    path: str,
+    staged: Dict[str, Tuple[str, Dict]],
+    removed: List[str],
+):
+    # Move the staged files into place and remove the fragments they replace,
+    # then rewrite the index (keeping any fragments appended by other writers
+    # since it was loaded) so it only ever points at files in place
+    with named_lock(pathlib.Path(path).name):
+        for key, (fn, _) in staged.items():
+            fs.mv(fn, f"{path}/{key}")
+        for key in removed:
+            fs.rm(f"{path}/{key}")
+
+        current = load_fragment_index(fs=fs, path=path) or {}
+        for key in removed:
+            current.pop(key, None)
+        current.update({key: entry for key, (_, entry) in staged.items()})
+        write_fragment_index(fs=fs, path=path, index=current)
+
+
+def _batch_fragments(keys: List[str], index: Dict[str, Dict], target_bytes: int):
+    batch: List[str] = []
+    batch_bytes = 0
+    for key in keys:
+        batch.append(key)
+        batch_bytes += index[key]["size"]
+        if batch_bytes >= target_bytes:
+            yield batch
+            batch, batch_bytes = [], 0
+    if batch:
+        yield batch
+
+
+def _compact_fragments(
+    fs,
+    path: str,
+    part_dir: str,
+    keys: List[str],
+    index: Dict[str, Dict],
+    target_bytes: int,
+    row_group_bytes: int,
+    date_format: Optional[str],
+) -> Dict[str, Tuple[str, Dict]]:
+    table = ds.dataset([f"{path}/{key}" for key in keys], filesystem=fs).to_table()
+    if table.num_rows == 0:
+        return {}
+
+    # Size files and row groups from the compressed bytes per row of the inputs
+    bytes_per_row = max(1.0, sum(index[key]["size"] for key in keys) / table.num_rows)
+    rows_per_file = max(1, int(target_bytes / bytes_per_row))
+    rows_per_group = max(1, min(rows_per_file, int(row_group_bytes / bytes_per_row)))
+
+    bounds = [0, table.num_rows]
+    if "ts_init" in table.column_names:
+        ts_init = table.column("ts_init").to_numpy()
+        order = np.argsort(ts_init, kind="stable")
+        table = table.take(pa.array(order))
+        ts_init = ts_init[order]
+        if date_format is not None:
+            # Label each distinct day once, then split where the label changes
+            days, inverse = np.unique(ts_init // _NANOS_PER_DAY, return_inverse=True)
+            day_labels = pd.to_datetime(days * _NANOS_PER_DAY, unit="ns").strftime(date_format)
+            labels = np.asarray(day_labels)[inverse]
+            changes = np.flatnonzero(labels[1:] != labels[:-1]) + 1
+            bounds = [0, *changes.tolist(), table.num_rows]
+
+    directory = f"{path}/{part_dir}" if part_dir else path
+    staged: Dict[str, Tuple[str, Dict]] = {}
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        for offset in range(start, stop, rows_per_file):
+            chunk = table.slice(offset, min(rows_per_file, stop - offset))
+            name = _compacted_filename(table=chunk)
+            key = f"{part_dir}/{name}" if part_dir else name
+            # Hidden from dataset discovery until moved into place
+            fn = f"{directory}/.staging-{name}"
+            with fs.open(fn, "wb") as f:
+                pq.write_table(chunk, f, row_group_size=rows_per_group)
+            staged[key] = (fn, fragment_stats(fs=fs, fn=fn, key=key))
+    return staged
+
+
+def _compacted_filename(table: pa.Table) -> str:
+    if "ts_init" in table.column_names:
+        ts_init = table.column("ts_init")
+        template = _basename_template(first=ts_init[0].as_py(), last=ts_init[-1].as_py())
+        return template.format(i=0)
+    return f"{uuid.uuid4().hex}-0.parquet"
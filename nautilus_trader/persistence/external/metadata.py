@@ -13,14 +13,18 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from typing import Dict
+import uuid
+from typing import Dict, Iterable, List, Optional
 
 import fsspec
 import orjson
+import pyarrow.parquet as pq
 from fsspec.utils import infer_storage_options
 
 
 PARTITION_MAPPINGS_FN = "_partition_mappings.json"
+FRAGMENT_INDEX_FN = "_fragment_index.json"
+FRAGMENT_STATS_COLUMNS = ("ts_event", "ts_init")
 
 
 def load_mappings(fs, path) -> Dict:
@@ -35,6 +39,143 @@ def write_partition_column_mappings(fs, path, mappings) -> None:
         f.write(orjson.dumps(mappings))
 
 
+def load_fragment_index(fs, path) -> Optional[Dict[str, Dict]]:
+    """
+    Load the fragment index for the dataset at `path` (or ``None`` if not indexed).
+
+    The index maps each fragment (file path relative to the dataset root) to its
+    hive `partition` values, `num_rows`, `size` in bytes and the [min, max] of
+    each of the `FRAGMENT_STATS_COLUMNS` present.
+    """
+    if not fs.exists(f"{path}/{FRAGMENT_INDEX_FN}"):
+        return None
+    with fs.open(f"{path}/{FRAGMENT_INDEX_FN}", "rb") as f:
+        return orjson.loads(f.read())
+
+
+def write_fragment_index(fs, path, index: Dict[str, Dict]) -> None:
+    # Write to a temporary file then move into place, so a concurrent reader
+    # only ever loads a complete index (either the previous or this one)
+    tmp = f"{path}/{FRAGMENT_INDEX_FN}.{uuid.uuid4().hex}.tmp"
+    with fs.open(tmp, "wb") as f:
+        f.write(orjson.dumps(index))
+    fs.mv(tmp, f"{path}/{FRAGMENT_INDEX_FN}")
+
+
+def update_fragment_index(fs, path, fragments: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Add (or replace) the given `fragments` in the index for the dataset at `path`.
+
+    The index is also synchronized with a listing of the datasets files (see
+    `sync_fragment_index`), so an index always covers every fragment in the
+    dataset even if files were added or removed without updating it.
+    """
+    index = load_fragment_index(fs=fs, path=path) or {}
+    index.update(fragments)
+    index = sync_fragment_index(fs=fs, path=path, index=index)
+    write_fragment_index(fs=fs, path=path, index=index)
+    return index
+
+
+def sync_fragment_index(fs, path, index: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Return the given `index` synchronized with a listing of the dataset at
+    `path`, dropping the entries of removed files and indexing any files which
+    are not yet indexed.
+    """
+    files = list_fragments(fs=fs, path=path)
+    synced = {key: entry for key, entry in index.items() if key in files}
+    new_files = [fn for key, fn in files.items() if key not in index]
+    synced.update(index_fragments(fs=fs, path=path, files=new_files))
+    return synced
+
+
+def build_fragment_index(fs, path) -> Dict[str, Dict]:
+    """
+    Build the fragment index for all parquet files in the dataset at `path`.
+    """
+    return index_fragments(fs=fs, path=path, files=list_fragments(fs=fs, path=path).values())
+
+
+def list_fragments(fs, path) -> Dict[str, str]:
+    """
+    Return the parquet files in the dataset at `path` by fragment key (file
+    path relative to the dataset root).
+
+    As per dataset discovery, files and directories prefixed with "_" or "."
+    are ignored.
+    """
+    root = fs._strip_protocol(str(path)).rstrip("/")
+    fragments = {}
+    for fn in fs.find(root):
+        key = _fragment_key(root=root, fn=fn)
+        if key.endswith(".parquet") and not any(
+            part.startswith(("_", ".")) for part in key.split("/")
+        ):
+            fragments[key] = fn
+    return fragments
+
+
+def rebuild_fragment_index(fs, path) -> Dict[str, Dict]:
+    index = build_fragment_index(fs=fs, path=path)
+    write_fragment_index(fs=fs, path=path, index=index)
+    return index
+
+
+def index_fragments(fs, path, files: Iterable[str]) -> Dict[str, Dict]:
+    """
+    Return the index entries for the given fragment `files` of the dataset at
+    `path`, read from each files parquet footer (row group statistics).
+    """
+    root = fs._strip_protocol(str(path)).rstrip("/")
+    index = {}
+    for fn in files:
+        fn = fs._strip_protocol(fn)
+        key = _fragment_key(root=root, fn=fn)
+        index[key] = fragment_stats(fs=fs, fn=fn, key=key)
+    return index
+
+
+def _fragment_key(root: str, fn: str) -> str:
+    return fn[len(root) + 1 :] if fn.startswith(root + "/") else fn
+
+
+def fragment_stats(fs, fn: str, key: str) -> Dict:
+    entry: Dict = {
+        "partition": _parse_hive_partition(key),
+        "size": fs.size(fn),
+    }
+    with fs.open(fn, "rb") as f:
+        metadata = pq.ParquetFile(f).metadata
+    entry["num_rows"] = metadata.num_rows
+    names: List[str] = [metadata.schema.column(i).name for i in range(metadata.num_columns)]
+    for column in FRAGMENT_STATS_COLUMNS:
+        if column not in names:
+            continue
+        col_idx = names.index(column)
+        lows, highs = [], []
+        for rg in range(metadata.num_row_groups):
+            stats = metadata.row_group(rg).column(col_idx).statistics
+            if stats is None or not stats.has_min_max:
+                # Can't bound this fragment, so it will never be pruned on `column`
+                lows = highs = []
+                break
+            lows.append(stats.min)
+            highs.append(stats.max)
+        if lows:
+            entry[column] = [min(lows), max(highs)]
+    return entry
+
+
+def _parse_hive_partition(key: str) -> Dict[str, str]:
+    partition = {}
+    for part in key.split("/")[:-1]:
+        name, sep, value = part.partition("=")
+        if sep:
+            partition[name] = value
+    return partition
+
+
 def _glob_path_to_fs(glob_path):
     inferred = infer_storage_options(glob_path)
     inferred.pop("path", None)
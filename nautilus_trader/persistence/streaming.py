@@ -30,15 +30,44 @@ from nautilus_trader.model.orderbook.data import OrderBookSnapshot
 from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
 from nautilus_trader.serialization.arrow.serializer import get_cls_table
 from nautilus_trader.serialization.arrow.serializer import list_schemas
-from nautilus_trader.serialization.arrow.util import list_dicts_to_dict_lists
 
 
 class FeatherWriter:
     """
     Provides a stream writer of Nautilus objects into feather files.
+
+    Rows are collected in a column buffer per table, and written as a single
+    record batch once the buffer reaches `max_rows` rows or `max_bytes` bytes
+    (estimated from the batches already written for the table). All buffers
+    are written when `flush_interval` has elapsed on the clock of the written
+    objects (their `ts_init`), so backtests flush on simulated time.
+
+    Parameters
+    ----------
+    path : str
+        The directory path for the feather files.
+    fs_protocol : str, default "file"
+        The fsspec filesystem protocol.
+    flush_interval : int or timedelta, optional
+        The interval (milliseconds if an int) between flushes of all buffers,
+        defaults to 1 second.
+    replace : bool, default False
+        If existing files at the path should be replaced.
+    max_rows : int, default 10_000
+        The maximum number of rows to buffer for a table before writing.
+    max_bytes : int, default 10_000_000
+        The maximum number of bytes to buffer for a table before writing.
     """
 
-    def __init__(self, path: str, fs_protocol: str = "file", flush_interval=None, replace=False):
+    def __init__(
+        self,
+        path: str,
+        fs_protocol: str = "file",
+        flush_interval=None,
+        replace=False,
+        max_rows: int = 10_000,
+        max_bytes: int = 10_000_000,
+    ):
         self.fs: fsspec.AbstractFileSystem = fsspec.filesystem(fs_protocol)
         self.path = str(self._check_path(path))
         if self.fs.exists(self.path) and replace:
@@ -54,11 +83,21 @@ class FeatherWriter:
                 OrderBookSnapshot: self._schemas[OrderBookData],
             }
         )
-        self._files: Dict[type, BinaryIO] = {}
-        self._writers: Dict[type, RecordBatchStreamWriter] = {}
+        self._files: Dict[str, BinaryIO] = {}
+        self._writers: Dict[str, RecordBatchStreamWriter] = {}
+        self._table_schemas: Dict[str, pa.Schema] = {}
+        self._buffers: Dict[str, Dict[str, list]] = {}
+        self._buffer_rows: Dict[str, int] = {}
+        self._row_bytes: Dict[str, float] = {}
         self._create_writers()
+        if isinstance(flush_interval, int):
+            flush_interval = datetime.timedelta(milliseconds=flush_interval)
         self.flush_interval = flush_interval or datetime.timedelta(milliseconds=1000)
-        self._last_flush = datetime.datetime(1970, 1, 1)
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self._flush_interval_ns = int(self.flush_interval.total_seconds() * 1_000_000_000)
+        self._last_flush_ns = 0
+        self._closed = False
 
     def _check_path(self, p):
         path = pathlib.Path(p)
@@ -77,8 +116,12 @@ class FeatherWriter:
             schema = self._schemas[cls]
             full_path = f"{self.path}/{prefix}{table_name}.feather"
             f = self.fs.open(str(full_path), "wb")
-            self._files[cls] = f
+            self._files[table_name] = f
             self._writers[table_name] = pa.ipc.new_stream(f, schema)
+            self._table_schemas[table_name] = schema
+            self._buffers[table_name] = {name: [] for name in schema.names}
+            self._buffer_rows[table_name] = 0
+            self._row_bytes[table_name] = 0.0
 
     def write(self, obj: object):
         assert obj is not None
@@ -89,33 +132,60 @@ class FeatherWriter:
         if table not in self._writers:
             print(f"Can't find writer for cls: {cls}")
             return
-        writer = self._writers[table]
         serialized = ParquetSerializer.serialize(obj)
         if isinstance(serialized, dict):
             serialized = [serialized]
-        data = list_dicts_to_dict_lists(
-            serialized,
-            keys=self._schemas[cls].names,
-        )
-        data = list(data.values())
-        batch = pa.record_batch(data, schema=self._schemas[cls])
-        writer.write_batch(batch)
-        self.check_flush()
-
-    def check_flush(self):
-        now = datetime.datetime.now()
-        if now - self._last_flush > self.flush_interval:
+        columns = self._buffers[table]
+        for row in serialized:
+            for name, values in columns.items():
+                values.append(row.get(name))
+        self._buffer_rows[table] += len(serialized)
+        rows = self._buffer_rows[table]
+        if rows >= self.max_rows or rows * self._row_bytes[table] >= self.max_bytes:
+            self._write_buffer(table)
+        self.check_flush(obj.ts_init)
+
+    def _write_buffer(self, table: str):
+        rows = self._buffer_rows[table]
+        if rows == 0:
+            return
+        columns = self._buffers[table]
+        batch = pa.record_batch(list(columns.values()), schema=self._table_schemas[table])
+        self._writers[table].write_batch(batch)
+        self._row_bytes[table] = batch.nbytes / rows
+        for values in columns.values():
+            values.clear()
+        self._buffer_rows[table] = 0
+
+    def check_flush(self, ts_ns: int):
+        """
+        Flush all buffers if the flush interval has elapsed at the given time.
+
+        Parameters
+        ----------
+        ts_ns : int
+            The current UNIX time (nanoseconds), on the clock of the written objects.
+
+        """
+        if ts_ns - self._last_flush_ns >= self._flush_interval_ns:
             self.flush()
-            self._last_flush = now
+            self._last_flush_ns = ts_ns
 
     def flush(self):
-        for cls in self._files:
-            self._files[cls].flush()
+        for table in self._writers:
+            self._write_buffer(table)
+        for f in self._files.values():
+            f.flush()
 
     def close(self):
+        if self._closed:
+            return
         self.flush()
-        for cls in self._writers:
-            self._writers[cls].close()
+        for writer in self._writers.values():
+            writer.close()
+        for f in self._files.values():
+            f.close()
+        self._closed = True
 
 
 def read_feather(path: str, fs: fsspec.AbstractFileSystem = None):
@@ -0,0 +1,31 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pydantic
+
+
+class PortfolioConfig(pydantic.BaseModel):
+    """
+    Configuration for ``Portfolio`` instances.
+
+    Parameters
+    ----------
+    incremental_accounting : bool
+        If unrealized PnL should be re-marked on each quote from per-instrument
+        running position aggregates (maintained on position events), rather
+        than being recalculated over all open positions on the next query.
+    """
+
+    incremental_accounting: bool = False
@@ -44,6 +44,8 @@ cdef class Portfolio(PortfolioFacade):
     cdef dict _unrealized_pnls
     cdef dict _net_positions
     cdef set _pending_calcs
+    cdef dict _exposures
+    cdef bint _incremental
 
 # -- COMMANDS --------------------------------------------------------------------------------------
 
@@ -59,6 +61,8 @@ cdef class Portfolio(PortfolioFacade):
 
     cdef object _net_position(self, InstrumentId instrument_id)
     cdef void _update_net_position(self, InstrumentId instrument_id, list positions_open) except *
+    cdef void _update_exposure(self, InstrumentId instrument_id, list positions_open) except *
+    cdef void _mark_unrealized_pnl(self, QuoteTick tick) except *
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id)
     cdef object _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side)
     cdef Price _get_last_price(self, Position position)
@@ -25,6 +25,9 @@ total risk exposures and total net positions.
 """
 
 from decimal import Decimal
+from typing import Optional
+
+from nautilus_trader.portfolio.config import PortfolioConfig
 
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.accounting.factory cimport AccountFactory
@@ -87,6 +90,13 @@ cdef class Portfolio(PortfolioFacade):
         The clock for the portfolio.
     logger : Logger
         The logger for the portfolio.
+    config : PortfolioConfig, optional
+        The portfolio configuration.
+
+    Raises
+    ------
+    TypeError
+        If `config` is not of type `PortfolioConfig`.
     """
 
     def __init__(
@@ -95,7 +105,12 @@ cdef class Portfolio(PortfolioFacade):
         CacheFacade cache not None,
         Clock clock not None,
         Logger logger=None,
+        config: Optional[PortfolioConfig]=None,
     ):
+        if config is None:
+            config = PortfolioConfig()
+        Condition.type(config, PortfolioConfig, "config")
+
         self._clock = clock
         self._uuid_factory = UUIDFactory()
         self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
@@ -110,6 +125,9 @@ cdef class Portfolio(PortfolioFacade):
         self._unrealized_pnls = {}   # type: dict[InstrumentId, Money]
         self._net_positions = {}     # type: dict[InstrumentId, Decimal]
         self._pending_calcs = set()  # type: set[InstrumentId]
+        self._exposures = {}         # type: dict[InstrumentId, tuple]
+
+        self._incremental = config.incremental_accounting
 
         # Register endpoints
         self._msgbus.register(endpoint="Portfolio.update_account", handler=self.update_account)
@@ -189,6 +207,7 @@ cdef class Portfolio(PortfolioFacade):
         """
         # Clean slate
         self._unrealized_pnls.clear()
+        self._exposures.clear()
 
         cdef list all_positions_open = self._cache.positions_open()
 
@@ -208,6 +227,12 @@ cdef class Portfolio(PortfolioFacade):
                 positions_open=positions_open,
             )
 
+            if self._incremental:
+                self._update_exposure(
+                    instrument_id=instrument_id,
+                    positions_open=positions_open,
+                )
+
             self._unrealized_pnls[instrument_id] = self._calculate_unrealized_pnl(instrument_id)
 
             account = self._cache.account_for_venue(instrument_id.venue)
@@ -255,8 +280,9 @@ cdef class Portfolio(PortfolioFacade):
         """
         Update the portfolio with the given tick.
 
-        Clears the unrealized PnL for the quote ticks instrument, and
-        performs any initialization calculations which may have been pending
+        Clears the unrealized PnL for the quote ticks instrument (or re-marks
+        it from the running position aggregates when incremental accounting is
+        enabled), and performs any initialization calculations which may have been pending
         a market quote update.
 
         Parameters
@@ -267,7 +293,10 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(tick, "tick")
 
-        self._unrealized_pnls.pop(tick.instrument_id, None)
+        if self._incremental:
+            self._mark_unrealized_pnl(tick)
+        else:
+            self._unrealized_pnls.pop(tick.instrument_id, None)
 
         if self.initialized:
             return
@@ -455,6 +484,12 @@ cdef class Portfolio(PortfolioFacade):
             positions_open=positions_open
         )
 
+        if self._incremental:
+            self._update_exposure(
+                instrument_id=event.instrument_id,
+                positions_open=positions_open,
+            )
+
         self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
             instrument_id=event.instrument_id,
         )
@@ -507,6 +542,7 @@ cdef class Portfolio(PortfolioFacade):
         self._net_positions.clear()
         self._unrealized_pnls.clear()
         self._pending_calcs.clear()
+        self._exposures.clear()
         self.initialized = False
 
         self._log.info("Reset.")
@@ -951,6 +987,117 @@ cdef class Portfolio(PortfolioFacade):
         cdef str net_position_str = f"{net_position:,}".replace(",", "_")
         self._log.info(f"{instrument_id} net_position={net_position_str}")
 
+    cdef void _update_exposure(self, InstrumentId instrument_id, list positions_open) except *:
+        # Rebuild the running position aggregates for the instrument, the
+        # open cost is held as sum(qty * avg_px_open) for standard instruments
+        # and sum(qty / avg_px_open) for inverse instruments.
+        cdef Account account = self._cache.account_for_venue(instrument_id.venue)
+        cdef Instrument instrument = self._cache.instrument(instrument_id)
+        if account is None or instrument is None or not positions_open:
+            self._exposures.pop(instrument_id, None)
+            return  # Nothing to aggregate (PnL falls back to full calculation)
+
+        cdef double long_qty = 0.0
+        cdef double long_cost = 0.0
+        cdef double short_qty = 0.0
+        cdef double short_cost = 0.0
+        cdef double qty
+        cdef double avg_px_open
+
+        cdef Position position
+        for position in positions_open:
+            if position.side == PositionSide.FLAT:
+                continue
+            qty = position.quantity.as_double()
+            avg_px_open = float(position.avg_px_open)
+            if position.side == PositionSide.LONG:
+                long_qty += qty
+                long_cost += qty / avg_px_open if instrument.is_inverse else qty * avg_px_open
+            else:
+                short_qty += qty
+                short_cost += qty / avg_px_open if instrument.is_inverse else qty * avg_px_open
+
+        self._exposures[instrument_id] = (
+            long_qty,
+            long_cost,
+            short_qty,
+            short_cost,
+            instrument.multiplier.as_double(),
+            instrument.is_inverse,
+            instrument.get_cost_currency(),
+            account.base_currency,
+        )
+
+    cdef void _mark_unrealized_pnl(self, QuoteTick tick) except *:
+        cdef tuple exposure = self._exposures.get(tick.instrument_id)
+        if exposure is None:
+            self._unrealized_pnls.pop(tick.instrument_id, None)
+            return  # No running aggregates (PnL recalculated on next query)
+
+        cdef double long_qty
+        cdef double long_cost
+        cdef double short_qty
+        cdef double short_cost
+        cdef double multiplier
+        cdef bint is_inverse
+        cdef Currency cost_currency
+        cdef Currency base_currency
+        (
+            long_qty,
+            long_cost,
+            short_qty,
+            short_cost,
+            multiplier,
+            is_inverse,
+            cost_currency,
+            base_currency,
+        ) = exposure
+
+        cdef double bid = tick.bid.as_double()
+        cdef double ask = tick.ask.as_double()
+        cdef double long_pnl = 0.0
+        cdef double short_pnl = 0.0
+        if long_qty > 0.0:
+            if is_inverse:
+                long_pnl = multiplier * (long_cost - long_qty / bid)
+            else:
+                long_pnl = multiplier * (long_qty * bid - long_cost)
+        if short_qty > 0.0:
+            if is_inverse:
+                short_pnl = multiplier * (short_qty / ask - short_cost)
+            else:
+                short_pnl = multiplier * (short_cost - short_qty * ask)
+
+        if base_currency is None:
+            self._unrealized_pnls[tick.instrument_id] = Money(long_pnl + short_pnl, cost_currency)
+            return
+
+        cdef double xrate_long = 1.0
+        cdef double xrate_short = 1.0
+        if long_qty > 0.0:
+            xrate_long = float(self._cache.get_xrate(
+                venue=tick.instrument_id.venue,
+                from_currency=cost_currency,
+                to_currency=base_currency,
+                price_type=PriceType.BID,
+            ))
+        if short_qty > 0.0:
+            xrate_short = float(self._cache.get_xrate(
+                venue=tick.instrument_id.venue,
+                from_currency=cost_currency,
+                to_currency=base_currency,
+                price_type=PriceType.ASK,
+            ))
+
+        if xrate_long == 0.0 or xrate_short == 0.0:
+            self._unrealized_pnls.pop(tick.instrument_id, None)
+            return  # Insufficient data (PnL recalculated on next query)
+
+        self._unrealized_pnls[tick.instrument_id] = Money(
+            long_pnl * xrate_long + short_pnl * xrate_short,
+            base_currency,
+        )
+
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id):
         cdef Account account = self._cache.account_for_venue(instrument_id.venue)
         if account is None:
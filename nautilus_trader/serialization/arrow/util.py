@@ -76,22 +76,33 @@ def check_partition_columns(
 
     mappings = {}
     for col in partition_columns or []:
-        values = list(map(str, df[col].unique()))
-        invalid_values = {val for val in values if any(x in val for x in INVALID_WINDOWS_CHARS)}
-        if invalid_values:
-            if col == "instrument_id":
-                # We have control over how instrument_ids are retrieved from the cache, so we can do this replacement
-                val_map = {k: clean_key(k) for k in values}
-                mappings[col] = val_map
-            else:
-                # We would be arbitrarily replacing values here which could break queries, we should not do this.
-                raise ValueError(
-                    f"Some values in partition column [{col}] contain invalid characters: {invalid_values}"
-                )
+        val_map = check_partition_values(column=col, values=list(map(str, df[col].unique())))
+        if val_map:
+            mappings[col] = val_map
 
     return mappings
 
 
+def check_partition_values(column: str, values: List[str]) -> Optional[Dict[str, str]]:
+    """
+    Check the unique `values` of a single partition column.
+
+    Returns a mapping of {illegal: legal} for all `values` if any contain illegal
+    characters (only possible for `instrument_id`), otherwise ``None``.
+    """
+    invalid_values = {val for val in values if any(x in val for x in INVALID_WINDOWS_CHARS)}
+    if not invalid_values:
+        return None
+    if column == "instrument_id":
+        # We have control over how instrument_ids are retrieved from the cache, so we can do this replacement
+        return {k: clean_key(k) for k in values}
+    else:
+        # We would be arbitrarily replacing values here which could break queries, we should not do this.
+        raise ValueError(
+            f"Some values in partition column [{column}] contain invalid characters: {invalid_values}"
+        )
+
+
 def clean_partition_cols(df, mappings: Dict[str, Dict[str, str]]):
     """
     Clean partition columns.
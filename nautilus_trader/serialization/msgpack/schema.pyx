@@ -0,0 +1,884 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from decimal import Decimal
+
+import msgpack
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.uuid cimport UUID4
+from nautilus_trader.model.c_enums.account_type cimport AccountType
+from nautilus_trader.model.c_enums.contingency_type cimport ContingencyType
+from nautilus_trader.model.c_enums.liquidity_side cimport LiquiditySide
+from nautilus_trader.model.c_enums.order_side cimport OrderSide
+from nautilus_trader.model.c_enums.order_type cimport OrderType
+from nautilus_trader.model.c_enums.position_side cimport PositionSide
+from nautilus_trader.model.c_enums.time_in_force cimport TimeInForce
+from nautilus_trader.model.commands.trading cimport CancelAllOrders
+from nautilus_trader.model.commands.trading cimport CancelOrder
+from nautilus_trader.model.commands.trading cimport ModifyOrder
+from nautilus_trader.model.commands.trading cimport SubmitOrder
+from nautilus_trader.model.commands.trading cimport SubmitOrderList
+from nautilus_trader.model.currency cimport Currency
+from nautilus_trader.model.events.account cimport AccountState
+from nautilus_trader.model.events.order cimport OrderAccepted
+from nautilus_trader.model.events.order cimport OrderCanceled
+from nautilus_trader.model.events.order cimport OrderCancelRejected
+from nautilus_trader.model.events.order cimport OrderDenied
+from nautilus_trader.model.events.order cimport OrderEvent
+from nautilus_trader.model.events.order cimport OrderExpired
+from nautilus_trader.model.events.order cimport OrderFilled
+from nautilus_trader.model.events.order cimport OrderInitialized
+from nautilus_trader.model.events.order cimport OrderModifyRejected
+from nautilus_trader.model.events.order cimport OrderPendingCancel
+from nautilus_trader.model.events.order cimport OrderPendingUpdate
+from nautilus_trader.model.events.order cimport OrderRejected
+from nautilus_trader.model.events.order cimport OrderSubmitted
+from nautilus_trader.model.events.order cimport OrderTriggered
+from nautilus_trader.model.events.order cimport OrderUpdated
+from nautilus_trader.model.events.position cimport PositionChanged
+from nautilus_trader.model.events.position cimport PositionClosed
+from nautilus_trader.model.events.position cimport PositionEvent
+from nautilus_trader.model.events.position cimport PositionOpened
+from nautilus_trader.model.identifiers cimport AccountId
+from nautilus_trader.model.identifiers cimport ClientOrderId
+from nautilus_trader.model.identifiers cimport ExecutionId
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport OrderListId
+from nautilus_trader.model.identifiers cimport PositionId
+from nautilus_trader.model.identifiers cimport StrategyId
+from nautilus_trader.model.identifiers cimport TraderId
+from nautilus_trader.model.identifiers cimport VenueOrderId
+from nautilus_trader.model.objects cimport AccountBalance
+from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.orders.list cimport OrderList
+from nautilus_trader.model.orders.unpacker cimport OrderUnpacker
+from nautilus_trader.serialization.msgpack.serializer cimport MsgPackSerializer
+
+
+# The version of the wire layouts below. Every payload starts with
+# [SCHEMA_VERSION, type tag], the remaining fields follow in the fixed order
+# of the layout for the tag. Any change to a layout must bump the version.
+SCHEMA_VERSION = 1
+
+cdef int _SCHEMA_VERSION = SCHEMA_VERSION
+
+
+# Type tags are part of the wire format and must never be reused
+cdef int _ORDER_INITIALIZED = 1
+cdef int _ORDER_DENIED = 2
+cdef int _ORDER_SUBMITTED = 3
+cdef int _ORDER_ACCEPTED = 4
+cdef int _ORDER_REJECTED = 5
+cdef int _ORDER_CANCELED = 6
+cdef int _ORDER_EXPIRED = 7
+cdef int _ORDER_TRIGGERED = 8
+cdef int _ORDER_PENDING_UPDATE = 9
+cdef int _ORDER_PENDING_CANCEL = 10
+cdef int _ORDER_MODIFY_REJECTED = 11
+cdef int _ORDER_CANCEL_REJECTED = 12
+cdef int _ORDER_UPDATED = 13
+cdef int _ORDER_FILLED = 14
+cdef int _POSITION_OPENED = 20
+cdef int _POSITION_CHANGED = 21
+cdef int _POSITION_CLOSED = 22
+cdef int _ACCOUNT_STATE = 30
+cdef int _SUBMIT_ORDER = 40
+cdef int _SUBMIT_ORDER_LIST = 41
+cdef int _MODIFY_ORDER = 42
+cdef int _CANCEL_ORDER = 43
+cdef int _CANCEL_ALL_ORDERS = 44
+
+
+# Order event types sharing the venue event layouts below
+cdef dict _ORDER_VENUE_EVENT_TYPES = {
+    _ORDER_ACCEPTED: OrderAccepted,
+    _ORDER_CANCELED: OrderCanceled,
+    _ORDER_EXPIRED: OrderExpired,
+    _ORDER_TRIGGERED: OrderTriggered,
+    _ORDER_PENDING_UPDATE: OrderPendingUpdate,
+    _ORDER_PENDING_CANCEL: OrderPendingCancel,
+    _ORDER_MODIFY_REJECTED: OrderModifyRejected,
+    _ORDER_CANCEL_REJECTED: OrderCancelRejected,
+}
+
+
+# -- ORDER EVENTS ---------------------------------------------------------------------------------
+
+cdef list _pack_order_initialized(OrderInitialized event, int tag):
+    cdef ClientOrderId o
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        event.trader_id.value,
+        event.strategy_id.value,
+        event.instrument_id.value,
+        event.client_order_id.value,
+        <int>event.side,
+        <int>event.type,
+        event.quantity.raw,
+        event.quantity.precision,
+        <int>event.time_in_force,
+        event.reduce_only,
+        event.options,
+        event.order_list_id.value if event.order_list_id is not None else None,
+        event.parent_order_id.value if event.parent_order_id is not None else None,
+        [o.value for o in event.child_order_ids] if event.child_order_ids is not None else None,
+        <int>event.contingency,
+        [o.value for o in event.contingency_ids] if event.contingency_ids is not None else None,
+        event.tags,
+        event.id.value,
+        event.ts_init,
+    ]
+
+
+cdef OrderInitialized _unpack_order_initialized(list v):
+    cdef str order_list_id = v[13]
+    cdef str parent_order_id = v[14]
+    cdef list child_order_ids = v[15]
+    cdef list contingency_ids = v[17]
+    cdef str o
+    return OrderInitialized(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        instrument_id=InstrumentId.from_str_c(v[4]),
+        client_order_id=ClientOrderId(v[5]),
+        order_side=<OrderSide>v[6],
+        order_type=<OrderType>v[7],
+        quantity=Quantity.from_raw_c(v[8], v[9]),
+        time_in_force=<TimeInForce>v[10],
+        reduce_only=v[11],
+        options=v[12],
+        order_list_id=OrderListId(order_list_id) if order_list_id is not None else None,
+        parent_order_id=ClientOrderId(parent_order_id) if parent_order_id is not None else None,
+        child_order_ids=[ClientOrderId(o) for o in child_order_ids] if child_order_ids is not None else None,
+        contingency=<ContingencyType>v[16],
+        contingency_ids=[ClientOrderId(o) for o in contingency_ids] if contingency_ids is not None else None,
+        tags=v[18],
+        event_id=UUID4(v[19]),
+        ts_init=v[20],
+    )
+
+
+cdef list _pack_order_denied(OrderDenied event, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        event.trader_id.value,
+        event.strategy_id.value,
+        event.instrument_id.value,
+        event.client_order_id.value,
+        event.reason,
+        event.id.value,
+        event.ts_init,
+    ]
+
+
+cdef OrderDenied _unpack_order_denied(list v):
+    return OrderDenied(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        instrument_id=InstrumentId.from_str_c(v[4]),
+        client_order_id=ClientOrderId(v[5]),
+        reason=v[6],
+        event_id=UUID4(v[7]),
+        ts_init=v[8],
+    )
+
+
+cdef list _pack_order_submitted(OrderSubmitted event, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        event.trader_id.value,
+        event.strategy_id.value,
+        event.account_id.value,
+        event.instrument_id.value,
+        event.client_order_id.value,
+        event.id.value,
+        event.ts_event,
+        event.ts_init,
+    ]
+
+
+cdef OrderSubmitted _unpack_order_submitted(list v):
+    return OrderSubmitted(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        account_id=AccountId.from_str_c(v[4]),
+        instrument_id=InstrumentId.from_str_c(v[5]),
+        client_order_id=ClientOrderId(v[6]),
+        event_id=UUID4(v[7]),
+        ts_event=v[8],
+        ts_init=v[9],
+    )
+
+
+cdef list _pack_order_rejected(OrderRejected event, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        event.trader_id.value,
+        event.strategy_id.value,
+        event.account_id.value,
+        event.instrument_id.value,
+        event.client_order_id.value,
+        event.reason,
+        event.id.value,
+        event.ts_event,
+        event.ts_init,
+    ]
+
+
+cdef OrderRejected _unpack_order_rejected(list v):
+    return OrderRejected(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        account_id=AccountId.from_str_c(v[4]),
+        instrument_id=InstrumentId.from_str_c(v[5]),
+        client_order_id=ClientOrderId(v[6]),
+        reason=v[7],
+        event_id=UUID4(v[8]),
+        ts_event=v[9],
+        ts_init=v[10],
+    )
+
+
+# Layout shared by the order events which only carry the common venue fields:
+# OrderAccepted, OrderCanceled, OrderExpired, OrderTriggered,
+# OrderPendingUpdate and OrderPendingCancel.
+cdef list _pack_order_venue_event(OrderEvent event, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        event.trader_id.value,
+        event.strategy_id.value,
+        event.account_id.value,
+        event.instrument_id.value,
+        event.client_order_id.value,
+        event.venue_order_id.value,
+        event.id.value,
+        event.ts_event,
+        event.ts_init,
+    ]
+
+
+cdef OrderEvent _unpack_order_venue_event(list v):
+    cdef type event_type = _ORDER_VENUE_EVENT_TYPES[v[1]]
+    return event_type(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        account_id=AccountId.from_str_c(v[4]),
+        instrument_id=InstrumentId.from_str_c(v[5]),
+        client_order_id=ClientOrderId(v[6]),
+        venue_order_id=VenueOrderId(v[7]),
+        event_id=UUID4(v[8]),
+        ts_event=v[9],
+        ts_init=v[10],
+    )
+
+
+# Layout shared by OrderModifyRejected and OrderCancelRejected
+cdef list _pack_order_venue_rejected(event, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        event.trader_id.value,
+        event.strategy_id.value,
+        event.account_id.value,
+        event.instrument_id.value,
+        event.client_order_id.value,
+        event.venue_order_id.value,
+        event.reason,
+        event.id.value,
+        event.ts_event,
+        event.ts_init,
+    ]
+
+
+cdef OrderEvent _unpack_order_venue_rejected(list v):
+    cdef type event_type = _ORDER_VENUE_EVENT_TYPES[v[1]]
+    return event_type(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        account_id=AccountId.from_str_c(v[4]),
+        instrument_id=InstrumentId.from_str_c(v[5]),
+        client_order_id=ClientOrderId(v[6]),
+        venue_order_id=VenueOrderId(v[7]),
+        reason=v[8],
+        event_id=UUID4(v[9]),
+        ts_event=v[10],
+        ts_init=v[11],
+    )
+
+
+cdef list _pack_order_updated(OrderUpdated event, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        event.trader_id.value,
+        event.strategy_id.value,
+        event.account_id.value,
+        event.instrument_id.value,
+        event.client_order_id.value,
+        event.venue_order_id.value,
+        event.quantity.raw,
+        event.quantity.precision,
+        event.price.raw if event.price is not None else None,
+        event.price.precision if event.price is not None else None,
+        event.trigger.raw if event.trigger is not None else None,
+        event.trigger.precision if event.trigger is not None else None,
+        event.id.value,
+        event.ts_event,
+        event.ts_init,
+    ]
+
+
+cdef OrderUpdated _unpack_order_updated(list v):
+    return OrderUpdated(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        account_id=AccountId.from_str_c(v[4]),
+        instrument_id=InstrumentId.from_str_c(v[5]),
+        client_order_id=ClientOrderId(v[6]),
+        venue_order_id=VenueOrderId(v[7]),
+        quantity=Quantity.from_raw_c(v[8], v[9]),
+        price=Price.from_raw_c(v[10], v[11]) if v[10] is not None else None,
+        trigger=Price.from_raw_c(v[12], v[13]) if v[12] is not None else None,
+        event_id=UUID4(v[14]),
+        ts_event=v[15],
+        ts_init=v[16],
+    )
+
+
+cdef list _pack_order_filled(OrderFilled event, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        event.trader_id.value,
+        event.strategy_id.value,
+        event.account_id.value,
+        event.instrument_id.value,
+        event.client_order_id.value,
+        event.venue_order_id.value,
+        event.execution_id.value,
+        event.position_id.value if event.position_id is not None else None,
+        <int>event.order_side,
+        <int>event.order_type,
+        event.last_qty.raw,
+        event.last_qty.precision,
+        event.last_px.raw,
+        event.last_px.precision,
+        event.currency.code,
+        event.commission.raw,
+        event.commission.currency.code,
+        <int>event.liquidity_side,
+        event.id.value,
+        event.ts_event,
+        event.ts_init,
+        event.info,
+    ]
+
+
+cdef OrderFilled _unpack_order_filled(list v):
+    cdef str position_id = v[9]
+    return OrderFilled(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        account_id=AccountId.from_str_c(v[4]),
+        instrument_id=InstrumentId.from_str_c(v[5]),
+        client_order_id=ClientOrderId(v[6]),
+        venue_order_id=VenueOrderId(v[7]),
+        execution_id=ExecutionId(v[8]),
+        position_id=PositionId(position_id) if position_id is not None else None,
+        order_side=<OrderSide>v[10],
+        order_type=<OrderType>v[11],
+        last_qty=Quantity.from_raw_c(v[12], v[13]),
+        last_px=Price.from_raw_c(v[14], v[15]),
+        currency=Currency.from_str_c(v[16]),
+        commission=Money.from_raw_c(v[17], Currency.from_str_c(v[18])),
+        liquidity_side=<LiquiditySide>v[19],
+        event_id=UUID4(v[20]),
+        ts_event=v[21],
+        ts_init=v[22],
+        info=v[23],
+    )
+
+
+# -- POSITION EVENTS ------------------------------------------------------------------------------
+
+# Layout shared by all position events, fields which a particular event does
+# not carry are still written in their slot so the ordering stays fixed.
+cdef list _pack_position_event(PositionEvent event, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        event.trader_id.value,
+        event.strategy_id.value,
+        event.instrument_id.value,
+        event.position_id.value,
+        event.account_id.value,
+        event.from_order.value,
+        <int>event.entry,
+        <int>event.side,
+        str(event.net_qty),
+        event.quantity.raw,
+        event.quantity.precision,
+        event.peak_qty.raw,
+        event.peak_qty.precision,
+        event.last_qty.raw,
+        event.last_qty.precision,
+        event.last_px.raw,
+        event.last_px.precision,
+        event.currency.code,
+        str(event.avg_px_open),
+        str(event.avg_px_close) if event.avg_px_close is not None else None,
+        str(event.realized_points),
+        str(event.realized_return),
+        event.realized_pnl.raw,
+        event.realized_pnl.currency.code,
+        event.unrealized_pnl.raw,
+        event.unrealized_pnl.currency.code,
+        event.id.value,
+        event.ts_opened,
+        event.ts_closed,
+        event.duration_ns,
+        event.ts_event,
+        event.ts_init,
+    ]
+
+
+cdef PositionOpened _unpack_position_opened(list v):
+    return PositionOpened(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        instrument_id=InstrumentId.from_str_c(v[4]),
+        position_id=PositionId(v[5]),
+        account_id=AccountId.from_str_c(v[6]),
+        from_order=ClientOrderId(v[7]),
+        entry=<OrderSide>v[8],
+        side=<PositionSide>v[9],
+        net_qty=Decimal(v[10]),
+        quantity=Quantity.from_raw_c(v[11], v[12]),
+        peak_qty=Quantity.from_raw_c(v[13], v[14]),
+        last_qty=Quantity.from_raw_c(v[15], v[16]),
+        last_px=Price.from_raw_c(v[17], v[18]),
+        currency=Currency.from_str_c(v[19]),
+        avg_px_open=Decimal(v[20]),
+        realized_pnl=Money.from_raw_c(v[24], Currency.from_str_c(v[25])),
+        event_id=UUID4(v[28]),
+        ts_event=v[32],
+        ts_init=v[33],
+    )
+
+
+cdef PositionChanged _unpack_position_changed(list v):
+    cdef str avg_px_close = v[21]
+    return PositionChanged(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        instrument_id=InstrumentId.from_str_c(v[4]),
+        position_id=PositionId(v[5]),
+        account_id=AccountId.from_str_c(v[6]),
+        from_order=ClientOrderId(v[7]),
+        entry=<OrderSide>v[8],
+        side=<PositionSide>v[9],
+        net_qty=Decimal(v[10]),
+        quantity=Quantity.from_raw_c(v[11], v[12]),
+        peak_qty=Quantity.from_raw_c(v[13], v[14]),
+        last_qty=Quantity.from_raw_c(v[15], v[16]),
+        last_px=Price.from_raw_c(v[17], v[18]),
+        currency=Currency.from_str_c(v[19]),
+        avg_px_open=Decimal(v[20]),
+        avg_px_close=Decimal(avg_px_close) if avg_px_close is not None else None,
+        realized_points=Decimal(v[22]),
+        realized_return=Decimal(v[23]),
+        realized_pnl=Money.from_raw_c(v[24], Currency.from_str_c(v[25])),
+        unrealized_pnl=Money.from_raw_c(v[26], Currency.from_str_c(v[27])),
+        event_id=UUID4(v[28]),
+        ts_opened=v[29],
+        ts_event=v[32],
+        ts_init=v[33],
+    )
+
+
+cdef PositionClosed _unpack_position_closed(list v):
+    return PositionClosed(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        instrument_id=InstrumentId.from_str_c(v[4]),
+        position_id=PositionId(v[5]),
+        account_id=AccountId.from_str_c(v[6]),
+        from_order=ClientOrderId(v[7]),
+        entry=<OrderSide>v[8],
+        side=<PositionSide>v[9],
+        net_qty=Decimal(v[10]),
+        quantity=Quantity.from_raw_c(v[11], v[12]),
+        peak_qty=Quantity.from_raw_c(v[13], v[14]),
+        last_qty=Quantity.from_raw_c(v[15], v[16]),
+        last_px=Price.from_raw_c(v[17], v[18]),
+        currency=Currency.from_str_c(v[19]),
+        avg_px_open=Decimal(v[20]),
+        avg_px_close=Decimal(v[21]),
+        realized_points=Decimal(v[22]),
+        realized_return=Decimal(v[23]),
+        realized_pnl=Money.from_raw_c(v[24], Currency.from_str_c(v[25])),
+        event_id=UUID4(v[28]),
+        ts_opened=v[29],
+        ts_closed=v[30],
+        duration_ns=v[31],
+        ts_init=v[33],
+    )
+
+
+# -- ACCOUNT EVENTS -------------------------------------------------------------------------------
+
+cdef list _pack_account_state(AccountState event, int tag):
+    cdef AccountBalance b
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        event.account_id.value,
+        <int>event.account_type,
+        event.base_currency.code if event.base_currency is not None else None,
+        event.is_reported,
+        [[b.currency.code, b.total.raw, b.locked.raw, b.free.raw] for b in event.balances],
+        event.info,
+        event.id.value,
+        event.ts_event,
+        event.ts_init,
+    ]
+
+
+cdef AccountState _unpack_account_state(list v):
+    cdef str base_currency = v[4]
+    cdef list balances = []
+    cdef list b
+    cdef Currency currency
+    for b in v[6]:
+        currency = Currency.from_str_c(b[0])
+        balances.append(
+            AccountBalance(
+                currency=currency,
+                total=Money.from_raw_c(b[1], currency),
+                locked=Money.from_raw_c(b[2], currency),
+                free=Money.from_raw_c(b[3], currency),
+            )
+        )
+    return AccountState(
+        account_id=AccountId.from_str_c(v[2]),
+        account_type=<AccountType>v[3],
+        base_currency=Currency.from_str_c(base_currency) if base_currency is not None else None,
+        reported=v[5],
+        balances=balances,
+        info=v[7],
+        event_id=UUID4(v[8]),
+        ts_event=v[9],
+        ts_init=v[10],
+    )
+
+
+# -- COMMANDS -------------------------------------------------------------------------------------
+
+cdef list _pack_submit_order(SubmitOrder command, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        command.trader_id.value,
+        command.strategy_id.value,
+        command.position_id.value if command.position_id is not None else None,
+        _pack_order_initialized(command.order.init_event_c(), _ORDER_INITIALIZED),
+        command.id.value,
+        command.ts_init,
+    ]
+
+
+cdef SubmitOrder _unpack_submit_order(list v):
+    cdef str position_id = v[4]
+    return SubmitOrder(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        position_id=PositionId(position_id) if position_id is not None else None,
+        order=OrderUnpacker.from_init_c(_unpack_order_initialized(v[5])),
+        command_id=UUID4(v[6]),
+        ts_init=v[7],
+    )
+
+
+cdef list _pack_submit_order_list(SubmitOrderList command, int tag):
+    cdef Order o
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        command.trader_id.value,
+        command.strategy_id.value,
+        command.list.id.value,
+        [_pack_order_initialized(o.init_event_c(), _ORDER_INITIALIZED) for o in command.list.orders],
+        command.id.value,
+        command.ts_init,
+    ]
+
+
+cdef SubmitOrderList _unpack_submit_order_list(list v):
+    cdef list o
+    cdef OrderList order_list = OrderList(
+        list_id=OrderListId(v[4]),
+        orders=[OrderUnpacker.from_init_c(_unpack_order_initialized(o)) for o in v[5]],
+    )
+    return SubmitOrderList(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        order_list=order_list,
+        command_id=UUID4(v[6]),
+        ts_init=v[7],
+    )
+
+
+cdef list _pack_modify_order(ModifyOrder command, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        command.trader_id.value,
+        command.strategy_id.value,
+        command.instrument_id.value,
+        command.client_order_id.value,
+        command.venue_order_id.value,
+        command.quantity.raw if command.quantity is not None else None,
+        command.quantity.precision if command.quantity is not None else None,
+        command.price.raw if command.price is not None else None,
+        command.price.precision if command.price is not None else None,
+        command.trigger.raw if command.trigger is not None else None,
+        command.trigger.precision if command.trigger is not None else None,
+        command.id.value,
+        command.ts_init,
+    ]
+
+
+cdef ModifyOrder _unpack_modify_order(list v):
+    return ModifyOrder(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        instrument_id=InstrumentId.from_str_c(v[4]),
+        client_order_id=ClientOrderId(v[5]),
+        venue_order_id=VenueOrderId(v[6]),
+        quantity=Quantity.from_raw_c(v[7], v[8]) if v[7] is not None else None,
+        price=Price.from_raw_c(v[9], v[10]) if v[9] is not None else None,
+        trigger=Price.from_raw_c(v[11], v[12]) if v[11] is not None else None,
+        command_id=UUID4(v[13]),
+        ts_init=v[14],
+    )
+
+
+cdef list _pack_cancel_order(CancelOrder command, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        command.trader_id.value,
+        command.strategy_id.value,
+        command.instrument_id.value,
+        command.client_order_id.value,
+        command.venue_order_id.value,
+        command.id.value,
+        command.ts_init,
+    ]
+
+
+cdef CancelOrder _unpack_cancel_order(list v):
+    return CancelOrder(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        instrument_id=InstrumentId.from_str_c(v[4]),
+        client_order_id=ClientOrderId(v[5]),
+        venue_order_id=VenueOrderId(v[6]),
+        command_id=UUID4(v[7]),
+        ts_init=v[8],
+    )
+
+
+cdef list _pack_cancel_all_orders(CancelAllOrders command, int tag):
+    return [
+        _SCHEMA_VERSION,
+        tag,
+        command.trader_id.value,
+        command.strategy_id.value,
+        command.instrument_id.value,
+        command.id.value,
+        command.ts_init,
+    ]
+
+
+cdef CancelAllOrders _unpack_cancel_all_orders(list v):
+    return CancelAllOrders(
+        trader_id=TraderId(v[2]),
+        strategy_id=StrategyId(v[3]),
+        instrument_id=InstrumentId.from_str_c(v[4]),
+        command_id=UUID4(v[5]),
+        ts_init=v[6],
+    )
+
+
+# -- SCHEMA ---------------------------------------------------------------------------------------
+
+# Mapping of type to (tag, pack delegate)
+cdef dict _SCHEMA_PACKERS = {
+    OrderInitialized: (_ORDER_INITIALIZED, _pack_order_initialized),
+    OrderDenied: (_ORDER_DENIED, _pack_order_denied),
+    OrderSubmitted: (_ORDER_SUBMITTED, _pack_order_submitted),
+    OrderAccepted: (_ORDER_ACCEPTED, _pack_order_venue_event),
+    OrderRejected: (_ORDER_REJECTED, _pack_order_rejected),
+    OrderCanceled: (_ORDER_CANCELED, _pack_order_venue_event),
+    OrderExpired: (_ORDER_EXPIRED, _pack_order_venue_event),
+    OrderTriggered: (_ORDER_TRIGGERED, _pack_order_venue_event),
+    OrderPendingUpdate: (_ORDER_PENDING_UPDATE, _pack_order_venue_event),
+    OrderPendingCancel: (_ORDER_PENDING_CANCEL, _pack_order_venue_event),
+    OrderModifyRejected: (_ORDER_MODIFY_REJECTED, _pack_order_venue_rejected),
+    OrderCancelRejected: (_ORDER_CANCEL_REJECTED, _pack_order_venue_rejected),
+    OrderUpdated: (_ORDER_UPDATED, _pack_order_updated),
+    OrderFilled: (_ORDER_FILLED, _pack_order_filled),
+    PositionOpened: (_POSITION_OPENED, _pack_position_event),
+    PositionChanged: (_POSITION_CHANGED, _pack_position_event),
+    PositionClosed: (_POSITION_CLOSED, _pack_position_event),
+    AccountState: (_ACCOUNT_STATE, _pack_account_state),
+    SubmitOrder: (_SUBMIT_ORDER, _pack_submit_order),
+    SubmitOrderList: (_SUBMIT_ORDER_LIST, _pack_submit_order_list),
+    ModifyOrder: (_MODIFY_ORDER, _pack_modify_order),
+    CancelOrder: (_CANCEL_ORDER, _pack_cancel_order),
+    CancelAllOrders: (_CANCEL_ALL_ORDERS, _pack_cancel_all_orders),
+}
+
+# Mapping of tag to unpack delegate
+cdef dict _SCHEMA_UNPACKERS = {
+    _ORDER_INITIALIZED: _unpack_order_initialized,
+    _ORDER_DENIED: _unpack_order_denied,
+    _ORDER_SUBMITTED: _unpack_order_submitted,
+    _ORDER_ACCEPTED: _unpack_order_venue_event,
+    _ORDER_REJECTED: _unpack_order_rejected,
+    _ORDER_CANCELED: _unpack_order_venue_event,
+    _ORDER_EXPIRED: _unpack_order_venue_event,
+    _ORDER_TRIGGERED: _unpack_order_venue_event,
+    _ORDER_PENDING_UPDATE: _unpack_order_venue_event,
+    _ORDER_PENDING_CANCEL: _unpack_order_venue_event,
+    _ORDER_MODIFY_REJECTED: _unpack_order_venue_rejected,
+    _ORDER_CANCEL_REJECTED: _unpack_order_venue_rejected,
+    _ORDER_UPDATED: _unpack_order_updated,
+    _ORDER_FILLED: _unpack_order_filled,
+    _POSITION_OPENED: _unpack_position_opened,
+    _POSITION_CHANGED: _unpack_position_changed,
+    _POSITION_CLOSED: _unpack_position_closed,
+    _ACCOUNT_STATE: _unpack_account_state,
+    _SUBMIT_ORDER: _unpack_submit_order,
+    _SUBMIT_ORDER_LIST: _unpack_submit_order_list,
+    _MODIFY_ORDER: _unpack_modify_order,
+    _CANCEL_ORDER: _unpack_cancel_order,
+    _CANCEL_ALL_ORDERS: _unpack_cancel_all_orders,
+}
+
+
+cdef inline bint _is_msgpack_array(bytes obj_bytes) except *:
+    cdef unsigned char first = obj_bytes[0]
+    return (first & 0xf0) == 0x90 or first == 0xdc or first == 0xdd
+
+
+cdef class MsgPackSchemaSerializer(MsgPackSerializer):
+    """
+    Provides a schema-compiled `MessagePack` serializer for order and position
+    events, account state events and trading commands.
+
+    Each object is written as a `MessagePack` array with a fixed field ordering
+    for its type, prefixed with the schema version and an integer type tag.
+    Enums are written as integers, and prices, quantities and money as their
+    raw fixed-point values, so no intermediate dicts or strings are built.
+
+    All other objects (such as instruments) fall back to the dict based
+    `MsgPackSerializer` format, which is also still accepted on
+    deserialization so previously persisted data remains readable.
+
+    Parameters
+    ----------
+    timestamps_as_str : bool
+        If the dict based fallback converts timestamp int64_t to str on
+        serialization, and back to int64_t on deserialization.
+    """
+
+    def __init__(self, bint timestamps_as_str=False):
+        super().__init__(timestamps_as_str=timestamps_as_str)
+
+        self._packer = msgpack.Packer()
+
+    cpdef bytes serialize(self, object obj):
+        """
+        Serialize the given object to `MessagePack` specification bytes.
+
+        Parameters
+        ----------
+        obj : object
+            The object to serialize.
+
+        Returns
+        -------
+        bytes
+
+        Raises
+        ------
+        RuntimeError
+            If `obj` cannot be serialized.
+
+        """
+        Condition.not_none(obj, "obj")
+
+        cdef tuple schema = _SCHEMA_PACKERS.get(type(obj))
+        if schema is None:
+            return MsgPackSerializer.serialize(self, obj)
+
+        return self._packer.pack(schema[1](obj, schema[0]))
+
+    cpdef object deserialize(self, bytes obj_bytes):
+        """
+        Deserialize the given `MessagePack` specification bytes to an object.
+
+        Parameters
+        ----------
+        obj_bytes : bytes
+            The object bytes to deserialize.
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        RuntimeError
+            If `obj_bytes` cannot be deserialized.
+
+        """
+        Condition.not_none(obj_bytes, "obj_bytes")
+
+        if not obj_bytes or not _is_msgpack_array(obj_bytes):
+            return MsgPackSerializer.deserialize(self, obj_bytes)
+
+        cdef list values = msgpack.unpackb(obj_bytes)
+        if values[0] != _SCHEMA_VERSION:
+            raise RuntimeError(
+                f"cannot deserialize object: unsupported schema version {values[0]}",
+            )
+
+        delegate = _SCHEMA_UNPACKERS.get(values[1])
+        if delegate is None:
+            raise RuntimeError("cannot deserialize object: unrecognized type tag")
+
+        return delegate(values)
@@ -699,6 +699,110 @@ class TestRedisCacheDatabase:
         # Assert
         assert result == {position.id: position}
 
+    def test_load_orders_cache_when_orders_span_multiple_batches(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(batch_size=2),
+        )
+
+        orders = [
+            self.strategy.order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100000),
+            )
+            for _ in range(5)
+        ]
+
+        for order in orders:
+            database.add_order(order)
+
+        # Act
+        result = database.load_orders()
+
+        # Assert
+        assert result == {order.client_order_id: order for order in orders}
+
+    def test_load_positions_cache_when_positions_share_instrument(self):
+        # Arrange
+        self.database.add_instrument(AUDUSD_SIM)
+
+        positions = []
+        for i in range(3):
+            order = self.strategy.order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100000),
+            )
+            fill = TestStubs.event_order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId(f"P-{i}"),
+                last_px=Price.from_str("1.00001"),
+            )
+            position = Position(instrument=AUDUSD_SIM, fill=fill)
+            self.database.add_position(position)
+            positions.append(position)
+
+        # Act
+        result = self.database.load_positions()
+
+        # Assert
+        assert result == {position.id: position for position in positions}
+
+    def test_write_behind_add_and_update_order_persisted_on_load(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(write_behind=True, write_behind_interval_ms=60_000),
+        )
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        database.add_order(order)
+        order.apply(TestStubs.event_order_submitted(order))
+        database.update_order(order)
+
+        # Act
+        result = database.load_order(order.client_order_id)
+
+        # Assert
+        assert result == order
+        assert result.status == order.status
+        database.close()
+
+    def test_write_behind_close_persists_pending_events(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(write_behind=True, write_behind_interval_ms=60_000),
+        )
+
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        database.add_order(order)
+
+        # Act
+        database.close()
+
+        # Assert
+        assert self.database.load_order(order.client_order_id) == order
+
     def test_delete_strategy(self):
         # Arrange, Act
         self.database.delete_strategy(self.strategy.id)
@@ -19,6 +19,8 @@ import pytest
 
 from nautilus_trader.adapters.betfair.factories import BetfairLiveDataClientFactory
 from nautilus_trader.adapters.betfair.factories import BetfairLiveExecutionClientFactory
+from nautilus_trader.common.logging import LiveLogger
+from nautilus_trader.common.logging import ThreadedLogger
 from nautilus_trader.infrastructure.cache import CacheDatabaseConfig
 from nautilus_trader.live.node import TradingNode
 from nautilus_trader.live.node import TradingNodeConfig
@@ -42,6 +44,23 @@ class TestTradingNodeConfiguration:
         # Assert
         assert node is not None
 
+    def test_config_default_uses_live_logger(self):
+        # Arrange, Act
+        node = TradingNode()
+
+        # Assert
+        assert isinstance(node.get_logger(), LiveLogger)
+
+    def test_config_with_threaded_logger(self):
+        # Arrange
+        config = TradingNodeConfig(threaded_logger=True)
+
+        # Act
+        node = TradingNode(config=config)
+
+        # Assert
+        assert isinstance(node.get_logger(), ThreadedLogger)
+
 
 class TestTradingNodeOperation:
     def setup(self):
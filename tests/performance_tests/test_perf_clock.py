@@ -17,6 +17,7 @@ from datetime import timedelta
 
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.clock import TestClockScheduler
 from tests.test_kit.performance import PerformanceHarness
 
 
@@ -79,3 +80,20 @@ class TestClockPerformanceTests(PerformanceHarness):
         )
         # ~320.1ms                       minimum of 1 runs @ 1 iteration each run. (100000 advances)
         # ~3.7ms / ~3655.1μs / 3655108ns minimum of 1 runs @ 1 iteration each run.
+
+    def test_scheduler_advance_time_with_many_clocks(self):
+        scheduler = TestClockScheduler()
+        for i in range(100):
+            clock = TestClock()
+            scheduler.register_clock(clock)
+            clock.set_timer(f"TIMER-{i}", timedelta(seconds=i + 1), callback=lambda e: None)
+
+        def advance():
+            for i in range(100_000):
+                scheduler.advance_time(i * 1_000_000)  # 1ms steps
+
+        self.benchmark.pedantic(
+            target=advance,
+            iterations=1,
+            rounds=1,
+        )
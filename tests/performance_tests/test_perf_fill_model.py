@@ -13,7 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.backtest.exchange import InflightQueue
 from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import LatencyModel
 from tests.test_kit.performance import PerformanceHarness
 
 
@@ -23,6 +25,26 @@ model = FillModel(
     random_seed=42,
 )
 
+latency_model = LatencyModel(
+    base_latency_nanos=1_000_000,
+    insert_jitter_nanos=250_000,
+    update_jitter_nanos=250_000,
+    cancel_jitter_nanos=250_000,
+    random_seed=42,
+)
+
+
+def push_and_drain_inflight_queue():
+    # Bursty flow: 1,000 commands in-flight before the first arrives
+    queue = InflightQueue()
+    for i in range(1_000):
+        queue.push(latency_model.sample_insert_latency(), i)
+    now_ns = 0
+    while len(queue) > 0:
+        now_ns += 100_000
+        while queue.is_due(now_ns):
+            queue.pop()
+
 
 class TestFillModelPerformance(PerformanceHarness):
     def test_is_limit_filled(self):
@@ -40,3 +62,19 @@ class TestFillModelPerformance(PerformanceHarness):
             rounds=1,
         )
         # ~0.0ms / ~0.1μs / 106ns minimum of 100,000 runs @ 1 iteration each run.
+
+
+class TestLatencyModelPerformance(PerformanceHarness):
+    def test_sample_insert_latency(self):
+        self.benchmark.pedantic(
+            target=latency_model.sample_insert_latency,
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_inflight_queue_push_and_drain(self):
+        self.benchmark.pedantic(
+            target=push_and_drain_inflight_queue,
+            iterations=1,
+            rounds=100,
+        )
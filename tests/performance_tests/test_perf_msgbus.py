@@ -0,0 +1,59 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.msgbus.bus import MessageBus
+from tests.test_kit.performance import PerformanceHarness
+
+
+@pytest.fixture()
+def msgbus(clock, logger):
+    return MessageBus(
+        trader_id=TraderId("TESTER-000"),
+        clock=clock,
+        logger=logger,
+        topic_cache_size=100,
+    )
+
+
+class TestMessageBusPerformance(PerformanceHarness):
+    def test_publish_cached_topic(self, msgbus):
+        handler = []
+        msgbus.subscribe(topic="data.quotes.*", handler=handler.append)
+        msgbus.publish("data.quotes.SIM", "QUOTE")  # Resolve and cache topic
+
+        self.benchmark.pedantic(
+            target=msgbus.publish,
+            args=("data.quotes.SIM", "QUOTE"),
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_publish_beyond_topic_cache_size(self, msgbus):
+        handler = []
+        msgbus.subscribe(topic="data.quotes.*", handler=handler.append)
+        topics = [f"data.quotes.{i}" for i in range(200)]
+
+        def publish():
+            for topic in topics:
+                msgbus.publish(topic, "QUOTE")
+
+        self.benchmark.pedantic(
+            target=publish,
+            iterations=1_000,
+            rounds=1,
+        )
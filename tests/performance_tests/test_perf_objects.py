@@ -56,6 +56,48 @@ class TestObjectPerformance(PerformanceHarness):
         )
         # ~0.0ms / ~0.2μs / 198ns minimum of 100,000 runs @ 1 iteration each run.
 
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_make_price(self):
+        self.benchmark.pedantic(
+            target=Price,
+            args=(1.00001, 5),
+            iterations=100_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_make_price_from_raw(self):
+        self.benchmark.pedantic(
+            target=Price.from_raw,
+            args=(100001, 5),
+            iterations=100_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_price_comparison(self):
+        price1 = Price.from_str("1.00001")
+        price2 = Price.from_str("1.00002")
+
+        self.benchmark.pedantic(
+            target=price1.__lt__,
+            args=(price2,),
+            iterations=100_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_price_addition(self):
+        price1 = Price.from_str("1.00001")
+        price2 = Price.from_str("1.00002")
+
+        self.benchmark.pedantic(
+            target=price1.__add__,
+            args=(price2,),
+            iterations=100_000,
+            rounds=1,
+        )
+
     @pytest.mark.benchmark(disable_gc=True, warmup=True)
     def test_build_bar_no_checking(self):
         self.benchmark.pedantic(
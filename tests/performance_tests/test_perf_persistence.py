@@ -0,0 +1,92 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pyarrow as pa
+
+from nautilus_trader.backtest.data.providers import TestDataProvider
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.data.wranglers import QuoteTickDataWrangler
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.persistence.batching import table_to_nautilus
+from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
+from nautilus_trader.serialization.arrow.serializer import get_schema
+from tests.test_kit.performance import PerformanceBench
+from tests.test_kit.performance import PerformanceHarness
+
+
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+def quote_tick_table(repeat: int = 50) -> pa.Table:
+    data = TestDataProvider().read_csv_ticks("truefx-usdjpy-ticks.csv")
+    ticks = QuoteTickDataWrangler(instrument=USDJPY_SIM).process(data) * repeat
+    rows = [ParquetSerializer.serialize(tick) for tick in ticks]
+    schema = get_schema(QuoteTick)
+    return pa.Table.from_pydict(
+        {name: pa.array([row[name] for row in rows]) for name in schema.names},
+    )
+
+
+def decode_via_pandas(table: pa.Table):
+    # The previous replay path, as a baseline
+    return ParquetSerializer.deserialize(cls=QuoteTick, chunk=table.to_pandas().to_dict("records"))
+
+
+def decode_via_arrow(table: pa.Table):
+    return table_to_nautilus(table=table, cls=QuoteTick)
+
+
+class TestPersistencePerformance(PerformanceHarness):
+    def test_decode_quote_ticks_via_pandas(self, benchmark):
+        table = quote_tick_table()
+
+        self.benchmark.pedantic(
+            decode_via_pandas,
+            args=(table,),
+            iterations=1,
+            rounds=5,
+        )
+
+    def test_decode_quote_ticks_via_arrow(self, benchmark):
+        table = quote_tick_table()
+
+        self.benchmark.pedantic(
+            decode_via_arrow,
+            args=(table,),
+            iterations=1,
+            rounds=5,
+        )
+
+    def test_decode_quote_ticks_via_arrow_is_an_order_of_magnitude_faster(self):
+        # Arrange
+        table = quote_tick_table()
+        assert decode_via_arrow(table) == decode_via_pandas(table)
+
+        # Act
+        pandas_time = PerformanceBench.profile_function(
+            target=lambda: decode_via_pandas(table),
+            runs=3,
+            iterations=1,
+            print_output=False,
+        )
+        arrow_time = PerformanceBench.profile_function(
+            target=lambda: decode_via_arrow(table),
+            runs=3,
+            iterations=1,
+            print_output=False,
+        )
+
+        # Assert
+        assert pandas_time / arrow_time >= 10
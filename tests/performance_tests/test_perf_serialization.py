@@ -15,6 +15,7 @@
 
 import pytest
 
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.core.uuid import UUID4
@@ -23,7 +24,9 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.serialization.msgpack.schema import MsgPackSchemaSerializer
 from nautilus_trader.serialization.msgpack.serializer import MsgPackSerializer
 from tests.test_kit.performance import PerformanceHarness
 from tests.test_kit.stubs import TestStubs
@@ -60,7 +63,16 @@ class TestSerializationPerformance(PerformanceHarness):
             0,
         )
 
+        self.fill = TestStubs.event_order_filled(
+            self.order,
+            instrument=TestInstrumentProvider.default_fx_ccy("AUD/USD"),
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00001"),
+        )
+
         self.serializer = MsgPackSerializer()
+        self.schema_serializer = MsgPackSchemaSerializer()
 
     @pytest.fixture(autouse=True)
     @pytest.mark.benchmark(disable_gc=True, warmup=True)
@@ -76,3 +88,62 @@ class TestSerializationPerformance(PerformanceHarness):
             rounds=1,
         )
         # ~0.0ms / ~4.1μs / 4105ns minimum of 10,000 runs @ 1 iteration each run.
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_serialize_submit_order_with_schema(self):
+        self.benchmark.pedantic(
+            target=self.schema_serializer.serialize,
+            args=(self.command,),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_serialize_order_filled(self):
+        self.benchmark.pedantic(
+            target=self.serializer.serialize,
+            args=(self.fill,),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_serialize_order_filled_with_schema(self):
+        self.benchmark.pedantic(
+            target=self.schema_serializer.serialize,
+            args=(self.fill,),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_deserialize_order_filled(self):
+        self.benchmark.pedantic(
+            target=self.serializer.deserialize,
+            args=(self.serializer.serialize(self.fill),),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_deserialize_order_filled_with_schema(self):
+        self.benchmark.pedantic(
+            target=self.schema_serializer.deserialize,
+            args=(self.schema_serializer.serialize(self.fill),),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_round_trip_order_filled_with_schema(self):
+        def round_trip():
+            deserialized = self.schema_serializer.deserialize(
+                self.schema_serializer.serialize(self.fill),
+            )
+            assert deserialized.last_px == self.fill.last_px
+
+        self.benchmark.pedantic(
+            target=round_trip,
+            iterations=10_000,
+            rounds=1,
+        )
@@ -0,0 +1,70 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.backtest.data.providers import TestDataProvider
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.data.wranglers import QuoteTickDataWrangler
+from tests.test_kit.performance import PerformanceHarness
+
+
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+class TestDataWranglersPerformance(PerformanceHarness):
+    def test_process_tick_data(self, benchmark):
+        data = TestDataProvider().read_csv_ticks("truefx-usdjpy-ticks.csv")
+        wrangler = QuoteTickDataWrangler(instrument=USDJPY_SIM)
+
+        self.benchmark.pedantic(
+            wrangler.process,
+            args=(data,),
+            iterations=100,
+            rounds=1,
+        )
+
+    def test_process_bar_data(self, benchmark):
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")
+        ask_data = provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")
+        wrangler = QuoteTickDataWrangler(instrument=USDJPY_SIM)
+
+        self.benchmark.pedantic(
+            wrangler.process_bar_data,
+            args=(bid_data, ask_data),
+            kwargs={"random_seed": 42},
+            iterations=1,
+            rounds=5,
+        )
+
+    def test_process_bar_data_chunks(self, benchmark):
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")
+        ask_data = provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")
+        wrangler = QuoteTickDataWrangler(instrument=USDJPY_SIM)
+
+        def consume_chunks():
+            for _ in wrangler.process_bar_data_chunks(
+                bid_data,
+                ask_data,
+                random_seed=42,
+                chunk_size=50_000,
+            ):
+                pass
+
+        self.benchmark.pedantic(
+            consume_chunks,
+            iterations=1,
+            rounds=5,
+        )
@@ -16,6 +16,8 @@
 from decimal import Decimal
 
 from nautilus_trader.accounting.calculators import ExchangeRateCalculator
+from nautilus_trader.accounting.calculators import ExchangeRateGraph
+from nautilus_trader.model.currencies import BTC
 from nautilus_trader.model.currencies import ETH
 from nautilus_trader.model.currencies import USDT
 from nautilus_trader.model.enums import PriceType
@@ -52,3 +54,28 @@ class TestExchangeRateCalculatorPerformanceTests(PerformanceHarness):
             rounds=1,
         )
         # ~0.0ms / ~8.2μs / 8198ns minimum of 100,000 runs @ 1 iteration each run.
+
+    def test_get_xrate_from_graph(self, benchmark):
+        graph = ExchangeRateGraph()
+        graph.update("BTC/USD", Decimal("11291.38"), Decimal("11292.58"))
+        graph.update("ETH/USDT", Decimal("371.90"), Decimal("372.11"))
+        graph.update("XBT/USD", Decimal("11285.50"), Decimal("11286.0"))
+
+        self.benchmark.pedantic(
+            graph.get_rate,
+            kwargs={"from_currency": ETH, "to_currency": USDT, "price_type": PriceType.MID},
+            iterations=100000,
+            rounds=1,
+        )
+
+    def test_get_cross_xrate_from_graph(self, benchmark):
+        graph = ExchangeRateGraph()
+        graph.update("BTC/USDT", Decimal("11291.38"), Decimal("11292.58"))
+        graph.update("ETH/USDT", Decimal("371.90"), Decimal("372.11"))
+
+        self.benchmark.pedantic(
+            graph.get_rate,
+            kwargs={"from_currency": ETH, "to_currency": BTC, "price_type": PriceType.MID},
+            iterations=100000,
+            rounds=1,
+        )
@@ -21,6 +21,7 @@ import pandas as pd
 import pytest
 
 from nautilus_trader.accounting.calculators import ExchangeRateCalculator
+from nautilus_trader.accounting.calculators import ExchangeRateGraph
 from nautilus_trader.accounting.calculators import RolloverInterestCalculator
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import BTC
@@ -226,6 +227,119 @@ class TestExchangeRateCalculator:
         assert result == Decimal("110.115")
 
 
+class TestExchangeRateGraph:
+    def test_get_rate_when_price_type_last_raises_value_error(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80010"))
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            graph.get_rate(AUD, USD, PriceType.LAST)
+
+    def test_get_rate_with_no_quotes_returns_zero(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+
+        # Act
+        result = graph.get_rate(AUD, USD, PriceType.MID)
+
+        # Assert
+        assert result == Decimal(0)
+
+    def test_get_rate_for_direct_and_inverse_pairs(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD/JPY", Decimal("110.100"), Decimal("110.130"))
+
+        # Act, Assert
+        assert graph.get_rate(USD, JPY, PriceType.BID) == Decimal("110.100")
+        assert graph.get_rate(USD, JPY, PriceType.ASK) == Decimal("110.130")
+        assert graph.get_rate(USD, JPY, PriceType.MID) == Decimal("110.115")
+        assert graph.get_rate(JPY, USD, PriceType.BID) == Decimal(1) / Decimal("110.100")
+
+    def test_get_rate_by_inference_matches_calculator(self):
+        # Arrange
+        bid_rates = {
+            "USD/JPY": Decimal("110.100"),
+            "AUD/USD": Decimal("0.80000"),
+        }
+        ask_rates = {
+            "USD/JPY": Decimal("110.130"),
+            "AUD/USD": Decimal("0.80010"),
+        }
+
+        graph = ExchangeRateGraph()
+        for symbol in bid_rates:
+            graph.update(symbol, bid_rates[symbol], ask_rates[symbol])
+
+        calculator = ExchangeRateCalculator()
+
+        # Act, Assert
+        for from_currency, to_currency in ((JPY, AUD), (AUD, JPY)):
+            for price_type in (PriceType.BID, PriceType.ASK, PriceType.MID):
+                expected = calculator.get_rate(
+                    from_currency,
+                    to_currency,
+                    price_type,
+                    bid_rates,
+                    ask_rates,
+                )
+                result = graph.get_rate(from_currency, to_currency, price_type)
+                assert result == pytest.approx(expected)
+
+    def test_get_rate_when_no_conversion_path_returns_zero(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80010"))
+        graph.update("BTC/JPY", Decimal("5000000"), Decimal("5000100"))
+
+        # Act
+        result = graph.get_rate(AUD, BTC, PriceType.MID)
+
+        # Assert
+        assert result == Decimal(0)
+
+    def test_update_invalidates_cached_cross_rates(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD/JPY", Decimal("100"), Decimal("100"))
+        graph.update("AUD/USD", Decimal("0.8"), Decimal("0.8"))
+
+        first = graph.get_rate(AUD, JPY, PriceType.MID)
+
+        # Act
+        graph.update("USD/JPY", Decimal("110"), Decimal("110"))
+        second = graph.get_rate(AUD, JPY, PriceType.MID)
+
+        # Assert
+        assert first == Decimal("80.0")
+        assert second == Decimal("88.0")
+
+    def test_quote_for_inverse_pair_takes_precedence(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD/AUD", Decimal("1.30"), Decimal("1.30"))
+
+        # Act
+        graph.update("AUD/USD", Decimal("0.80"), Decimal("0.80"))
+
+        # Assert
+        assert graph.get_rate(USD, AUD, PriceType.MID) == Decimal("1.30")
+        assert graph.get_rate(AUD, USD, PriceType.MID) == Decimal("0.80")
+
+    def test_clear(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", Decimal("0.80000"), Decimal("0.80010"))
+
+        # Act
+        graph.clear()
+
+        # Assert
+        assert graph.get_rate(AUD, USD, PriceType.MID) == Decimal(0)
+
+
 class TestRolloverInterestCalculator:
     def setup(self):
         # Fixture Setup
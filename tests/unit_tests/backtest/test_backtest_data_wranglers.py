@@ -15,6 +15,8 @@
 
 import os
 
+import pandas as pd
+
 from nautilus_trader.backtest.data.loaders import TardisQuoteDataLoader
 from nautilus_trader.backtest.data.loaders import TardisTradeDataLoader
 from nautilus_trader.backtest.data.providers import TestDataProvider
@@ -66,8 +68,49 @@ class TestQuoteTickDataWrangler:
         assert ticks[0].ask == Price.from_str("86.728")
         assert ticks[0].bid_size == Quantity.from_int(1000000)
         assert ticks[0].ask_size == Quantity.from_int(1000000)
-        assert ticks[0].ts_event == 1357077600295000064
-        assert ticks[0].ts_event == 1357077600295000064
+        assert ticks[0].ts_event == 1357077600295000000
+        assert ticks[0].ts_event == 1357077600295000000
+
+    def test_process_tick_data_rounds_as_per_price_and_keeps_nanos(self):
+        # Arrange
+        audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        wrangler = QuoteTickDataWrangler(instrument=audusd)
+        data = pd.DataFrame(
+            {
+                "bid": [1.000005, 0.123454999],
+                "ask": [1.000015, 0.1234551],
+            },
+            index=pd.DatetimeIndex(
+                ["2021-01-01 00:00:00.000000001", "2021-01-01 00:00:01"],
+                tz="UTC",
+            ),
+        )
+
+        # Act
+        ticks = wrangler.process(data)
+
+        # Assert
+        assert len(ticks) == 2
+        assert ticks[0].bid == Price(1.000005, audusd.price_precision)
+        assert ticks[0].ask == Price(1.000015, audusd.price_precision)
+        assert ticks[1].bid == Price(0.123454999, audusd.price_precision)
+        assert ticks[1].ask == Price(0.1234551, audusd.price_precision)
+        assert ticks[0].ts_event == 1609459200000000001
+        assert ticks[1].ts_event == 1609459201000000000
+
+    def test_process_columns_matches_process(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+        data = TestDataProvider().read_csv_ticks("truefx-usdjpy-ticks.csv")
+
+        # Act
+        columns = wrangler.process_columns(data=data.copy(), ts_init_delta=1_000)
+
+        # Assert
+        assert len(columns) == 1000
+        assert columns.instrument_ids() == [usdjpy.id]
+        assert list(columns) == wrangler.process(data=data.copy(), ts_init_delta=1_000)
 
     def test_process_tick_data_with_delta(self):
         # Arrange
@@ -90,8 +133,8 @@ class TestQuoteTickDataWrangler:
         assert ticks[0].ask == Price.from_str("86.728")
         assert ticks[0].bid_size == Quantity.from_int(1000000)
         assert ticks[0].ask_size == Quantity.from_int(1000000)
-        assert ticks[0].ts_event == 1357077600295000064
-        assert ticks[0].ts_init == 1357077600296000564  # <-- delta diff
+        assert ticks[0].ts_event == 1357077600295000000
+        assert ticks[0].ts_init == 1357077600296000500  # <-- delta diff
 
     def test_pre_process_bar_data_with_delta(self):
         # Arrange
@@ -120,6 +163,105 @@ class TestQuoteTickDataWrangler:
         assert ticks[0].ts_event == 1359676799700000000
         assert ticks[0].ts_init == 1359676799701000500  # <-- delta diff
 
+    def test_process_bar_data_interleaves_ohlc_ticks(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")[:10]
+        ask_data = provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")[:10]
+
+        wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+
+        # Act
+        ticks = wrangler.process_bar_data(bid_data=bid_data, ask_data=ask_data)
+
+        # Assert
+        assert len(ticks) == 40
+        assert [t.bid.as_double() for t in ticks[:4]] == list(bid_data.iloc[0][:4])
+        assert [t.ask.as_double() for t in ticks[:4]] == list(ask_data.iloc[0][:4])
+        assert [t.ts_event - ticks[3].ts_event for t in ticks[:4]] == [
+            -300_000_000,
+            -200_000_000,
+            -100_000_000,
+            0,
+        ]
+        assert all(a.ts_event <= b.ts_event for a, b in zip(ticks, ticks[1:]))
+
+    def test_process_bar_data_with_random_seed_is_reproducible(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")[:100]
+        ask_data = provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")[:100]
+
+        wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+
+        # Act
+        ticks1 = wrangler.process_bar_data(bid_data, ask_data, random_seed=42)
+        ticks2 = wrangler.process_bar_data(bid_data, ask_data, random_seed=42)
+        unshuffled = wrangler.process_bar_data(bid_data, ask_data)
+
+        # Assert
+        assert ticks1 == ticks2
+        assert [t.bid for t in ticks1] == [t.bid for t in ticks2]
+        assert [t.bid for t in ticks1] != [t.bid for t in unshuffled]
+        # Only the high and low ticks are swapped, timestamps are unchanged
+        assert [t.ts_event for t in ticks1] == [t.ts_event for t in unshuffled]
+        assert [t.bid for t in ticks1[::4]] == [t.bid for t in unshuffled[::4]]
+        assert [t.bid for t in ticks1[3::4]] == [t.bid for t in unshuffled[3::4]]
+        for i in range(1, len(ticks1), 4):
+            assert {ticks1[i].bid, ticks1[i + 1].bid} == {unshuffled[i].bid, unshuffled[i + 1].bid}
+
+    def test_process_bar_data_chunks_matches_process_bar_data(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")[:100]
+        ask_data = provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")[:100]
+
+        wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+        expected = wrangler.process_bar_data(bid_data, ask_data, random_seed=1)
+
+        # Act
+        chunks = list(
+            wrangler.process_bar_data_chunks(bid_data, ask_data, random_seed=1, chunk_size=30),
+        )
+
+        # Assert
+        assert [len(chunk) for chunk in chunks] == [120, 120, 120, 40]
+        ticks = [tick for chunk in chunks for tick in chunk]
+        assert [(t.bid, t.ask, t.ts_event) for t in ticks] == [
+            (t.bid, t.ask, t.ts_event) for t in expected
+        ]
+
+    def test_process_bar_data_chunks_with_close_bars_carries_ticks_across_chunks(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")[:10]
+        ask_data = provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")[:10]
+
+        # Bars 100ms apart, so each bars ticks interleave with the next bars
+        index = pd.date_range("2013-01-01", periods=10, freq="100ms", tz="UTC")
+        bid_data.index = index
+        ask_data.index = index
+
+        wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+        expected = wrangler.process_bar_data(bid_data, ask_data, random_seed=1)
+
+        # Act
+        chunks = list(
+            wrangler.process_bar_data_chunks(bid_data, ask_data, random_seed=1, chunk_size=2),
+        )
+
+        # Assert
+        ticks = [tick for chunk in chunks for tick in chunk]
+        assert len(ticks) == 40
+        assert [t.ts_event for t in ticks] == sorted(t.ts_event for t in ticks)
+        assert [(t.bid, t.ask, t.ts_event) for t in ticks] == [
+            (t.bid, t.ask, t.ts_event) for t in expected
+        ]
+
 
 class TestTradeTickDataWrangler:
     def setup(self):
@@ -148,8 +290,23 @@ class TestTradeTickDataWrangler:
         assert ticks[0].size == Quantity.from_str("2.67900")
         assert ticks[0].aggressor_side == AggressorSide.SELL
         assert ticks[0].trade_id == "148568980"
-        assert ticks[0].ts_event == 1597399200223000064
-        assert ticks[0].ts_init == 1597399200223000064
+        assert ticks[0].ts_event == 1597399200223000000
+        assert ticks[0].ts_init == 1597399200223000000
+
+    def test_process_columns_matches_process(self):
+        # Arrange
+        ethusdt = TestInstrumentProvider.ethusdt_binance()
+        wrangler = TradeTickDataWrangler(instrument=ethusdt)
+        data = TestDataProvider().read_csv_ticks("binance-ethusdt-trades.csv")[:100]
+
+        # Act
+        columns = wrangler.process_columns(data)
+
+        # Assert
+        assert len(columns) == 100
+        assert columns[0].aggressor_side == AggressorSide.SELL
+        assert columns[0].trade_id == "148568980"
+        assert list(columns) == wrangler.process(data)
 
     def test_process_with_delta(self):
         # Arrange
@@ -169,8 +326,8 @@ class TestTradeTickDataWrangler:
         assert ticks[0].size == Quantity.from_str("2.67900")
         assert ticks[0].aggressor_side == AggressorSide.SELL
         assert ticks[0].trade_id == "148568980"
-        assert ticks[0].ts_event == 1597399200223000064
-        assert ticks[0].ts_init == 1597399200224000564  # <-- delta diff
+        assert ticks[0].ts_event == 1597399200223000000
+        assert ticks[0].ts_init == 1597399200224000500  # <-- delta diff
 
 
 class TestBarDataWrangler:
@@ -295,8 +452,8 @@ class TestTardisQuoteDataWrangler:
         assert ticks[0].ask == Price.from_str("9682.00")
         assert ticks[0].bid_size == Quantity.from_str("0.670000")
         assert ticks[0].ask_size == Quantity.from_str("0.840000")
-        assert ticks[0].ts_event == 1582329603502091776
-        assert ticks[0].ts_init == 1582329603503092277
+        assert ticks[0].ts_event == 1582329603502092000
+        assert ticks[0].ts_init == 1582329603503092501
 
 
 class TestTardisTradeDataWrangler:
@@ -328,5 +485,5 @@ class TestTardisTradeDataWrangler:
         assert ticks[0].size == Quantity.from_str("0.132000")
         assert ticks[0].aggressor_side == AggressorSide.BUY
         assert ticks[0].trade_id == "42377944"
-        assert ticks[0].ts_event == 1582329602418379008
-        assert ticks[0].ts_init == 1582329602418379008
+        assert ticks[0].ts_event == 1582329602418379000
+        assert ticks[0].ts_init == 1582329602418379000
@@ -13,9 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pickle
 from decimal import Decimal
 
 import pandas as pd
+import pytest
 
 from nautilus_trader.backtest.data.providers import TestDataProvider
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
@@ -32,6 +34,8 @@ from nautilus_trader.model.data.bar import BarSpecification
 from nautilus_trader.model.data.bar import BarType
 from nautilus_trader.model.data.base import DataType
 from nautilus_trader.model.data.base import GenericData
+from nautilus_trader.model.data.columnar import QuoteTickColumns
+from nautilus_trader.model.data.tick import QuoteTick
 from nautilus_trader.model.data.venue import InstrumentStatusUpdate
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import AggregationSource
@@ -135,6 +139,46 @@ class TestBacktestEngine:
         # Assert
         assert len(self.engine.trader.strategy_states()) == 1
 
+    def test_run_with_start_and_end_runs_only_data_in_range(self):
+        # Arrange
+        data = pickle.loads(self.engine.dump_pickled_data())
+        start = data[1000].ts_init
+        end = data[2000].ts_init
+        expected = len([x for x in data if start <= x.ts_init <= end])
+
+        # Act
+        self.engine.run(start=start, end=end)
+
+        # Assert
+        assert self.engine.iteration == expected
+
+    def test_run_windows(self):
+        # Arrange
+        data = pickle.loads(self.engine.dump_pickled_data())
+        windows = [
+            (data[0].ts_init, data[1000].ts_init),
+            (data[5000].ts_init, data[6000].ts_init),
+        ]
+        expected = len([x for x in data for s, e in windows if s <= x.ts_init <= e])
+
+        # Act
+        self.engine.run_windows(windows)
+
+        # Assert
+        assert self.engine.iteration == expected
+
+    def test_run_windows_when_overlapping_raises_value_error(self):
+        # Arrange
+        data = pickle.loads(self.engine.dump_pickled_data())
+        windows = [
+            (data[0].ts_init, data[2000].ts_init),
+            (data[1000].ts_init, data[3000].ts_init),
+        ]
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.run_windows(windows)
+
     def test_change_fill_model(self):
         # Arrange, Act
         self.engine.change_fill_model(Venue("SIM"), FillModel())
@@ -432,6 +476,68 @@ class TestBacktestEngineData:
         assert "Added USD/JPY.SIM Instrument." in log
         assert "Added 2 USD/JPY.SIM InstrumentStatusUpdate elements." in log
 
+    def test_add_data_from_multiple_sources_merges_stream_in_order(self):
+        # Arrange
+        engine = BacktestEngine()
+        engine.add_instrument(AUDUSD_SIM)
+        engine.add_instrument(USDJPY_SIM)
+
+        def make_tick(instrument, ts):
+            return QuoteTick(
+                instrument_id=instrument.id,
+                bid=Price(1.0, instrument.price_precision),
+                ask=Price(1.0, instrument.price_precision),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+
+        ticks1 = [make_tick(USDJPY_SIM, ts) for ts in (3, 1, 5)]  # <-- not sorted
+        ticks2 = [make_tick(AUDUSD_SIM, ts) for ts in (0, 2, 4)]
+
+        # Act
+        engine.add_ticks(ticks1)
+        engine.add_ticks(ticks2)
+
+        # Assert
+        data = pickle.loads(engine.dump_pickled_data())
+        assert [x.ts_init for x in data] == [0, 1, 2, 3, 4, 5]
+
+    def test_add_tick_columns_merges_with_data_stream(self, capsys):
+        # Arrange
+        engine = BacktestEngine()
+        engine.add_instrument(AUDUSD_SIM)
+        engine.add_instrument(USDJPY_SIM)
+
+        def make_tick(instrument, ts):
+            return QuoteTick(
+                instrument_id=instrument.id,
+                bid=Price(1.0, instrument.price_precision),
+                ask=Price(1.0, instrument.price_precision),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(1_000_000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+
+        ticks = [make_tick(USDJPY_SIM, ts) for ts in (1, 3, 5)]
+        columns = QuoteTickColumns.from_ticks(
+            [make_tick(AUDUSD_SIM, ts) for ts in (0, 2, 4)],
+        )
+
+        # Act
+        engine.add_ticks(ticks)
+        engine.add_tick_columns(columns)
+
+        # Assert
+        log = "".join(capsys.readouterr())
+        assert "Added 3 QuoteTickColumns elements for 1 instrument." in log
+        data = pickle.loads(engine.dump_pickled_data())
+        assert [x.ts_init for x in data] == [0, 1, 2, 3, 4, 5]
+        assert data[0] == columns[0]
+        assert data[1] == ticks[0]
+
 
 class TestBacktestWithAddedBars:
     def setup(self):
@@ -522,7 +628,9 @@ class TestBacktestWithAddedBars:
 
     def test_dump_pickled_data(self):
         # Arrange, # Act, # Assert
-        assert len(self.engine.dump_pickled_data()) == 34_700_594
+        # Raw fixed-point prices and quantities pickle smaller than the previous
+        # `Decimal` backed values (34_700_594 bytes).
+        assert len(self.engine.dump_pickled_data()) < 34_700_594
 
     def test_load_pickled_data(self):
         # Arrange
@@ -17,6 +17,7 @@ from datetime import timedelta
 from decimal import Decimal
 
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.exchange import InflightQueue
 from nautilus_trader.backtest.exchange import SimulatedExchange
 from nautilus_trader.backtest.execution_client import BacktestExecClient
 from nautilus_trader.backtest.models import FillModel
@@ -65,6 +66,81 @@ from tests.test_kit.stubs import TestStubs
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
+INT64_MAX = 2 ** 63 - 1
+
+
+class TestInflightQueue:
+    def test_pop_returns_messages_in_arrival_time_order(self):
+        # Arrange
+        queue = InflightQueue()
+        queue.push(3, "c")
+        queue.push(1, "a")
+        queue.push(2, "b")
+
+        # Act
+        result = [queue.pop() for _ in range(3)]
+
+        # Assert
+        assert result == ["a", "b", "c"]
+        assert len(queue) == 0
+
+    def test_pop_with_same_arrival_time_returns_messages_in_send_order(self):
+        # Arrange
+        queue = InflightQueue()
+        for message in ("a", "b", "c", "d"):
+            queue.push(1, message)
+        queue.push(0, "first")
+
+        # Act
+        result = [queue.pop() for _ in range(5)]
+
+        # Assert
+        assert result == ["first", "a", "b", "c", "d"]
+
+    def test_is_due(self):
+        # Arrange
+        queue = InflightQueue()
+        queue.push(10, "a")
+
+        # Act, Assert
+        assert not queue.is_due(9)
+        assert queue.is_due(10)
+        assert queue.is_due(11)
+
+    def test_next_ts(self):
+        # Arrange
+        queue = InflightQueue()
+        queue.push(20, "b")
+        queue.push(10, "a")
+
+        # Act, Assert
+        assert queue.next_ts() == 10
+
+    def test_next_ts_when_empty_returns_int64_max(self):
+        # Arrange
+        queue = InflightQueue()
+
+        # Act, Assert
+        assert queue.next_ts() == INT64_MAX
+
+    def test_is_due_when_empty_returns_false(self):
+        # Arrange
+        queue = InflightQueue()
+
+        # Act, Assert
+        assert not queue.is_due(0)
+
+    def test_clear(self):
+        # Arrange
+        queue = InflightQueue()
+        queue.push(1, "a")
+
+        # Act
+        queue.clear()
+
+        # Assert
+        assert len(queue) == 0
+
 
 class TestSimulatedExchange:
     def setup(self):
@@ -908,6 +984,42 @@ class TestSimulatedExchange:
         assert len(self.exchange.get_working_orders()) == 1
         assert order.price == Price.from_str("90.011")
 
+    def test_update_limit_order_price_then_matches_at_new_price(self):
+        # Arrange: Prepare market
+        tick1 = TestStubs.quote_tick_3decimal(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.002"),
+            ask=Price.from_str("90.005"),
+        )
+        self.data_engine.process(tick1)
+        self.exchange.process_tick(tick1)
+
+        order = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+            Price.from_str("90.100"),
+        )
+
+        self.strategy.submit_order(order)
+        self.exchange.process(0)
+
+        self.strategy.modify_order(order, order.quantity, Price.from_str("90.010"))
+        self.exchange.process(0)
+
+        tick2 = TestStubs.quote_tick_3decimal(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.011"),
+            ask=Price.from_str("90.012"),
+        )
+
+        # Act
+        self.exchange.process_tick(tick2)
+
+        # Assert
+        assert order.status == OrderStatus.FILLED
+        assert len(self.exchange.get_working_orders()) == 0
+
     def test_update_untriggered_stop_limit_order_when_price_inside_market_then_rejects_amendment(
         self,
     ):
@@ -1781,6 +1893,78 @@ class TestSimulatedExchange:
         assert entry.status == OrderStatus.ACCEPTED
         assert entry.quantity == 100000
 
+    def test_next_wakeup_ns_with_no_pending_commands_returns_int64_max(self):
+        # Arrange, Act, Assert
+        assert self.exchange.next_wakeup_ns() == INT64_MAX
+
+    def test_next_wakeup_ns_with_pending_command_returns_due_time(self):
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            instrument_id=USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=Price.from_int(100),
+            quantity=Quantity.from_int(200000),
+        )
+
+        # Act
+        self.strategy.submit_order(order)
+
+        # Assert
+        assert self.exchange.next_wakeup_ns() == 0
+        self.exchange.process(0)
+        assert self.exchange.next_wakeup_ns() == INT64_MAX
+
+    def test_next_wakeup_ns_with_inflight_command_returns_arrival_time(self):
+        # Arrange
+        self.exchange.set_latency_model(LatencyModel(secs_to_nanos(1)))
+        order = self.strategy.order_factory.limit(
+            instrument_id=USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=Price.from_int(100),
+            quantity=Quantity.from_int(200000),
+        )
+
+        # Act
+        self.strategy.submit_order(order)
+
+        # Assert
+        assert self.exchange.next_wakeup_ns() == secs_to_nanos(1)
+
+    def test_latency_model_processes_multiple_inflight_commands_in_order(self):
+        # Arrange
+        self.exchange.set_latency_model(LatencyModel(secs_to_nanos(1)))
+        entry1 = self.strategy.order_factory.limit(
+            instrument_id=USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=Price.from_int(100),
+            quantity=Quantity.from_int(200000),
+        )
+        entry2 = self.strategy.order_factory.limit(
+            instrument_id=USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=Price.from_int(99),
+            quantity=Quantity.from_int(200000),
+        )
+        entry3 = self.strategy.order_factory.limit(
+            instrument_id=USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=Price.from_int(98),
+            quantity=Quantity.from_int(200000),
+        )
+
+        # Act
+        self.strategy.submit_order(entry1)
+        self.strategy.submit_order(entry2)
+        self.strategy.submit_order(entry3)
+        self.exchange.process(0)  # Still in-flight
+        self.exchange.process(secs_to_nanos(1))
+
+        # Assert
+        assert entry1.status == OrderStatus.ACCEPTED
+        assert entry2.status == OrderStatus.ACCEPTED
+        assert entry3.status == OrderStatus.ACCEPTED
+        assert entry1.venue_order_id < entry2.venue_order_id < entry3.venue_order_id
+
 
 XBTUSD_BITMEX = TestInstrumentProvider.xbtusd_bitmex()
 
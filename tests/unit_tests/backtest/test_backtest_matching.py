@@ -0,0 +1,176 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.matching import OrderPriceIndex
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestOrderPriceIndex:
+    def setup(self):
+        # Fixture Setup
+        self.order_factory = OrderFactory(
+            trader_id=TestStubs.trader_id(),
+            strategy_id=TestStubs.strategy_id(),
+            clock=TestClock(),
+        )
+
+    def limit(self, side, price):
+        return self.order_factory.limit(
+            AUDUSD_SIM.id,
+            side,
+            Quantity.from_int(100000),
+            Price.from_str(price),
+        )
+
+    def test_instantiate(self):
+        # Arrange, Act
+        index = OrderPriceIndex(descending=True)
+
+        # Assert
+        assert index.descending
+        assert len(index) == 0
+        assert index.orders() == []
+        assert repr(index) == "OrderPriceIndex(descending=True, orders=0)"
+
+    def test_add_orders_ascending_sorts_by_price_then_time(self):
+        # Arrange
+        index = OrderPriceIndex(descending=False)
+        order1 = self.limit(OrderSide.SELL, "1.00010")
+        order2 = self.limit(OrderSide.SELL, "1.00005")
+        order3 = self.limit(OrderSide.SELL, "1.00010")
+        order4 = self.limit(OrderSide.SELL, "1.00001")
+
+        # Act
+        for order in (order1, order2, order3, order4):
+            index.add(order, order.price)
+
+        # Assert
+        assert index.orders() == [order4, order2, order1, order3]
+        assert index.contains(order1.client_order_id)
+
+    def test_add_orders_descending_sorts_by_price_then_time(self):
+        # Arrange
+        index = OrderPriceIndex(descending=True)
+        order1 = self.limit(OrderSide.BUY, "1.00000")
+        order2 = self.limit(OrderSide.BUY, "1.00005")
+        order3 = self.limit(OrderSide.BUY, "1.00000")
+
+        # Act
+        for order in (order1, order2, order3):
+            index.add(order, order.price)
+
+        # Assert
+        assert index.orders() == [order2, order1, order3]
+
+    def test_add_duplicate_order_raises_value_error(self):
+        # Arrange
+        index = OrderPriceIndex(descending=True)
+        order = self.limit(OrderSide.BUY, "1.00000")
+        index.add(order, order.price)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            index.add(order, order.price)
+
+    def test_remove_order_at_shared_price_keeps_priority_of_others(self):
+        # Arrange
+        index = OrderPriceIndex(descending=True)
+        order1 = self.limit(OrderSide.BUY, "1.00000")
+        order2 = self.limit(OrderSide.BUY, "1.00000")
+        order3 = self.limit(OrderSide.BUY, "1.00000")
+        for order in (order1, order2, order3):
+            index.add(order, order.price)
+
+        # Act
+        result = index.remove(order2)
+
+        # Assert
+        assert result
+        assert index.orders() == [order1, order3]
+        assert not index.contains(order2.client_order_id)
+
+    def test_remove_order_not_in_index_returns_false(self):
+        # Arrange
+        index = OrderPriceIndex(descending=True)
+        order = self.limit(OrderSide.BUY, "1.00000")
+
+        # Act, Assert
+        assert not index.remove(order)
+
+    def test_crossed_when_descending_returns_orders_at_or_above_price(self):
+        # Arrange
+        index = OrderPriceIndex(descending=True)
+        order1 = self.limit(OrderSide.BUY, "1.00000")
+        order2 = self.limit(OrderSide.BUY, "1.00010")
+        order3 = self.limit(OrderSide.BUY, "1.00005")
+        for order in (order1, order2, order3):
+            index.add(order, order.price)
+
+        # Act, Assert
+        assert index.crossed(Price.from_str("1.00011")) == []
+        assert index.crossed(Price.from_str("1.00005")) == [order2, order3]
+        assert index.crossed(Price.from_str("0.99999")) == [order2, order3, order1]
+
+    def test_crossed_when_ascending_returns_orders_at_or_below_price(self):
+        # Arrange
+        index = OrderPriceIndex(descending=False)
+        order1 = self.limit(OrderSide.SELL, "1.00000")
+        order2 = self.limit(OrderSide.SELL, "1.00010")
+        order3 = self.limit(OrderSide.SELL, "1.00005")
+        for order in (order1, order2, order3):
+            index.add(order, order.price)
+
+        # Act, Assert
+        assert index.crossed(Price.from_str("0.99999")) == []
+        assert index.crossed(Price.from_str("1.00005")) == [order1, order3]
+
+    def test_crossed_returns_copy_safe_to_modify_index_during_iteration(self):
+        # Arrange
+        index = OrderPriceIndex(descending=False)
+        order1 = self.limit(OrderSide.SELL, "1.00000")
+        order2 = self.limit(OrderSide.SELL, "1.00001")
+        for order in (order1, order2):
+            index.add(order, order.price)
+
+        # Act
+        for order in index.crossed(Price.from_str("1.00001")):
+            index.remove(order)
+
+        # Assert
+        assert len(index) == 0
+
+    def test_clear(self):
+        # Arrange
+        index = OrderPriceIndex(descending=False)
+        order = self.limit(OrderSide.SELL, "1.00000")
+        index.add(order, order.price)
+
+        # Act
+        index.clear()
+
+        # Assert
+        assert len(index) == 0
+        assert not index.contains(order.client_order_id)
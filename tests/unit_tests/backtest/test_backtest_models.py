@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pytest
+
 from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.backtest.models import LatencyModel
 
@@ -76,3 +78,51 @@ class TestExchangeLatency:
         assert latency.insert_latency_nanos == self.NANOSECONDS_IN_MILLISECOND
         assert latency.update_latency_nanos == self.NANOSECONDS_IN_MILLISECOND
         assert latency.cancel_latency_nanos == self.NANOSECONDS_IN_MILLISECOND
+
+    def test_sample_latencies_with_no_jitter_returns_fixed_latency(self):
+        # Arrange
+        latency = LatencyModel(
+            base_latency_nanos=1_000,
+            insert_latency_nanos=100,
+            update_latency_nanos=200,
+            cancel_latency_nanos=300,
+        )
+
+        # Act, Assert
+        assert latency.sample_insert_latency() == 1_100
+        assert latency.sample_update_latency() == 1_200
+        assert latency.sample_cancel_latency() == 1_300
+
+    def test_sample_latencies_with_jitter_are_not_less_than_fixed_latency(self):
+        # Arrange
+        latency = LatencyModel(
+            base_latency_nanos=1_000,
+            insert_jitter_nanos=500,
+            update_jitter_nanos=500,
+            cancel_jitter_nanos=500,
+            random_seed=42,
+        )
+
+        # Act
+        samples = [latency.sample_insert_latency() for _ in range(100)]
+
+        # Assert
+        assert min(samples) >= 1_000
+        assert len(set(samples)) > 1
+        assert latency.sample_update_latency() >= 1_000
+        assert latency.sample_cancel_latency() >= 1_000
+
+    def test_sample_latencies_with_random_seed_is_reproducible(self):
+        # Arrange
+        latency1 = LatencyModel(insert_jitter_nanos=1_000, random_seed=42)
+        latency2 = LatencyModel(insert_jitter_nanos=1_000, random_seed=42)
+
+        # Act, Assert
+        assert [latency1.sample_insert_latency() for _ in range(10)] == [
+            latency2.sample_insert_latency() for _ in range(10)
+        ]
+
+    def test_instantiate_with_negative_jitter_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            LatencyModel(cancel_jitter_nanos=-1)
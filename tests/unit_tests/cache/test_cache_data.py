@@ -494,6 +494,62 @@ class TestCache:
         # Assert
         assert result == Decimal("0.009025266685348968705339031887")
 
+    def test_get_xrate_updates_on_new_quote(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+
+        tick1 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=Price.from_str("0.80000"),
+            ask=Price.from_str("0.80010"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        tick2 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=Price.from_str("0.81000"),
+            ask=Price.from_str("0.81010"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=1,
+            ts_init=1,
+        )
+
+        self.cache.add_quote_tick(tick1)
+        first = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Act
+        self.cache.add_quote_tick(tick2)
+        second = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert first == Decimal("0.80005")
+        assert second == Decimal("0.81005")
+
+    def test_get_xrate_when_instrument_added_after_quotes(self):
+        # Arrange
+        tick = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=Price.from_str("0.80000"),
+            ask=Price.from_str("0.80010"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(tick)
+
+        # Act
+        self.cache.add_instrument(AUDUSD_SIM)
+        result = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result == Decimal("0.80005")
+
     def test_get_xrate_with_no_conversion_returns_one(self):
         # Arrange, Act
         result = self.cache.get_xrate(SIM, AUD, AUD)
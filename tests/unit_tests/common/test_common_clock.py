@@ -23,6 +23,7 @@ import pytz
 
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.clock import TestClockScheduler
 from nautilus_trader.common.timer import TimeEvent
 from nautilus_trader.common.timer import TimeEventHandler
 from nautilus_trader.core.datetime import millis_to_nanos
@@ -562,6 +563,124 @@ class TestTestClock:
         assert clock.timer_count == 2
 
 
+class TestTestClockScheduler:
+    def setup(self):
+        # Fixture Setup
+        self.scheduler = TestClockScheduler()
+        self.clock1 = TestClock()
+        self.clock2 = TestClock()
+        self.scheduler.register_clock(self.clock1)
+        self.scheduler.register_clock(self.clock2)
+
+    def test_register_clock_shares_scheduler_time(self):
+        # Arrange, Act
+        self.scheduler.set_time(1_000)
+
+        # Assert
+        assert self.scheduler.clocks() == [self.clock1, self.clock2]
+        assert self.clock1.timestamp_ns() == 1_000
+        assert self.clock2.timestamp_ns() == 1_000
+
+    def test_register_clock_twice_has_no_effect(self):
+        # Arrange, Act
+        self.scheduler.register_clock(self.clock1)
+
+        # Assert
+        assert self.scheduler.clocks() == [self.clock1, self.clock2]
+
+    def test_register_clock_with_another_scheduler_raises_value_error(self):
+        # Arrange
+        other = TestClockScheduler()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            other.register_clock(self.clock1)
+
+    def test_advance_registered_clock_directly_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.clock1.advance_time(1_000)
+
+    def test_advance_time_given_time_in_past_raises_value_error(self):
+        # Arrange
+        self.scheduler.set_time(1_000)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.scheduler.advance_time(999)
+
+    def test_advance_time_with_no_timers_returns_empty_list(self):
+        # Arrange, Act
+        event_handlers = self.scheduler.advance_time(1_000)
+
+        # Assert
+        assert event_handlers == []
+        assert self.scheduler.time_ns == 1_000
+        assert self.clock1.timestamp_ns() == 1_000
+
+    def test_advance_time_with_timers_across_clocks_returns_chronological_handlers(self):
+        # Arrange
+        self.clock1.set_time_alert_ns("ALERT1", 3_000, callback=lambda e: None)
+        self.clock2.set_time_alert_ns("ALERT2", 1_000, callback=lambda e: None)
+        self.clock2.set_time_alert_ns("ALERT3", 2_000, callback=lambda e: None)
+
+        # Act
+        event_handlers = self.scheduler.advance_time(3_000)
+
+        # Assert
+        assert [h.event.name for h in event_handlers] == ["ALERT2", "ALERT3", "ALERT1"]
+        assert self.clock1.timer_count == 0
+        assert self.clock2.timer_count == 0
+
+    def test_advance_time_with_events_at_same_time_returns_in_registration_order(self):
+        # Arrange
+        self.clock2.set_time_alert_ns("ALERT2", 1_000, callback=lambda e: None)
+        self.clock1.set_time_alert_ns("ALERT1", 1_000, callback=lambda e: None)
+
+        # Act
+        event_handlers = self.scheduler.advance_time(1_000)
+
+        # Assert
+        assert [h.event.name for h in event_handlers] == ["ALERT1", "ALERT2"]
+
+    def test_advance_time_only_returns_due_events(self):
+        # Arrange
+        self.clock1.set_time_alert_ns("ALERT1", 1_000, callback=lambda e: None)
+        self.clock2.set_time_alert_ns("ALERT2", 5_000, callback=lambda e: None)
+
+        # Act
+        event_handlers1 = self.scheduler.advance_time(2_000)
+        event_handlers2 = self.scheduler.advance_time(5_000)
+
+        # Assert
+        assert [h.event.name for h in event_handlers1] == ["ALERT1"]
+        assert [h.event.name for h in event_handlers2] == ["ALERT2"]
+
+    def test_advance_time_with_repeating_timer_reschedules_clock(self):
+        # Arrange
+        self.clock1.set_timer("TIMER1", timedelta(microseconds=1), callback=lambda e: None)
+
+        # Act
+        event_handlers1 = self.scheduler.advance_time(1_000)
+        event_handlers2 = self.scheduler.advance_time(3_000)
+
+        # Assert
+        assert len(event_handlers1) == 1
+        assert len(event_handlers2) == 2
+        assert self.clock1.next_event_time_ns == 4_000
+
+    def test_advance_time_after_cancelled_timer_skips_stale_entry(self):
+        # Arrange
+        self.clock1.set_time_alert_ns("ALERT1", 1_000, callback=lambda e: None)
+        self.clock1.cancel_timer("ALERT1")
+
+        # Act
+        event_handlers = self.scheduler.advance_time(2_000)
+
+        # Assert
+        assert event_handlers == []
+
+
 class TestLiveClockWithThreadTimer:
     def setup(self):
         # Fixture Setup
@@ -15,6 +15,7 @@
 
 import asyncio
 import socket
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -26,6 +27,7 @@ from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.common.logging import LogLevel
 from nautilus_trader.common.logging import LogLevelParser
+from nautilus_trader.common.logging import ThreadedLogger
 
 
 class TestLogLevelParser:
@@ -182,6 +184,23 @@ class TestLoggerTests:
             "trader_id": "TRADER-000",
         }
 
+    def test_log_to_console_formats_timestamp_with_nanoseconds(self, capsys):
+        # Arrange
+        clock = TestClock()
+        logger = Logger(clock=clock)
+        logger_adapter = LoggerAdapter(component_name="TEST_LOGGER", logger=logger)
+
+        # Act
+        clock.set_time(1_600_000_000_000_000_001)
+        logger_adapter.info("A log message.")
+        clock.set_time(1_600_000_000_500_000_000)
+        logger_adapter.info("A log message.")
+
+        # Assert
+        lines = capsys.readouterr().out.splitlines()
+        assert "2020-09-13T12:26:40.000000001Z" in lines[0]
+        assert "2020-09-13T12:26:40.500000000Z" in lines[1]
+
 
 class TestLiveLogger:
     def setup(self):
@@ -257,3 +276,102 @@ class TestLiveLogger:
 
         # Assert
         assert not logger.is_running
+
+
+class TestThreadedLogger:
+    def setup(self):
+        # Fixture Setup
+        self.logger = ThreadedLogger(clock=LiveClock(), level_stdout=LogLevel.CRITICAL)
+        self.logger_adapter = LoggerAdapter(component_name="THREADED_LOGGER", logger=self.logger)
+
+    def teardown(self):
+        self.logger.stop()
+
+    def test_log_when_not_running_sends_records_to_sink(self):
+        # Arrange
+        sink = []
+        self.logger.register_sink(sink.append)
+
+        # Act
+        self.logger_adapter.info("A log message.")
+
+        # Assert
+        assert not self.logger.is_running
+        assert [r["msg"] for r in sink] == ["A log message."]
+
+    def test_start_and_stop_writes_all_records_to_sink_in_order(self):
+        # Arrange
+        sink = []
+        self.logger.register_sink(sink.append)
+
+        # Act
+        self.logger.start()
+        for i in range(100):
+            self.logger_adapter.info(f"Message {i}", annotations={"tag": "test"})
+        self.logger.stop()
+
+        # Assert
+        assert not self.logger.is_running
+        assert [r["msg"] for r in sink] == [f"Message {i}" for i in range(100)]
+        assert sink[0]["component"] == "THREADED_LOGGER"
+        assert sink[0]["level"] == "INF"
+        assert sink[0]["tag"] == "test"
+        assert sink[0]["timestamp"] > 0
+
+    def test_log_when_ring_buffer_full_drops_entries(self):
+        # Arrange
+        sink = []
+        logger = ThreadedLogger(clock=LiveClock(), level_stdout=LogLevel.CRITICAL, capacity=1)
+        logger.register_sink(sink.append)
+        logger_adapter = LoggerAdapter(component_name="THREADED_LOGGER", logger=logger)
+        logger.start()
+
+        # Act
+        for _ in range(1000):
+            logger_adapter.info("A log message.")
+        logger.stop()
+
+        # Assert
+        dropped = logger.dropped_count
+        reported = [int(r["msg"].split()[1]) for r in sink if r["msg"].startswith("Dropped")]
+        assert len([r for r in sink if r["msg"] == "A log message."]) == 1000 - dropped
+        assert sum(reported) == dropped
+
+    def test_log_warnings_when_ring_buffer_full_are_not_dropped(self):
+        # Arrange
+        sink = []
+        logger = ThreadedLogger(clock=LiveClock(), level_stdout=LogLevel.CRITICAL, capacity=1)
+        logger.register_sink(sink.append)
+        logger_adapter = LoggerAdapter(component_name="THREADED_LOGGER", logger=logger)
+        logger.start()
+
+        # Act
+        for _ in range(100):
+            logger_adapter.warning("A warning message.")
+        logger.stop()
+
+        # Assert
+        assert logger.dropped_count == 0
+        assert len([r for r in sink if r["msg"] == "A warning message."]) == 100
+
+    def test_log_from_multiple_threads_writes_all_records(self):
+        # Arrange
+        sink = []
+        self.logger.register_sink(sink.append)
+        self.logger.start()
+
+        def log_messages(thread):
+            for i in range(1000):
+                self.logger_adapter.info(f"Message {thread}-{i}")
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(log_messages, range(4)))
+        self.logger.stop()
+
+        # Assert
+        assert self.logger.dropped_count == 0
+        assert len(sink) == 4000
+        for thread in range(4):
+            messages = [r["msg"] for r in sink if r["msg"].startswith(f"Message {thread}-")]
+            assert messages == [f"Message {thread}-{i}" for i in range(1000)]
@@ -17,13 +17,16 @@ import pytest
 
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.backtest.data_client import BacktestMarketDataClient
+from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.enums import LogLevel
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.core.data import Data
 from nautilus_trader.core.fsm import InvalidStateTrigger
+from nautilus_trader.data.engine import BarTopicRegistry
 from nautilus_trader.data.engine import DataEngine
+from nautilus_trader.data.engine import TopicRegistry
 from nautilus_trader.data.messages import DataCommand
 from nautilus_trader.data.messages import DataRequest
 from nautilus_trader.data.messages import DataResponse
@@ -54,6 +57,7 @@ from nautilus_trader.model.orderbook.data import OrderBookDeltas
 from nautilus_trader.model.orderbook.data import OrderBookSnapshot
 from nautilus_trader.msgbus.bus import MessageBus
 from nautilus_trader.portfolio.portfolio import Portfolio
+from tests.test_kit.mocks import MockCacheDatabase
 from tests.test_kit.mocks import ObjectStorer
 from tests.test_kit.stubs import TestStubs
 
@@ -65,6 +69,49 @@ BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
 
 
+class TestTopicRegistry:
+    def test_get_builds_topic_once_per_instrument(self):
+        # Arrange
+        registry = TopicRegistry("data.quotes")
+
+        # Act
+        topic1 = registry.get(ETHUSDT_BINANCE.id)
+        topic2 = registry.get(InstrumentId.from_str("ETH/USDT.BINANCE"))
+        topic3 = registry.get(BTCUSDT_BINANCE.id)
+
+        # Assert
+        assert topic1 == "data.quotes.BINANCE.ETH/USDT"
+        assert topic2 is topic1
+        assert topic3 == "data.quotes.BINANCE.BTC/USDT"
+        assert registry.get(ETHUSDT_BINANCE.id) is topic1
+        assert len(registry) == 2
+
+    def test_bar_topic_registry_get_returns_bar_topic(self):
+        # Arrange
+        registry = BarTopicRegistry()
+        bar_type = TestStubs.bartype_gbpusd_1min_bid()
+
+        # Act
+        topic = registry.get(bar_type)
+
+        # Assert
+        assert topic == f"data.bars.{bar_type}"
+        assert registry.get(BarType.from_str(str(bar_type))) is topic
+
+    def test_clear_removes_all_topics(self):
+        # Arrange
+        registry = TopicRegistry("data.trades")
+        topic = registry.get(ETHUSDT_BINANCE.id)
+
+        # Act
+        registry.clear()
+
+        # Assert
+        assert len(registry) == 0
+        assert registry.get(ETHUSDT_BINANCE.id) == topic
+        assert len(registry) == 1
+
+
 class TestDataEngine:
     def setup(self):
         # Fixture Setup
@@ -627,6 +674,24 @@ class TestDataEngine:
         # Assert
         assert self.data_engine.subscribed_instruments() == []
 
+    def test_process_new_instrument_adds_its_currencies_to_cache(self):
+        # Arrange
+        database = MockCacheDatabase(logger=self.logger)
+        cache = Cache(database=database, logger=self.logger)
+        data_engine = DataEngine(
+            msgbus=MessageBus(trader_id=self.trader_id, clock=self.clock, logger=self.logger),
+            cache=cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        # Act
+        data_engine.process(ETHUSDT_BINANCE)
+
+        # Assert
+        assert cache.instrument(ETHUSDT_BINANCE.id) == ETHUSDT_BINANCE
+        assert set(database.currencies) == {"ETH", "USDT"}
+
     def test_process_instrument_when_subscriber_then_sends_to_registered_handler(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
@@ -1221,6 +1286,32 @@ class TestDataEngine:
         # Assert
         assert handler == [tick]
 
+    def test_process_quote_tick_after_reset_sends_to_registered_handler(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        handler = []
+        self.msgbus.subscribe(topic="data.quotes.BINANCE.ETH/USDT", handler=handler.append)
+
+        tick = QuoteTick(
+            instrument_id=ETHUSDT_BINANCE.id,
+            bid=Price.from_str("100.003"),
+            ask=Price.from_str("100.003"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+        self.data_engine.process(tick)
+
+        # Act
+        self.data_engine.reset()
+        self.data_engine.process(tick)
+
+        # Assert
+        assert handler == [tick, tick]
+
     def test_process_quote_tick_when_subscribers_then_sends_to_registered_handlers(
         self,
     ):
@@ -33,6 +33,7 @@ from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
 from nautilus_trader.msgbus.bus import MessageBus
 from nautilus_trader.portfolio.portfolio import Portfolio
 from tests.test_kit.stubs import TestStubs
@@ -367,3 +368,188 @@ class TestLiveDataEngine:
 
         # Tear Down
         self.engine.stop()
+
+    def _engine_with_config(self, config):
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=config,
+        )
+
+    def test_instantiate_with_invalid_overflow_policy_raises_key_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(KeyError):
+            self._engine_with_config(LiveDataEngineConfig(overflow_policy="random"))
+
+    @pytest.mark.asyncio
+    async def test_data_qsize_at_max_with_drop_oldest_drops_oldest(self):
+        # Arrange
+        self._engine_with_config(LiveDataEngineConfig(qsize=2, overflow_policy="drop_oldest"))
+
+        tick1 = TestStubs.trade_tick_5decimal(price=Price.from_str("1.00001"))
+        tick2 = TestStubs.trade_tick_5decimal(price=Price.from_str("1.00002"))
+        tick3 = TestStubs.trade_tick_5decimal(price=Price.from_str("1.00003"))
+
+        # Act
+        self.engine.process(tick1)
+        self.engine.process(tick2)
+        self.engine.process(tick3)  # Add over max size
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.engine.data_qsize() == 2
+        assert self.engine.dropped_count == 1
+        assert self.engine.backlog_qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_process_quotes_with_conflate_when_full_keeps_latest_per_instrument(self):
+        # Arrange
+        self._engine_with_config(
+            LiveDataEngineConfig(qsize=2, drain_batch_size=10, overflow_policy="conflate"),
+        )
+        handler = []
+        self.msgbus.subscribe(topic="data.quotes*", handler=handler.append)
+
+        ticks = [
+            TestStubs.quote_tick_5decimal(bid=Price.from_str(f"1.0000{i}")) for i in range(1, 5)
+        ]
+
+        # Act
+        for tick in ticks:
+            self.engine.process(tick)
+        self.engine.start()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.engine.data_qsize() == 0
+        assert self.engine.dropped_count == 1
+        assert self.engine.conflated_count == 1
+        assert handler == [ticks[1], ticks[3]]
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_quotes_with_conflate_when_not_full_keeps_all(self):
+        # Arrange
+        self._engine_with_config(
+            LiveDataEngineConfig(drain_batch_size=10, overflow_policy="conflate"),
+        )
+        handler = []
+        self.msgbus.subscribe(topic="data.quotes*", handler=handler.append)
+
+        ticks = [
+            TestStubs.quote_tick_5decimal(bid=Price.from_str(f"1.0000{i}")) for i in range(1, 4)
+        ]
+
+        # Act
+        for tick in ticks:
+            self.engine.process(tick)
+        self.engine.start()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.engine.conflated_count == 0
+        assert handler == ticks
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_with_full_queue_does_not_raise(self):
+        # Arrange
+        self._engine_with_config(LiveDataEngineConfig(qsize=1))
+        self.engine.start()
+        self.engine.process(TestStubs.trade_tick_5decimal())
+
+        # Act
+        self.engine.stop()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.engine.data_qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_batched_consumer_processes_messages_and_data(self):
+        # Arrange
+        self._engine_with_config(LiveDataEngineConfig(drain_batch_size=2))
+        self.engine.start()
+
+        subscribe = Subscribe(
+            client_id=ClientId(BINANCE.value),
+            data_type=DataType(QuoteTick),
+            command_id=self.uuid_factory.generate(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.engine.execute(subscribe)
+        for _ in range(5):
+            self.engine.process(TestStubs.trade_tick_5decimal())
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.engine.message_qsize() == 0
+        assert self.engine.data_qsize() == 0
+        assert self.engine.command_count == 1
+        assert self.engine.data_count == 5
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_batched_consumer_parks_when_idle_and_wakes_on_data(self):
+        # Arrange
+        self._engine_with_config(LiveDataEngineConfig(drain_batch_size=2))
+        self.engine.start()
+        await asyncio.sleep(0.1)
+        task = self.engine.get_run_queue_task()
+
+        # Act
+        parked = task._fut_waiter is not None  # Awaiting a wakeup rather than spinning
+        self.engine.process(TestStubs.trade_tick_5decimal())
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert parked
+        assert task._fut_waiter is not None
+        assert self.engine.data_qsize() == 0
+        assert self.engine.data_count == 1
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_batched_consumer_with_full_queue_holds_data_on_backlog_in_order(self):
+        # Arrange
+        self._engine_with_config(LiveDataEngineConfig(qsize=1, drain_batch_size=1))
+        handler = []
+        self.msgbus.subscribe(topic="data.trades*", handler=handler.append)
+
+        ticks = [
+            TestStubs.trade_tick_5decimal(price=Price.from_str(f"1.0000{i}")) for i in range(1, 4)
+        ]
+
+        # Act
+        for tick in ticks:
+            self.engine.process(tick)
+        backlog_qsize = self.engine.backlog_qsize()
+        self.engine.start()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert backlog_qsize == 2
+        assert self.engine.backlog_qsize() == 0
+        assert self.engine.data_count == 3
+        assert handler == ticks
+
+        # Tear Down
+        self.engine.stop()
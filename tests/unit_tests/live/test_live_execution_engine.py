@@ -257,6 +257,94 @@ class TestLiveExecutionEngine:
         assert self.exec_engine.qsize() == 1
         assert self.exec_engine.command_count == 0
 
+    @pytest.mark.asyncio
+    async def test_batched_with_full_queue_holds_messages_on_backlog_in_order(self):
+        # Arrange
+        # Deregister test fixture ExecutionEngine from msgbus)
+        self.msgbus.deregister(endpoint="ExecEngine.execute", handler=self.exec_engine.execute)
+        self.msgbus.deregister(endpoint="ExecEngine.process", handler=self.exec_engine.process)
+
+        self.exec_engine = LiveExecutionEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveExecEngineConfig(qsize=1, drain_batch_size=10),
+        )
+
+        strategy = TradingStrategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order = strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        submit_order = SubmitOrder(
+            self.trader_id,
+            strategy.id,
+            None,
+            order,
+            self.uuid_factory.generate(),
+            self.clock.timestamp_ns(),
+        )
+
+        event = TestStubs.event_order_submitted(order)
+
+        # Act
+        self.exec_engine.execute(submit_order)
+        self.exec_engine.process(event)  # Add over max size
+        backlog_qsize = self.exec_engine.backlog_qsize()
+        self.exec_engine.start()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert backlog_qsize == 1
+        assert self.exec_engine.qsize() == 0
+        assert self.exec_engine.backlog_qsize() == 0
+        assert self.exec_engine.command_count == 1
+        assert self.exec_engine.event_count == 1
+
+        # Tear Down
+        self.exec_engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_batched_consumer_parks_when_idle(self):
+        # Arrange
+        # Deregister test fixture ExecutionEngine from msgbus)
+        self.msgbus.deregister(endpoint="ExecEngine.execute", handler=self.exec_engine.execute)
+        self.msgbus.deregister(endpoint="ExecEngine.process", handler=self.exec_engine.process)
+
+        self.exec_engine = LiveExecutionEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveExecEngineConfig(drain_batch_size=10),
+        )
+
+        # Act
+        self.exec_engine.start()
+        await asyncio.sleep(0.1)
+        task = self.exec_engine.get_run_queue_task()
+        parked = task._fut_waiter is not None  # Awaiting a wakeup rather than spinning
+        self.exec_engine.stop()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert parked
+        assert task.done()
+
     @pytest.mark.asyncio
     async def test_start(self):
         # Arrange, Act
@@ -0,0 +1,198 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import threading
+
+import pytest
+
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.live.sharding import EventLoopShard
+from nautilus_trader.msgbus.bus import MessageBus
+from tests.test_kit.stubs import TestStubs
+
+
+class TestEventLoopShard:
+    def setup(self):
+        # Fixture Setup
+        self.loop = asyncio.get_event_loop()
+
+        self.clock = LiveClock()
+        self.logger = Logger(self.clock)
+
+        self.msgbus = MessageBus(
+            trader_id=TestStubs.trader_id(),
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.shard = EventLoopShard(
+            name="SIM",
+            loop=self.loop,
+            msgbus=self.msgbus,
+            logger=self.logger,
+        )
+
+    def teardown(self):
+        self.shard.stop(timeout=1.0)
+
+    def test_instantiate(self):
+        # Arrange, Act, Assert
+        assert self.shard.name == "SIM"
+        assert not self.shard.is_running
+        assert self.shard.msgbus.trader_id == self.msgbus.trader_id
+        assert self.shard.msgbus.handoff_count == 0
+        assert self.shard.msgbus.handoff_latency_avg_ns == 0
+
+    def test_start_and_stop(self):
+        # Arrange, Act
+        self.shard.start()
+        running = self.shard.is_running
+        self.shard.stop(timeout=1.0)
+
+        # Assert
+        assert running
+        assert not self.shard.is_running
+        assert self.shard.loop.is_closed()
+
+    @pytest.mark.asyncio
+    async def test_create_task_from_core_thread_runs_on_shard_thread(self):
+        # Arrange
+        self.shard.start()
+        thread_ids = []
+
+        async def record_thread():
+            thread_ids.append(threading.get_ident())
+
+        # Act
+        future = self.shard.loop.create_task(record_thread())
+        await asyncio.wrap_future(future)
+
+        # Assert
+        assert thread_ids
+        assert thread_ids[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_send_from_shard_dispatches_on_core_loop_in_order(self):
+        # Arrange
+        received = []
+        thread_ids = set()
+
+        def handler(msg):
+            received.append(msg)
+            thread_ids.add(threading.get_ident())
+
+        self.msgbus.register(endpoint="DataEngine.process", handler=handler)
+        self.shard.start()
+
+        def send_all():
+            for i in range(100):
+                self.shard.msgbus.send(endpoint="DataEngine.process", msg=i)
+
+        # Act
+        self.shard.loop.call_soon_threadsafe(send_all)
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if len(received) == 100:
+                break
+
+        # Assert
+        assert received == list(range(100))
+        assert thread_ids == {threading.get_ident()}
+        assert self.shard.msgbus.handoff_count == 100
+        assert 1 <= self.shard.msgbus.handoff_batches <= 100
+        assert self.shard.msgbus.handoff_latency_max_ns > 0
+        assert self.shard.msgbus.pending_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_call_later_from_core_thread_runs_on_shard_thread(self):
+        # Arrange
+        self.shard.start()
+        fired = threading.Event()
+        thread_ids = []
+
+        def record_thread():
+            thread_ids.append(threading.get_ident())
+            fired.set()
+
+        # Act
+        self.shard.loop.call_later(0.01, record_thread)
+        fired.wait(1.0)
+
+        # Assert
+        assert thread_ids
+        assert thread_ids[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_cancel_timer_from_core_thread_does_not_run_callback(self):
+        # Arrange
+        self.shard.start()
+        fired = []
+
+        # Act
+        handle = self.shard.loop.call_at(self.shard.loop.time() + 0.01, fired.append, 1)
+        handle.cancel()
+        await asyncio.sleep(0.05)
+
+        # Assert
+        assert handle.cancelled()
+        assert fired == []
+
+    @pytest.mark.asyncio
+    async def test_run_in_executor_from_core_thread_returns_result(self):
+        # Arrange
+        self.shard.start()
+
+        # Act
+        future = self.shard.loop.run_in_executor(None, sum, [1, 2, 3])
+        result = await asyncio.wrap_future(future)
+
+        # Assert
+        assert result == 6
+
+    @pytest.mark.asyncio
+    async def test_publish_from_shard_dispatches_on_core_loop(self):
+        # Arrange
+        received = []
+        thread_ids = set()
+
+        def handler(msg):
+            received.append(msg)
+            thread_ids.add(threading.get_ident())
+
+        self.msgbus.subscribe(topic="events.*", handler=handler)
+        self.shard.start()
+
+        # Act
+        self.shard.loop.call_soon_threadsafe(self.shard.msgbus.publish, "events.test", "A")
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if received:
+                break
+
+        # Assert
+        assert received == ["A"]
+        assert thread_ids == {threading.get_ident()}
+
+    def test_subscribe_on_shard_raises_runtime_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(RuntimeError):
+            self.shard.msgbus.subscribe(topic="events.*", handler=print)
+
+    def test_unsubscribe_on_shard_raises_runtime_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(RuntimeError):
+            self.shard.msgbus.unsubscribe(topic="events.*", handler=print)
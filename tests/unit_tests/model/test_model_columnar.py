@@ -0,0 +1,177 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.model.data.columnar import QuoteTickColumns
+from nautilus_trader.model.data.columnar import TradeTickColumns
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+class TestQuoteTickColumns:
+    def test_instantiate_with_mismatched_column_lengths_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickColumns(
+                instrument_ids=[AUDUSD_SIM.id],
+                price_precisions=np.array([5], dtype=np.uint8),
+                size_precisions=np.array([0], dtype=np.uint8),
+                instrument_index=np.zeros(2, dtype=np.uint16),
+                bid=np.array([100000, 100001], dtype=np.int64),
+                ask=np.array([100001], dtype=np.int64),  # <-- too short
+                bid_size=np.array([1, 1], dtype=np.int64),
+                ask_size=np.array([1, 1], dtype=np.int64),
+                ts_event=np.array([0, 1], dtype=np.int64),
+                ts_init=np.array([0, 1], dtype=np.int64),
+            )
+
+    def test_instantiate_with_instrument_index_out_of_range_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickColumns(
+                instrument_ids=[AUDUSD_SIM.id],
+                price_precisions=np.array([5], dtype=np.uint8),
+                size_precisions=np.array([0], dtype=np.uint8),
+                instrument_index=np.array([0, 1], dtype=np.uint16),  # <-- no instrument 1
+                bid=np.array([100000, 100001], dtype=np.int64),
+                ask=np.array([100001, 100002], dtype=np.int64),
+                bid_size=np.array([1, 1], dtype=np.int64),
+                ask_size=np.array([1, 1], dtype=np.int64),
+                ts_event=np.array([0, 1], dtype=np.int64),
+                ts_init=np.array([0, 1], dtype=np.int64),
+            )
+
+    def test_get_item_builds_tick_from_raw_values(self):
+        # Arrange
+        columns = QuoteTickColumns(
+            instrument_ids=[AUDUSD_SIM.id, USDJPY_SIM.id],
+            price_precisions=np.array([5, 3], dtype=np.uint8),
+            size_precisions=np.array([0, 0], dtype=np.uint8),
+            instrument_index=np.array([0, 1], dtype=np.uint16),
+            bid=np.array([100000, 90002], dtype=np.int64),
+            ask=np.array([100001, 90005], dtype=np.int64),
+            bid_size=np.array([1, 2], dtype=np.int64),
+            ask_size=np.array([3, 4], dtype=np.int64),
+            ts_event=np.array([0, 1], dtype=np.int64),
+            ts_init=np.array([2, 3], dtype=np.int64),
+        )
+
+        # Act
+        tick = columns[1]
+
+        # Assert
+        assert len(columns) == 2
+        assert columns.instrument_ids() == [AUDUSD_SIM.id, USDJPY_SIM.id]
+        assert tick == QuoteTick(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.002"),
+            ask=Price.from_str("90.005"),
+            bid_size=Quantity.from_int(2),
+            ask_size=Quantity.from_int(4),
+            ts_event=1,
+            ts_init=3,
+        )
+        assert str(tick.bid) == "90.002"
+
+    def test_from_ticks_round_trip(self):
+        # Arrange
+        ticks = [
+            QuoteTick(
+                instrument_id=InstrumentId.from_str(instrument_id),
+                bid=Price.from_str(bid),
+                ask=Price.from_str(ask),
+                bid_size=Quantity.from_int(1_000_000),
+                ask_size=Quantity.from_int(2_000_000),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i, (instrument_id, bid, ask) in enumerate(
+                [
+                    ("AUD/USD.SIM", "1.00000", "1.00001"),
+                    ("USD/JPY.SIM", "90.002", "90.005"),
+                    ("AUD/USD.SIM", "0.99999", "1.00002"),
+                ],
+            )
+        ]
+
+        # Act
+        columns = QuoteTickColumns.from_ticks(ticks)
+
+        # Assert
+        assert len(columns) == 3
+        assert columns.instrument_index.tolist() == [0, 1, 0]
+        assert columns.bid.tolist() == [100000, 90002, 99999]
+        assert list(columns) == ticks
+
+    def test_from_ticks_with_inconsistent_precisions_raises_value_error(self):
+        # Arrange
+        ticks = [
+            QuoteTick(
+                instrument_id=AUDUSD_SIM.id,
+                bid=Price.from_str(bid),
+                ask=Price.from_str(bid),
+                bid_size=Quantity.from_int(1),
+                ask_size=Quantity.from_int(1),
+                ts_event=0,
+                ts_init=0,
+            )
+            for bid in ("1.00000", "1.000")
+        ]
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickColumns.from_ticks(ticks)
+
+
+class TestTradeTickColumns:
+    def test_from_ticks_round_trip(self):
+        # Arrange
+        ticks = [
+            TradeTick(
+                instrument_id=AUDUSD_SIM.id,
+                price=Price.from_str(price),
+                size=Quantity.from_str("10.5"),
+                aggressor_side=side,
+                trade_id=str(i),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i, (price, side) in enumerate(
+                [
+                    ("1.00000", AggressorSide.BUY),
+                    ("1.00001", AggressorSide.SELL),
+                ],
+            )
+        ]
+
+        # Act
+        columns = TradeTickColumns.from_ticks(ticks)
+
+        # Assert
+        assert len(columns) == 2
+        assert columns.size.tolist() == [105, 105]
+        assert columns[-1] == ticks[-1]
+        assert list(columns) == ticks
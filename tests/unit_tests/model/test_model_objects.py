@@ -336,6 +336,19 @@ class TestBaseDecimal:
         assert isinstance(result, expected_type)
         assert result == expected_value
 
+    def test_addition_and_subtraction_outside_raw_range_returns_decimal(self):
+        # Arrange
+        value1 = BaseDecimal(9_000_000_000, precision=9)
+        value2 = BaseDecimal(-9_000_000_000, precision=9)
+
+        # Act
+        result1 = value1 + value1
+        result2 = value1 - value2
+
+        # Assert
+        assert result1 == Decimal("18000000000.000000000")
+        assert result2 == Decimal("18000000000.000000000")
+
     @pytest.mark.parametrize(
         "value1, value2, expected_type, expected_value",
         [
@@ -583,8 +596,110 @@ class TestBaseDecimal:
         # Assert
         assert result == expected
 
+    @pytest.mark.parametrize(
+        "value, precision, expected",
+        [
+            [0, 0, 0],
+            [1, 2, 100],
+            [-1.1, 1, -11],
+            ["1.00001", 5, 100001],
+            [Decimal("1.235"), 2, 124],
+            [1.155, 2, 116],
+            [0.125, 2, 12],  # <-- half to even (as per float formatting)
+        ],
+    )
+    def test_raw_with_various_values_returns_expected_raw_value(self, value, precision, expected):
+        # Arrange, Act
+        result = BaseDecimal(value, precision)
+
+        # Assert
+        assert result.raw == expected
+
+    def test_instantiate_with_precision_greater_than_max_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            BaseDecimal(1, precision=19)
+
+    def test_instantiate_with_value_out_of_range_raises_overflow_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(OverflowError):
+            BaseDecimal(10_000_000_000, precision=10)
+
+    @pytest.mark.parametrize(
+        "value, precision",
+        [
+            [0, 0],
+            [1, 0],
+            [-1, 1],
+            [1.5, 1],
+            [-0.1, 3],
+            ["0.0000001", 7],
+            ["123456.789", 3],
+        ],
+    )
+    def test_hash_and_str_equal_decimal(self, value, precision):
+        # Arrange
+        decimal_object = BaseDecimal(value, precision)
+
+        # Act, Assert
+        assert hash(decimal_object) == hash(decimal_object.as_decimal())
+        assert str(decimal_object) == str(decimal_object.as_decimal())
+
+    def test_comparisons_with_different_precisions(self):
+        # Arrange
+        decimal1 = BaseDecimal(1.1, 1)
+        decimal2 = BaseDecimal(1.10, 2)
+        decimal3 = BaseDecimal(1.11, 2)
+
+        # Act, Assert
+        assert decimal1 == decimal2
+        assert decimal1 < decimal3
+        assert decimal3 > decimal1
+        assert hash(decimal1) == hash(decimal2)
+
 
 class TestPrice:
+    def test_from_raw_returns_expected_value(self):
+        # Arrange, Act
+        price = Price.from_raw(100001, 5)
+
+        # Assert
+        assert price == Price.from_str("1.00001")
+        assert str(price) == "1.00001"
+        assert price.precision == 5
+
+    def test_add_and_sub_returns_expected_price(self):
+        # Arrange
+        price1 = Price.from_str("1.00001")
+        price2 = Price.from_str("0.1")
+
+        # Act
+        result1 = price1.add(price2)
+        result2 = price2.sub(price1)
+
+        # Assert
+        assert isinstance(result1, Price)
+        assert str(result1) == "1.10001"
+        assert str(result2) == "-0.90001"
+
+    def test_add_with_rescale_out_of_range_raises_overflow_error(self):
+        # Arrange
+        price1 = Price.from_raw(10 ** 17, 0)
+        price2 = Price.from_raw(1, 9)
+
+        # Act, Assert
+        with pytest.raises(OverflowError):
+            price1.add(price2)
+
+    def test_sub_out_of_range_raises_overflow_error(self):
+        # Arrange
+        price1 = Price.from_raw(-(2 ** 63) + 1, 0)
+        price2 = Price.from_raw(2, 0)
+
+        # Act, Assert
+        with pytest.raises(OverflowError):
+            price1.sub(price2)
+
     def test_from_int_returns_expected_value(self):
         # Arrange, Act
         price = Price.from_int(100)
@@ -652,6 +767,39 @@ class TestQuantity:
         with pytest.raises(ValueError):
             Quantity(-1, 0)
 
+    def test_from_raw_with_negative_value_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            Quantity.from_raw(-1, 0)
+
+    def test_sub_with_negative_result_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            Quantity.from_int(1).sub(Quantity.from_int(2))
+
+    def test_add_and_sub_returns_expected_quantity(self):
+        # Arrange
+        qty1 = Quantity.from_str("1.5")
+        qty2 = Quantity.from_str("0.25")
+
+        # Act
+        result1 = qty1.add(qty2)
+        result2 = qty1.sub(qty2)
+
+        # Assert
+        assert isinstance(result1, Quantity)
+        assert str(result1) == "1.75"
+        assert str(result2) == "1.25"
+
+    def test_add_out_of_range_raises_overflow_error(self):
+        # Arrange
+        qty1 = Quantity.from_raw(2 ** 63 - 2, 0)
+        qty2 = Quantity.from_raw(2, 0)
+
+        # Act, Assert
+        with pytest.raises(OverflowError):
+            qty1.add(qty2)
+
     @pytest.mark.parametrize(
         "value, expected",
         [
@@ -793,6 +941,43 @@ class TestMoney:
         assert isinstance(hash(money0), int)
         assert hash(money0) == hash(money0)
 
+    def test_from_raw_returns_expected_money(self):
+        # Arrange, Act
+        money = Money.from_raw(100_050, USD)
+
+        # Assert
+        assert money == Money(1000.50, USD)
+        assert money.to_str() == "1_000.50 USD"
+
+    def test_add_and_sub_returns_expected_money(self):
+        # Arrange
+        money1 = Money(1.50, USD)
+        money2 = Money(0.25, USD)
+
+        # Act
+        result1 = money1.add(money2)
+        result2 = money2.sub(money1)
+
+        # Assert
+        assert result1 == Money(1.75, USD)
+        assert result2 == Money(-1.25, USD)
+
+    def test_add_with_different_currency_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            Money(1, USD).add(Money(1, AUD))
+
+    def test_add_and_sub_out_of_range_raises_overflow_error(self):
+        # Arrange
+        money1 = Money.from_raw(2 ** 63 - 2, USD)
+        money2 = Money.from_raw(-(2 ** 63) + 2, USD)
+
+        # Act, Assert
+        with pytest.raises(OverflowError):
+            money1.add(money1)
+        with pytest.raises(OverflowError):
+            money2.sub(money1)
+
     def test_str(self):
         # Arrange
         money0 = Money(0, USD)
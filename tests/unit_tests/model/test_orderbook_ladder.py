@@ -64,6 +64,52 @@ def test_insert():
     assert result == expected
 
 
+def test_insert_reverse_levels_sorted_descending():
+    ladder = Ladder(reverse=True, price_precision=0, size_precision=0)
+    for price in (100.0, 105.0, 101.0, 99.0, 103.0, 101.0):
+        ladder.add(order=Order(price=price, size=1.0, side=OrderSide.BUY))
+
+    assert ladder.prices() == [105.0, 103.0, 101.0, 100.0, 99.0]
+    assert ladder.top().price == 105.0
+
+
+def test_delete_level_keeps_remaining_levels_sorted():
+    orders = [
+        Order(price=100.0, size=1.0, side=OrderSide.BUY, id="1"),
+        Order(price=102.0, size=1.0, side=OrderSide.BUY, id="2"),
+        Order(price=101.0, size=1.0, side=OrderSide.BUY, id="3"),
+    ]
+    ladder = TestStubs.ladder(reverse=True, orders=orders)
+    ladder.delete(orders[1])
+    ladder.add(Order(price=100.5, size=1.0, side=OrderSide.BUY, id="4"))
+
+    assert ladder.prices() == [101.0, 100.5, 100.0]
+    assert ladder.top().price == 101.0
+
+
+def test_update_order_to_new_price_moves_level():
+    order = Order(price=100.0, size=10.0, side=OrderSide.SELL, id="1")
+    ladder = TestStubs.ladder(reverse=False, orders=[order])
+    ladder.add(Order(price=101.0, size=10.0, side=OrderSide.SELL, id="2"))
+    ladder.update(Order(price=102.0, size=10.0, side=OrderSide.SELL, id="1"))
+
+    assert ladder.prices() == [101.0, 102.0]
+
+
+def test_update_no_volume_then_re_add_same_id():
+    order = Order(price=100.0, size=10.0, side=OrderSide.SELL, id="1")
+    ladder = TestStubs.ladder(reverse=False, orders=[order])
+    ladder.update(Order(price=100.0, size=0.0, side=OrderSide.SELL, id="1"))
+    ladder.update(Order(price=100.0, size=5.0, side=OrderSide.SELL, id="1"))
+
+    assert ladder.volumes() == [5.0]
+
+
+def test_top_level_empty_ladder_returns_none():
+    ladder = Ladder(reverse=False, price_precision=2, size_precision=2)
+    assert ladder.top() is None
+
+
 def test_delete_individual_order(asks):
     orders = [
         Order(price=100.0, size=10.0, side=OrderSide.BUY, id="1"),
@@ -108,7 +154,7 @@ def test_exposure():
         Order(price=105.0, size=5.0, side=OrderSide.SELL),
     ]
     ladder = TestStubs.ladder(reverse=True, orders=orders)
-    assert tuple(ladder.exposures()) == (525.0, 1000.0, 1010.0)
+    assert tuple(ladder.exposures()) == (525.0, 1010.0, 1000.0)
 
 
 def test_repr(asks):
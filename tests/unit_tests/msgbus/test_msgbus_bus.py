@@ -408,3 +408,66 @@ class TestMessageBus:
         assert "OK!" in subscriber1
         assert "OK!" in subscriber2
         assert self.msgbus.pub_count == 1
+
+    def test_subscribe_after_publish_updates_cached_topic(self):
+        # Arrange
+        subscriber = []
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", "QUOTE1")
+
+        # Act
+        self.msgbus.subscribe(topic="data.quotes.SIM.*", handler=subscriber.append)
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", "QUOTE2")
+
+        # Assert
+        assert subscriber == ["QUOTE2"]
+
+    def test_unsubscribe_after_publish_updates_cached_topic(self):
+        # Arrange
+        subscriber = []
+        self.msgbus.subscribe(topic="data.quotes.*", handler=subscriber.append)
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", "QUOTE1")
+
+        # Act
+        self.msgbus.unsubscribe(topic="data.quotes.*", handler=subscriber.append)
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", "QUOTE2")
+
+        # Assert
+        assert subscriber == ["QUOTE1"]
+
+    def test_publish_with_equal_priorities_sends_in_subscription_order(self):
+        # Arrange
+        received = []
+        self.msgbus.subscribe(topic="data.*", handler=lambda m: received.append(1))
+        self.msgbus.subscribe(topic="data.quotes.SIM", handler=lambda m: received.append(2))
+        self.msgbus.subscribe(topic="data.quotes.S?M", handler=lambda m: received.append(3))
+        self.msgbus.subscribe(topic="*", handler=lambda m: received.append(4), priority=1)
+
+        # Act
+        self.msgbus.publish("data.quotes.SIM", "QUOTE")
+
+        # Assert
+        assert received == [4, 1, 2, 3]
+
+    def test_publish_beyond_topic_cache_size_evicts_oldest_topics(self):
+        # Arrange
+        msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+            topic_cache_size=2,
+        )
+        subscriber = []
+        msgbus.subscribe(topic="data.*", handler=subscriber.append)
+
+        # Act
+        msgbus.publish("data.1", "A")
+        msgbus.publish("data.2", "B")
+        msgbus.publish("data.1", "C")  # Cached
+        msgbus.publish("data.3", "D")  # Evicts data.1
+        msgbus.unsubscribe(topic="data.*", handler=subscriber.append)
+        msgbus.publish("data.1", "E")
+        msgbus.publish("data.2", "F")
+        msgbus.publish("data.3", "G")
+
+        # Assert
+        assert subscriber == ["A", "B", "C", "D"]
@@ -0,0 +1,98 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.msgbus.subscription import Subscription
+from nautilus_trader.msgbus.trie import SubscriptionTrie
+
+
+class TestSubscriptionTrie:
+    def setup(self):
+        # Fixture Setup
+        self.trie = SubscriptionTrie()
+
+    def test_instantiate_trie(self):
+        # Arrange, Act, Assert
+        assert len(self.trie) == 0
+        assert self.trie.match("data.quotes.SIM.AUD/USD") == []
+
+    def test_add_duplicate_subscription_raises_value_error(self):
+        # Arrange
+        sub = Subscription(topic="data.*", handler=[].append)
+        self.trie.add(sub)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.trie.add(sub)
+
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            ["*", True],
+            ["data.*", True],
+            ["data.quotes*", True],
+            ["data.*.BINANCE.*", True],
+            ["data.trades.BINANCE.ETH*", True],
+            ["data.trades.BINANCE.???/USDT", True],
+            ["data.trades.BINANCE.ETH/USDT", True],
+            ["data.trades.BINANCE", False],
+            ["data.trades.BINANCE.ETH/USDT.*", False],
+            ["data.quotes.*", False],
+            ["data.trades.BINANCE.??/USDT", False],
+        ],
+    )
+    def test_match_given_various_patterns(self, pattern, expected):
+        # Arrange
+        sub = Subscription(topic=pattern, handler=[].append)
+        self.trie.add(sub)
+
+        # Act
+        result = self.trie.match("data.trades.BINANCE.ETH/USDT")
+
+        # Assert
+        assert (result == [sub]) == expected
+
+    def test_match_returns_subscriptions_in_order_added(self):
+        # Arrange
+        sub1 = Subscription(topic="data.quotes.SIM", handler=[].append)
+        sub2 = Subscription(topic="*", handler=[].append)
+        sub3 = Subscription(topic="data.*", handler=[].append)
+        self.trie.add(sub1)
+        self.trie.add(sub2)
+        self.trie.add(sub3)
+
+        # Act
+        result = self.trie.match("data.quotes.SIM")
+
+        # Assert
+        assert result == [sub1, sub2, sub3]
+
+    def test_remove_subscription(self):
+        # Arrange
+        sub1 = Subscription(topic="data.quotes.SIM", handler=[].append)
+        sub2 = Subscription(topic="data.quotes.*", handler=[].append)
+        self.trie.add(sub1)
+        self.trie.add(sub2)
+
+        # Act
+        removed1 = self.trie.remove(sub1)
+        removed2 = self.trie.remove(sub1)
+
+        # Assert
+        assert removed1
+        assert not removed2
+        assert len(self.trie) == 1
+        assert self.trie.match("data.quotes.SIM") == [sub2]
@@ -15,6 +15,8 @@
 
 import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import fsspec
@@ -33,8 +35,13 @@ from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.external.core import RawFile
+from nautilus_trader.persistence.external.core import TableBuffer
+from nautilus_trader.persistence.external.core import _swap_compacted_fragments
 from nautilus_trader.persistence.external.core import _validate_dataset
+from nautilus_trader.persistence.external.core import compact_data_catalog
+from nautilus_trader.persistence.external.core import compact_dataset
 from nautilus_trader.persistence.external.core import dicts_to_dataframes
+from nautilus_trader.persistence.external.core import ingest_files
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.core import process_raw_file
 from nautilus_trader.persistence.external.core import scan_files
@@ -43,7 +50,12 @@ from nautilus_trader.persistence.external.core import validate_data_catalog
 from nautilus_trader.persistence.external.core import write_objects
 from nautilus_trader.persistence.external.core import write_parquet
 from nautilus_trader.persistence.external.core import write_tables
+from nautilus_trader.persistence.external.metadata import list_fragments
+from nautilus_trader.persistence.external.metadata import load_fragment_index
+from nautilus_trader.persistence.external.metadata import write_fragment_index
 from nautilus_trader.persistence.external.readers import CSVReader
+from nautilus_trader.persistence.util import clear_singleton_instances
+from nautilus_trader.serialization.arrow.serializer import get_schema
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.mocks import MockReader
@@ -405,6 +417,143 @@ class TestPersistenceCore:
         expected = {TEST_DATA + "/1.166564490.bz2": 2908}
         assert results == expected
 
+    def test_ingest_files(self):
+        # Arrange
+        instrument_provider = BetfairInstrumentProvider.from_instruments([])
+
+        # Act
+        result = ingest_files(
+            glob_path=f"{TEST_DATA_DIR}/**.bz2",
+            reader=BetfairTestStubs.betfair_reader(instrument_provider=instrument_provider),
+            catalog=self.catalog,
+        )
+
+        # Assert
+        assert result == {
+            TEST_DATA_DIR + "/1.166564490.bz2": 2908,
+            TEST_DATA_DIR + "/betfair/1.180305278.bz2": 17085,
+            TEST_DATA_DIR + "/betfair/1.166811431.bz2": 22692,
+        }
+
+    def test_ingest_files_matches_process_files(self):
+        # Arrange
+        instrument_provider = BetfairInstrumentProvider.from_instruments([])
+        process_files(
+            glob_path=f"{TEST_DATA}/1.166564490*.bz2",
+            reader=BetfairTestStubs.betfair_reader(instrument_provider=instrument_provider),
+            catalog=self.catalog,
+        )
+        columns = ["ts_init", "trade_id", "price", "size"]
+        expected = sorted(map(tuple, self.catalog.trade_ticks()[columns].values.tolist()))
+        data_catalog_setup()
+        self.catalog = DataCatalog.from_env()
+
+        # Act
+        instrument_provider = BetfairInstrumentProvider.from_instruments([])
+        ingest_files(
+            glob_path=f"{TEST_DATA}/1.166564490*.bz2",
+            reader=BetfairTestStubs.betfair_reader(instrument_provider=instrument_provider),
+            catalog=self.catalog,
+            block_size="5kb",
+            row_group_size=50,
+        )
+        result = sorted(map(tuple, self.catalog.trade_ticks()[columns].values.tolist()))
+
+        # Assert
+        assert len(result) == 114
+        assert result == expected
+        assert len(self.catalog.instruments()) == 2
+
+    def test_ingest_files_with_executor(self):
+        # Arrange
+        instrument_provider = BetfairInstrumentProvider.from_instruments([])
+
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = ingest_files(
+                glob_path=f"{TEST_DATA_DIR}/**.bz2",
+                reader=BetfairTestStubs.betfair_reader(instrument_provider=instrument_provider),
+                catalog=self.catalog,
+                executor=executor,
+                max_in_flight=2,
+            )
+
+        # Assert
+        assert result == {
+            TEST_DATA_DIR + "/1.166564490.bz2": 2908,
+            TEST_DATA_DIR + "/betfair/1.180305278.bz2": 17085,
+            TEST_DATA_DIR + "/betfair/1.166811431.bz2": 22692,
+        }
+
+    def test_ingest_files_with_process_pool_executor(self, tmp_path):
+        # Arrange
+        # Worker processes can't share a memory filesystem, so use a local catalog
+        clear_singleton_instances(DataCatalog)
+        catalog = DataCatalog(path=str(tmp_path), fs_protocol="file")
+        instrument_provider = BetfairInstrumentProvider.from_instruments([])
+
+        # Act
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result = ingest_files(
+                glob_path=f"{TEST_DATA}/1.166564490*.bz2",
+                reader=BetfairTestStubs.betfair_reader(instrument_provider=instrument_provider),
+                catalog=catalog,
+                executor=executor,
+                row_group_size=50,
+            )
+
+        # Assert
+        assert result == {TEST_DATA + "/1.166564490.bz2": 2908}
+        assert len(catalog.trade_ticks()) == 114
+        assert len(catalog.instruments()) == 2
+
+    def test_ingest_files_appends_only_new_instruments(self):
+        # Arrange
+        def ingest():
+            instrument_provider = BetfairInstrumentProvider.from_instruments([])
+            ingest_files(
+                glob_path=f"{TEST_DATA}/1.166564490*.bz2",
+                reader=BetfairTestStubs.betfair_reader(instrument_provider=instrument_provider),
+                catalog=self.catalog,
+            )
+
+        ingest()
+        path = f"{self.catalog.path}/data/betting_instrument.parquet"
+        files = ds.dataset(path, filesystem=self.fs).files
+
+        # Act
+        ingest()
+
+        # Assert
+        assert ds.dataset(path, filesystem=self.fs).files == files
+        assert len(self.catalog.instruments()) == 2
+
+    def test_table_buffer_to_table_sorts_by_ts_init(self):
+        # Arrange
+        buffer = TableBuffer(cls=QuoteTick, schema=get_schema(QuoteTick))
+        for ts in (3, 1, 2):
+            buffer.append(
+                {
+                    "instrument_id": "AUD/USD.SIM",
+                    "bid": "0.80",
+                    "ask": "0.81",
+                    "bid_size": "1000",
+                    "ask_size": "1000",
+                    "ts_event": ts,
+                    "ts_init": ts,
+                }
+            )
+
+        # Act
+        mappings = buffer.clean_partition_cols(partition_cols=["instrument_id"])
+        table = buffer.to_table()
+
+        # Assert
+        assert mappings == {"instrument_id": {"AUD/USD.SIM": "AUD-USD.SIM"}}
+        assert table.column("ts_init").to_pylist() == [1, 2, 3]
+        assert table.column("instrument_id").to_pylist() == ["AUD-USD.SIM"] * 3
+        assert table.schema == get_schema(QuoteTick)
+
     def test_repartition_dataset(self):
         # Arrange
         catalog = DataCatalog.from_env()
@@ -479,6 +628,123 @@ class TestPersistenceCore:
         ]
         assert new_partitions == expected
 
+    def _write_quote_ticks(self, timestamps):
+        # Write each tick separately, leaving one small file per tick
+        for ts in timestamps:
+            tick = QuoteTick(
+                instrument_id=TestStubs.audusd_id(),
+                bid=Price.from_str("0.80"),
+                ask=Price.from_str("0.81"),
+                bid_size=Quantity.from_int(1000),
+                ask_size=Quantity.from_int(1000),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            write_objects(catalog=self.catalog, chunk=[tick])
+        return f"{self.catalog.path}/data/quote_tick.parquet"
+
+    def test_compact_dataset_merges_small_files(self):
+        # Arrange
+        day = 86_400_000_000_000
+        path = self._write_quote_ticks([4 * day, 1 * day, 3 * day, 2 * day, 5 * day])
+        original = self.fs.glob(f"{path}/**/*.parquet")
+
+        # Act
+        result = compact_dataset(catalog=self.catalog, path=path)
+
+        # Assert
+        files = self.fs.glob(f"{path}/**/*.parquet")
+        index = load_fragment_index(fs=self.fs, path=path)
+        assert len(original) == 5
+        assert result == {"removed": 5, "added": 1}
+        assert len(files) == 1
+        ((key, entry),) = index.items()
+        assert files[0].endswith(key)
+        assert entry["num_rows"] == 5
+        assert entry["ts_init"] == [1 * day, 5 * day]
+        ticks = self.catalog.quote_ticks()
+        assert ticks["ts_init"].tolist() == [1 * day, 2 * day, 3 * day, 4 * day, 5 * day]
+
+    def test_compact_dataset_by_date(self):
+        # Arrange
+        day = 86_400_000_000_000
+        path = self._write_quote_ticks([day, day + 1, 2 * day, 2 * day + 1, 2 * day + 2])
+
+        # Act
+        result = compact_dataset(catalog=self.catalog, path=path, date_format="%Y%m%d")
+
+        # Assert
+        index = load_fragment_index(fs=self.fs, path=path)
+        assert result == {"removed": 5, "added": 2}
+        assert sorted(entry["num_rows"] for entry in index.values()) == [2, 3]
+        assert len(self.catalog.quote_ticks()) == 5
+
+    def test_compact_dataset_leaves_files_at_target_size(self):
+        # Arrange
+        path = self._write_quote_ticks([1, 2, 3])
+        original = sorted(self.fs.glob(f"{path}/**/*.parquet"))
+
+        # Act
+        result = compact_dataset(catalog=self.catalog, path=path, target_file_size=1)
+
+        # Assert
+        assert result == {"removed": 0, "added": 0}
+        assert sorted(self.fs.glob(f"{path}/**/*.parquet")) == original
+
+    def test_compact_dataset_hides_compacted_files_while_staged(self):
+        # Arrange
+        path = self._write_quote_ticks([1, 2, 3])
+        rows_before_swap = []
+
+        def count_rows_then_swap(**kwargs):
+            # Readers discovering the dataset (ignoring the index) mid-compaction
+            rows_before_swap.append(ds.dataset(path, filesystem=self.fs).to_table().num_rows)
+            _swap_compacted_fragments(**kwargs)
+
+        # Act
+        with patch(
+            "nautilus_trader.persistence.external.core._swap_compacted_fragments",
+            side_effect=count_rows_then_swap,
+        ):
+            result = compact_dataset(catalog=self.catalog, path=path)
+
+        # Assert
+        assert result == {"removed": 3, "added": 1}
+        assert rows_before_swap == [3]
+        assert ds.dataset(path, filesystem=self.fs).to_table().num_rows == 3
+        assert len(self.fs.glob(f"{path}/**/*.parquet")) == 1
+
+    def test_compact_dataset_writes_index_once_files_in_place(self):
+        # Arrange
+        path = self._write_quote_ticks([1, 2, 3])
+        files_at_write = []
+
+        def list_then_write(fs, path, index):
+            files_at_write.append(set(list_fragments(fs=fs, path=path)))
+            write_fragment_index(fs=fs, path=path, index=index)
+
+        # Act
+        with patch(
+            "nautilus_trader.persistence.external.core.write_fragment_index",
+            side_effect=list_then_write,
+        ):
+            compact_dataset(catalog=self.catalog, path=path)
+
+        # Assert
+        assert files_at_write == [set(load_fragment_index(fs=self.fs, path=path))]
+
+    def test_compact_data_catalog(self):
+        # Arrange
+        self._loaded_data_into_catalog()
+        expected = len(self.catalog.trade_ticks())
+
+        # Act
+        results = compact_data_catalog(catalog=self.catalog)
+
+        # Assert
+        assert set(results) == set(self.catalog.list_data_types())
+        assert len(self.catalog.trade_ticks()) == expected
+
     def test_split_and_serialize_generic_data_gets_correct_class(self):
         # Arrange
         TestStubs.setup_news_event_persistence()
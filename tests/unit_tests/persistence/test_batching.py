@@ -16,6 +16,7 @@
 import sys
 
 import fsspec
+import pyarrow as pa
 import pytest
 from dask.utils import parse_bytes
 
@@ -23,11 +24,21 @@ from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.backtest.config import BacktestDataConfig
 from nautilus_trader.backtest.config import BacktestRunConfig
 from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.data.venue import InstrumentStatusUpdate
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.persistence.batching import _deserialize_rows
 from nautilus_trader.persistence.batching import batch_files
+from nautilus_trader.persistence.batching import table_to_nautilus
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.readers import CSVReader
+from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
+from nautilus_trader.serialization.arrow.serializer import get_schema
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.mocks import NewsEventData
@@ -86,6 +97,61 @@ class TestPersistenceBatching:
             latest_timestamp = max(timestamps)
             assert timestamps == sorted(timestamps)
 
+    def test_batch_files_replays_all_data_in_order(self):
+        # Arrange
+        instrument_ids = self.catalog.instruments()["id"].unique().tolist()
+        base = BacktestDataConfig(
+            catalog_path=str(self.catalog.path),
+            catalog_fs_protocol=self.catalog.fs.protocol,
+            data_cls_path="nautilus_trader.model.orderbook.data.OrderBookData",
+        )
+        # Act
+        result = []
+        for batch in batch_files(
+            catalog=self.catalog,
+            data_configs=[
+                base.replace(instrument_id=instrument_ids[0]),
+                base.replace(instrument_id=instrument_ids[1]),
+            ],
+            target_batch_size_bytes=parse_bytes("10kib"),
+            read_num_rows=100,
+        ):
+            result.extend(batch)
+
+        # Assert
+        timestamps = [x.ts_init for x in result]
+        assert timestamps == sorted(timestamps)
+        assert {x.instrument_id.value for x in result} == set(instrument_ids[:2])
+
+    def test_batch_files_trade_ticks_match_catalog(self):
+        # Arrange
+        instrument_ids = self.catalog.instruments()["id"].unique().tolist()
+        base = BacktestDataConfig(
+            catalog_path=str(self.catalog.path),
+            catalog_fs_protocol=self.catalog.fs.protocol,
+            data_cls_path="nautilus_trader.model.data.tick.TradeTick",
+        )
+        expected = self.catalog.trade_ticks(instrument_ids=instrument_ids[:2], as_nautilus=True)
+
+        # Act
+        result = []
+        for batch in batch_files(
+            catalog=self.catalog,
+            data_configs=[
+                base.replace(instrument_id=instrument_ids[0]),
+                base.replace(instrument_id=instrument_ids[1]),
+            ],
+            read_num_rows=50,
+        ):
+            result.extend(batch)
+
+        # Assert
+        assert len(result) == len(expected)
+        assert [x.ts_init for x in result] == sorted(x.ts_init for x in result)
+        assert sorted(result, key=lambda x: (x.ts_init, x.trade_id)) == sorted(
+            expected, key=lambda x: (x.ts_init, x.trade_id)
+        )
+
     def test_batch_generic_data(self):
         # Arrange
         TestStubs.setup_news_event_persistence()
@@ -121,3 +187,108 @@ class TestPersistenceBatching:
 
         # Assert
         assert node
+
+
+class TestTableToNautilus:
+    @staticmethod
+    def _to_table(objs, cls, drop=()):
+        rows = [ParquetSerializer.serialize(obj) for obj in objs]
+        columns = {}
+        for field in get_schema(cls):
+            if field.name in drop:
+                continue
+            values = [row[field.name] for row in rows]
+            if pa.types.is_dictionary(field.type):
+                columns[field.name] = pa.array(values).dictionary_encode()
+            else:
+                columns[field.name] = pa.array(values, type=field.type)
+        return pa.Table.from_pydict(columns)
+
+    def test_quote_ticks_decoded_from_columns(self):
+        # Arrange
+        ticks = [
+            QuoteTick(
+                instrument_id=InstrumentId.from_str(instrument_id),
+                bid=Price.from_str(bid),
+                ask=Price.from_str(ask),
+                bid_size=Quantity.from_str("1000000"),
+                ask_size=Quantity.from_str("2000000.5"),
+                ts_event=i,
+                ts_init=i + 1,
+            )
+            for i, (instrument_id, bid, ask) in enumerate(
+                [
+                    ("AUD/USD.SIM", "1.00000", "1.00001"),
+                    ("USD/JPY.SIM", "90.002", "90.005"),
+                    ("AUD/USD.SIM", "-0.00001", "0.00002"),
+                ],
+            )
+        ]
+        table = self._to_table(ticks, QuoteTick)
+
+        # Act
+        result = table_to_nautilus(table=table, cls=QuoteTick)
+
+        # Assert
+        assert result == ticks
+        assert result == _deserialize_rows(table=table, cls=QuoteTick, instrument_id=None)
+        assert [str(x.bid) for x in result] == ["1.00000", "90.002", "-0.00001"]
+
+    def test_quote_ticks_with_mixed_precisions_decoded_per_row(self):
+        # Arrange
+        ticks = [
+            QuoteTick(
+                instrument_id=TestStubs.audusd_id(),
+                bid=Price.from_str(bid),
+                ask=Price.from_str(bid),
+                bid_size=Quantity.from_int(1),
+                ask_size=Quantity.from_int(1),
+                ts_event=0,
+                ts_init=0,
+            )
+            for bid in ("1.00000", "1.000")
+        ]
+
+        # Act
+        result = table_to_nautilus(table=self._to_table(ticks, QuoteTick), cls=QuoteTick)
+
+        # Assert
+        assert result == ticks
+        assert [x.bid.precision for x in result] == [5, 3]
+
+    def test_trade_ticks_decoded_from_columns_with_partition_instrument_id(self):
+        # Arrange
+        ticks = [
+            TradeTick(
+                instrument_id=TestStubs.audusd_id(),
+                price=Price.from_str(price),
+                size=Quantity.from_str("10.5"),
+                aggressor_side=side,
+                trade_id=str(i),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i, (price, side) in enumerate(
+                [
+                    ("1.00000", AggressorSide.BUY),
+                    ("1.00001", AggressorSide.SELL),
+                    ("1.00002", AggressorSide.BUY),
+                ],
+            )
+        ]
+        table = self._to_table(ticks, TradeTick, drop=("instrument_id",))
+
+        # Act
+        result = table_to_nautilus(
+            table=table,
+            cls=TradeTick,
+            instrument_id=TestStubs.audusd_id().value,
+        )
+
+        # Assert
+        assert result == ticks
+        assert [x.aggressor_side for x in result] == [
+            AggressorSide.BUY,
+            AggressorSide.SELL,
+            AggressorSide.BUY,
+        ]
@@ -192,6 +192,145 @@ class TestPersistenceCatalog:
         filtered_deltas = self.catalog.order_book_deltas(filter_expr=ds.field("action") == "DELETE")
         assert len(filtered_deltas) == 351
 
+    def test_data_catalog_fragment_index_maintained_on_write(self):
+        # Arrange
+        path = f"{self.catalog.path}/data/trade_tick.parquet"
+        files = ds.dataset(path, filesystem=self.fs).files
+
+        # Act
+        index = self.catalog.fragment_index(path=path)
+
+        # Assert
+        assert set(index) == {fn[len(path) + 1 :] for fn in files}
+        assert sum(entry["num_rows"] for entry in index.values()) == 312
+        assert all(list(entry["partition"]) == ["instrument_id"] for entry in index.values())
+        assert all(entry["ts_init"][0] <= entry["ts_init"][1] for entry in index.values())
+
+    def test_data_catalog_fragment_index_cached_until_written(self):
+        # Arrange
+        path = f"{self.catalog.path}/data/quote_tick.parquet"
+        self._write_quote_tick(ts=0)
+        index1 = self.catalog.fragment_index(path=path)
+
+        # Act
+        index2 = self.catalog.fragment_index(path=path)
+        self._write_quote_tick(ts=1_000_000_000)
+        index3 = self.catalog.fragment_index(path=path)
+
+        # Assert
+        assert index2 is index1
+        assert len(index1) == 1
+        assert len(index3) == 2
+
+    def test_data_catalog_query_prunes_fragments_by_time_range(self):
+        # Arrange
+        path = f"{self.catalog.path}/data/quote_tick.parquet"
+        for ts in (0, 1_000_000_000, 2_000_000_000):
+            self._write_quote_tick(ts=ts)
+
+        # Act
+        fragments = self.catalog._prune_fragments(
+            path=path,
+            partition_values={"instrument_id": ["AUD/USD.SIM"]},
+            ts_column="ts_event",
+            start=500_000_000,
+            end=None,
+        )
+        ticks = self.catalog.quote_ticks(instrument_ids=["AUD/USD.SIM"], start=500_000_000)
+
+        # Assert
+        assert len(fragments) == 2
+        assert len(ticks) == 2
+
+    def test_data_catalog_query_prunes_fragments_by_instrument_id(self):
+        # Arrange
+        path = f"{self.catalog.path}/data/quote_tick.parquet"
+        self._write_quote_tick(ts=0)
+
+        # Act
+        fragments = self.catalog._prune_fragments(
+            path=path,
+            partition_values={"instrument_id": ["GBP/USD.SIM"]},
+            ts_column="ts_event",
+            start=None,
+            end=None,
+        )
+
+        # Assert
+        assert fragments == []
+
+    def test_data_catalog_query_pruned_to_no_fragments_returns_empty(self):
+        # Arrange
+        self._write_quote_tick(ts=0)
+
+        # Act
+        df = self.catalog.quote_ticks(instrument_ids=["GBP/USD.SIM"], raise_on_empty=False)
+        ticks = self.catalog.quote_ticks(instrument_ids=["GBP/USD.SIM"], as_nautilus=True)
+
+        # Assert
+        assert df.empty
+        assert ticks == []
+
+    def test_data_catalog_fragment_index_not_rewritten_by_readers(self):
+        # Arrange
+        path = f"{self.catalog.path}/data/quote_tick.parquet"
+        self._write_quote_tick(ts=0)
+        (key,) = self.catalog.fragment_index(path=path)
+        added = key.replace(".parquet", "-copy.parquet")
+
+        # Act
+        self.fs.copy(f"{path}/{key}", f"{path}/{added}")
+        index = self.catalog.fragment_index(path=path)
+
+        # Assert
+        assert set(index) == {key}
+
+    def test_data_catalog_fragment_index_resynced_by_rebuild(self):
+        # Arrange
+        path = f"{self.catalog.path}/data/quote_tick.parquet"
+        for ts in (0, 1_000_000_000):
+            self._write_quote_tick(ts=ts)
+        removed = sorted(self.catalog.fragment_index(path=path))[0]
+
+        # Act
+        self.fs.rm(f"{path}/{removed}")
+        index = self.catalog.rebuild_fragment_index(path=path)
+        ticks = self.catalog.quote_ticks()
+
+        # Assert
+        assert removed not in index
+        assert self.catalog.fragment_index(path=path) is index
+        assert len(ticks) == 1
+
+    def test_data_catalog_fragment_index_resynced_on_write(self):
+        # Arrange
+        path = f"{self.catalog.path}/data/quote_tick.parquet"
+        self._write_quote_tick(ts=0)
+        (key,) = self.catalog.fragment_index(path=path)
+        added = key.replace(".parquet", "-copy.parquet")
+
+        # Act
+        self.fs.copy(f"{path}/{key}", f"{path}/{added}")
+        self._write_quote_tick(ts=1_000_000_000)
+        index = self.catalog.fragment_index(path=path)
+
+        # Assert
+        assert {key, added} < set(index)
+        assert len(index) == 3
+        assert index[added]["num_rows"] == 1
+
+    def _write_quote_tick(self, ts: int):
+        tick = QuoteTick(
+            instrument_id=TestStubs.audusd_id(),
+            bid=Price.from_str("0.80"),
+            ask=Price.from_str("0.81"),
+            bid_size=Quantity.from_int(1000),
+            ask_size=Quantity.from_int(1000),
+            ts_event=ts,
+            ts_init=ts,
+        )
+        write_objects(catalog=self.catalog, chunk=[tick])
+
     def test_data_catalog_generic_data(self):
         TestStubs.setup_news_event_persistence()
         process_files(
@@ -16,6 +16,7 @@
 import sys
 from collections import Counter
 
+import pyarrow as pa
 import pytest
 
 from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
@@ -26,6 +27,7 @@ from nautilus_trader.model.data.venue import InstrumentStatusUpdate
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.readers import CSVReader
+from nautilus_trader.persistence.streaming import FeatherWriter
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.mocks import NewsEventData
@@ -94,6 +96,21 @@ class TestPersistenceStreaming:
         }
         assert result == expected
 
+    def test_feather_writer_writes_buffered_rows_in_batches(self):
+        # Arrange
+        self.fs.mkdir("/root/backtest")
+        writer = FeatherWriter(path="/root/backtest/run.feather", fs_protocol="memory", max_rows=5)
+
+        # Act
+        for _ in range(12):
+            writer.write(TestStubs.trade_tick_5decimal())
+        writer.close()
+
+        # Assert
+        with self.fs.open("/root/backtest/run.feather/TradeTick.feather") as f:
+            batches = list(pa.ipc.open_stream(f))
+        assert [batch.num_rows for batch in batches] == [5, 5, 2]
+
     def test_feather_writer_generic_data(self):
         # Arrange
         TestStubs.setup_news_event_persistence()
@@ -15,6 +15,8 @@
 
 from decimal import Decimal
 
+import pytest
+
 from nautilus_trader.accounting.factory import AccountFactory
 from nautilus_trader.adapters.betfair.common import BETFAIR_VENUE
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
@@ -44,6 +46,7 @@ from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.position import Position
 from nautilus_trader.msgbus.bus import MessageBus
+from nautilus_trader.portfolio.config import PortfolioConfig
 from nautilus_trader.portfolio.portfolio import Portfolio
 from tests.test_kit.stubs import TestStubs
 
@@ -1313,3 +1316,247 @@ class TestPortfolio:
         assert self.portfolio.is_net_long(AUDUSD_SIM.id)
         assert self.portfolio.is_flat(GBPUSD_SIM.id)
         assert not self.portfolio.is_completely_flat()
+
+
+class TestPortfolioIncrementalAccounting:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(self.clock)
+
+        self.trader_id = TestStubs.trader_id()
+
+        self.order_factory = OrderFactory(
+            trader_id=self.trader_id,
+            strategy_id=StrategyId("S-001"),
+            clock=TestClock(),
+        )
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.cache = TestStubs.cache()
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=PortfolioConfig(incremental_accounting=True),
+        )
+
+        # Prepare components
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_instrument(BTCUSD_BITMEX)
+
+    def _open_position(self, instrument, account_id, side, quantity, last_px, position_id):
+        order = self.order_factory.market(instrument.id, side, quantity)
+        fill = TestStubs.event_order_filled(
+            order,
+            instrument=instrument,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=position_id,
+            last_px=last_px,
+        )
+        position = Position(instrument=instrument, fill=fill)
+        self.cache.add_position(position, OMSType.HEDGING)
+        self.portfolio.update_position(TestStubs.event_position_opened(position))
+        return position
+
+    def _update_quote(self, instrument_id, bid, ask):
+        tick = QuoteTick(
+            instrument_id=instrument_id,
+            bid=Price.from_str(bid),
+            ask=Price.from_str(ask),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+        self.cache.add_quote_tick(tick)
+        self.portfolio.update_tick(tick)
+        return tick
+
+    def _register_sim_account(self):
+        account_id = AccountId("SIM", "01234")
+        self.portfolio.update_account(
+            AccountState(
+                account_id=account_id,
+                account_type=AccountType.MARGIN,
+                base_currency=USD,
+                reported=True,
+                balances=[
+                    AccountBalance(
+                        USD,
+                        Money(1_000_000, USD),
+                        Money(0, USD),
+                        Money(1_000_000, USD),
+                    ),
+                ],
+                info={},
+                event_id=UUID4(),
+                ts_event=0,
+                ts_init=0,
+            )
+        )
+        return account_id
+
+    def test_instantiate_with_invalid_config_raises_type_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(TypeError):
+            Portfolio(
+                msgbus=self.msgbus,
+                cache=self.cache,
+                clock=self.clock,
+                logger=self.logger,
+                config={"incremental_accounting": True},
+            )
+
+    def test_update_tick_re_marks_unrealized_pnl(self):
+        # Arrange
+        account_id = self._register_sim_account()
+        self._update_quote(AUDUSD_SIM.id, "0.80501", "0.80505")
+        self._open_position(
+            AUDUSD_SIM,
+            account_id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+            PositionId("P-1"),
+        )
+
+        # Act
+        self._update_quote(AUDUSD_SIM.id, "0.81000", "0.81002")
+
+        # Assert
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(-19000.00, USD)
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-19000.00, USD)}
+
+    def test_update_tick_with_long_and_short_positions_marks_each_side(self):
+        # Arrange
+        account_id = self._register_sim_account()
+        self._update_quote(AUDUSD_SIM.id, "0.80501", "0.80505")
+        self._open_position(
+            AUDUSD_SIM,
+            account_id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+            PositionId("P-1"),
+        )
+        self._open_position(
+            AUDUSD_SIM,
+            account_id,
+            OrderSide.SELL,
+            Quantity.from_int(50000),
+            Price.from_str("0.90000"),
+            PositionId("P-2"),
+        )
+
+        # Act
+        self._update_quote(AUDUSD_SIM.id, "0.80000", "0.80002")
+
+        # Assert
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(-15001.00, USD)
+
+    def test_update_tick_for_inverse_instrument_matches_position_calculation(self):
+        # Arrange
+        AccountFactory.register_calculated_account("BITMEX")
+        account_id = AccountId("BITMEX", "01234")
+        self.portfolio.update_account(
+            AccountState(
+                account_id=account_id,
+                account_type=AccountType.MARGIN,
+                base_currency=None,  # Multi-currency account
+                reported=True,
+                balances=[
+                    AccountBalance(
+                        BTC,
+                        Money(10.00000000, BTC),
+                        Money(0.00000000, BTC),
+                        Money(10.00000000, BTC),
+                    ),
+                ],
+                info={},
+                event_id=UUID4(),
+                ts_event=0,
+                ts_init=0,
+            )
+        )
+        self._update_quote(BTCUSD_BITMEX.id, "10500.0", "10500.5")
+        position = self._open_position(
+            BTCUSD_BITMEX,
+            account_id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("10000.0"),
+            PositionId("P-1"),
+        )
+
+        # Act
+        tick = self._update_quote(BTCUSD_BITMEX.id, "11000.0", "11000.5")
+
+        # Assert
+        assert self.portfolio.unrealized_pnl(BTCUSD_BITMEX.id) == position.unrealized_pnl(tick.bid)
+        assert self.portfolio.unrealized_pnl(BTCUSD_BITMEX.id) == Money(0.90909091, BTC)
+
+    def test_update_tick_after_position_closed_returns_zero(self):
+        # Arrange
+        account_id = self._register_sim_account()
+        self._update_quote(AUDUSD_SIM.id, "0.80501", "0.80505")
+        position = self._open_position(
+            AUDUSD_SIM,
+            account_id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+            PositionId("P-1"),
+        )
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+        )
+        fill = TestStubs.event_order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("0.80501"),
+        )
+        position.apply(fill)
+        self.cache.update_position(position)
+        self.portfolio.update_position(TestStubs.event_position_closed(position))
+
+        # Act
+        self._update_quote(AUDUSD_SIM.id, "0.81000", "0.81002")
+
+        # Assert
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(0, USD)
+        assert self.portfolio.is_flat(AUDUSD_SIM.id)
+
+    def test_reset_clears_running_aggregates(self):
+        # Arrange
+        account_id = self._register_sim_account()
+        self._update_quote(AUDUSD_SIM.id, "0.80501", "0.80505")
+        self._open_position(
+            AUDUSD_SIM,
+            account_id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+            PositionId("P-1"),
+        )
+
+        # Act
+        self.portfolio.reset()
+        self._update_quote(AUDUSD_SIM.id, "0.81000", "0.81002")
+
+        # Assert
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(-19000.00, USD)
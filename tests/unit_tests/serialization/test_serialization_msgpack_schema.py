@@ -0,0 +1,490 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import msgpack
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.model.commands.trading import CancelAllOrders
+from nautilus_trader.model.commands.trading import CancelOrder
+from nautilus_trader.model.commands.trading import ModifyOrder
+from nautilus_trader.model.commands.trading import SubmitOrder
+from nautilus_trader.model.commands.trading import SubmitOrderList
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import LiquiditySide
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderType
+from nautilus_trader.model.events.account import AccountState
+from nautilus_trader.model.events.order import OrderAccepted
+from nautilus_trader.model.events.order import OrderCancelRejected
+from nautilus_trader.model.events.order import OrderDenied
+from nautilus_trader.model.events.order import OrderFilled
+from nautilus_trader.model.events.order import OrderUpdated
+from nautilus_trader.model.events.position import PositionChanged
+from nautilus_trader.model.events.position import PositionClosed
+from nautilus_trader.model.events.position import PositionOpened
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.identifiers import ExecutionId
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import VenueOrderId
+from nautilus_trader.model.objects import AccountBalance
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.position import Position
+from nautilus_trader.serialization.msgpack.schema import SCHEMA_VERSION
+from nautilus_trader.serialization.msgpack.schema import MsgPackSchemaSerializer
+from nautilus_trader.serialization.msgpack.serializer import MsgPackSerializer
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestMsgPackSchemaSerializer:
+    def setup(self):
+        # Fixture Setup
+        self.trader_id = TestStubs.trader_id()
+        self.strategy_id = TestStubs.strategy_id()
+        self.account_id = TestStubs.account_id()
+
+        self.order_factory = OrderFactory(
+            trader_id=self.trader_id,
+            strategy_id=self.strategy_id,
+            clock=TestClock(),
+        )
+
+        self.serializer = MsgPackSchemaSerializer()
+
+    def test_serialize_writes_schema_version_and_fixed_field_array(self):
+        # Arrange
+        event = OrderAccepted(
+            self.trader_id,
+            self.strategy_id,
+            self.account_id,
+            AUDUSD_SIM.id,
+            ClientOrderId("O-123456"),
+            VenueOrderId("1"),
+            UUID4(),
+            0,
+            0,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(event)
+
+        # Assert
+        values = msgpack.unpackb(serialized)
+        assert isinstance(values, list)
+        assert values[0] == SCHEMA_VERSION
+        assert values[2] == self.trader_id.value
+
+    def test_serialize_writes_raw_fixed_point_values_and_integer_enums(self):
+        # Arrange
+        event = OrderFilled(
+            self.trader_id,
+            self.strategy_id,
+            self.account_id,
+            AUDUSD_SIM.id,
+            ClientOrderId("O-123456"),
+            VenueOrderId("1"),
+            ExecutionId("E123456"),
+            PositionId("T123456"),
+            OrderSide.SELL,
+            OrderType.MARKET,
+            Quantity(100000, precision=0),
+            Price(1.00001, precision=5),
+            AUDUSD_SIM.quote_currency,
+            Money(2.50, USD),
+            LiquiditySide.TAKER,
+            UUID4(),
+            0,
+            0,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(event)
+
+        # Assert
+        values = msgpack.unpackb(serialized)
+        assert values[10] == OrderSide.SELL
+        assert values[14:16] == [100001, 5]
+        assert values[17] == 250
+        assert len(serialized) < len(MsgPackSerializer().serialize(event))
+
+    def test_deserialize_unsupported_schema_version_raises_runtime_error(self):
+        # Arrange
+        serialized = msgpack.packb([SCHEMA_VERSION + 1, 4])
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            self.serializer.deserialize(serialized)
+
+    def test_deserialize_unrecognized_type_tag_raises_runtime_error(self):
+        # Arrange
+        serialized = msgpack.packb([SCHEMA_VERSION, 255])
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            self.serializer.deserialize(serialized)
+
+    def test_serialize_and_deserialize_instrument_falls_back_to_dict_format(self):
+        # Arrange, Act
+        serialized = self.serializer.serialize(AUDUSD_SIM)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert isinstance(msgpack.unpackb(serialized), dict)
+        assert deserialized == AUDUSD_SIM
+
+    def test_deserialize_dict_format_event(self):
+        # Arrange
+        event = OrderDenied(
+            self.trader_id,
+            self.strategy_id,
+            AUDUSD_SIM.id,
+            ClientOrderId("O-123456"),
+            "Exceeds risk for FX",
+            UUID4(),
+            0,
+        )
+
+        serialized = MsgPackSerializer(timestamps_as_str=True).serialize(event)
+
+        # Act
+        deserialized = MsgPackSchemaSerializer(timestamps_as_str=True).deserialize(serialized)
+
+        # Assert
+        assert deserialized == event
+
+    def test_serialize_and_deserialize_submit_order_commands(self):
+        # Arrange
+        order = self.order_factory.stop_limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity(100000, precision=0),
+            price=Price(1.00000, precision=5),
+            trigger=Price(1.00010, precision=5),
+            tags="ENTRY",
+        )
+
+        command = SubmitOrder(
+            self.trader_id,
+            StrategyId("SCALPER-001"),
+            PositionId("P-123456"),
+            order,
+            UUID4(),
+            0,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(command)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert deserialized == command
+        assert deserialized.order == order
+        assert deserialized.order.price == order.price
+        assert deserialized.order.trigger == order.trigger
+        assert deserialized.order.tags == "ENTRY"
+
+    def test_serialize_and_deserialize_submit_order_list_commands(self):
+        # Arrange
+        bracket = self.order_factory.bracket_market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity(100000, precision=0),
+            stop_loss=Price(0.99900, precision=5),
+            take_profit=Price(1.00010, precision=5),
+        )
+
+        command = SubmitOrderList(
+            trader_id=self.trader_id,
+            strategy_id=StrategyId("SCALPER-001"),
+            order_list=bracket,
+            command_id=UUID4(),
+            ts_init=0,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(command)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert deserialized == command
+        assert deserialized.list == bracket
+        assert deserialized.list.orders[1].parent_order_id == bracket.orders[1].parent_order_id
+
+    def test_serialize_and_deserialize_modify_order_commands(self):
+        # Arrange
+        command = ModifyOrder(
+            self.trader_id,
+            StrategyId("SCALPER-001"),
+            AUDUSD_SIM.id,
+            ClientOrderId("O-123456"),
+            VenueOrderId("001"),
+            Quantity(100000, precision=0),
+            Price(1.00001, precision=5),
+            None,
+            UUID4(),
+            0,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(command)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert deserialized == command
+        assert deserialized.price == command.price
+        assert deserialized.trigger is None
+
+    def test_serialize_and_deserialize_cancel_order_commands(self):
+        # Arrange
+        command = CancelOrder(
+            self.trader_id,
+            StrategyId("SCALPER-001"),
+            AUDUSD_SIM.id,
+            ClientOrderId("O-123456"),
+            VenueOrderId("001"),
+            UUID4(),
+            0,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(command)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert deserialized == command
+
+    def test_serialize_and_deserialize_cancel_all_orders_commands(self):
+        # Arrange
+        command = CancelAllOrders(
+            self.trader_id,
+            StrategyId("SCALPER-001"),
+            AUDUSD_SIM.id,
+            UUID4(),
+            0,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(command)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert deserialized == command
+        assert deserialized.instrument_id == AUDUSD_SIM.id
+
+    def test_serialize_and_deserialize_account_state_events(self):
+        # Arrange
+        event = AccountState(
+            account_id=AccountId("SIM", "000"),
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(USD, Money(1525000, USD), Money(25000, USD), Money(1500000, USD)),
+            ],
+            info={"default_leverage": "100"},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=1_000_000_000,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(event)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert deserialized == event
+        assert deserialized.account_type == AccountType.MARGIN
+        assert deserialized.balances[0].locked == Money(25000, USD)
+        assert deserialized.info == {"default_leverage": "100"}
+
+    def test_serialize_and_deserialize_order_initialized_events(self):
+        # Arrange
+        order = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity(100000, precision=0),
+            price=Price(1.00000, precision=5),
+            post_only=True,
+        )
+        event = order.init_event
+
+        # Act
+        serialized = self.serializer.serialize(event)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert deserialized == event
+        assert deserialized.options == event.options
+        assert deserialized.quantity == event.quantity
+
+    def test_serialize_and_deserialize_order_cancel_reject_events(self):
+        # Arrange
+        event = OrderCancelRejected(
+            self.trader_id,
+            self.strategy_id,
+            self.account_id,
+            AUDUSD_SIM.id,
+            ClientOrderId("O-123456"),
+            VenueOrderId("1"),
+            "ORDER_DOES_NOT_EXIST",
+            UUID4(),
+            0,
+            0,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(event)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert deserialized == event
+        assert isinstance(deserialized, OrderCancelRejected)
+        assert deserialized.reason == "ORDER_DOES_NOT_EXIST"
+
+    def test_serialize_and_deserialize_order_updated_events(self):
+        # Arrange
+        event = OrderUpdated(
+            self.trader_id,
+            self.strategy_id,
+            self.account_id,
+            AUDUSD_SIM.id,
+            ClientOrderId("O-123456"),
+            VenueOrderId("1"),
+            Quantity(100000, precision=0),
+            Price(0.80010, precision=5),
+            Price(0.80050, precision=5),
+            UUID4(),
+            0,
+            0,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(event)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert deserialized == event
+        assert deserialized.price == event.price
+        assert deserialized.trigger == event.trigger
+
+    def test_serialize_and_deserialize_order_filled_events(self):
+        # Arrange
+        event = OrderFilled(
+            self.trader_id,
+            self.strategy_id,
+            self.account_id,
+            AUDUSD_SIM.id,
+            ClientOrderId("O-123456"),
+            VenueOrderId("1"),
+            ExecutionId("E123456"),
+            None,
+            OrderSide.SELL,
+            OrderType.MARKET,
+            Quantity(100000, precision=0),
+            Price(1.00000, precision=5),
+            AUDUSD_SIM.quote_currency,
+            Money(0, USD),
+            LiquiditySide.TAKER,
+            UUID4(),
+            1_630_000_000_123_456_789,
+            1_630_000_000_123_456_789,
+        )
+
+        # Act
+        serialized = self.serializer.serialize(event)
+        deserialized = self.serializer.deserialize(serialized)
+
+        # Assert
+        assert deserialized == event
+        assert deserialized.position_id is None
+        assert deserialized.last_px == event.last_px
+        assert deserialized.commission == event.commission
+        assert deserialized.liquidity_side == LiquiditySide.TAKER
+        assert deserialized.ts_event == 1_630_000_000_123_456_789
+
+    def test_serialize_and_deserialize_position_events(self):
+        # Arrange
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        fill1 = TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00001"),
+        )
+
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(50000),
+        )
+
+        fill2 = TestStubs.event_order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00011"),
+        )
+
+        order3 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(50000),
+        )
+
+        fill3 = TestStubs.event_order_filled(
+            order3,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00021"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        opened = PositionOpened.create(position, fill1, UUID4(), 0)
+        position.apply(fill2)
+        changed = PositionChanged.create(position, fill2, UUID4(), 0)
+        position.apply(fill3)
+        closed = PositionClosed.create(position, fill3, UUID4(), 0)
+
+        for event in (opened, changed, closed):
+            # Act
+            serialized = self.serializer.serialize(event)
+            deserialized = self.serializer.deserialize(serialized)
+
+            # Assert
+            assert deserialized == event
+            assert type(deserialized) is type(event)
+            assert deserialized.net_qty == event.net_qty
+            assert deserialized.avg_px_open == event.avg_px_open
+            assert deserialized.realized_pnl == event.realized_pnl
+            assert deserialized.ts_opened == event.ts_opened